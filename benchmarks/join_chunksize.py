@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the latency of searches using a Join for different chunk sizes.
+
+Searches the boreholes deeper than a given depth and joins them with their
+lithological descriptions, splitting the Join in chunks of increasing size.
+For every chunk size, the total search time and the median and maximum
+latency of the individual WFS GetFeature requests are reported.
+
+Only fields available in the WFS service are requested, so no XML documents
+are downloaded. This benchmark requires access to the DOV services.
+
+Usage::
+
+    python benchmarks/join_chunksize.py --depth 200 --chunksizes 50 100 500
+
+"""
+import argparse
+import statistics
+import time
+
+from owslib.fes import PropertyIsGreaterThan
+
+import pydov.util.owsutil
+from pydov.search.boring import BoringSearch
+from pydov.search.interpretaties import LithologischeBeschrijvingenSearch
+from pydov.util.query import Join
+
+
+class RequestTimer(object):
+    """Record the latency of all WFS GetFeature requests."""
+
+    def __init__(self):
+        """Initialisation."""
+        self.latencies = []
+        self._wfs_get_feature = pydov.util.owsutil.wfs_get_feature
+
+    def __enter__(self):
+        def wfs_get_feature(*args, **kwargs):
+            start = time.time()
+            try:
+                return self._wfs_get_feature(*args, **kwargs)
+            finally:
+                self.latencies.append(time.time() - start)
+
+        pydov.util.owsutil.wfs_get_feature = wfs_get_feature
+        return self
+
+    def __exit__(self, *args):
+        pydov.util.owsutil.wfs_get_feature = self._wfs_get_feature
+
+
+def run(depth, chunksizes, repeat):
+    """Run the benchmark and print the results.
+
+    Parameters
+    ----------
+    depth : float
+        Minimal depth of the boreholes to join.
+    chunksizes : list of int
+        Chunk sizes to benchmark.
+    repeat : int
+        Number of times to repeat the search for every chunk size.
+
+    """
+    boringen = BoringSearch().search(
+        query=PropertyIsGreaterThan('diepte_tot_m', str(depth)),
+        return_fields=('pkey_boring',))
+    print('Joining {} boreholes.'.format(len(boringen)))
+
+    ls = LithologischeBeschrijvingenSearch()
+    ls.get_fields()
+
+    print('{:>10} {:>10} {:>10} {:>12} {:>12}'.format(
+        'chunksize', 'requests', 'total (s)', 'median (s)', 'max (s)'))
+
+    for chunksize in chunksizes:
+        for i in range(repeat):
+            with RequestTimer() as timer:
+                start = time.time()
+                ls.search(query=Join(boringen, 'pkey_boring',
+                                     chunksize=chunksize),
+                          return_fields=('pkey_interpretatie',
+                                         'pkey_boring'))
+                total = time.time() - start
+
+            print('{:>10} {:>10} {:>10.2f} {:>12.2f} {:>12.2f}'.format(
+                chunksize, len(timer.latencies), total,
+                statistics.median(timer.latencies), max(timer.latencies)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--depth', type=float, default=200,
+                        help='minimal depth of the boreholes to join')
+    parser.add_argument('--chunksizes', type=int, nargs='+',
+                        default=[50, 100, 250, 500, 1000, 5000],
+                        help='chunk sizes to benchmark')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of searches per chunk size')
+    args = parser.parse_args()
+
+    run(args.depth, args.chunksizes, args.repeat)
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the throughput of extracting CPT measurements.
+
+Builds a CPT XML document with the given number of measurements (Meetdata)
+by repeating the measurements of the CPT document of the test suite, and
+reports the number of rows per second for:
+
+* extracting the measurements as subtype instances, one XPath expression
+  and conversion per field and measurement (`Meetdata.from_xml`),
+* extracting the measurements in columns in a single pass, converting the
+  numeric columns to NumPy arrays at once,
+* building the dataframe of a search from the data array with a row per
+  measurement (`Sondering.to_df_array`),
+* building the dataframe of a search from the columns (`Sondering.to_df`).
+
+No access to the DOV services is needed.
+
+Usage::
+
+    python benchmarks/subtype_extraction.py --rows 10000 100000
+
+"""
+import argparse
+import copy
+import time
+
+import pandas as pd
+
+from owslib.etree import etree
+from pydov.types.abstract import _SubtypeRecords
+from pydov.types.sondering import Meetdata, Sondering
+from pydov.util.dovutil import parse_dov_xml
+
+DATA = 'tests/data/types/sondering/'
+
+
+def build_xml(rows):
+    """Build a CPT XML document with the given number of measurements.
+
+    Parameters
+    ----------
+    rows : int
+        Number of measurements.
+
+    Returns
+    -------
+    bytes
+        The XML document.
+
+    """
+    with open(DATA + 'sondering.xml', 'rb') as f:
+        tree = parse_dov_xml(f.read())
+
+    elements = tree.findall(Meetdata.rootpath)
+    parent = tree.find(Meetdata.rootpath.rsplit('/', 1)[0])
+    for element in elements:
+        parent.remove(element)
+
+    for i in range(rows):
+        parent.append(copy.deepcopy(elements[i % len(elements)]))
+
+    return etree.tostring(tree)
+
+
+def get_instance(xml):
+    """Get an instance of a CPT using the given XML document.
+
+    Parameters
+    ----------
+    xml : bytes
+        The XML document of the CPT.
+
+    Returns
+    -------
+    pydov.types.sondering.Sondering
+        Instance of the CPT.
+
+    """
+    with open(DATA + 'feature.xml', 'rb') as f:
+        feature = etree.fromstring(f.read())
+
+    instance = Sondering.from_wfs_element(
+        feature, 'http://dov.vlaanderen.be/ocdov/dov-pub')
+    instance._xml_data = xml
+    return instance
+
+
+def timed(fn, repeat):
+    """Return the median duration of calling the given function.
+
+    Parameters
+    ----------
+    fn : function
+        Function without arguments.
+    repeat : int
+        Number of times to call the function.
+
+    Returns
+    -------
+    float
+        Median duration, in seconds.
+
+    """
+    durations = []
+    for i in range(repeat):
+        start = time.time()
+        fn()
+        durations.append(time.time() - start)
+    return sorted(durations)[len(durations) // 2]
+
+
+def run(rows, repeat):
+    """Run the benchmark and print the results.
+
+    Parameters
+    ----------
+    rows : list of int
+        Numbers of measurements to benchmark.
+    repeat : int
+        Number of times to repeat every measurement.
+
+    """
+    return_fields = ['pkey_sondering'] + Meetdata.get_field_names()
+
+    print('{:>10} {:>14} {:>14} {:>14} {:>14}'.format(
+        'rows', 'instances/s', 'columns/s', 'df rows/s', 'df cols/s'))
+
+    for count in rows:
+        xml = build_xml(count)
+        tree = parse_dov_xml(xml)
+
+        results = [
+            timed(lambda: list(Meetdata.from_xml(tree)), repeat),
+            timed(lambda: _SubtypeRecords.from_xml(Meetdata, tree), repeat),
+            timed(lambda: pd.DataFrame(Sondering.to_df_array(
+                [get_instance(xml)], return_fields),
+                columns=return_fields), repeat),
+            timed(lambda: Sondering.to_df(
+                [get_instance(xml)], return_fields), repeat)]
+
+        print('{:>10} {:>14.0f} {:>14.0f} {:>14.0f} {:>14.0f}'.format(
+            count, *[count / d for d in results]))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--rows', type=int, nargs='+',
+                        default=[1000, 10000, 100000],
+                        help='numbers of measurements to benchmark')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of runs per measurement')
+    args = parser.parse_args()
+
+    run(args.rows, args.repeat)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the memory used per subtype record.
+
+Parses the measurements (Meetdata) of a CPT XML document both as a list of
+subtype instances, each with its own data dictionary, and as the compact
+column based records used by the main types. For both representations,
+the memory used per record and the time needed to extract the records
+are reported.
+
+The records are extracted from an XML document on disk, so no access to
+the DOV services is needed. By default, the CPT document of the test suite
+is used.
+
+Usage::
+
+    python benchmarks/subtype_memory.py --file sondering.xml --repeat 5
+
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from pydov.types.abstract import _SubtypeRecords
+from pydov.types.sondering import Meetdata
+from pydov.util.dovutil import parse_dov_xml
+
+
+def measure(fn, repeat):
+    """Measure the memory retained by the result of the given function.
+
+    Parameters
+    ----------
+    fn : function
+        Function without arguments returning the records.
+    repeat : int
+        Number of times to run the function to measure the extraction time.
+
+    Returns
+    -------
+    tuple of (int, int, float)
+        Number of records, number of bytes retained by the records and the
+        median extraction time, in seconds.
+
+    """
+    durations = []
+    for i in range(repeat):
+        start = time.time()
+        fn()
+        durations.append(time.time() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    records = fn()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return len(records), size, sorted(durations)[len(durations) // 2]
+
+
+def run(filename, repeat):
+    """Run the benchmark and print the results.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the XML document of a CPT.
+    repeat : int
+        Number of times to extract the records for every representation.
+
+    """
+    with open(filename, 'rb') as f:
+        tree = parse_dov_xml(f.read())
+
+    print('{:>12} {:>10} {:>14} {:>10}'.format(
+        'storage', 'records', 'bytes/record', 'time (s)'))
+
+    for name, fn in (
+            ('instances', lambda: list(Meetdata.from_xml(tree))),
+            ('columns', lambda: _SubtypeRecords.from_xml(Meetdata, tree))):
+        count, size, duration = measure(fn, repeat)
+        print('{:>12} {:>10} {:>14.1f} {:>10.4f}'.format(
+            name, count, float(size) / max(count, 1), duration))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--file',
+                        default='tests/data/types/sondering/sondering.xml',
+                        help='XML document of a CPT')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of extractions per representation')
+    args = parser.parse_args()
+
+    run(args.file, args.repeat)
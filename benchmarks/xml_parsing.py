@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the CPU time of parsing DOV XML documents once per object.
+
+For the XML document of every type in the test suite, reports the CPU time
+needed to extract the fields of the main type and all of its subtypes:
+
+* parsing the document once, and sharing the parsed tree between the main
+  type and its subtypes,
+* parsing the document again for every subtype, like before the parsed
+  tree was shared.
+
+No access to the DOV services is needed.
+
+Usage::
+
+    python benchmarks/xml_parsing.py --repeat 7 --number 100
+
+"""
+import argparse
+import time
+
+from pydov.types.abstract import _SubtypeRecords
+from pydov.types.boring import Boring
+from pydov.types.grondmonster import Grondmonster
+from pydov.types.grondwaterfilter import GrondwaterFilter
+from pydov.types.grondwatermonster import GrondwaterMonster
+from pydov.types.interpretaties import (
+    FormeleStratigrafie,
+    GecodeerdeLithologie,
+    GeotechnischeCodering,
+    HydrogeologischeStratigrafie,
+    InformeleHydrogeologischeStratigrafie,
+    InformeleStratigrafie,
+    LithologischeBeschrijvingen,
+    QuartairStratigrafie,
+)
+from pydov.types.sondering import Sondering
+from pydov.util.dovutil import parse_dov_xml
+
+DATA = 'tests/data/types/'
+
+TYPES = [
+    (Boring, 'boring/boring.xml'),
+    (Sondering, 'sondering/sondering.xml'),
+    (GrondwaterFilter, 'grondwaterfilter/grondwaterfilter.xml'),
+    (GrondwaterMonster, 'grondwatermonster/grondwatermonster.xml'),
+    (Grondmonster, 'grondmonster/grondmonster.xml'),
+    (FormeleStratigrafie, 'interpretaties/formele_stratigrafie/'
+                          'formele_stratigrafie.xml'),
+    (GecodeerdeLithologie, 'interpretaties/gecodeerde_lithologie/'
+                           'gecodeerde_lithologie.xml'),
+    (GeotechnischeCodering, 'interpretaties/geotechnische_codering/'
+                            'geotechnische_codering.xml'),
+    (HydrogeologischeStratigrafie,
+     'interpretaties/hydrogeologische_stratigrafie/'
+     'hydrogeologische_stratigrafie.xml'),
+    (InformeleHydrogeologischeStratigrafie,
+     'interpretaties/informele_hydrogeologische_stratigrafie/'
+     'informele_hydrogeologische_stratigrafie.xml'),
+    (InformeleStratigrafie, 'interpretaties/informele_stratigrafie/'
+                            'informele_stratigrafie.xml'),
+    (LithologischeBeschrijvingen,
+     'interpretaties/lithologische_beschrijvingen/'
+     'lithologische_beschrijvingen.xml'),
+    (QuartairStratigrafie, 'interpretaties/quartaire_stratigrafie/'
+                           'quartaire_stratigrafie.xml'),
+]
+
+
+def parse_once(objecttype, xml):
+    """Extract the main fields and all subtypes, parsing the document once.
+
+    Parameters
+    ----------
+    objecttype : class
+        The DOV type, subclass of AbstractDovType.
+    xml : bytes
+        The XML document of the object.
+
+    """
+    tree = parse_dov_xml(xml)
+    objecttype._extract(
+        tree, objecttype._get_extraction_plan(source=('xml',)), {})
+    for subtype in objecttype.subtypes:
+        _SubtypeRecords.from_xml(subtype, tree)
+
+
+def parse_per_subtype(objecttype, xml):
+    """Extract the main fields and all subtypes, parsing the document again
+    for every subtype.
+
+    Parameters
+    ----------
+    objecttype : class
+        The DOV type, subclass of AbstractDovType.
+    xml : bytes
+        The XML document of the object.
+
+    """
+    tree = parse_dov_xml(xml)
+    objecttype._extract(
+        tree, objecttype._get_extraction_plan(source=('xml',)), {})
+    for subtype in objecttype.subtypes:
+        _SubtypeRecords.from_xml(subtype, parse_dov_xml(xml))
+
+
+def timed(fn, repeat, number):
+    """Return the best CPU time per call of the given function.
+
+    Parameters
+    ----------
+    fn : function
+        Function without arguments.
+    repeat : int
+        Number of times to repeat the measurement.
+    number : int
+        Number of calls per measurement.
+
+    Returns
+    -------
+    float
+        Best CPU time per call, in seconds.
+
+    """
+    durations = []
+    for i in range(repeat):
+        start = time.process_time()
+        for j in range(number):
+            fn()
+        durations.append((time.process_time() - start) / number)
+    return min(durations)
+
+
+def run(repeat, number):
+    """Run the benchmark and print the results.
+
+    Parameters
+    ----------
+    repeat : int
+        Number of times to repeat every measurement.
+    number : int
+        Number of objects to parse per measurement.
+
+    """
+    print('{:<38} {:>14} {:>14} {:>8}'.format(
+        'type', 'per subtype', 'once', 'gain'))
+
+    for objecttype, filename in TYPES:
+        with open(DATA + filename, 'rb') as f:
+            xml = f.read()
+
+        before = timed(lambda: parse_per_subtype(objecttype, xml),
+                       repeat, number)
+        after = timed(lambda: parse_once(objecttype, xml), repeat, number)
+
+        print('{:<38} {:>11.3f} ms {:>11.3f} ms {:>7.0%}'.format(
+            objecttype.__name__, before * 1000, after * 1000,
+            1 - after / before))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--repeat', type=int, default=7,
+                        help='number of measurements per type')
+    parser.add_argument('--number', type=int, default=100,
+                        help='number of objects parsed per measurement')
+    args = parser.parse_args()
+
+    run(args.repeat, args.number)
@@ -2,6 +2,7 @@
 import requests
 
 import pydov.util.caching
+import pydov.util.executor
 from pydov.util.hooks import (
     SimpleStatusHook,
     Hooks,
@@ -12,6 +13,27 @@ __version__ = '1.0.0'
 
 cache = pydov.util.caching.GzipTextFileCache()
 
+# Optional package wide cache of the parsed field values of DOV objects,
+# allowing to skip parsing their XML documents in subsequent searches.
+# Disabled by default, see pydov.util.caching.MemoryRecordCache.
+record_cache = None
+
+# Package wide executor to perform IO operations (like XML downloads) in
+# parallel. It is shared by all searches, reusing its worker threads.
+executor = pydov.util.executor.ThreadExecutor(workers=4)
+
+# Package wide executor to perform the WFS GetFeature requests of a single
+# search in parallel (f.ex. the pages of a large result). It is separate from
+# `executor`, since searches can run in a task of `executor` themselves and
+# tasks should not wait for other tasks of the same executor.
+wfs_executor = pydov.util.executor.ThreadExecutor(workers=4)
+
+# Package wide executor to request the metadata of the search classes (like
+# the WFS schema, feature catalogue and XSD schemas) in parallel. It is
+# separate from `executor`, since the fields of a search class can be
+# initialised in a task of `executor` (f.ex. a search started from a task).
+metadata_executor = pydov.util.executor.ThreadExecutor(workers=4)
+
 hooks = Hooks(
     (SimpleStatusHook(),)
 )
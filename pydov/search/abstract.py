@@ -1,20 +1,28 @@
 # -*- coding: utf-8 -*-
 """Module containing the abstract search classes to retrieve DOV data."""
+import asyncio
+import collections
+import concurrent.futures
 import datetime
+import functools
+import io
+import threading
 from distutils.util import strtobool
 
 import owslib
 import pydov
 from owslib.etree import etree
-from owslib.feature import get_schema
 from owslib.fes import (
+    And,
     FilterRequest,
 )
 from owslib.wfs import WebFeatureService
+from pydov.types.fields import _WfsInjectedField
 from pydov.util import owsutil
 from pydov.util.dovutil import (
     get_xsd_schema,
     build_dov_url,
+    create_async_session,
 )
 from pydov.util.errors import (
     LayerNotFoundError,
@@ -24,12 +32,95 @@ from pydov.util.errors import (
     WfsGetFeatureError,
 )
 from pydov.util.hooks import HookRunner
+from pydov.util.location import (
+    Box,
+    Intersects,
+    Within,
+)
+from pydov.util.query import PropertyInList
+
+
+def _convert_string(x):
+    return u'' + (x.strip())
+
+
+def _convert_date(x):
+    # Patch for Zulu-time issue of geoserver for WFS 1.1.0
+    if x.endswith('Z'):
+        return datetime.datetime.strptime(x, '%Y-%m-%dZ').date() \
+               + datetime.timedelta(days=1)
+    else:
+        return datetime.datetime.strptime(x, '%Y-%m-%d').date()
+
+
+def _convert_datetime(x):
+    if x.endswith('Z'):
+        return datetime.datetime.strptime(
+                x, '%Y-%m-%dT%H:%M:%SZ').date() \
+               + datetime.timedelta(days=1)
+    else:
+        return datetime.datetime.strptime(
+            x.split('.')[0], '%Y-%m-%dT%H:%M:%S')
+
+
+def _convert_boolean(x):
+    return strtobool(x) == 1
+
+
+def _convert_identity(x):
+    return x
+
+
+def _parse_xsd_schema(url):
+    """Request and parse the XSD schema with the given URL.
+
+    Parameters
+    ----------
+    url : str
+        URL of the XSD schema.
+
+    Returns
+    -------
+    etree.Element
+        Parsed XSD schema.
+
+    """
+    return etree.fromstring(get_xsd_schema(url))
 
 
 class AbstractCommon(object):
     """Class grouping methods common to AbstractSearch and
     AbstractTypeCommon."""
 
+    _typeconverters = {
+        'string': _convert_string,
+        'integer': int,
+        'float': float,
+        'date': _convert_date,
+        'datetime': _convert_datetime,
+        'boolean': _convert_boolean,
+    }
+
+    @classmethod
+    def _get_typeconverter(cls, returntype):
+        """Get the function to parse text to the given returntype.
+
+        Parameters
+        ----------
+        returntype : str
+            Output datatype of the function. One of `string`, `float`,
+            `integer`, `date`, `datetime`, `boolean`. Other values return
+            a function returning the text as is.
+
+        Returns
+        -------
+        function
+            Function taking the text as single argument and returning the
+            converted value.
+
+        """
+        return cls._typeconverters.get(returntype, _convert_identity)
+
     @classmethod
     def _typeconvert(cls, text, returntype):
         """Parse the text to the given returntype.
@@ -49,40 +140,91 @@ class AbstractCommon(object):
             `returntype`.
 
         """
-        if returntype == 'string':
-            def typeconvert(x):
-                return u'' + (x.strip())
-        elif returntype == 'integer':
-            def typeconvert(x):
-                return int(x)
-        elif returntype == 'float':
-            def typeconvert(x):
-                return float(x)
-        elif returntype == 'date':
-            def typeconvert(x):
-                # Patch for Zulu-time issue of geoserver for WFS 1.1.0
-                if x.endswith('Z'):
-                    return datetime.datetime.strptime(x, '%Y-%m-%dZ').date() \
-                           + datetime.timedelta(days=1)
-                else:
-                    return datetime.datetime.strptime(x, '%Y-%m-%d').date()
-        elif returntype == 'datetime':
-            def typeconvert(x):
-                if x.endswith('Z'):
-                    return datetime.datetime.strptime(
-                            x, '%Y-%m-%dT%H:%M:%SZ').date() \
-                           + datetime.timedelta(days=1)
-                else:
-                    return datetime.datetime.strptime(
-                        x.split('.')[0], '%Y-%m-%dT%H:%M:%S')
-        elif returntype == 'boolean':
-            def typeconvert(x):
-                return strtobool(x) == 1
-        else:
-            def typeconvert(x):
-                return x
+        return cls._get_typeconverter(returntype)(text)
+
+
+class MetadataRegistry(object):
+    """Thread-safe registry of the metadata of the DOV services, shared by
+    all search classes.
+
+    Metadata (like WFS capabilities, DescribeFeatureType responses,
+    feature catalogues and XSD schemas) is keyed by the URL it is requested
+    from, and is requested and parsed only once per process. Concurrent
+    requests for the same URL wait for the first one to finish instead of
+    requesting it again. Failed requests are not saved, so they will be
+    retried the next time.
 
-        return typeconvert(text)
+    """
+
+    def __init__(self):
+        """Initialisation."""
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def get(self, url, fn, *args):
+        """Get the metadata associated with the given URL, calling `fn` to
+        request and parse it if it is not available yet.
+
+        Parameters
+        ----------
+        url : str or tuple of str
+            URL(s) of the metadata, used as key in the registry.
+        fn : callable
+            Function to call to request and parse the metadata.
+        args : list
+            Positional arguments to pass to `fn`.
+
+        Returns
+        -------
+        object
+            The (parsed) metadata, as returned by `fn`.
+
+        """
+        with self._lock:
+            future = self._entries.get(url)
+            owner = future is None
+            if owner:
+                future = concurrent.futures.Future()
+                self._entries[url] = future
+
+        if owner:
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                with self._lock:
+                    del self._entries[url]
+                future.set_exception(e)
+
+        return future.result()
+
+    def __contains__(self, url):
+        """Check whether the metadata of the given URL is available.
+
+        Parameters
+        ----------
+        url : str or tuple of str
+            URL(s) of the metadata.
+
+        Returns
+        -------
+        bool
+            True if the metadata has been retrieved successfully, False
+            otherwise.
+
+        """
+        with self._lock:
+            future = self._entries.get(url)
+        return future is not None and future.done() and \
+            future.exception() is None
+
+    def clear(self):
+        """Remove all metadata from the registry, so it will be requested
+        again when needed."""
+        with self._lock:
+            self._entries = {}
+
+
+metadata_registry = MetadataRegistry()
 
 
 class AbstractSearch(AbstractCommon):
@@ -91,7 +233,12 @@ class AbstractSearch(AbstractCommon):
 
     __wfs = None
 
-    def __init__(self, layer, objecttype):
+    # maximum number of features returned by a single WFS GetFeature request
+    _max_features_per_request = 10000
+    # maximum depth of the quadtree splitting location searches into tiles
+    _max_tile_depth = 8
+
+    def __init__(self, layer, objecttype, extra_wfs_fields=None):
         """Initialisation.
 
         Parameters
@@ -100,10 +247,16 @@ class AbstractSearch(AbstractCommon):
             WFS layer to use for searching and retrieving records.
         objecttype : pydov.types.AbstractDovType
             Subclass of AbstractDovType indicating the associated DOV datatype.
+        extra_wfs_fields : list<str>, optional
+            A list of extra fields to be included in the WFS requests,
+            regardless whether they're needed as return field. Defaults to
+            None, which includes no extra fields.
 
         """
         self._layer = layer
         self._type = objecttype
+        self._extra_wfs_fields = extra_wfs_fields or []
+        self._wfs_namespace = None
 
         self._fields = None
         self._wfs_fields = None
@@ -118,49 +271,94 @@ class AbstractSearch(AbstractCommon):
         to all subclasses and instances.
         """
         if AbstractSearch.__wfs is None:
+            AbstractSearch.__wfs = metadata_registry.get(
+                build_dov_url('geoserver/wfs') + '?version=1.1.0',
+                self._get_wfs)
 
-            capabilities = HookRunner.execute_inject_meta_response(
-                build_dov_url('geoserver/wfs') + '?version=1.1.0'
-            )
+    @staticmethod
+    def _get_wfs():
+        """Request the capabilities of the WFS service.
 
-            if capabilities is None:
-                AbstractSearch.__wfs = WebFeatureService(
-                    url=build_dov_url('geoserver/wfs'), version="1.1.0")
-            else:
-                AbstractSearch.__wfs = WebFeatureService(
-                    url=build_dov_url('geoserver/wfs'), version="1.1.0",
-                    xml=capabilities)
+        Returns
+        -------
+        owslib.wfs.WebFeatureService
+            WFS service based on its capabilities.
 
-            HookRunner.execute_meta_received(
-                build_dov_url('geoserver/wfs') + '?version=1.1.0',
-                etree.tostring(AbstractSearch.__wfs._capabilities,
-                               encoding='utf8')
-            )
+        """
+        capabilities = HookRunner.execute_inject_meta_response(
+            build_dov_url('geoserver/wfs') + '?version=1.1.0'
+        )
 
-    def _init_namespace(self):
-        """Initialise the WFS namespace associated with the layer.
+        if capabilities is None:
+            wfs = WebFeatureService(
+                url=build_dov_url('geoserver/wfs'), version="1.1.0")
+        else:
+            wfs = WebFeatureService(
+                url=build_dov_url('geoserver/wfs'), version="1.1.0",
+                xml=capabilities)
 
-        Raises
-        ------
-        NotImplementedError
-            This is an abstract method that should be implemented in a
-            subclass.
+        HookRunner.execute_meta_received(
+            build_dov_url('geoserver/wfs') + '?version=1.1.0',
+            etree.tostring(wfs._capabilities, encoding='utf8')
+        )
+        return wfs
 
-        """
-        raise NotImplementedError('This should be implemented in a subclass.')
+    def _init_namespace(self):
+        """Initialise the WFS namespace associated with the layer."""
+        if self._wfs_namespace is None:
+            self._wfs_namespace = self._get_namespace()
 
     def _init_fields(self):
         """Initialise the fields and their metadata available in this search
         class.
 
-        Raises
-        ------
-        NotImplementedError
-            This is an abstract method that should be implemented in a
-            subclass.
+        The metadata is requested only once for each URL, and saved in the
+        metadata registry shared by all subclasses and instances.
+
+        """
+        if self._fields is None:
+            wfs_schema, feature_catalogue, xsd_schemas = self._get_metadata()
+
+            fields = self._build_fields(
+                wfs_schema, feature_catalogue, xsd_schemas)
+
+            for field in fields.values():
+                if field['name'] not in self._type.get_field_names(
+                        include_wfs_injected=True):
+                    self._type.fields.append(
+                        _WfsInjectedField(name=field['name'],
+                                          datatype=field['type']))
+
+            self._fields = self._build_fields(
+                wfs_schema, feature_catalogue, xsd_schemas)
+
+    def _get_metadata(self):
+        """Request the metadata needed to build the fields of this search
+        class.
+
+        The WFS schema, the feature catalogue (which depends on the remote
+        metadata) and the XSD schemas are independent and are requested
+        concurrently, using the package wide metadata executor.
+
+        Returns
+        -------
+        wfs_schema : dict
+            Schema associated with the layer.
+        feature_catalogue : dict
+            Dictionary with fields described in the feature catalogue, as
+            returned by pydov.util.owsutil.get_remote_featurecatalogue.
+        xsd_schemas : list of etree.ElementTree
+            List of parsed XSD schemas associated with this type.
 
         """
-        raise NotImplementedError('This should be implemented in a subclass.')
+        self._init_wfs()
+
+        wfs_schema = pydov.metadata_executor.submit(self._get_schema)
+        feature_catalogue = pydov.metadata_executor.submit(
+            self._get_featurecatalogue)
+        xsd_schemas = self._get_remote_xsd_schemas()
+
+        return wfs_schema.result(), feature_catalogue.result(), xsd_schemas
 
     def _get_layer(self):
         """Get the WFS metadata for the layer.
@@ -195,11 +393,8 @@ class AbstractSearch(AbstractCommon):
             Schema associated with the layer.
 
         """
-        self._init_wfs()
-        layername = self._layer.split(':')[1] if ':' in self._layer else \
-            self._layer
-        return get_schema(
-            build_dov_url('geoserver/wfs'), layername, '1.1.0')
+        return owsutil.get_schema(self.__wfs, self._layer,
+                                  self._get_describefeaturetype())
 
     def _get_namespace(self):
         """Get the WFS namespace of the layer.
@@ -211,9 +406,24 @@ class AbstractSearch(AbstractCommon):
             namespace of the fields of this layer, needed to parse the
             output of a GetFeature request.
 
+        """
+        return owsutil.get_namespace(self.__wfs, self._layer,
+                                     self._get_describefeaturetype())
+
+    def _get_describefeaturetype(self):
+        """Get the DescribeFeatureType of the layer, shared by the namespace
+        and the schema.
+
+        Returns
+        -------
+        etree.Element
+            Root element of the DescribeFeatureType response.
+
         """
         self._init_wfs()
-        return owsutil.get_namespace(self.__wfs, self._layer)
+        return metadata_registry.get(
+            owsutil.get_describefeaturetype_url(self.__wfs, self._layer),
+            owsutil.get_remote_describefeaturetype, self.__wfs, self._layer)
 
     def _get_remote_metadata(self):
         """Request and parse the remote metadata associated with the layer.
@@ -226,19 +436,51 @@ class AbstractSearch(AbstractCommon):
 
         """
         wfs_layer = self._get_layer()
-        return owsutil.get_remote_metadata(wfs_layer)
+        return metadata_registry.get(
+            tuple(i.get('url') for i in wfs_layer.metadataUrls),
+            owsutil.get_remote_metadata, wfs_layer)
 
     def _get_remote_xsd_schemas(self):
         """Request and parse the remote XSD schemas associated with this type.
 
+        Multiple schemas are requested concurrently, using the package wide
+        metadata executor.
+
         Returns
         -------
         list of etree.ElementTree
             List of parsed XSD schemas associated with this type.
 
         """
-        return [etree.fromstring(get_xsd_schema(i)) for i in
-                self._type.get_xsd_schemas()]
+        def get_schema(url):
+            return metadata_registry.get(url, _parse_xsd_schema, url)
+
+        urls = list(self._type.get_xsd_schemas())
+        if len([i for i in urls if i not in metadata_registry]) < 2:
+            return [get_schema(i) for i in urls]
+
+        futures = [pydov.metadata_executor.submit(get_schema, i)
+                   for i in urls]
+        return [f.result() for f in futures]
+
+    def _get_featurecatalogue(self):
+        """Request and parse the remote feature catalogue associated with
+        the layer.
+
+        Returns
+        -------
+        dict
+            Dictionary with fields described in the feature catalogue, as
+            returned by pydov.util.owsutil.get_remote_featurecatalogue.
+
+        """
+        md_metadata = self._get_remote_metadata()
+        csw_url = self._get_csw_base_url()
+        fc_uuid = owsutil.get_featurecatalogue_uuid(md_metadata)
+
+        return metadata_registry.get(
+            owsutil.get_featurecatalogue_url(csw_url, fc_uuid),
+            owsutil.get_remote_featurecatalogue, csw_url, fc_uuid)
 
     def _get_csw_base_url(self):
         """Get the CSW base url for the remote metadata associated with the
@@ -520,63 +762,165 @@ class AbstractSearch(AbstractCommon):
                     raise InvalidFieldError(
                         "Unknown return field: '{}'".format(rf))
 
+    def _validate_depth_parameters(self, depth_range, depth_step):
+        """Perform validation on the parameters limiting the depth of the
+        subtype records.
+
+        Parameters
+        ----------
+        depth_range : tuple of (float, float)
+            Minimum and maximum depth of the subtype records to return,
+            either can be None.
+        depth_step : float
+            Return only the first subtype record in every interval of this
+            depth.
+
+        Raises
+        ------
+        pydov.util.errors.InvalidSearchParameterError
+            When `depth_range` is not a tuple or list of two numbers (or
+            None) with the minimum not exceeding the maximum.
+
+            When `depth_step` is not a positive number.
+
+            When the type has no subtypes that can be filtered by depth, or
+            no subtypes with records at a single depth for `depth_step`.
+
+        """
+        if depth_range is None and depth_step is None:
+            return
+
+        if not any(st.depthfields is not None for st in self._type.subtypes):
+            raise InvalidSearchParameterError(
+                "Type '{}' has no subtypes that can be filtered by "
+                "depth.".format(self._type.__name__))
+
+        if depth_range is not None:
+            if type(depth_range) not in (list, tuple) or \
+                    len(depth_range) != 2 or not all(
+                        d is None or isinstance(d, (int, float))
+                        for d in depth_range):
+                raise InvalidSearchParameterError(
+                    'depth_range should be a tuple of two numbers (or None).')
+
+            if None not in depth_range and depth_range[0] > depth_range[1]:
+                raise InvalidSearchParameterError(
+                    'The minimum of depth_range should not exceed the '
+                    'maximum.')
+
+        if depth_step is not None:
+            if not isinstance(depth_step, (int, float)) or depth_step <= 0:
+                raise InvalidSearchParameterError(
+                    'depth_step should be a positive number.')
+
+            if not any(st.depthfields is not None and
+                       st.depthfields[0] == st.depthfields[1]
+                       for st in self._type.subtypes):
+                raise InvalidSearchParameterError(
+                    "Type '{}' has no subtypes with records at a single "
+                    "depth.".format(self._type.__name__))
+
     @staticmethod
-    def _get_remote_wfs_feature(wfs, typename, location, filter,
-                                sort_by, propertyname, max_features,
-                                geometry_column):
+    def _get_remote_wfs_feature(wfs, get_feature_request):
         """Perform the WFS GetFeature call to get features from the remote
         service.
 
         Parameters
         ----------
-        typename : str
-            Layername to query.
-        location : pydov.util.location.AbstractLocationFilter
-            Location filter limiting the features to retrieve.
-        filter : str of owslib.fes.FilterRequest
-            Filter request to search on attribute values.
-        sort_by : str of owslib.fes.SortBy, optional
-            List of properties to sort by.
-        propertyname : list<str>
-            List of properties to return.
-        max_features : int
-            Limit the maximum number of features to request.
-        geometry_column : str
-            Name of the geometry column to use in the spatial filter.
+        wfs : owslib.wfs.WebFeatureService
+            WFS service to query.
+        get_feature_request : etree.Element
+            XML element representing the WFS GetFeature request.
 
         Returns
         -------
-        wfs_response, wfs_getfeature_request : bytes, etree.Element
+        wfs_response : bytes or etree.Element
             Response of the WFS service.
 
         """
-        wfs_getfeature_xml = owsutil.wfs_build_getfeature_request(
-            version=wfs.version,
-            geometry_column=geometry_column,
-            typename=typename,
-            location=location,
-            filter=filter,
-            sort_by=sort_by,
-            max_features=max_features,
-            propertyname=propertyname
+        tree = HookRunner.execute_inject_wfs_getfeature_response(
+            get_feature_request)
+
+        if tree is not None:
+            return tree
+
+        return owsutil.wfs_get_feature(
+            baseurl=wfs.url,
+            get_feature_request=get_feature_request
         )
 
-        HookRunner.execute_wfs_search_init(typename)
+    @staticmethod
+    async def _get_remote_wfs_feature_async(wfs, get_feature_request,
+                                            session=None):
+        """Asynchronously perform the WFS GetFeature call to get features
+        from the remote service.
+
+        Parameters
+        ----------
+        wfs : owslib.wfs.WebFeatureService
+            WFS service to query.
+        get_feature_request : etree.Element
+            XML element representing the WFS GetFeature request.
+        session : aiohttp.ClientSession, optional
+            Session to use for the request, as returned by
+            pydov.util.dovutil.create_async_session.
+
+        Returns
+        -------
+        wfs_response : bytes or etree.Element
+            Response of the WFS service.
 
+        """
         tree = HookRunner.execute_inject_wfs_getfeature_response(
-            wfs_getfeature_xml)
+            get_feature_request)
 
         if tree is not None:
-            return tree, wfs_getfeature_xml
+            return tree
 
-        return owsutil.wfs_get_feature(
+        return await owsutil.wfs_get_feature_async(
             baseurl=wfs.url,
-            get_feature_request=wfs_getfeature_xml
-        ), wfs_getfeature_xml
+            get_feature_request=get_feature_request,
+            session=session
+        )
 
-    def _search(self, location=None, query=None, return_fields=None,
-                sort_by=None, max_features=None, extra_wfs_fields=[]):
-        """Perform the WFS search by issuing a GetFeature request.
+    @staticmethod
+    def _get_remote_wfs_feature_stream(wfs, get_feature_request):
+        """Perform the WFS GetFeature call to get features from the remote
+        service, returning the response as a stream.
+
+        Parameters
+        ----------
+        wfs : owslib.wfs.WebFeatureService
+            WFS service to query.
+        get_feature_request : etree.Element
+            XML element representing the WFS GetFeature request.
+
+        Returns
+        -------
+        file-like object
+            Binary file-like object to read the response of the WFS service
+            from. Should be closed after use.
+
+        """
+        tree = HookRunner.execute_inject_wfs_getfeature_response(
+            get_feature_request)
+
+        if tree is not None:
+            if not isinstance(tree, (str, bytes)):
+                tree = etree.tostring(tree)
+            elif isinstance(tree, str):
+                tree = tree.encode('utf-8')
+            return io.BytesIO(tree)
+
+        return owsutil.wfs_get_feature_stream(
+            baseurl=wfs.url,
+            get_feature_request=get_feature_request
+        )
+
+    def _prepare_search(self, location=None, query=None, return_fields=None,
+                        sort_by=None, max_features=None, extra_wfs_fields=[]):
+        """Validate the search parameters and build the WFS GetFeature
+        request.
 
         Parameters
         ----------
@@ -602,9 +946,10 @@ class AbstractSearch(AbstractCommon):
 
         Returns
         -------
-        etree.Element
-            XML tree of the WFS response containing the features matching
-            the location or the query.
+        etree.Element or None
+            XML element representing the WFS GetFeature request, or None
+            when the query is split into multiple requests (see
+            `_split_query`), which are built by `_plan_search` instead.
 
         Raises
         ------
@@ -620,16 +965,75 @@ class AbstractSearch(AbstractCommon):
             When a field that can only be used as a query parameter is used as
             a return field.
 
-        pydov.util.errors.FeatureOverflowError
-            When the number of features to be returned is equal to the
-            maxFeatures limit of the WFS server.
-
         """
         self._pre_search_validation(location, query, sort_by, return_fields,
                                     max_features)
         self._init_namespace()
         self._init_wfs()
 
+        HookRunner.execute_wfs_search_init(self._layer)
+
+        if sort_by is None and self._split_query(query) is not None:
+            return None
+
+        return self._build_search_request(
+            location=location, query=query, return_fields=return_fields,
+            sort_by=sort_by, max_features=max_features,
+            extra_wfs_fields=extra_wfs_fields)
+
+    def _extend_query(self, query):
+        """Extend the query of a search with the filters specific to this
+        search class.
+
+        This is applied to every WFS GetFeature request of a search,
+        including the requests of the chunks of a split query and of the
+        tiles of a location. By default, the query is returned as is.
+
+        Parameters
+        ----------
+        query : owslib.fes.OgcExpression
+            OGC filter expression to use for searching, or None.
+
+        Returns
+        -------
+        owslib.fes.OgcExpression
+            OGC filter expression to use in the WFS GetFeature request, or
+            None.
+
+        """
+        return query
+
+    def _build_search_request(self, location=None, query=None,
+                              return_fields=None, sort_by=None,
+                              max_features=None, extra_wfs_fields=[]):
+        """Build the WFS GetFeature request of a search with validated
+        search parameters.
+
+        Parameters
+        ----------
+        location : pydov.util.location.AbstractLocationFilter
+            Location filter limiting the features to retrieve.
+        query : owslib.fes.OgcExpression
+            OGC filter expression to use for searching.
+        return_fields : list<str>
+            A list of fields to be returned in the output data.
+        sort_by : owslib.fes.SortBy, optional
+            List of properties to sort by.
+        max_features : int
+            Limit the maximum number of features to request.
+        extra_wfs_fields: list<str>
+            A list of extra fields to be included in the WFS requests,
+            regardless whether they're needed as return field. Optional,
+            defaults to an empty list.
+
+        Returns
+        -------
+        etree.Element
+            XML element representing the WFS GetFeature request.
+
+        """
+        query = self._extend_query(query)
+
         filter_request = None
         if query is not None:
             filter_request = FilterRequest()
@@ -668,16 +1072,42 @@ class AbstractSearch(AbstractCommon):
 
             sort_by = etree.tostring(sort_by_xml, encoding='unicode')
 
-        fts, getfeature = self._get_remote_wfs_feature(
-            wfs=self.__wfs,
+        wfs_getfeature_xml = owsutil.wfs_build_getfeature_request(
+            version=self.__wfs.version,
+            geometry_column=self._geometry_column,
             typename=self._layer,
             location=location,
             filter=filter_request,
             sort_by=sort_by,
             max_features=max_features,
-            propertyname=wfs_property_names,
-            geometry_column=self._geometry_column)
+            propertyname=wfs_property_names
+        )
+
+        return wfs_getfeature_xml
+
+    @staticmethod
+    def _parse_search_result(fts, get_feature_request):
+        """Parse and validate the response of a WFS GetFeature request.
 
+        Parameters
+        ----------
+        fts : bytes or etree.Element
+            Response of the WFS service.
+        get_feature_request : etree.Element
+            XML element representing the WFS GetFeature request.
+
+        Returns
+        -------
+        etree.Element
+            XML tree of the WFS response.
+
+        Raises
+        ------
+        pydov.util.errors.WfsGetFeatureError
+            When the response of the WFS service is not a valid GetFeature
+            response.
+
+        """
         tree = etree.fromstring(fts)
 
         if tree.get('numberOfFeatures') is None:
@@ -685,36 +1115,1108 @@ class AbstractSearch(AbstractCommon):
                 'Error retrieving features from DOV WFS server:\n{}'.format(
                     etree.tostring(tree).decode('utf8')))
 
-        if int(tree.get('numberOfFeatures')) == 10000:
-            raise FeatureOverflowError(
-                'Reached the limit of {:d} returned features. Please split up '
-                'the query to ensure getting all results.'.format(10000))
-
-        HookRunner.execute_wfs_search_result(int(tree.get('numberOfFeatures')))
-        HookRunner.execute_wfs_search_result_received(getfeature, tree)
-
         return tree
 
-    def get_description(self):
-        """Get the description of this search layer.
+    def _is_truncated(self, tree, max_features):
+        """Check whether the response of the WFS GetFeature request was
+        truncated by the server, and the remaining features should be
+        requested using multiple requests.
+
+        Parameters
+        ----------
+        tree : etree.Element
+            XML tree of the WFS response.
+        max_features : int
+            Limit the maximum number of features to request.
 
         Returns
         -------
-        str
-            The description of this layer.
+        bool
+            True if the number of features in the response equals the
+            maximum number of features per request of the WFS server and
+            more features were requested, False otherwise.
 
         """
-        wfs_layer = self._get_layer()
-        return wfs_layer.abstract
+        number_of_features = int(tree.get('numberOfFeatures'))
+        return number_of_features == self._max_features_per_request and (
+            max_features is None or max_features > number_of_features)
 
-    def get_fields(self):
-        """Get the metadata of the fields that are available.
+    def _get_pkey_field(self):
+        """Get the WFS field containing the primary key of the features.
 
         Returns
         -------
-        fields : dict<str,dict>
-            Dictionary containing the metadata of the available fields,
-            where the metadata dictionary includes:
+        str
+            Name of the WFS field containing the primary key, or None when
+            the type has no primary key field.
+
+        """
+        pkey_fields = [f['sourcefield'] for f in self._type.get_fields(
+            source=('wfs',)).values() if f['name'].startswith('pkey')]
+        if len(pkey_fields) > 0:
+            return pkey_fields[0]
+
+    def _get_number_of_hits(self, hits, get_feature_request):
+        """Get the number of features from the response of a WFS GetFeature
+        request with resultType 'hits'.
+
+        Parameters
+        ----------
+        hits : bytes or etree.Element
+            Response of the WFS service.
+        get_feature_request : etree.Element
+            XML element representing the WFS GetFeature request.
+
+        Returns
+        -------
+        int
+            Number of features matching the request.
+
+        """
+        return int(self._parse_search_result(
+            hits, get_feature_request).get('numberOfFeatures'))
+
+    def _get_page_requests(self, get_feature_request, number_of_features):
+        """Build the WFS GetFeature requests for all the pages of features
+        matching the request.
+
+        Parameters
+        ----------
+        get_feature_request : etree.Element
+            XML element representing the WFS GetFeature request.
+        number_of_features : int
+            Number of features to request.
+
+        Returns
+        -------
+        list of etree.Element
+            XML elements representing the WFS GetFeature requests of the
+            pages, in order.
+
+        Raises
+        ------
+        pydov.util.errors.FeatureOverflowError
+            When the features cannot be sorted on a primary key field.
+
+        """
+        pkey_field = self._get_pkey_field()
+        if pkey_field is None:
+            raise FeatureOverflowError(
+                'Reached the limit of {:d} returned features. Please split up '
+                'the query to ensure getting all results.'.format(
+                    self._max_features_per_request))
+
+        return [owsutil.wfs_build_getfeature_page_request(
+            get_feature_request, start_index=i,
+            max_features=min(self._max_features_per_request,
+                             number_of_features - i),
+            sort_property=pkey_field)
+            for i in range(0, number_of_features,
+                           self._max_features_per_request)]
+
+    @staticmethod
+    def _can_tile(location, sort_by, max_features):
+        """Check whether the features of a search can be requested by
+        splitting the location into tiles.
+
+        Parameters
+        ----------
+        location : pydov.util.location.AbstractLocationFilter
+            Location filter limiting the features to retrieve.
+        sort_by : owslib.fes.SortBy, optional
+            List of properties to sort by.
+        max_features : int
+            Limit the maximum number of features to request.
+
+        Returns
+        -------
+        bool
+            True if the location is a Within filter of a Box, and the
+            features need not be sorted or limited, False otherwise.
+
+        """
+        return isinstance(location, Within) and \
+            isinstance(location.location, Box) and \
+            sort_by is None and max_features is None
+
+    @staticmethod
+    def _get_tile_location(location, tile):
+        """Get the location filter limiting the features of a search to a
+        single tile.
+
+        Features on the boundary of two tiles match both tiles, features on
+        the boundary of the original location match neither.
+
+        Parameters
+        ----------
+        location : pydov.util.location.Within
+            Within filter of a Box, limiting the features of the search.
+        tile : pydov.util.location.Box
+            Box of the tile.
+
+        Returns
+        -------
+        owslib.fes.And
+            Location filter limiting the features to the tile.
+
+        """
+        box = location.location
+        return And([Within(Box(box.minx, box.miny, box.maxx, box.maxy,
+                               box.epsg)),
+                    Intersects(tile)])
+
+    def _plan_tile_requests(self, location, query, return_fields,
+                            extra_wfs_fields):
+        """Plan the WFS GetFeature requests of a search by recursively
+        splitting the location into quadrants, until the number of features
+        of each tile is below the maximum number of features per request.
+
+        This is a generator yielding lists of WFS GetFeature requests with
+        resultType 'hits', to be sent the list of responses.
+
+        Parameters
+        ----------
+        location : pydov.util.location.Within
+            Within filter of a Box, limiting the features of the search.
+        query : owslib.fes.OgcExpression
+            OGC filter expression to use for searching.
+        return_fields : list<str>
+            A list of fields to be returned in the output data.
+        extra_wfs_fields: list<str>
+            A list of extra fields to be included in the WFS requests.
+
+        Returns
+        -------
+        list of etree.Element
+            XML elements representing the WFS GetFeature requests of the
+            tiles. Tiles still exceeding the maximum number of features per
+            request at the maximum depth are requested page by page.
+
+        """
+        requests = []
+        tiles = location.location.split()
+        depth = 1
+
+        while len(tiles) > 0:
+            tile_requests = [self._build_search_request(
+                location=self._get_tile_location(location, tile),
+                query=query, return_fields=return_fields,
+                extra_wfs_fields=extra_wfs_fields) for tile in tiles]
+
+            hits = yield [owsutil.wfs_build_getfeature_hits_request(r)
+                          for r in tile_requests]
+
+            next_tiles = []
+            for tile, request, response in zip(tiles, tile_requests, hits):
+                number_of_features = self._get_number_of_hits(
+                    response, request)
+                if number_of_features > self._max_features_per_request:
+                    if depth < self._max_tile_depth:
+                        next_tiles.extend(tile.split())
+                    else:
+                        requests.extend(self._get_page_requests(
+                            request, number_of_features))
+                elif number_of_features > 0:
+                    requests.append(request)
+
+            tiles = next_tiles
+            depth += 1
+
+        return requests
+
+    def _get_first_page_request(self, get_feature_request, location,
+                                sort_by, max_features):
+        """Get the WFS GetFeature request to send first for a search.
+
+        When the response can be truncated and the remaining features would
+        be requested page by page, the features are sorted on the primary
+        key, like the pages (see `_get_page_requests`). A truncated response
+        can then be used as the first page instead of being requested again.
+
+        Parameters
+        ----------
+        get_feature_request : etree.Element
+            XML element representing the WFS GetFeature request.
+        location : pydov.util.location.AbstractLocationFilter
+            Location filter limiting the features to retrieve.
+        sort_by : owslib.fes.SortBy, optional
+            List of properties to sort by.
+        max_features : int
+            Limit the maximum number of features to request.
+
+        Returns
+        -------
+        etree.Element
+            XML element representing the WFS GetFeature request to send.
+
+        """
+        pkey_field = self._get_pkey_field()
+        if pkey_field is None or self._can_tile(
+                location, sort_by, max_features) or (
+                max_features is not None and
+                max_features <= self._max_features_per_request):
+            return get_feature_request
+
+        return owsutil.wfs_build_getfeature_sorted_request(
+            get_feature_request, pkey_field)
+
+    def _plan_remaining_requests(self, get_feature_request, location, query,
+                                 return_fields, sort_by, max_features,
+                                 extra_wfs_fields):
+        """Plan the WFS GetFeature requests to retrieve all the features of
+        a search, after the response of its first request (see
+        `_get_first_page_request`) was truncated.
+
+        Searches within a box are split into tiles (see
+        `_plan_tile_requests`), other searches are requested page by page,
+        reusing the truncated response as the first page.
+
+        This is a generator yielding lists of WFS GetFeature requests with
+        resultType 'hits', to be sent the list of responses.
+
+        Parameters
+        ----------
+        get_feature_request : etree.Element
+            XML element representing the first WFS GetFeature request.
+        location : pydov.util.location.AbstractLocationFilter
+            Location filter limiting the features to retrieve.
+        query : owslib.fes.OgcExpression
+            OGC filter expression to use for searching.
+        return_fields : list<str>
+            A list of fields to be returned in the output data.
+        sort_by : owslib.fes.SortBy, optional
+            List of properties to sort by.
+        max_features : int
+            Limit the maximum number of features to request.
+        extra_wfs_fields: list<str>
+            A list of extra fields to be included in the WFS requests.
+
+        Returns
+        -------
+        requests : list of etree.Element
+            XML elements representing the remaining WFS GetFeature requests,
+            in order.
+        reuse_first : bool
+            Whether the truncated response of the first request is the
+            first page of the features, to be combined with the responses
+            of the remaining requests.
+        pkey_field : str or None
+            Name of the WFS field containing the primary key, when the
+            responses can have features in common (see
+            `_merge_search_results`), None otherwise.
+
+        """
+        if self._can_tile(location, sort_by, max_features):
+            requests = yield from self._plan_tile_requests(
+                location, query, return_fields, extra_wfs_fields)
+            return requests, False, self._get_pkey_field()
+
+        hits = yield [owsutil.wfs_build_getfeature_hits_request(
+            get_feature_request)]
+        number_of_features = self._get_number_of_hits(
+            hits[0], get_feature_request)
+        if max_features is not None:
+            number_of_features = min(number_of_features, max_features)
+
+        requests = self._get_page_requests(
+            get_feature_request, number_of_features)
+        return requests[1:], True, None
+
+    def _plan_requests(self, get_feature_request, tree, location, query,
+                       return_fields, sort_by, max_features,
+                       extra_wfs_fields):
+        """Plan and perform the WFS GetFeature requests to retrieve all the
+        features of a search exceeding the maximum number of features per
+        request (see `_plan_remaining_requests`).
+
+        This is a generator yielding lists of WFS GetFeature requests, to be
+        sent the list of responses. Use `_run_requests` or
+        `_run_requests_async` to perform the requests.
+
+        Parameters
+        ----------
+        get_feature_request : etree.Element
+            XML element representing the first WFS GetFeature request.
+        tree : etree.Element
+            XML tree of the truncated response of the first request.
+        location : pydov.util.location.AbstractLocationFilter
+            Location filter limiting the features to retrieve.
+        query : owslib.fes.OgcExpression
+            OGC filter expression to use for searching.
+        return_fields : list<str>
+            A list of fields to be returned in the output data.
+        sort_by : owslib.fes.SortBy, optional
+            List of properties to sort by.
+        max_features : int
+            Limit the maximum number of features to request.
+        extra_wfs_fields: list<str>
+            A list of extra fields to be included in the WFS requests.
+
+        Returns
+        -------
+        etree.Element
+            XML tree of the WFS response containing all the features.
+
+        """
+        requests, reuse_first, pkey_field = \
+            yield from self._plan_remaining_requests(
+                get_feature_request, location, query, return_fields,
+                sort_by, max_features, extra_wfs_fields)
+
+        trees = []
+        if reuse_first:
+            trees.append(tree)
+            HookRunner.execute_wfs_search_result_received(
+                get_feature_request, tree)
+
+        responses = yield requests
+
+        for request, response in zip(requests, responses):
+            trees.append(self._parse_search_result(response, request))
+            HookRunner.execute_wfs_search_result_received(request, trees[-1])
+
+        return self._merge_search_results(trees, pkey_field)
+
+    def _plan_search(self, get_feature_request, location, query,
+                     return_fields, sort_by, max_features, extra_wfs_fields):
+        """Plan and perform the WFS GetFeature requests of a search.
+
+        Queries containing a PropertyInList with more values than its
+        chunksize are split into multiple queries (see `_split_query`),
+        unless the features should be sorted.
+
+        This is a generator yielding lists of WFS GetFeature requests, to be
+        sent the list of responses. Use `_run_requests` or
+        `_run_requests_async` to perform the requests.
+
+        Parameters
+        ----------
+        get_feature_request : etree.Element or None
+            XML element representing the WFS GetFeature request, as returned
+            by `_prepare_search`. None when the query is split.
+        location : pydov.util.location.AbstractLocationFilter
+            Location filter limiting the features to retrieve.
+        query : owslib.fes.OgcExpression
+            OGC filter expression to use for searching.
+        return_fields : list<str>
+            A list of fields to be returned in the output data.
+        sort_by : owslib.fes.SortBy, optional
+            List of properties to sort by.
+        max_features : int
+            Limit the maximum number of features to request.
+        extra_wfs_fields: list<str>
+            A list of extra fields to be included in the WFS requests.
+
+        Returns
+        -------
+        etree.Element
+            XML tree of the WFS response containing all the features.
+
+        """
+        queries = self._split_query(query) if sort_by is None else None
+        if queries is None:
+            tree = yield from self._plan_request(
+                get_feature_request, location, query, return_fields,
+                sort_by, max_features, extra_wfs_fields)
+            return tree
+
+        trees = yield from self._plan_parallel([self._plan_request(
+            self._build_search_request(
+                location=location, query=q, return_fields=return_fields,
+                max_features=max_features,
+                extra_wfs_fields=extra_wfs_fields),
+            location, q, return_fields, None, max_features,
+            extra_wfs_fields) for q in queries])
+
+        tree = self._merge_search_results(trees, self._get_pkey_field())
+
+        if max_features is not None:
+            feature_members = tree.find('.//{http://www.opengis.net/gml}'
+                                        'featureMembers')
+            for ft in list(feature_members)[max_features:]:
+                feature_members.remove(ft)
+            tree.set('numberOfFeatures', str(len(feature_members)))
+
+        return tree
+
+    def _plan_request(self, get_feature_request, location, query,
+                      return_fields, sort_by, max_features,
+                      extra_wfs_fields):
+        """Plan and perform a single WFS GetFeature request, followed by
+        the requests needed to retrieve the remaining features when the
+        response is truncated (see `_plan_requests`).
+
+        This is a generator yielding lists of WFS GetFeature requests, to be
+        sent the list of responses.
+
+        Parameters
+        ----------
+        get_feature_request : etree.Element
+            XML element representing the WFS GetFeature request.
+        location : pydov.util.location.AbstractLocationFilter
+            Location filter limiting the features to retrieve.
+        query : owslib.fes.OgcExpression
+            OGC filter expression to use for searching.
+        return_fields : list<str>
+            A list of fields to be returned in the output data.
+        sort_by : owslib.fes.SortBy, optional
+            List of properties to sort by.
+        max_features : int
+            Limit the maximum number of features to request.
+        extra_wfs_fields: list<str>
+            A list of extra fields to be included in the WFS requests.
+
+        Returns
+        -------
+        etree.Element
+            XML tree of the WFS response containing all the features.
+
+        """
+        get_feature_request = self._get_first_page_request(
+            get_feature_request, location, sort_by, max_features)
+
+        responses = yield [get_feature_request]
+        tree = self._parse_search_result(responses[0], get_feature_request)
+
+        if not self._is_truncated(tree, max_features):
+            HookRunner.execute_wfs_search_result_received(
+                get_feature_request, tree)
+            return tree
+
+        tree = yield from self._plan_requests(
+            get_feature_request, tree, location, query, return_fields,
+            sort_by, max_features, extra_wfs_fields)
+        return tree
+
+    @staticmethod
+    def _plan_parallel(plans):
+        """Combine multiple generators planning WFS GetFeature requests,
+        like `_plan_request`, so their requests are performed in parallel.
+
+        This is a generator yielding lists of WFS GetFeature requests, to be
+        sent the list of responses.
+
+        Parameters
+        ----------
+        plans : list of generator
+            Generators yielding lists of WFS GetFeature requests, and
+            receiving the list of responses.
+
+        Returns
+        -------
+        list
+            The return values of the generators, in order.
+
+        """
+        results = [None] * len(plans)
+        responses = [None] * len(plans)
+        active = list(range(len(plans)))
+
+        while len(active) > 0:
+            batches = {}
+            for i in active:
+                try:
+                    batches[i] = plans[i].send(responses[i])
+                except StopIteration as e:
+                    results[i] = e.value
+
+            active = [i for i in active if i in batches]
+            if len(active) == 0:
+                break
+
+            combined = yield [r for i in active for r in batches[i]]
+
+            offset = 0
+            for i in active:
+                responses[i] = combined[offset:offset + len(batches[i])]
+                offset += len(batches[i])
+
+        return results
+
+    @staticmethod
+    def _split_query(query):
+        """Split a query containing a PropertyInList with more values than
+        its chunksize into multiple queries.
+
+        The PropertyInList can either be the query itself or (recursively)
+        be part of an And expression.
+
+        Parameters
+        ----------
+        query : owslib.fes.OgcExpression
+            OGC filter expression to use for searching.
+
+        Returns
+        -------
+        list of owslib.fes.OgcExpression
+            List of queries together matching the same features as the
+            query, or None if the query cannot be split.
+
+        """
+        if isinstance(query, PropertyInList):
+            chunks = query.split()
+            if len(chunks) > 1:
+                return chunks
+        elif isinstance(query, And):
+            for i, operation in enumerate(query.operations):
+                chunks = AbstractSearch._split_query(operation)
+                if chunks is not None:
+                    return [And(query.operations[:i] + [c] +
+                                query.operations[i + 1:]) for c in chunks]
+
+    def _run_requests(self, requests):
+        """Perform the WFS GetFeature requests planned by a generator, like
+        `_plan_requests`, using the package wide WFS executor
+        (`pydov.wfs_executor`).
+
+        Single requests are performed in the calling thread.
+
+        Parameters
+        ----------
+        requests : generator
+            Generator yielding lists of WFS GetFeature requests to perform
+            in parallel, and receiving the list of responses.
+
+        Returns
+        -------
+        object
+            The return value of the generator.
+
+        """
+        responses = None
+        while True:
+            try:
+                batch = requests.send(responses)
+            except StopIteration as e:
+                return e.value
+
+            if len(batch) == 1:
+                responses = [self._get_remote_wfs_feature(
+                    self.__wfs, batch[0])]
+            else:
+                responses = self._get_remote_wfs_features(batch)
+
+    def _get_remote_wfs_features(self, requests):
+        """Perform multiple WFS GetFeature requests in parallel, using the
+        package wide WFS executor.
+
+        At most as many requests as the executor has workers are submitted
+        at once, the next request being submitted when one finishes. Large
+        batches (f.ex. the chunks of a long Join) therefore never flood the
+        queue of the executor.
+
+        Parameters
+        ----------
+        requests : list of etree.Element
+            XML elements representing the WFS GetFeature requests.
+
+        Returns
+        -------
+        list of bytes
+            Responses of the WFS service, in the order of the requests.
+
+        """
+        executor = pydov.wfs_executor
+        limit = max(1, getattr(executor, 'workers', 4))
+
+        responses = [None] * len(requests)
+        remaining = iter(enumerate(requests))
+        pending = {}
+
+        def submit_next():
+            for i, request in remaining:
+                pending[executor.submit(self._get_remote_wfs_feature,
+                                        self.__wfs, request)] = i
+                return
+
+        try:
+            for i in range(limit):
+                submit_next()
+
+            while len(pending) > 0:
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    responses[pending.pop(future)] = future.result()
+                    submit_next()
+        finally:
+            for future in pending:
+                future.cancel()
+
+        return responses
+
+    def _iter_remote_wfs_features(self, requests):
+        """Perform multiple WFS GetFeature requests in parallel, using the
+        package wide WFS executor, yielding the responses in order.
+
+        At most as many requests as the executor has workers are in flight
+        or waiting to be consumed at once, so the number of responses kept
+        in memory is bounded as well.
+
+        Parameters
+        ----------
+        requests : list of etree.Element
+            XML elements representing the WFS GetFeature requests.
+
+        Yields
+        ------
+        bytes
+            Responses of the WFS service, in the order of the requests.
+
+        """
+        executor = pydov.wfs_executor
+        limit = max(1, getattr(executor, 'workers', 4))
+
+        remaining = iter(requests)
+        pending = collections.deque()
+
+        def submit_next():
+            for request in remaining:
+                pending.append(executor.submit(
+                    self._get_remote_wfs_feature, self.__wfs, request))
+                return
+
+        try:
+            for i in range(limit):
+                submit_next()
+
+            while len(pending) > 0:
+                response = pending.popleft().result()
+                submit_next()
+                yield response
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _iter_search_features(self, features, requests, pkey_field):
+        """Iterate over the features of a search exceeding the maximum
+        number of features per request, parsing the responses of the
+        remaining requests one by one as they arrive.
+
+        The wfs_search_result hook is called after the last feature.
+
+        Parameters
+        ----------
+        features : iterable of etree.Element
+            Features of the truncated response of the first request, when it
+            is the first page of the features (see
+            `_plan_remaining_requests`), or an empty list otherwise.
+        requests : list of etree.Element
+            XML elements representing the remaining WFS GetFeature requests,
+            in order.
+        pkey_field : str or None
+            Name of the WFS field containing the primary key, when the
+            responses can have features in common, None otherwise.
+
+        Yields
+        ------
+        etree.Element
+            Elements of the features, each feature once.
+
+        Raises
+        ------
+        pydov.util.errors.FeatureOverflowError
+            When the responses contain the same feature more than once,
+            f.ex. when the WFS server does not support paging, and no
+            `pkey_field` is given.
+
+        """
+        if pkey_field is not None:
+            key_tag = '{{{}}}{}'.format(self._wfs_namespace, pkey_field)
+
+        def get_key(ft):
+            if pkey_field is not None:
+                return ft.findtext(key_tag)
+            return ft.get('{http://www.opengis.net/gml}id')
+
+        def iter_responses():
+            for ft in features:
+                yield ft
+            for request, response in zip(
+                    requests, self._iter_remote_wfs_features(requests)):
+                members = self._parse_search_result(response, request).find(
+                    './/{http://www.opengis.net/gml}featureMembers')
+                if members is not None:
+                    for ft in list(members):
+                        yield ft
+
+        keys = set()
+        number_of_features = 0
+        for ft in iter_responses():
+            key = get_key(ft)
+            if key is not None:
+                if key in keys:
+                    if pkey_field is not None:
+                        continue
+                    raise FeatureOverflowError(
+                        'Failed to page through the results of the WFS '
+                        'server. Please split up the query to ensure '
+                        'getting all results.')
+                keys.add(key)
+
+            number_of_features += 1
+            yield ft
+
+        HookRunner.execute_wfs_search_result(number_of_features)
+
+    async def _run_requests_async(self, requests, session=None):
+        """Asynchronously perform the WFS GetFeature requests planned by a
+        generator, like `_plan_requests`.
+
+        Parameters
+        ----------
+        requests : generator
+            Generator yielding lists of WFS GetFeature requests to perform
+            concurrently, and receiving the list of responses.
+        session : aiohttp.ClientSession, optional
+            Session to use for the requests, as returned by
+            pydov.util.dovutil.create_async_session.
+
+        Returns
+        -------
+        object
+            The return value of the generator.
+
+        """
+        responses = None
+        while True:
+            try:
+                batch = requests.send(responses)
+            except StopIteration as e:
+                return e.value
+
+            responses = await asyncio.gather(*[
+                self._get_remote_wfs_feature_async(self.__wfs, r, session)
+                for r in batch])
+
+    def _merge_search_results(self, trees, pkey_field=None):
+        """Merge the parsed responses of multiple WFS GetFeature requests.
+
+        Parameters
+        ----------
+        trees : list of etree.Element
+            XML trees of the WFS responses, in order.
+        pkey_field : str, optional
+            Name of the WFS field containing the primary key of the
+            features. When given, features occurring in multiple responses
+            are kept only once. Defaults to None, in which case the
+            responses should not have any features in common.
+
+        Returns
+        -------
+        etree.Element
+            XML tree of the WFS response containing the features of all
+            responses.
+
+        Raises
+        ------
+        pydov.util.errors.FeatureOverflowError
+            When the responses contain the same feature more than once,
+            f.ex. when the WFS server does not support paging, and no
+            `pkey_field` is given.
+
+        """
+        features = []
+        for tree in trees:
+            members = tree.find('.//{http://www.opengis.net/gml}'
+                                'featureMembers')
+            if members is not None:
+                features.extend(list(members))
+
+        if pkey_field is not None:
+            pkey_tag = '{{{}}}{}'.format(self._wfs_namespace, pkey_field)
+            pkeys = set()
+            unique_features = []
+            for ft in features:
+                pkey = ft.findtext(pkey_tag)
+                if pkey is None or pkey not in pkeys:
+                    pkeys.add(pkey)
+                    unique_features.append(ft)
+            features = unique_features
+        else:
+            gml_ids = [ft.get('{http://www.opengis.net/gml}id') for ft in
+                       features if ft.get(
+                           '{http://www.opengis.net/gml}id') is not None]
+            if len(set(gml_ids)) < len(gml_ids):
+                raise FeatureOverflowError(
+                    'Failed to page through the results of the WFS server. '
+                    'Please split up the query to ensure getting all '
+                    'results.')
+
+        tree = trees[0]
+        feature_members = tree.find('.//{http://www.opengis.net/gml}'
+                                    'featureMembers')
+        if feature_members is None:
+            feature_members = etree.SubElement(
+                tree, '{http://www.opengis.net/gml}featureMembers')
+
+        for ft in list(feature_members):
+            feature_members.remove(ft)
+        feature_members.extend(features)
+
+        tree.set('numberOfFeatures', str(len(features)))
+        return tree
+
+    def _search(self, location=None, query=None, return_fields=None,
+                sort_by=None, max_features=None, extra_wfs_fields=[]):
+        """Perform the WFS search by issuing a GetFeature request.
+
+        Parameters
+        ----------
+        location : pydov.util.location.AbstractLocationFilter
+            Location filter limiting the features to retrieve.
+        query : owslib.fes.OgcExpression
+            OGC filter expression to use for searching. This can contain any
+            combination of filter elements defined in owslib.fes. The query
+            should use the fields provided in `get_fields()`. Note that not
+            all fields are currently supported as a search parameter.
+        return_fields : list<str>
+            A list of fields to be returned in the output data. This should
+            be a subset of the fields provided in `get_fields()`. Note that
+            not all fields are currently supported as return fields.
+        sort_by : owslib.fes.SortBy, optional
+            List of properties to sort by.
+        max_features : int
+            Limit the maximum number of features to request.
+        extra_wfs_fields: list<str>
+            A list of extra fields to be included in the WFS requests,
+            regardless whether they're needed as return field. Optional,
+            defaults to an empty list.
+
+        Returns
+        -------
+        etree.Element
+            XML tree of the WFS response containing the features matching
+            the location or the query.
+
+        Raises
+        ------
+        pydov.util.errors.InvalidSearchParameterError
+            When not one of `location`, `query` or `max_features` is provided.
+
+        pydov.util.errors.InvalidFieldError
+            When at least one of the fields in `return_fields` is unknown.
+
+            When a field that is only accessible as return field is used as
+            a query parameter.
+
+            When a field that can only be used as a query parameter is used as
+            a return field.
+
+        pydov.util.errors.FeatureOverflowError
+            When the features exceeding the maxFeatures limit of the WFS
+            server could not be retrieved by paging through the results.
+
+        """
+        getfeature = self._prepare_search(
+            location=location, query=query, return_fields=return_fields,
+            sort_by=sort_by, max_features=max_features,
+            extra_wfs_fields=extra_wfs_fields)
+
+        tree = self._run_requests(self._plan_search(
+            getfeature, location, query, return_fields, sort_by,
+            max_features, extra_wfs_fields))
+
+        HookRunner.execute_wfs_search_result(
+            int(tree.get('numberOfFeatures')))
+        return tree
+
+    async def _search_async(self, location=None, query=None,
+                            return_fields=None, sort_by=None,
+                            max_features=None, extra_wfs_fields=[],
+                            session=None):
+        """Asynchronously perform the WFS search by issuing a GetFeature
+        request.
+
+        Validating the search parameters can involve (blocking) metadata
+        requests and is therefore executed using the package wide executor.
+
+        Parameters
+        ----------
+        location : pydov.util.location.AbstractLocationFilter
+            Location filter limiting the features to retrieve.
+        query : owslib.fes.OgcExpression
+            OGC filter expression to use for searching.
+        return_fields : list<str>
+            A list of fields to be returned in the output data.
+        sort_by : owslib.fes.SortBy, optional
+            List of properties to sort by.
+        max_features : int
+            Limit the maximum number of features to request.
+        extra_wfs_fields: list<str>
+            A list of extra fields to be included in the WFS requests,
+            regardless whether they're needed as return field. Optional,
+            defaults to an empty list.
+        session : aiohttp.ClientSession, optional
+            Session to use for the request, as returned by
+            pydov.util.dovutil.create_async_session.
+
+        Returns
+        -------
+        etree.Element
+            XML tree of the WFS response containing the features matching
+            the location or the query.
+
+        Raises
+        ------
+        pydov.util.errors.InvalidSearchParameterError
+            When not one of `location`, `query` or `max_features` is provided.
+
+        pydov.util.errors.InvalidFieldError
+            When at least one of the fields in `return_fields` is unknown.
+
+        pydov.util.errors.FeatureOverflowError
+            When the features exceeding the maxFeatures limit of the WFS
+            server could not be retrieved by paging through the results.
+
+        """
+        loop = asyncio.get_event_loop()
+        getfeature = await loop.run_in_executor(
+            pydov.executor, functools.partial(
+                self._prepare_search, location=location, query=query,
+                return_fields=return_fields, sort_by=sort_by,
+                max_features=max_features, extra_wfs_fields=extra_wfs_fields))
+
+        tree = await self._run_requests_async(self._plan_search(
+            getfeature, location, query, return_fields, sort_by,
+            max_features, extra_wfs_fields), session)
+
+        HookRunner.execute_wfs_search_result(
+            int(tree.get('numberOfFeatures')))
+        return tree
+
+    def _search_stream(self, location=None, query=None, return_fields=None,
+                       sort_by=None, max_features=None, extra_wfs_fields=[]):
+        """Perform the WFS search by issuing a GetFeature request, parsing
+        the response incrementally while it is being received.
+
+        Features are discarded after they have been processed, instead of
+        keeping the complete response in memory. When the response is
+        truncated, the remaining pages or tiles are requested in parallel
+        and parsed one by one as they arrive (see `_iter_search_features`).
+        The complete response is parsed in memory nonetheless (see
+        `_search`) when the query is split into multiple requests, or when
+        a registered hook implements the `wfs_search_result_received` hook.
+
+        Parameters
+        ----------
+        location : pydov.util.location.AbstractLocationFilter
+            Location filter limiting the features to retrieve.
+        query : owslib.fes.OgcExpression
+            OGC filter expression to use for searching.
+        return_fields : list<str>
+            A list of fields to be returned in the output data.
+        sort_by : owslib.fes.SortBy, optional
+            List of properties to sort by.
+        max_features : int
+            Limit the maximum number of features to request.
+        extra_wfs_fields: list<str>
+            A list of extra fields to be included in the WFS requests,
+            regardless whether they're needed as return field. Optional,
+            defaults to an empty list.
+
+        Returns
+        -------
+        etree.Element or generator of etree.Element
+            XML tree of the WFS response, or generator yielding the elements
+            of the features in the WFS response.
+
+        Raises
+        ------
+        pydov.util.errors.InvalidSearchParameterError
+            When not one of `location`, `query` or `max_features` is provided.
+
+        pydov.util.errors.InvalidFieldError
+            When at least one of the fields in `return_fields` is unknown.
+
+        pydov.util.errors.WfsGetFeatureError
+            When the response of the WFS service is not a valid GetFeature
+            response.
+
+        pydov.util.errors.FeatureOverflowError
+            When the features exceeding the maxFeatures limit of the WFS
+            server could not be retrieved by paging through the results.
+
+        """
+        if HookRunner.is_read_hook_implemented(
+                'wfs_search_result_received') or (
+                sort_by is None and self._split_query(query) is not None):
+            return self._search(
+                location=location, query=query, return_fields=return_fields,
+                sort_by=sort_by, max_features=max_features,
+                extra_wfs_fields=extra_wfs_fields)
+
+        getfeature = self._get_first_page_request(self._prepare_search(
+            location=location, query=query, return_fields=return_fields,
+            sort_by=sort_by, max_features=max_features,
+            extra_wfs_fields=extra_wfs_fields), location, sort_by,
+            max_features)
+
+        stream = self._get_remote_wfs_feature_stream(self.__wfs, getfeature)
+        try:
+            root, features = owsutil.wfs_iterparse_features(stream)
+
+            if root.get('numberOfFeatures') is None:
+                for ft in features:
+                    pass
+                raise WfsGetFeatureError(
+                    'Error retrieving features from DOV WFS server:\n'
+                    '{}'.format(etree.tostring(root).decode('utf8')))
+
+            truncated = self._is_truncated(root, max_features)
+        except Exception:
+            stream.close()
+            raise
+
+        if truncated:
+            try:
+                requests, reuse_first, pkey_field = self._run_requests(
+                    self._plan_remaining_requests(
+                        getfeature, location, query, return_fields, sort_by,
+                        max_features, extra_wfs_fields))
+            except Exception:
+                stream.close()
+                raise
+
+            if not reuse_first:
+                stream.close()
+                features = []
+
+            features = self._iter_search_features(
+                features, requests, pkey_field)
+        else:
+            HookRunner.execute_wfs_search_result(
+                int(root.get('numberOfFeatures')))
+
+        def iter_features():
+            try:
+                for ft in features:
+                    yield ft
+            finally:
+                stream.close()
+
+        return iter_features()
+
+    def get_description(self):
+        """Get the description of this search layer.
+
+        Returns
+        -------
+        str
+            The description of this layer.
+
+        """
+        wfs_layer = self._get_layer()
+        return wfs_layer.abstract
+
+    def get_fields(self):
+        """Get the metadata of the fields that are available.
+
+        Returns
+        -------
+        fields : dict<str,dict>
+            Dictionary containing the metadata of the available fields,
+            where the metadata dictionary includes:
 
             name (str)
                 The name of the field.
@@ -745,7 +2247,8 @@ class AbstractSearch(AbstractCommon):
         return self._fields
 
     def search(self, location=None, query=None,
-               sort_by=None, return_fields=None, max_features=None):
+               sort_by=None, return_fields=None, max_features=None,
+               depth_range=None, depth_step=None):
         """Search for objects of this type. Provide `location` and/or
         `query` and/or `max_features`.
         When `return_fields` is None, all fields are returned.
@@ -771,6 +2274,294 @@ class AbstractSearch(AbstractCommon):
             not all fields are currently supported as return fields.
         max_features : int
             Limit the maximum number of features to request.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the subtype records to return,
+            either can be None. Only applies to subtypes with depth fields,
+            like CPT measurements and the layers of interpretations. Records
+            outside the range are not extracted from the XML documents.
+        depth_step : float, optional
+            Return only the first subtype record in every interval of this
+            depth, f.ex. 0.1 to return CPT measurements every 10 cm. Only
+            applies to subtypes with records at a single depth.
+
+        Returns
+        -------
+        pandas.core.frame.DataFrame
+            DataFrame containing the output of the search query.
+
+        Raises
+        ------
+        pydov.util.errors.InvalidSearchParameterError
+            When not one of `location` or `query` or `max_features` is
+            provided.
+
+            When `depth_range` or `depth_step` is invalid or not
+            applicable to the subtypes of this type.
+
+        pydov.util.errors.InvalidFieldError
+            When at least one of the fields in `return_fields` is unknown.
+
+            When a field that is only accessible as return field is used as
+            a query parameter.
+
+            When a field that can only be used as a query parameter is used as
+            a return field.
+
+        pydov.util.errors.FeatureOverflowError
+            When the features exceeding the maxFeatures limit of the WFS
+            server could not be retrieved by paging through the results.
+
+        AttributeError
+            When the argument supplied as return_fields is not a list,
+            tuple or set.
+
+        """
+        self._validate_depth_parameters(depth_range, depth_step)
+
+        fts = self._search_stream(location=location, query=query,
+                                  sort_by=sort_by,
+                                  return_fields=return_fields,
+                                  max_features=max_features,
+                                  extra_wfs_fields=self._extra_wfs_fields)
+
+        objects = self._type.from_wfs(fts, self._wfs_namespace)
+
+        return self._type.to_df(objects, return_fields, depth_range,
+                                depth_step)
+
+    def search_iter(self, location=None, query=None, sort_by=None,
+                    return_fields=None, max_features=None, chunksize=1000,
+                    depth_range=None, depth_step=None):
+        """Search for objects of this type, yielding the results in
+        consecutive dataframes of at most `chunksize` objects each.
+
+        Every dataframe is yielded as soon as the WFS data and (if
+        requested) the XML data of its objects are resolved, instead of
+        after all objects have been resolved. This allows processing partial
+        results while the search continues, without keeping all the results
+        in memory. Fields of subtypes can result in multiple rows per
+        object, all rows of an object are part of the same dataframe.
+
+        Parameters
+        ----------
+        location : pydov.util.location.AbstractLocationFilter or \
+                   owslib.fes.BinaryLogicOpType<AbstractLocationFilter> or \
+                   owslib.fes.UnaryLogicOpType<AbstractLocationFilter>
+            Location filter limiting the features to retrieve. Can either be a
+            single instance of a subclass of AbstractLocationFilter, or a
+            combination using And, Or, Not of AbstractLocationFilters.
+        query : owslib.fes.OgcExpression
+            OGC filter expression to use for searching. This can contain any
+            combination of filter elements defined in owslib.fes. The query
+            should use the fields provided in `get_fields()`. Note that not
+            all fields are currently supported as a search parameter.
+        sort_by : owslib.fes.SortBy, optional
+            List of properties to sort by.
+        return_fields : list<str> or tuple<str> or set<str>
+            A list of fields to be returned in the output data. This should
+            be a subset of the fields provided in `get_fields()`. Note that
+            not all fields are currently supported as return fields.
+        max_features : int
+            Limit the maximum number of features to request.
+        chunksize : int, optional
+            Maximum number of objects per dataframe. Defaults to 1000.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the subtype records to return,
+            either can be None. Only applies to subtypes with depth fields,
+            like CPT measurements and the layers of interpretations. Records
+            outside the range are not extracted from the XML documents.
+        depth_step : float, optional
+            Return only the first subtype record in every interval of this
+            depth, f.ex. 0.1 to return CPT measurements every 10 cm. Only
+            applies to subtypes with records at a single depth.
+
+        Returns
+        -------
+        generator of pandas.core.frame.DataFrame
+            Generator yielding dataframes containing the output of the
+            search query, in order.
+
+        Raises
+        ------
+        pydov.util.errors.InvalidSearchParameterError
+            When not one of `location` or `query` or `max_features` is
+            provided.
+
+            When `chunksize` is not a positive integer.
+
+            When `depth_range` or `depth_step` is invalid or not
+            applicable to the subtypes of this type.
+
+        pydov.util.errors.InvalidFieldError
+            When at least one of the fields in `return_fields` is unknown.
+
+            When a field that is only accessible as return field is used as
+            a query parameter.
+
+            When a field that can only be used as a query parameter is used as
+            a return field.
+
+        pydov.util.errors.FeatureOverflowError
+            When the features exceeding the maxFeatures limit of the WFS
+            server could not be retrieved by paging through the results.
+
+        AttributeError
+            When the argument supplied as return_fields is not a list,
+            tuple or set.
+
+        """
+        if not isinstance(chunksize, int) or chunksize < 1:
+            raise InvalidSearchParameterError(
+                'chunksize should be a positive integer.')
+
+        self._validate_depth_parameters(depth_range, depth_step)
+
+        fts = self._search_stream(location=location, query=query,
+                                  sort_by=sort_by,
+                                  return_fields=return_fields,
+                                  max_features=max_features,
+                                  extra_wfs_fields=self._extra_wfs_fields)
+
+        objects = self._type.from_wfs(fts, self._wfs_namespace)
+
+        # validate the return fields before the first dataframe is requested
+        self._type.get_field_names(return_fields)
+
+        return self._type.to_df_iter(objects, return_fields, chunksize,
+                                     depth_range, depth_step)
+
+    def search_normalized(self, location=None, query=None, sort_by=None,
+                          return_fields=None, max_features=None,
+                          depth_range=None, depth_step=None):
+        """Search for objects of this type, returning the fields of the
+        subtypes in separate dataframes.
+
+        Where `search` repeats the fields of an object for every row of its
+        subtypes (f.ex. every measurement of a CPT), this returns a
+        dataframe with a single row per object and a dataframe per subtype
+        containing the primary key of the object and the subtype fields
+        only. This avoids duplicating the fields of the main type, which can
+        save a lot of memory for objects with many subtype rows.
+
+        Parameters
+        ----------
+        location : pydov.util.location.AbstractLocationFilter or \
+                   owslib.fes.BinaryLogicOpType<AbstractLocationFilter> or \
+                   owslib.fes.UnaryLogicOpType<AbstractLocationFilter>
+            Location filter limiting the features to retrieve. Can either be a
+            single instance of a subclass of AbstractLocationFilter, or a
+            combination using And, Or, Not of AbstractLocationFilters.
+        query : owslib.fes.OgcExpression
+            OGC filter expression to use for searching. This can contain any
+            combination of filter elements defined in owslib.fes. The query
+            should use the fields provided in `get_fields()`. Note that not
+            all fields are currently supported as a search parameter.
+        sort_by : owslib.fes.SortBy, optional
+            List of properties to sort by.
+        return_fields : list<str> or tuple<str> or set<str>
+            A list of fields to be returned in the output data. This should
+            be a subset of the fields provided in `get_fields()`. The
+            primary key is always returned.
+        max_features : int
+            Limit the maximum number of features to request.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the subtype records to return,
+            either can be None. Only applies to subtypes with depth fields,
+            like CPT measurements and the layers of interpretations. Records
+            outside the range are not extracted from the XML documents.
+        depth_step : float, optional
+            Return only the first subtype record in every interval of this
+            depth, f.ex. 0.1 to return CPT measurements every 10 cm. Only
+            applies to subtypes with records at a single depth.
+
+        Returns
+        -------
+        tuple of (pandas.core.frame.DataFrame, dict)
+            DataFrame containing the fields of the main type, and a
+            dictionary mapping the name of every requested subtype to a
+            DataFrame containing its fields.
+
+        Raises
+        ------
+        pydov.util.errors.InvalidSearchParameterError
+            When not one of `location` or `query` or `max_features` is
+            provided.
+
+            When `depth_range` or `depth_step` is invalid or not
+            applicable to the subtypes of this type.
+
+        pydov.util.errors.InvalidFieldError
+            When at least one of the fields in `return_fields` is unknown.
+
+            When a field that is only accessible as return field is used as
+            a query parameter.
+
+            When a field that can only be used as a query parameter is used as
+            a return field.
+
+        pydov.util.errors.FeatureOverflowError
+            When the features exceeding the maxFeatures limit of the WFS
+            server could not be retrieved by paging through the results.
+
+        AttributeError
+            When the argument supplied as return_fields is not a list,
+            tuple or set.
+
+        """
+        self._validate_depth_parameters(depth_range, depth_step)
+
+        fts = self._search_stream(location=location, query=query,
+                                  sort_by=sort_by,
+                                  return_fields=return_fields,
+                                  max_features=max_features,
+                                  extra_wfs_fields=self._extra_wfs_fields)
+
+        objects = self._type.from_wfs(fts, self._wfs_namespace)
+
+        return self._type.to_df_normalized(objects, return_fields,
+                                           depth_range, depth_step)
+
+    async def search_async(self, location=None, query=None, sort_by=None,
+                           return_fields=None, max_features=None,
+                           depth_range=None, depth_step=None):
+        """Asynchronous counterpart of `search`, to be awaited from a
+        running event loop.
+
+        The WFS GetFeature request and the XML documents of the resulting
+        objects are requested concurrently on the event loop, using aiohttp
+        when it is installed. Without aiohttp, the requests are performed
+        using the package wide executor instead.
+
+        Parameters
+        ----------
+        location : pydov.util.location.AbstractLocationFilter or \
+                   owslib.fes.BinaryLogicOpType<AbstractLocationFilter> or \
+                   owslib.fes.UnaryLogicOpType<AbstractLocationFilter>
+            Location filter limiting the features to retrieve. Can either be a
+            single instance of a subclass of AbstractLocationFilter, or a
+            combination using And, Or, Not of AbstractLocationFilters.
+        query : owslib.fes.OgcExpression
+            OGC filter expression to use for searching. This can contain any
+            combination of filter elements defined in owslib.fes. The query
+            should use the fields provided in `get_fields()`. Note that not
+            all fields are currently supported as a search parameter.
+        sort_by : owslib.fes.SortBy, optional
+            List of properties to sort by.
+        return_fields : list<str> or tuple<str> or set<str>
+            A list of fields to be returned in the output data. This should
+            be a subset of the fields provided in `get_fields()`. Note that
+            not all fields are currently supported as return fields.
+        max_features : int
+            Limit the maximum number of features to request.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the subtype records to return,
+            either can be None. Only applies to subtypes with depth fields,
+            like CPT measurements and the layers of interpretations. Records
+            outside the range are not extracted from the XML documents.
+        depth_step : float, optional
+            Return only the first subtype record in every interval of this
+            depth, f.ex. 0.1 to return CPT measurements every 10 cm. Only
+            applies to subtypes with records at a single depth.
 
         Returns
         -------
@@ -783,6 +2574,9 @@ class AbstractSearch(AbstractCommon):
             When not one of `location` or `query` or `max_features` is
             provided.
 
+            When `depth_range` or `depth_step` is invalid or not
+            applicable to the subtypes of this type.
+
         pydov.util.errors.InvalidFieldError
             When at least one of the fields in `return_fields` is unknown.
 
@@ -793,12 +2587,29 @@ class AbstractSearch(AbstractCommon):
             a return field.
 
         pydov.util.errors.FeatureOverflowError
-            When the number of features to be returned is equal to the
-            maxFeatures limit of the WFS server.
+            When the features exceeding the maxFeatures limit of the WFS
+            server could not be retrieved by paging through the results.
 
         AttributeError
             When the argument supplied as return_fields is not a list,
             tuple or set.
 
         """
-        raise NotImplementedError
+        self._validate_depth_parameters(depth_range, depth_step)
+
+        session = create_async_session()
+        try:
+            fts = await self._search_async(
+                location=location, query=query, sort_by=sort_by,
+                return_fields=return_fields, max_features=max_features,
+                extra_wfs_fields=self._extra_wfs_fields, session=session)
+
+            objects = self._type.from_wfs(fts, self._wfs_namespace)
+
+            df = await self._type.to_df_async(
+                objects, return_fields, session, depth_range, depth_step)
+        finally:
+            if session is not None:
+                await session.close()
+
+        return df
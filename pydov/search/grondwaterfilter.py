@@ -1,17 +1,13 @@
 # -*- coding: utf-8 -*-
 """Module containing the search classes to retrieve DOV groundwater screen
  data."""
-import pandas as pd
-
 from owslib.fes import (
     Not,
     PropertyIsNull,
     And,
 )
-from pydov.types.fields import _WfsInjectedField
 from .abstract import AbstractSearch
 from ..types.grondwaterfilter import GrondwaterFilter
-from ..util import owsutil
 
 
 class GrondwaterFilterSearch(AbstractSearch):
@@ -19,12 +15,6 @@ class GrondwaterFilterSearch(AbstractSearch):
     (GrondwaterFilter).
     """
 
-    __wfs_schema = None
-    __wfs_namespace = None
-    __md_metadata = None
-    __fc_featurecatalogue = None
-    __xsd_schemas = None
-
     def __init__(self, objecttype=GrondwaterFilter):
         """Initialisation.
 
@@ -39,50 +29,27 @@ class GrondwaterFilterSearch(AbstractSearch):
         super(GrondwaterFilterSearch,
               self).__init__('gw_meetnetten:meetnetten', objecttype)
 
-    def _init_namespace(self):
-        """Initialise the WFS namespace associated with the layer."""
-        if GrondwaterFilterSearch.__wfs_namespace is None:
-            GrondwaterFilterSearch.__wfs_namespace = self._get_namespace()
-
-    def _init_fields(self):
-        """Initialise the fields and their metadata available in this search
-        class."""
-        if self._fields is None:
-            if GrondwaterFilterSearch.__wfs_schema is None:
-                GrondwaterFilterSearch.__wfs_schema = self._get_schema()
-
-            if GrondwaterFilterSearch.__md_metadata is None:
-                GrondwaterFilterSearch.__md_metadata = \
-                    self._get_remote_metadata()
-
-            if GrondwaterFilterSearch.__fc_featurecatalogue is None:
-                csw_url = self._get_csw_base_url()
-                fc_uuid = owsutil.get_featurecatalogue_uuid(
-                    GrondwaterFilterSearch.__md_metadata)
-
-                GrondwaterFilterSearch.__fc_featurecatalogue = \
-                    owsutil.get_remote_featurecatalogue(csw_url, fc_uuid)
-
-            if GrondwaterFilterSearch.__xsd_schemas is None:
-                GrondwaterFilterSearch.__xsd_schemas = \
-                    self._get_remote_xsd_schemas()
-
-            fields = self._build_fields(
-                GrondwaterFilterSearch.__wfs_schema,
-                GrondwaterFilterSearch.__fc_featurecatalogue,
-                GrondwaterFilterSearch.__xsd_schemas)
-
-            for field in fields.values():
-                if field['name'] not in self._type.get_field_names(
-                        include_wfs_injected=True):
-                    self._type.fields.append(
-                        _WfsInjectedField(name=field['name'],
-                                          datatype=field['type']))
-
-            self._fields = self._build_fields(
-                GrondwaterFilterSearch.__wfs_schema,
-                GrondwaterFilterSearch.__fc_featurecatalogue,
-                GrondwaterFilterSearch.__xsd_schemas)
+    def _extend_query(self, query):
+        """Extend the query of a search, excluding groundwater screens
+        without a primary key (i.e. Putten without Filters).
+
+        Parameters
+        ----------
+        query : owslib.fes.OgcExpression
+            OGC filter expression to use for searching, or None.
+
+        Returns
+        -------
+        owslib.fes.OgcExpression
+            The query combined with a not-null check on pkey_filter.
+
+        """
+        exclude_empty_filters = Not([PropertyIsNull(
+                                     propertyname='pkey_filter')])
+
+        if query is not None:
+            return And([query, exclude_empty_filters])
+        return exclude_empty_filters
 
     def search(self, location=None, query=None, sort_by=None,
                return_fields=None, max_features=None):
@@ -135,33 +102,14 @@ class GrondwaterFilterSearch(AbstractSearch):
             a return field.
 
         pydov.util.errors.FeatureOverflowError
-            When the number of features to be returned is equal to the
-            maxFeatures limit of the WFS server.
+            When the features exceeding the maxFeatures limit of the WFS
+            server could not be retrieved by paging through the results.
 
         AttributeError
             When the argument supplied as return_fields is not a list,
             tuple or set.
 
         """
-        self._pre_search_validation(location, query, sort_by, return_fields,
-                                    max_features)
-
-        exclude_empty_filters = Not([PropertyIsNull(
-                                     propertyname='pkey_filter')])
-
-        if query is not None:
-            query = And([query, exclude_empty_filters])
-        else:
-            query = exclude_empty_filters
-
-        fts = self._search(location=location, query=query, sort_by=sort_by,
-                           return_fields=return_fields,
-                           max_features=max_features)
-
-        gw_filters = self._type.from_wfs(fts, self.__wfs_namespace)
-
-        df = pd.DataFrame(
-            data=self._type.to_df_array(gw_filters, return_fields),
-            columns=self._type.get_field_names(return_fields))
-
-        return df
+        return super(GrondwaterFilterSearch, self).search(
+            location=location, query=query, sort_by=sort_by,
+            return_fields=return_fields, max_features=max_features)
@@ -1,7 +1,4 @@
-import pandas as pd
-
 from pydov.search.abstract import AbstractSearch
-from pydov.types.fields import _WfsInjectedField
 from pydov.types.interpretaties import FormeleStratigrafie
 from pydov.types.interpretaties import InformeleHydrogeologischeStratigrafie
 from pydov.types.interpretaties import InformeleStratigrafie
@@ -10,18 +7,11 @@ from pydov.types.interpretaties import LithologischeBeschrijvingen
 from pydov.types.interpretaties import GecodeerdeLithologie
 from pydov.types.interpretaties import GeotechnischeCodering
 from pydov.types.interpretaties import QuartairStratigrafie
-from pydov.util import owsutil
 
 
 class InformeleStratigrafieSearch(AbstractSearch):
     """Search class to retrieve information about 'informele stratigrafie'."""
 
-    __wfs_schema = None
-    __wfs_namespace = None
-    __md_metadata = None
-    __fc_featurecatalogue = None
-    __xsd_schemas = None
-
     def __init__(self, objecttype=InformeleStratigrafie):
         """Initialisation.
 
@@ -34,55 +24,11 @@ class InformeleStratigrafieSearch(AbstractSearch):
 
         """
         super(InformeleStratigrafieSearch, self).__init__(
-            'interpretaties:informele_stratigrafie', objecttype)
-
-    def _init_namespace(self):
-        """Initialise the WFS namespace associated with the layer."""
-        if InformeleStratigrafieSearch.__wfs_namespace is None:
-            InformeleStratigrafieSearch.__wfs_namespace = self._get_namespace()
-
-    def _init_fields(self):
-        """Initialise the fields and their metadata available in this search
-        class."""
-        if self._fields is None:
-            if InformeleStratigrafieSearch.__wfs_schema is None:
-                InformeleStratigrafieSearch.__wfs_schema = self._get_schema()
-
-            if InformeleStratigrafieSearch.__md_metadata is None:
-                InformeleStratigrafieSearch.__md_metadata = \
-                    self._get_remote_metadata()
-
-            if InformeleStratigrafieSearch.__fc_featurecatalogue is None:
-                csw_url = self._get_csw_base_url()
-                fc_uuid = owsutil.get_featurecatalogue_uuid(
-                    InformeleStratigrafieSearch.__md_metadata)
-
-                InformeleStratigrafieSearch.__fc_featurecatalogue = \
-                    owsutil.get_remote_featurecatalogue(csw_url, fc_uuid)
-
-            if InformeleStratigrafieSearch.__xsd_schemas is None:
-                InformeleStratigrafieSearch.__xsd_schemas = \
-                    self._get_remote_xsd_schemas()
-
-            fields = self._build_fields(
-                InformeleStratigrafieSearch.__wfs_schema,
-                InformeleStratigrafieSearch.__fc_featurecatalogue,
-                InformeleStratigrafieSearch.__xsd_schemas)
-
-            for field in fields.values():
-                if field['name'] not in self._type.get_field_names(
-                        include_wfs_injected=True):
-                    self._type.fields.append(
-                        _WfsInjectedField(name=field['name'],
-                                          datatype=field['type']))
-
-            self._fields = self._build_fields(
-                InformeleStratigrafieSearch.__wfs_schema,
-                InformeleStratigrafieSearch.__fc_featurecatalogue,
-                InformeleStratigrafieSearch.__xsd_schemas)
+            'interpretaties:informele_stratigrafie', objecttype,
+            extra_wfs_fields=['Type_proef', 'Proeffiche'])
 
     def search(self, location=None, query=None, sort_by=None,
-               return_fields=None, max_features=None):
+               return_fields=None, max_features=None, depth_range=None):
         """Search for 'informele stratigrafie'. Provide either `location`
         and/or `query` and/or `max_features`.
         When `return_fields` is None, all fields are returned.
@@ -108,6 +54,10 @@ class InformeleStratigrafieSearch(AbstractSearch):
             not all fields are currently supported as return fields.
         max_features : int
             Limit the maximum number of features to request.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the layers to return, either can be
+            None. Layers partially within the range are returned. Layers
+            outside the range are not extracted from the XML documents.
 
         Returns
         -------
@@ -119,6 +69,8 @@ class InformeleStratigrafieSearch(AbstractSearch):
         pydov.util.errors.InvalidSearchParameterError
             When not one of `location`, `query` or `max_features` is provided.
 
+            When `depth_range` is invalid.
+
         pydov.util.errors.InvalidFieldError
             When at least one of the fields in `return_fields` is unknown.
 
@@ -129,38 +81,24 @@ class InformeleStratigrafieSearch(AbstractSearch):
             a return field.
 
         pydov.util.errors.FeatureOverflowError
-            When the number of features to be returned is equal to the
-            maxFeatures limit of the WFS server.
+            When the features exceeding the maxFeatures limit of the WFS
+            server could not be retrieved by paging through the results.
 
         AttributeError
             When the argument supplied as return_fields is not a list,
             tuple or set.
 
         """
-        fts = self._search(location=location, query=query, sort_by=sort_by,
-                           return_fields=return_fields,
-                           extra_wfs_fields=['Type_proef', 'Proeffiche'],
-                           max_features=max_features)
-
-        interpretaties = self._type.from_wfs(
-            fts, self.__wfs_namespace)
-
-        df = pd.DataFrame(
-            data=self._type.to_df_array(interpretaties, return_fields),
-            columns=self._type.get_field_names(return_fields))
-        return df
+        return super(InformeleStratigrafieSearch, self).search(
+            location=location, query=query, sort_by=sort_by,
+            return_fields=return_fields, max_features=max_features,
+            depth_range=depth_range)
 
 
 class FormeleStratigrafieSearch(AbstractSearch):
     """Search class to retrieve the interpretation for Formele
     stratigrafie"""
 
-    __wfs_schema = None
-    __wfs_namespace = None
-    __md_metadata = None
-    __fc_featurecatalogue = None
-    __xsd_schemas = None
-
     def __init__(self, objecttype=FormeleStratigrafie):
         """Initialisation.
 
@@ -173,55 +111,11 @@ class FormeleStratigrafieSearch(AbstractSearch):
 
         """
         super(FormeleStratigrafieSearch, self).__init__(
-            'interpretaties:formele_stratigrafie', objecttype)
-
-    def _init_namespace(self):
-        """Initialise the WFS namespace associated with the layer."""
-        if FormeleStratigrafieSearch.__wfs_namespace is None:
-            FormeleStratigrafieSearch.__wfs_namespace = self._get_namespace()
-
-    def _init_fields(self):
-        """Initialise the fields and their metadata available in this search
-        class."""
-        if self._fields is None:
-            if FormeleStratigrafieSearch.__wfs_schema is None:
-                FormeleStratigrafieSearch.__wfs_schema = self._get_schema()
-
-            if FormeleStratigrafieSearch.__md_metadata is None:
-                FormeleStratigrafieSearch.__md_metadata = \
-                    self._get_remote_metadata()
-
-            if FormeleStratigrafieSearch.__fc_featurecatalogue is None:
-                csw_url = self._get_csw_base_url()
-                fc_uuid = owsutil.get_featurecatalogue_uuid(
-                    FormeleStratigrafieSearch.__md_metadata)
-
-                FormeleStratigrafieSearch.__fc_featurecatalogue = \
-                    owsutil.get_remote_featurecatalogue(csw_url, fc_uuid)
-
-            if FormeleStratigrafieSearch.__xsd_schemas is None:
-                FormeleStratigrafieSearch.__xsd_schemas = \
-                    self._get_remote_xsd_schemas()
-
-            fields = self._build_fields(
-                FormeleStratigrafieSearch.__wfs_schema,
-                FormeleStratigrafieSearch.__fc_featurecatalogue,
-                FormeleStratigrafieSearch.__xsd_schemas)
-
-            for field in fields.values():
-                if field['name'] not in self._type.get_field_names(
-                        include_wfs_injected=True):
-                    self._type.fields.append(
-                        _WfsInjectedField(name=field['name'],
-                                          datatype=field['type']))
-
-            self._fields = self._build_fields(
-                FormeleStratigrafieSearch.__wfs_schema,
-                FormeleStratigrafieSearch.__fc_featurecatalogue,
-                FormeleStratigrafieSearch.__xsd_schemas)
+            'interpretaties:formele_stratigrafie', objecttype,
+            extra_wfs_fields=['Type_proef', 'Proeffiche'])
 
     def search(self, location=None, query=None, sort_by=None,
-               return_fields=None, max_features=None):
+               return_fields=None, max_features=None, depth_range=None):
         """Search for 'formele stratigrafie'. Provide either `location` and/or
         `query` and/or `max_features`.
         When `return_fields` is None, all fields are returned.
@@ -247,6 +141,10 @@ class FormeleStratigrafieSearch(AbstractSearch):
             not all fields are currently supported as return fields.
         max_features : int
             Limit the maximum number of features to request.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the layers to return, either can be
+            None. Layers partially within the range are returned. Layers
+            outside the range are not extracted from the XML documents.
 
         Returns
         -------
@@ -258,6 +156,8 @@ class FormeleStratigrafieSearch(AbstractSearch):
         pydov.util.errors.InvalidSearchParameterError
             When not one of `location`, `query` or `max_features` is provided.
 
+            When `depth_range` is invalid.
+
         pydov.util.errors.InvalidFieldError
             When at least one of the fields in `return_fields` is unknown.
 
@@ -268,37 +168,23 @@ class FormeleStratigrafieSearch(AbstractSearch):
             a return field.
 
         pydov.util.errors.FeatureOverflowError
-            When the number of features to be returned is equal to the
-            maxFeatures limit of the WFS server.
+            When the features exceeding the maxFeatures limit of the WFS
+            server could not be retrieved by paging through the results.
 
         AttributeError
             When the argument supplied as return_fields is not a list,
             tuple or set.
 
         """
-        fts = self._search(location=location, query=query, sort_by=sort_by,
-                           return_fields=return_fields,
-                           extra_wfs_fields=['Type_proef', 'Proeffiche'],
-                           max_features=max_features)
-
-        interpretaties = self._type.from_wfs(
-            fts, self.__wfs_namespace)
-
-        df = pd.DataFrame(
-            data=self._type.to_df_array(interpretaties, return_fields),
-            columns=self._type.get_field_names(return_fields))
-        return df
+        return super(FormeleStratigrafieSearch, self).search(
+            location=location, query=query, sort_by=sort_by,
+            return_fields=return_fields, max_features=max_features,
+            depth_range=depth_range)
 
 
 class HydrogeologischeStratigrafieSearch(AbstractSearch):
     """Search class to retrieve hydrogeological interpretations """
 
-    __wfs_schema = None
-    __wfs_namespace = None
-    __md_metadata = None
-    __fc_featurecatalogue = None
-    __xsd_schemas = None
-
     def __init__(self, objecttype=HydrogeologischeStratigrafie):
         """Initialisation.
 
@@ -314,56 +200,8 @@ class HydrogeologischeStratigrafieSearch(AbstractSearch):
             'interpretaties:hydrogeologische_stratigrafie',
             objecttype)
 
-    def _init_namespace(self):
-        """Initialise the WFS namespace associated with the layer."""
-        if HydrogeologischeStratigrafieSearch.__wfs_namespace is None:
-            HydrogeologischeStratigrafieSearch.__wfs_namespace = \
-                self._get_namespace()
-
-    def _init_fields(self):
-        """Initialise the fields and their metadata available in this search
-        class."""
-        if self._fields is None:
-            if HydrogeologischeStratigrafieSearch.__wfs_schema is None:
-                HydrogeologischeStratigrafieSearch.__wfs_schema = \
-                    self._get_schema()
-
-            if HydrogeologischeStratigrafieSearch.__md_metadata is None:
-                HydrogeologischeStratigrafieSearch.__md_metadata = \
-                    self._get_remote_metadata()
-
-            if HydrogeologischeStratigrafieSearch.__fc_featurecatalogue \
-                    is None:
-                csw_url = self._get_csw_base_url()
-                fc_uuid = owsutil.get_featurecatalogue_uuid(
-                    HydrogeologischeStratigrafieSearch.__md_metadata)
-
-                HydrogeologischeStratigrafieSearch.__fc_featurecatalogue = \
-                    owsutil.get_remote_featurecatalogue(csw_url, fc_uuid)
-
-            if HydrogeologischeStratigrafieSearch.__xsd_schemas is None:
-                HydrogeologischeStratigrafieSearch.__xsd_schemas = \
-                    self._get_remote_xsd_schemas()
-
-            fields = self._build_fields(
-                HydrogeologischeStratigrafieSearch.__wfs_schema,
-                HydrogeologischeStratigrafieSearch.__fc_featurecatalogue,
-                HydrogeologischeStratigrafieSearch.__xsd_schemas)
-
-            for field in fields.values():
-                if field['name'] not in self._type.get_field_names(
-                        include_wfs_injected=True):
-                    self._type.fields.append(
-                        _WfsInjectedField(name=field['name'],
-                                          datatype=field['type']))
-
-            self._fields = self._build_fields(
-                HydrogeologischeStratigrafieSearch.__wfs_schema,
-                HydrogeologischeStratigrafieSearch.__fc_featurecatalogue,
-                HydrogeologischeStratigrafieSearch.__xsd_schemas)
-
     def search(self, location=None, query=None, sort_by=None,
-               return_fields=None, max_features=None):
+               return_fields=None, max_features=None, depth_range=None):
         """Search for hydrogeological interpretations. Provide either
         `location` and/or `query` and/or `max_features`. When
         `return_fields` is None, all fields
@@ -390,6 +228,10 @@ class HydrogeologischeStratigrafieSearch(AbstractSearch):
             not all fields are currently supported as return fields.
         max_features : int
             Limit the maximum number of features to request.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the layers to return, either can be
+            None. Layers partially within the range are returned. Layers
+            outside the range are not extracted from the XML documents.
 
         Returns
         -------
@@ -401,6 +243,8 @@ class HydrogeologischeStratigrafieSearch(AbstractSearch):
         pydov.util.errors.InvalidSearchParameterError
             When not one of `location`, `query` or `max_features` is provided.
 
+            When `depth_range` is invalid.
+
         pydov.util.errors.InvalidFieldError
             When at least one of the fields in `return_fields` is unknown.
 
@@ -411,36 +255,23 @@ class HydrogeologischeStratigrafieSearch(AbstractSearch):
             a return field.
 
         pydov.util.errors.FeatureOverflowError
-            When the number of features to be returned is equal to the
-            maxFeatures limit of the WFS server.
+            When the features exceeding the maxFeatures limit of the WFS
+            server could not be retrieved by paging through the results.
 
         AttributeError
             When the argument supplied as return_fields is not a list,
             tuple or set.
 
         """
-        fts = self._search(location=location, query=query, sort_by=sort_by,
-                           return_fields=return_fields,
-                           max_features=max_features)
-
-        interpretaties = self._type.from_wfs(
-            fts, self.__wfs_namespace)
-
-        df = pd.DataFrame(
-            data=self._type.to_df_array(interpretaties, return_fields),
-            columns=self._type.get_field_names(return_fields))
-        return df
+        return super(HydrogeologischeStratigrafieSearch, self).search(
+            location=location, query=query, sort_by=sort_by,
+            return_fields=return_fields, max_features=max_features,
+            depth_range=depth_range)
 
 
 class LithologischeBeschrijvingenSearch(AbstractSearch):
     """Search class to retrieve lithologische beschrijvingen """
 
-    __wfs_schema = None
-    __wfs_namespace = None
-    __md_metadata = None
-    __fc_featurecatalogue = None
-    __xsd_schemas = None
-
     def __init__(self, objecttype=LithologischeBeschrijvingen):
         """Initialisation.
 
@@ -456,56 +287,8 @@ class LithologischeBeschrijvingenSearch(AbstractSearch):
             'interpretaties:lithologische_beschrijvingen',
             objecttype)
 
-    def _init_namespace(self):
-        """Initialise the WFS namespace associated with the layer."""
-        if LithologischeBeschrijvingenSearch.__wfs_namespace is None:
-            LithologischeBeschrijvingenSearch.__wfs_namespace = \
-                self._get_namespace()
-
-    def _init_fields(self):
-        """Initialise the fields and their metadata available in this search
-        class."""
-        if self._fields is None:
-            if LithologischeBeschrijvingenSearch.__wfs_schema is None:
-                LithologischeBeschrijvingenSearch.__wfs_schema = \
-                    self._get_schema()
-
-            if LithologischeBeschrijvingenSearch.__md_metadata is None:
-                LithologischeBeschrijvingenSearch.__md_metadata = \
-                    self._get_remote_metadata()
-
-            if LithologischeBeschrijvingenSearch.__fc_featurecatalogue \
-                    is None:
-                csw_url = self._get_csw_base_url()
-                fc_uuid = owsutil.get_featurecatalogue_uuid(
-                    LithologischeBeschrijvingenSearch.__md_metadata)
-
-                LithologischeBeschrijvingenSearch.__fc_featurecatalogue = \
-                    owsutil.get_remote_featurecatalogue(csw_url, fc_uuid)
-
-            if LithologischeBeschrijvingenSearch.__xsd_schemas is None:
-                LithologischeBeschrijvingenSearch.__xsd_schemas = \
-                    self._get_remote_xsd_schemas()
-
-            fields = self._build_fields(
-                LithologischeBeschrijvingenSearch.__wfs_schema,
-                LithologischeBeschrijvingenSearch.__fc_featurecatalogue,
-                LithologischeBeschrijvingenSearch.__xsd_schemas)
-
-            for field in fields.values():
-                if field['name'] not in self._type.get_field_names(
-                        include_wfs_injected=True):
-                    self._type.fields.append(
-                        _WfsInjectedField(name=field['name'],
-                                          datatype=field['type']))
-
-            self._fields = self._build_fields(
-                LithologischeBeschrijvingenSearch.__wfs_schema,
-                LithologischeBeschrijvingenSearch.__fc_featurecatalogue,
-                LithologischeBeschrijvingenSearch.__xsd_schemas)
-
     def search(self, location=None, query=None, sort_by=None,
-               return_fields=None, max_features=None):
+               return_fields=None, max_features=None, depth_range=None):
         """Search for 'lithologische beschrijvingen'. Provide either
         `location` and/or `query` and/or `max_features`.
         When `return_fields` is None, all fields are returned.
@@ -531,6 +314,10 @@ class LithologischeBeschrijvingenSearch(AbstractSearch):
             not all fields are currently supported as return fields.
         max_features : int
             Limit the maximum number of features to request.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the layers to return, either can be
+            None. Layers partially within the range are returned. Layers
+            outside the range are not extracted from the XML documents.
 
         Returns
         -------
@@ -542,6 +329,8 @@ class LithologischeBeschrijvingenSearch(AbstractSearch):
         pydov.util.errors.InvalidSearchParameterError
             When not one of `location`, `query` or `max_features` is provided.
 
+            When `depth_range` is invalid.
+
         pydov.util.errors.InvalidFieldError
             When at least one of the fields in `return_fields` is unknown.
 
@@ -552,36 +341,23 @@ class LithologischeBeschrijvingenSearch(AbstractSearch):
             a return field.
 
         pydov.util.errors.FeatureOverflowError
-            When the number of features to be returned is equal to the
-            maxFeatures limit of the WFS server.
+            When the features exceeding the maxFeatures limit of the WFS
+            server could not be retrieved by paging through the results.
 
         AttributeError
             When the argument supplied as return_fields is not a list,
             tuple or set.
 
         """
-        fts = self._search(location=location, query=query, sort_by=sort_by,
-                           return_fields=return_fields,
-                           max_features=max_features)
-
-        interpretaties = self._type.from_wfs(
-            fts, self.__wfs_namespace)
-
-        df = pd.DataFrame(
-            data=self._type.to_df_array(interpretaties, return_fields),
-            columns=self._type.get_field_names(return_fields))
-        return df
+        return super(LithologischeBeschrijvingenSearch, self).search(
+            location=location, query=query, sort_by=sort_by,
+            return_fields=return_fields, max_features=max_features,
+            depth_range=depth_range)
 
 
 class GecodeerdeLithologieSearch(AbstractSearch):
     """Search class to retrieve gecodeerde lithologie """
 
-    __wfs_schema = None
-    __wfs_namespace = None
-    __md_metadata = None
-    __fc_featurecatalogue = None
-    __xsd_schemas = None
-
     def __init__(self, objecttype=GecodeerdeLithologie):
         """Initialisation.
 
@@ -597,56 +373,8 @@ class GecodeerdeLithologieSearch(AbstractSearch):
             'interpretaties:gecodeerde_lithologie',
             objecttype)
 
-    def _init_namespace(self):
-        """Initialise the WFS namespace associated with the layer."""
-        if GecodeerdeLithologieSearch.__wfs_namespace is None:
-            GecodeerdeLithologieSearch.__wfs_namespace = \
-                self._get_namespace()
-
-    def _init_fields(self):
-        """Initialise the fields and their metadata available in this search
-        class."""
-        if self._fields is None:
-            if GecodeerdeLithologieSearch.__wfs_schema is None:
-                GecodeerdeLithologieSearch.__wfs_schema = \
-                    self._get_schema()
-
-            if GecodeerdeLithologieSearch.__md_metadata is None:
-                GecodeerdeLithologieSearch.__md_metadata = \
-                    self._get_remote_metadata()
-
-            if GecodeerdeLithologieSearch.__fc_featurecatalogue \
-                    is None:
-                csw_url = self._get_csw_base_url()
-                fc_uuid = owsutil.get_featurecatalogue_uuid(
-                    GecodeerdeLithologieSearch.__md_metadata)
-
-                GecodeerdeLithologieSearch.__fc_featurecatalogue = \
-                    owsutil.get_remote_featurecatalogue(csw_url, fc_uuid)
-
-            if GecodeerdeLithologieSearch.__xsd_schemas is None:
-                GecodeerdeLithologieSearch.__xsd_schemas = \
-                    self._get_remote_xsd_schemas()
-
-            fields = self._build_fields(
-                GecodeerdeLithologieSearch.__wfs_schema,
-                GecodeerdeLithologieSearch.__fc_featurecatalogue,
-                GecodeerdeLithologieSearch.__xsd_schemas)
-
-            for field in fields.values():
-                if field['name'] not in self._type.get_field_names(
-                        include_wfs_injected=True):
-                    self._type.fields.append(
-                        _WfsInjectedField(name=field['name'],
-                                          datatype=field['type']))
-
-            self._fields = self._build_fields(
-                GecodeerdeLithologieSearch.__wfs_schema,
-                GecodeerdeLithologieSearch.__fc_featurecatalogue,
-                GecodeerdeLithologieSearch.__xsd_schemas)
-
     def search(self, location=None, query=None, sort_by=None,
-               return_fields=None, max_features=None):
+               return_fields=None, max_features=None, depth_range=None):
         """Search for 'gecodeerde lithologie'. Provide either `location`
         and/or `query` and/or `max_features`.
         When `return_fields` is None, all fields are returned.
@@ -672,6 +400,10 @@ class GecodeerdeLithologieSearch(AbstractSearch):
             not all fields are currently supported as return fields.
         max_features : int
             Limit the maximum number of features to request.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the layers to return, either can be
+            None. Layers partially within the range are returned. Layers
+            outside the range are not extracted from the XML documents.
 
         Returns
         -------
@@ -683,6 +415,8 @@ class GecodeerdeLithologieSearch(AbstractSearch):
         pydov.util.errors.InvalidSearchParameterError
             When not one of `location`, `query` or `max_features` is provided.
 
+            When `depth_range` is invalid.
+
         pydov.util.errors.InvalidFieldError
             When at least one of the fields in `return_fields` is unknown.
 
@@ -693,36 +427,23 @@ class GecodeerdeLithologieSearch(AbstractSearch):
             a return field.
 
         pydov.util.errors.FeatureOverflowError
-            When the number of features to be returned is equal to the
-            maxFeatures limit of the WFS server.
+            When the features exceeding the maxFeatures limit of the WFS
+            server could not be retrieved by paging through the results.
 
         AttributeError
             When the argument supplied as return_fields is not a list,
             tuple or set.
 
         """
-        fts = self._search(location=location, query=query, sort_by=sort_by,
-                           return_fields=return_fields,
-                           max_features=max_features)
-
-        interpretaties = self._type.from_wfs(
-            fts, self.__wfs_namespace)
-
-        df = pd.DataFrame(
-            data=self._type.to_df_array(interpretaties, return_fields),
-            columns=self._type.get_field_names(return_fields))
-        return df
+        return super(GecodeerdeLithologieSearch, self).search(
+            location=location, query=query, sort_by=sort_by,
+            return_fields=return_fields, max_features=max_features,
+            depth_range=depth_range)
 
 
 class GeotechnischeCoderingSearch(AbstractSearch):
     """Search class to retrieve geotechnische codering """
 
-    __wfs_schema = None
-    __wfs_namespace = None
-    __md_metadata = None
-    __fc_featurecatalogue = None
-    __xsd_schemas = None
-
     def __init__(self, objecttype=GeotechnischeCodering):
         """Initialisation.
 
@@ -738,56 +459,8 @@ class GeotechnischeCoderingSearch(AbstractSearch):
             'interpretaties:geotechnische_coderingen',
             objecttype)
 
-    def _init_namespace(self):
-        """Initialise the WFS namespace associated with the layer."""
-        if GeotechnischeCoderingSearch.__wfs_namespace is None:
-            GeotechnischeCoderingSearch.__wfs_namespace = \
-                self._get_namespace()
-
-    def _init_fields(self):
-        """Initialise the fields and their metadata available in this search
-        class."""
-        if self._fields is None:
-            if GeotechnischeCoderingSearch.__wfs_schema is None:
-                GeotechnischeCoderingSearch.__wfs_schema = \
-                    self._get_schema()
-
-            if GeotechnischeCoderingSearch.__md_metadata is None:
-                GeotechnischeCoderingSearch.__md_metadata = \
-                    self._get_remote_metadata()
-
-            if GeotechnischeCoderingSearch.__fc_featurecatalogue \
-                    is None:
-                csw_url = self._get_csw_base_url()
-                fc_uuid = owsutil.get_featurecatalogue_uuid(
-                    GeotechnischeCoderingSearch.__md_metadata)
-
-                GeotechnischeCoderingSearch.__fc_featurecatalogue = \
-                    owsutil.get_remote_featurecatalogue(csw_url, fc_uuid)
-
-            if GeotechnischeCoderingSearch.__xsd_schemas is None:
-                GeotechnischeCoderingSearch.__xsd_schemas = \
-                    self._get_remote_xsd_schemas()
-
-            fields = self._build_fields(
-                GeotechnischeCoderingSearch.__wfs_schema,
-                GeotechnischeCoderingSearch.__fc_featurecatalogue,
-                GeotechnischeCoderingSearch.__xsd_schemas)
-
-            for field in fields.values():
-                if field['name'] not in self._type.get_field_names(
-                        include_wfs_injected=True):
-                    self._type.fields.append(
-                        _WfsInjectedField(name=field['name'],
-                                          datatype=field['type']))
-
-            self._fields = self._build_fields(
-                GeotechnischeCoderingSearch.__wfs_schema,
-                GeotechnischeCoderingSearch.__fc_featurecatalogue,
-                GeotechnischeCoderingSearch.__xsd_schemas)
-
     def search(self, location=None, query=None, sort_by=None,
-               return_fields=None, max_features=None):
+               return_fields=None, max_features=None, depth_range=None):
         """Search for 'geotechnische_codering'. Provide either `location`
         and/or `query` and/or `max_features`.
         When `return_fields` is None, all fields are returned.
@@ -809,6 +482,10 @@ class GeotechnischeCoderingSearch(AbstractSearch):
             not all fields are currently supported as return fields.
         max_features : int
             Limit the maximum number of features to request.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the layers to return, either can be
+            None. Layers partially within the range are returned. Layers
+            outside the range are not extracted from the XML documents.
 
         Returns
         -------
@@ -820,6 +497,8 @@ class GeotechnischeCoderingSearch(AbstractSearch):
         pydov.util.errors.InvalidSearchParameterError
             When not one of `location`, `query` or `max_features` is provided.
 
+            When `depth_range` is invalid.
+
         pydov.util.errors.InvalidFieldError
             When at least one of the fields in `return_fields` is unknown.
 
@@ -830,37 +509,24 @@ class GeotechnischeCoderingSearch(AbstractSearch):
             a return field.
 
         pydov.util.errors.FeatureOverflowError
-            When the number of features to be returned is equal to the
-            maxFeatures limit of the WFS server.
+            When the features exceeding the maxFeatures limit of the WFS
+            server could not be retrieved by paging through the results.
 
         AttributeError
             When the argument supplied as return_fields is not a list,
             tuple or set.
 
         """
-        fts = self._search(location=location, query=query, sort_by=sort_by,
-                           return_fields=return_fields,
-                           max_features=max_features)
-
-        interpretaties = self._type.from_wfs(
-            fts, self.__wfs_namespace)
-
-        df = pd.DataFrame(
-            data=self._type.to_df_array(interpretaties, return_fields),
-            columns=self._type.get_field_names(return_fields))
-        return df
+        return super(GeotechnischeCoderingSearch, self).search(
+            location=location, query=query, sort_by=sort_by,
+            return_fields=return_fields, max_features=max_features,
+            depth_range=depth_range)
 
 
 class QuartairStratigrafieSearch(AbstractSearch):
     """Search class to retrieve the interpretation for Quartair
     stratigrafie"""
 
-    __wfs_schema = None
-    __wfs_namespace = None
-    __md_metadata = None
-    __fc_featurecatalogue = None
-    __xsd_schemas = None
-
     def __init__(self, objecttype=QuartairStratigrafie):
         """Initialisation.
 
@@ -875,53 +541,8 @@ class QuartairStratigrafieSearch(AbstractSearch):
         super(QuartairStratigrafieSearch, self).__init__(
             'interpretaties:quartaire_stratigrafie', objecttype)
 
-    def _init_namespace(self):
-        """Initialise the WFS namespace associated with the layer."""
-        if QuartairStratigrafieSearch.__wfs_namespace is None:
-            QuartairStratigrafieSearch.__wfs_namespace = self._get_namespace()
-
-    def _init_fields(self):
-        """Initialise the fields and their metadata available in this search
-        class."""
-        if self._fields is None:
-            if QuartairStratigrafieSearch.__wfs_schema is None:
-                QuartairStratigrafieSearch.__wfs_schema = self._get_schema()
-
-            if QuartairStratigrafieSearch.__md_metadata is None:
-                QuartairStratigrafieSearch.__md_metadata = \
-                    self._get_remote_metadata()
-
-            if QuartairStratigrafieSearch.__fc_featurecatalogue is None:
-                csw_url = self._get_csw_base_url()
-                fc_uuid = owsutil.get_featurecatalogue_uuid(
-                    QuartairStratigrafieSearch.__md_metadata)
-
-                QuartairStratigrafieSearch.__fc_featurecatalogue = \
-                    owsutil.get_remote_featurecatalogue(csw_url, fc_uuid)
-
-            if QuartairStratigrafieSearch.__xsd_schemas is None:
-                QuartairStratigrafieSearch.__xsd_schemas = \
-                    self._get_remote_xsd_schemas()
-
-            fields = self._build_fields(
-                QuartairStratigrafieSearch.__wfs_schema,
-                QuartairStratigrafieSearch.__fc_featurecatalogue,
-                QuartairStratigrafieSearch.__xsd_schemas)
-
-            for field in fields.values():
-                if field['name'] not in self._type.get_field_names(
-                        include_wfs_injected=True):
-                    self._type.fields.append(
-                        _WfsInjectedField(name=field['name'],
-                                          datatype=field['type']))
-
-            self._fields = self._build_fields(
-                QuartairStratigrafieSearch.__wfs_schema,
-                QuartairStratigrafieSearch.__fc_featurecatalogue,
-                QuartairStratigrafieSearch.__xsd_schemas)
-
     def search(self, location=None, query=None, sort_by=None,
-               return_fields=None, max_features=None):
+               return_fields=None, max_features=None, depth_range=None):
         """Search for interpretations of Quartair stratigrafie.
 
         Provide either `location` and/or `query` and/or `max_features`.
@@ -948,6 +569,10 @@ class QuartairStratigrafieSearch(AbstractSearch):
             not all fields are currently supported as return fields.
         max_features : int
             Limit the maximum number of features to request.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the layers to return, either can be
+            None. Layers partially within the range are returned. Layers
+            outside the range are not extracted from the XML documents.
 
         Returns
         -------
@@ -959,6 +584,8 @@ class QuartairStratigrafieSearch(AbstractSearch):
         pydov.util.errors.InvalidSearchParameterError
             When not one of `location`, `query` or `max_features` is provided.
 
+            When `depth_range` is invalid.
+
         pydov.util.errors.InvalidFieldError
             When at least one of the fields in `return_fields` is unknown.
 
@@ -969,24 +596,18 @@ class QuartairStratigrafieSearch(AbstractSearch):
             a return field.
 
         pydov.util.errors.FeatureOverflowError
-            When the number of features to be returned is equal to the
-            maxFeatures limit of the WFS server.
+            When the features exceeding the maxFeatures limit of the WFS
+            server could not be retrieved by paging through the results.
 
         AttributeError
             When the argument supplied as return_fields is not a list,
             tuple or set.
 
         """
-        fts = self._search(location=location, query=query, sort_by=sort_by,
-                           return_fields=return_fields,
-                           max_features=max_features)
-
-        interpretaties = self._type.from_wfs(fts, self.__wfs_namespace)
-
-        df = pd.DataFrame(
-            data=self._type.to_df_array(interpretaties, return_fields),
-            columns=self._type.get_field_names(return_fields))
-        return df
+        return super(QuartairStratigrafieSearch, self).search(
+            location=location, query=query, sort_by=sort_by,
+            return_fields=return_fields, max_features=max_features,
+            depth_range=depth_range)
 
 
 class InformeleHydrogeologischeStratigrafieSearch(AbstractSearch):
@@ -1003,74 +624,14 @@ class InformeleHydrogeologischeStratigrafieSearch(AbstractSearch):
 
     """
 
-    __wfs_schema = None
-    __wfs_namespace = None
-    __md_metadata = None
-    __fc_featurecatalogue = None
-    __xsd_schemas = None
-
     def __init__(self, objecttype=InformeleHydrogeologischeStratigrafie):
         """Initialisation."""
         super(InformeleHydrogeologischeStratigrafieSearch, self).__init__(
             'interpretaties:informele_hydrogeologische_stratigrafie',
             objecttype)
 
-    def _init_namespace(self):
-        """Initialise the WFS namespace associated with the layer."""
-        if InformeleHydrogeologischeStratigrafieSearch.__wfs_namespace is None:
-            InformeleHydrogeologischeStratigrafieSearch.__wfs_namespace = \
-                self._get_namespace()
-
-    def _init_fields(self):
-        """Initialise the fields and their metadata available in this search
-        class."""
-        if self._fields is None:
-            if InformeleHydrogeologischeStratigrafieSearch.__wfs_schema is \
-                    None:
-                InformeleHydrogeologischeStratigrafieSearch.__wfs_schema = \
-                    self._get_schema()
-
-            if InformeleHydrogeologischeStratigrafieSearch.__md_metadata is \
-                    None:
-                InformeleHydrogeologischeStratigrafieSearch.__md_metadata = \
-                    self._get_remote_metadata()
-
-            if InformeleHydrogeologischeStratigrafieSearch.\
-                    __fc_featurecatalogue is None:
-                csw_url = self._get_csw_base_url()
-                fc_uuid = owsutil.get_featurecatalogue_uuid(
-                    InformeleHydrogeologischeStratigrafieSearch.__md_metadata)
-
-                InformeleHydrogeologischeStratigrafieSearch.\
-                    __fc_featurecatalogue = \
-                    owsutil.get_remote_featurecatalogue(csw_url, fc_uuid)
-
-            if InformeleHydrogeologischeStratigrafieSearch.__xsd_schemas is \
-                    None:
-                InformeleHydrogeologischeStratigrafieSearch.__xsd_schemas = \
-                    self._get_remote_xsd_schemas()
-
-            fields = self._build_fields(
-                InformeleHydrogeologischeStratigrafieSearch.__wfs_schema,
-                InformeleHydrogeologischeStratigrafieSearch.
-                __fc_featurecatalogue,
-                InformeleHydrogeologischeStratigrafieSearch.__xsd_schemas)
-
-            for field in fields.values():
-                if field['name'] not in self._type.get_field_names(
-                        include_wfs_injected=True):
-                    self._type.fields.append(
-                        _WfsInjectedField(name=field['name'],
-                                          datatype=field['type']))
-
-            self._fields = self._build_fields(
-                InformeleHydrogeologischeStratigrafieSearch.__wfs_schema,
-                InformeleHydrogeologischeStratigrafieSearch.
-                __fc_featurecatalogue,
-                InformeleHydrogeologischeStratigrafieSearch.__xsd_schemas)
-
     def search(self, location=None, query=None, sort_by=None,
-               return_fields=None, max_features=None):
+               return_fields=None, max_features=None, depth_range=None):
         """Search for boreholes (Boring). Provide either `location` or `query`.
         When `return_fields` is None, all fields are returned.
 
@@ -1095,6 +656,10 @@ class InformeleHydrogeologischeStratigrafieSearch(AbstractSearch):
             not all fields are currently supported as return fields.
         max_features : int
             Limit the maximum number of features to request.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the layers to return, either can be
+            None. Layers partially within the range are returned. Layers
+            outside the range are not extracted from the XML documents.
 
         Returns
         -------
@@ -1106,6 +671,8 @@ class InformeleHydrogeologischeStratigrafieSearch(AbstractSearch):
         pydov.util.errors.InvalidSearchParameterError
             When not one of `location` or `query` is provided.
 
+            When `depth_range` is invalid.
+
         pydov.util.errors.InvalidFieldError
             When at least one of the fields in `return_fields` is unknown.
 
@@ -1116,24 +683,16 @@ class InformeleHydrogeologischeStratigrafieSearch(AbstractSearch):
             a return field.
 
         pydov.util.errors.FeatureOverflowError
-            When the number of features to be returned is equal to the
-            maxFeatures limit of the WFS server.
+            When the features exceeding the maxFeatures limit of the WFS
+            server could not be retrieved by paging through the results.
 
         AttributeError
             When the argument supplied as return_fields is not a list,
             tuple or set.
 
         """
-        fts = self._search(location=location, query=query, sort_by=sort_by,
-                           return_fields=return_fields,
-                           max_features=max_features)
-
-        interpretaties = InformeleHydrogeologischeStratigrafie.from_wfs(
-            fts, self.__wfs_namespace)
-
-        df = pd.DataFrame(
-            data=InformeleHydrogeologischeStratigrafie.to_df_array(
-                interpretaties, return_fields),
-            columns=InformeleHydrogeologischeStratigrafie.get_field_names(
-                return_fields))
-        return df
+        return super(InformeleHydrogeologischeStratigrafieSearch,
+                     self).search(
+            location=location, query=query, sort_by=sort_by,
+            return_fields=return_fields, max_features=max_features,
+            depth_range=depth_range)
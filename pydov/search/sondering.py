@@ -1,23 +1,13 @@
 # -*- coding: utf-8 -*-
 """Module containing the search classes to retrieve DOV CPT data."""
-import pandas as pd
-
 from pydov.search.abstract import AbstractSearch
-from pydov.types.fields import _WfsInjectedField
 from pydov.types.sondering import Sondering
-from pydov.util import owsutil
 
 
 class SonderingSearch(AbstractSearch):
     """Search class to retrieve information about CPT measurements (
     Sonderingen)."""
 
-    __wfs_schema = None
-    __wfs_namespace = None
-    __md_metadata = None
-    __fc_featurecatalogue = None
-    __xsd_schemas = None
-
     def __init__(self, objecttype=Sondering):
         """Initialisation.
 
@@ -32,52 +22,9 @@ class SonderingSearch(AbstractSearch):
         super(SonderingSearch, self).__init__(
             'dov-pub:Sonderingen', objecttype)
 
-    def _init_namespace(self):
-        """Initialise the WFS namespace associated with the layer."""
-        if SonderingSearch.__wfs_namespace is None:
-            SonderingSearch.__wfs_namespace = self._get_namespace()
-
-    def _init_fields(self):
-        """Initialise the fields and their metadata available in this search
-        class."""
-        if self._fields is None:
-            if SonderingSearch.__wfs_schema is None:
-                SonderingSearch.__wfs_schema = self._get_schema()
-
-            if SonderingSearch.__md_metadata is None:
-                SonderingSearch.__md_metadata = self._get_remote_metadata()
-
-            if SonderingSearch.__fc_featurecatalogue is None:
-                csw_url = self._get_csw_base_url()
-                fc_uuid = owsutil.get_featurecatalogue_uuid(
-                    SonderingSearch.__md_metadata)
-
-                SonderingSearch.__fc_featurecatalogue = \
-                    owsutil.get_remote_featurecatalogue(csw_url, fc_uuid)
-
-            if SonderingSearch.__xsd_schemas is None:
-                SonderingSearch.__xsd_schemas = \
-                    self._get_remote_xsd_schemas()
-
-            fields = self._build_fields(
-                SonderingSearch.__wfs_schema,
-                SonderingSearch.__fc_featurecatalogue,
-                SonderingSearch.__xsd_schemas)
-
-            for field in fields.values():
-                if field['name'] not in self._type.get_field_names(
-                        include_wfs_injected=True):
-                    self._type.fields.append(
-                        _WfsInjectedField(name=field['name'],
-                                          datatype=field['type']))
-
-            self._fields = self._build_fields(
-                SonderingSearch.__wfs_schema,
-                SonderingSearch.__fc_featurecatalogue,
-                SonderingSearch.__xsd_schemas)
-
     def search(self, location=None, query=None, sort_by=None,
-               return_fields=None, max_features=None):
+               return_fields=None, max_features=None,
+               depth_range=None, depth_step=None):
         """Search for CPT measurements (Sondering). Provide `location` and/or
         `query` and/or `max_features`.
         When `return_fields` is None, all fields are returned.
@@ -103,6 +50,13 @@ class SonderingSearch(AbstractSearch):
             not all fields are currently supported as return fields.
         max_features : int
             Limit the maximum number of features to request.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the measurements to return, either
+            can be None. Measurements outside the range are not extracted
+            from the XML documents.
+        depth_step : float, optional
+            Return only the first measurement in every interval of this
+            depth, f.ex. 0.1 to return measurements every 10 cm.
 
         Returns
         -------
@@ -114,6 +68,8 @@ class SonderingSearch(AbstractSearch):
         pydov.util.errors.InvalidSearchParameterError
             When not one of `location`, `query` or `max_features` is provided.
 
+            When `depth_range` or `depth_step` is invalid.
+
         pydov.util.errors.InvalidFieldError
             When at least one of the fields in `return_fields` is unknown.
 
@@ -124,21 +80,15 @@ class SonderingSearch(AbstractSearch):
             a return field.
 
         pydov.util.errors.FeatureOverflowError
-            When the number of features to be returned is equal to the
-            maxFeatures limit of the WFS server.
+            When the features exceeding the maxFeatures limit of the WFS
+            server could not be retrieved by paging through the results.
 
         AttributeError
             When the argument supplied as return_fields is not a list,
             tuple or set.
 
         """
-        fts = self._search(location=location, query=query, sort_by=sort_by,
-                           return_fields=return_fields,
-                           max_features=max_features)
-
-        sonderingen = self._type.from_wfs(fts, self.__wfs_namespace)
-
-        df = pd.DataFrame(
-            data=self._type.to_df_array(sonderingen, return_fields),
-            columns=self._type.get_field_names(return_fields))
-        return df
+        return super(SonderingSearch, self).search(
+            location=location, query=query, sort_by=sort_by,
+            return_fields=return_fields, max_features=max_features,
+            depth_range=depth_range, depth_step=depth_step)
@@ -1,19 +1,24 @@
 # -*- coding: utf-8 -*-
 """Module containing the base DOV data types."""
 
+import asyncio
+import hashlib
+import re
+import threading
 import types
 import warnings
 from collections import OrderedDict
-from multiprocessing.dummy import Pool
 
 import pydov
 import numpy as np
+import pandas as pd
 
 from owslib.etree import etree
 from pydov.search.abstract import AbstractCommon
 from pydov.types.fields import AbstractField
 from pydov.util.dovutil import (
     get_dov_xml,
+    get_dov_xml_async,
     parse_dov_xml,
 )
 
@@ -38,6 +43,8 @@ class AbstractTypeCommon(AbstractCommon):
 
     fields = []
 
+    __extraction_plans = {}
+
     @classmethod
     def _parse(cls, func, xpath, namespace, returntype):
         """Parse the result of an XML path function, stripping the namespace
@@ -74,6 +81,142 @@ class AbstractTypeCommon(AbstractCommon):
 
         return cls._typeconvert(text, returntype)
 
+    @staticmethod
+    def _compile_xpath(xpath, namespace):
+        """Compile the XML path of a field into a function returning its
+        text from a given element.
+
+        When lxml is available, the path is compiled once into an XPath
+        expression. Otherwise the returned function uses `findtext`.
+
+        Parameters
+        ----------
+        xpath : str
+            XML path of the element.
+        namespace : str or None
+            Namespace to be added to each item in the `xpath`. None to use
+            the xpath as is.
+
+        Returns
+        -------
+        function
+            Function taking an element as single argument and returning the
+            text of the first matching subelement, an empty string if it has
+            no text or None if there is no matching subelement (like
+            `findtext`).
+
+        """
+        if namespace is not None:
+            ns = '{{{}}}'.format(namespace)
+            path = './' + ns + ('/' + ns).join(xpath.split('/'))
+        else:
+            path = './' + xpath.lstrip('/')
+
+        if hasattr(etree, 'ETXPath'):
+            try:
+                compiled = etree.ETXPath(path)
+            except etree.XPathSyntaxError:
+                compiled = None
+
+            if compiled is not None:
+                def extract(element):
+                    result = compiled(element)
+                    if len(result) == 0:
+                        return None
+                    return getattr(result[0], 'text', result[0]) or ''
+
+                return extract
+
+        def findtext(element):
+            return element.findtext(path)
+
+        return findtext
+
+    @classmethod
+    def _get_field_definitions(cls):
+        """Get the definitions of the fields of this type, to detect
+        changes to the fields.
+
+        Returns
+        -------
+        tuple of tuple
+            Tuple (name, source, sourcefield, type) for every field.
+
+        """
+        return tuple((f['name'], f['source'], f.get('sourcefield'),
+                      f.get('type')) for f in cls.fields)
+
+    @classmethod
+    def _get_extraction_plan(cls, source=None, namespace=None):
+        """Get the extraction plan for the fields of this type with the given
+        source.
+
+        The plan is compiled once and cached, until the definitions of the
+        fields of this type change (f.ex. by assigning the result of
+        `extend_fields`, by injecting extra WFS fields or by replacing a
+        field).
+
+        Parameters
+        ----------
+        source : tuple<str>, optional
+            Sources of the fields to include, one or more of `wfs`, `xml` or
+            `custom`. Defaults to None, which includes all fields.
+        namespace : str or None
+            Namespace to be added to each item in the xpath of the fields.
+            None to use the xpath as is.
+
+        Returns
+        -------
+        list of tuple
+            List of tuples (name, extract, convert) for each field, with
+            `extract` a function returning the text of the field from an
+            element and `convert` a function converting this text to the
+            datatype of the field.
+
+        """
+        key = (cls, source, namespace, etree)
+        fingerprint = cls._get_field_definitions()
+
+        cached = AbstractTypeCommon.__extraction_plans.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        fields = [f for f in cls.fields
+                  if source is None or f['source'] in source]
+        extractors = _ParameterIndex.get_extractors(
+            [f['sourcefield'] for f in fields], namespace)
+
+        plan = [(f['name'],
+                 extractors.get(f['sourcefield']) or cls._compile_xpath(
+                     f['sourcefield'], namespace),
+                 cls._get_typeconverter(f.get('type', None)))
+                for f in fields]
+
+        AbstractTypeCommon.__extraction_plans[key] = (fingerprint, plan)
+        return plan
+
+    @classmethod
+    def _extract(cls, element, plan, data):
+        """Extract the values of the fields in the plan from the given
+        element, and save them in the data dictionary.
+
+        Parameters
+        ----------
+        element : etree.Element
+            XML element to extract the values from.
+        plan : list of tuple
+            Extraction plan, as returned by `_get_extraction_plan`.
+        data : dict
+            Dictionary to save the values in, by field name.
+
+        """
+        try:
+            for name, extract, convert in plan:
+                text = extract(element)
+                data[name] = np.nan if text is None else convert(text)
+        finally:
+            _ParameterIndex.clear()
+
     @classmethod
     def extend_fields(cls, extra_fields):
         """Extend the fields of this type with given extra fields and return
@@ -105,6 +248,11 @@ class AbstractDovSubType(AbstractTypeCommon):
     rootpath : str
         XPath expression of the root element of this subtype. Should return
         all elements of this subtype.
+    depthfields : tuple of (str, str)
+        Names of the float fields containing the upper and lower depth of
+        every record, allowing the records to be filtered by depth. Both are
+        the same field for records at a single depth (f.ex. measurements).
+        None if the records cannot be filtered by depth.
 
     Raises
     ------
@@ -114,6 +262,7 @@ class AbstractDovSubType(AbstractTypeCommon):
     """
 
     rootpath = None
+    depthfields = None
 
     _UNRESOLVED = "{UNRESOLVED}"
 
@@ -144,9 +293,10 @@ class AbstractDovSubType(AbstractTypeCommon):
 
         Parameters
         ----------
-        xml_data : bytes
+        xml_data : bytes or etree.Element
             Raw XML data of the DOV object that contains information about
-            this subtype.
+            this subtype, or the root element of the already parsed XML
+            document.
 
         Yields
         ------
@@ -155,7 +305,11 @@ class AbstractDovSubType(AbstractTypeCommon):
 
         """
         try:
-            tree = parse_dov_xml(xml_data)
+            if etree.iselement(xml_data):
+                tree = xml_data
+            else:
+                tree = parse_dov_xml(xml_data)
+
             for element in tree.findall(cls.rootpath):
                 yield cls.from_xml_element(element)
         except XmlParseError:
@@ -181,15 +335,27 @@ class AbstractDovSubType(AbstractTypeCommon):
 
         """
         instance = cls()
+        cls._extract(element, cls._get_extraction_plan(), instance.data)
+        return instance
+
+    @classmethod
+    def _from_data(cls, data):
+        """Build an instance of this subtype from previously extracted
+        values, as saved in the record cache.
 
-        for field in cls.get_fields().values():
-            instance.data[field['name']] = instance._parse(
-                func=element.findtext,
-                xpath=field['sourcefield'],
-                namespace=None,
-                returntype=field.get('type', None)
-            )
+        Parameters
+        ----------
+        data : dict
+            Dictionary with the value of each field of this subtype.
+
+        Returns
+        -------
+        instance of this class
+            An instance of this class with the given data.
 
+        """
+        instance = cls.__new__(cls)
+        instance.data = dict(data)
         return instance
 
     @classmethod
@@ -255,229 +421,1097 @@ class AbstractDovSubType(AbstractTypeCommon):
         return cls.__name__
 
 
-class AbstractDovType(AbstractTypeCommon):
-    """Abstract DOV type grouping fields and methods common to all DOV
-    object types. Not to be instantiated or used directly.
+class _DepthFilter(object):
+    """Filter limiting the records of subtypes to a depth range, and
+    keeping at most one record per depth step.
 
-    Attributes
-    ----------
-    subtypes : list of subclass of pydov.types.abstract.AbstractDovSubType
-        List of subtypes of this type.
+    Only applies to subtypes defining their `depthfields`. Records without
+    depth are removed.
 
     """
 
-    subtypes = []
-
-    _UNRESOLVED = "{UNRESOLVED}"
-
-    def __init__(self, typename, pkey):
+    def __init__(self, depth_range=None, depth_step=None):
         """Initialisation.
 
         Parameters
         ----------
-        typename : str
-            Name of the DOV object type.
-        pkey : str
-            Permanent key of this DOV object, being a URI of the form
-            `https://www.dov.vlaanderen.be/data/typename/id`.
-
-        Raises
-        ------
-        RuntimeError
-            When the defined fields of this type are invalid.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the records to keep, either can be
+            None to not limit the depth on that side. Records partially
+            within the range are kept. Defaults to None.
+        depth_step : float, optional
+            Keep only the first record of every interval of this size,
+            starting from depth 0. Only applies to records at a single depth.
+            Defaults to None, keeping all records.
 
         """
-        if typename is None or pkey is None:
-            raise ValueError(
-                "Failed to instantiate object of class {} with typename '{}' "
-                "and permkey '{}'. Typename and pkey must not be None.".format(
-                    self.__class__.__name__, typename, pkey))
-
-        self.typename = typename
-        self.pkey = pkey
+        self.minimum, self.maximum = depth_range or (None, None)
+        self.step = depth_step
 
-        for f in self.fields:
-            if not isinstance(f, AbstractField):
-                raise RuntimeError(
-                    "Type '{}' fields should be instances of "
-                    "pydov.types.fields.AbstractField, found {}.".format(
-                        self.__class__.__name__, str(type(f))))
+    def __eq__(self, other):
+        return isinstance(other, _DepthFilter) and \
+            (self.minimum, self.maximum, self.step) == \
+            (other.minimum, other.maximum, other.step)
 
-        self.data = dict(
-            zip(self.get_field_names(include_subtypes=False),
-                [AbstractDovType._UNRESOLVED] * len(self.get_field_names()))
-        )
+    def __ne__(self, other):
+        return not self.__eq__(other)
 
-        self.subdata = dict(
-            zip([st.get_name() for st in self.subtypes],
-                [] * len(self.subtypes))
-        )
+    def __hash__(self):
+        return hash((self.minimum, self.maximum, self.step))
 
-        self.data['pkey_{}'.format(self.typename)] = self.pkey
+    def get_mask(self, subtype, top, bottom):
+        """Get the records of the given subtype to keep.
 
-    def _parse_xml_data(self):
-        """Get remote XML data for this DOV object, parse the raw XML and
-        save the results in the data object.
+        Parameters
+        ----------
+        subtype : class
+            The subtype of the records, subclass of AbstractDovSubType.
+        top : numpy.ndarray
+            Upper depth of every record.
+        bottom : numpy.ndarray
+            Lower depth of every record.
 
-        Raises
-        ------
-        NotImplementedError
-            This is an abstract method that should be implemented in a
-            subclass.
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array indicating the records to keep.
 
         """
-        xml = self._get_xml_data()
+        keep = ~(np.isnan(top) | np.isnan(bottom))
+        if self.minimum is not None:
+            keep &= bottom >= self.minimum
+        if self.maximum is not None:
+            keep &= top <= self.maximum
+
+        if self.step is not None and \
+                subtype.depthfields[0] == subtype.depthfields[1]:
+            index = np.flatnonzero(keep)
+            # round first, to keep f.ex. 0.3 / 0.1 in the third step
+            steps = np.floor(np.round(top[index] / self.step, 6))
+            keep[index[1:][steps[1:] == steps[:-1]]] = False
+
+        return keep
+
+
+class _ParameterIndex(object):
+    """Index of repeated XML elements by the text of one of their children.
+
+    Fields with an XML path like
+    `/grondmonster/observatieData/observatie[parameter="BGGG"]/waarde_text`
+    select one of the repeated elements by the value of a child element.
+    Evaluating such a path for every field scans all repeated elements
+    again. Instead, all fields sharing the repeated elements and the
+    child element of the predicate use a single index, built by scanning
+    the repeated elements once per XML element to extract from.
+
+    The indexes of the last XML element are kept per thread, as the
+    extraction plans using them are shared between threads. They hold
+    references to the XML document, and are to be released (see `clear`)
+    after extracting the fields of an element.
 
-        try:
-            tree = parse_dov_xml(xml)
+    """
 
-            for field in self.get_fields(source=('xml',),
-                                         include_subtypes=False).values():
-                self.data[field['name']] = self._parse(
-                    func=tree.findtext,
-                    xpath=field['sourcefield'],
-                    namespace=None,
-                    returntype=field.get('type', None)
-                )
+    _local = threading.local()
 
-            self._parse_subtypes(xml)
-        except XmlParseError:
-            warnings.warn(("Failed to parse XML for object '{}'. Resulting "
-                          "dataframe will be incomplete.").format(self.pkey),
-                          XmlParseWarning)
+    _pattern = re.compile(
+        r'^(?P<path>/?[A-Za-z_][\w.-]*(?:/[A-Za-z_][\w.-]*)*)'
+        r'\[(?P<key>[A-Za-z_][\w.-]*)=(?P<quote>["\'])(?P<value>.*?)'
+        r'(?P=quote)\]'
+        r'/(?P<child>[A-Za-z_][\w.-]*(?:/[A-Za-z_][\w.-]*)*)$')
 
-    @classmethod
-    def from_wfs_element(cls, feature, namespace):
-        """Build an instance of this type from a WFS feature element.
+    def __init__(self, path, key):
+        """Initialisation.
 
         Parameters
         ----------
-        feature : etree.Element
-            XML element representing a single record of the WFS layer.
-        namespace : str
-            Namespace associated with this WFS featuretype.
-
-        Raises
-        ------
-        NotImplementedError
-            This is an abstract method that should be implemented in a
-            subclass.
+        path : str
+            Path of the repeated elements, relative to the element to
+            extract from.
+        key : str
+            Path of the child element of the repeated elements to index by.
 
         """
-        raise NotImplementedError('This should be implemented in a subclass.')
+        self.path = path
+        self.key = key
 
     @classmethod
-    def from_wfs(cls, response, namespace):
-        """Build instances of this type from a WFS response.
+    def get_extractors(cls, xpaths, namespace=None):
+        """Get the functions extracting the given XML paths using a shared
+        index.
+
+        Only paths selecting an element using a predicate on the value of
+        one of its children are included, if at least one other path uses
+        the same elements and child.
 
         Parameters
         ----------
-        response : str or bytes or etree.Element or iterable<etree.Element>
-            WFS response containing GML features.
+        xpaths : list of str
+            XML paths of the fields.
+        namespace : str or None
+            Namespace to be added to each item in the xpaths. None to use
+            the xpaths as is.
 
-            Can either be a GML `str` or `byte` sequence, in which case it
-            will be parsed and scanned for `gml:featureMembers`.
+        Returns
+        -------
+        dict
+            Dictionary with, for the included XML paths, a function taking
+            an element as single argument and returning the text of the
+            first matching subelement, an empty string if it has no text or
+            None if there is no matching subelement (like `findtext`).
 
-            Can also be a single instance of `etree.Element` containing the
-            parsed GML response.
+        """
+        def qualify(path):
+            if namespace is None:
+                return path
+            ns = '{{{}}}'.format(namespace)
+            return ns + ('/' + ns).join(path.split('/'))
+
+        groups = OrderedDict()
+        for xpath in OrderedDict.fromkeys(xpaths):
+            match = cls._pattern.match(xpath)
+            if match is not None:
+                groups.setdefault(
+                    (match.group('path'), match.group('key')), []).append(
+                        (xpath, match.group('value'), match.group('child')))
+
+        extractors = {}
+        for (path, key), items in groups.items():
+            if len(items) < 2:
+                continue
+            index = cls('./' + qualify(path.lstrip('/')), qualify(key))
+            for xpath, value, child in items:
+                extractors[xpath] = index.get_extractor(
+                    value, './' + qualify(child))
+
+        return extractors
+
+    def get_index(self, element):
+        """Get the index of the repeated elements of the given element.
 
-            It can also be an iterable (list, tuple or generator) of
-            `etree.Element` in which case it will be looped over.
-        namespace : str
-             Namespace associated with this WFS featuretype.
+        Parameters
+        ----------
+        element : etree.Element
+            XML element to extract from.
 
-        Yields
-        ------
-            An instance of this type for each record in the WFS response.
+        Returns
+        -------
+        dict
+            Dictionary with the text of the key element as key and the list
+            of repeated elements with this text as value, in document order.
 
         """
-        if type(response) is str:
-            response = response.encode('utf-8')
-
-        if type(response) is bytes:
-            response = etree.fromstring(response)
+        local = _ParameterIndex._local
+        if not hasattr(local, 'indexes'):
+            local.indexes = {}
+
+        cached = local.indexes.get(self)
+        if cached is None or cached[0] is not element:
+            cached = (element, self._build_index(element))
+            local.indexes[self] = cached
+        return cached[1]
+
+    @staticmethod
+    def clear():
+        """Release the indexes kept by the current thread, together with
+        the XML elements they were built from."""
+        _ParameterIndex._local.indexes = {}
+
+    def _build_index(self, element):
+        """Build the index of the repeated elements of the given element,
+        scanning them once.
 
-        element_type = type(etree.Element(b'xml'))
-        if isinstance(response, element_type):
-            feature_members = response.find('.//{http://www.opengis.net/gml}'
-                                            'featureMembers')
+        Parameters
+        ----------
+        element : etree.Element
+            XML element to extract from.
 
-            if feature_members is not None:
-                for ft in feature_members:
-                    yield (cls.from_wfs_element(ft, namespace))
+        Returns
+        -------
+        dict
+            Dictionary with the text of the key element as key and the list
+            of repeated elements with this text as value, in document order.
 
-        if type(response) in (list, tuple, set) \
-                or isinstance(response, types.GeneratorType):
-            for el in response:
-                yield (cls.from_wfs_element(el, namespace))
+        """
+        index = {}
+        for item in element.iterfind(self.path):
+            for key in item.iterfind(self.key):
+                index.setdefault(key.text or '', []).append(item)
+        return index
 
-    @classmethod
-    def get_field_names(cls, return_fields=None, include_subtypes=True,
-                        include_wfs_injected=False):
-        """Return the names of the fields available for this type.
+    def get_extractor(self, value, child):
+        """Get the function extracting a child of the repeated element with
+        the given key.
 
         Parameters
         ----------
-        return_fields : list<str> or tuple<str> or set<str>
-            List of fields to include in the data array. The order is
-            ignored, the default order of the fields of the datatype is used
-            instead. Defaults to None, which will include all fields.
-        include_subtypes : boolean
-            Whether to include fields defined in subtypes (True) or not (
-            False). Defaults to True.
-        include_wfs_injected : boolean
-            Whether to include fields defined in WFS only, not in the
-            default dataframe for this type. Defaults to False.
+        value : str
+            Text of the key element of the repeated element.
+        child : str
+            Path of the element to extract, relative to the repeated element.
 
         Returns
         -------
-        list<str>
-            List of the field names available for this type. These are also
-            the names of the columns in the output dataframe for this type.
-
-        Raises
-        ------
-        AttributeError
-            If the type of `return_fields` is not one of None, list, tuple or
-            set.
-        pydov.util.errors.InvalidFieldError
-            If at least one of the fields listed in `return_fields` is unknown.
+        function
+            Function taking an element as single argument and returning the
+            text of the first matching subelement, an empty string if it has
+            no text or None if there is no matching subelement.
 
         """
-        if return_fields is None:
-            if include_wfs_injected:
-                fields = [f['name'] for f in cls.fields]
-            else:
-                fields = [f['name'] for f in cls.fields if not f.get(
-                    'wfs_injected', False)]
-            if include_subtypes:
-                for st in cls.subtypes:
-                    fields.extend(st.get_field_names())
-        elif type(return_fields) not in (list, tuple, set):
-            raise AttributeError(
-                'return_fields should be a list, tuple or set')
-        else:
-            cls_fields = [f['name'] for f in cls.fields]
-            if include_subtypes:
-                for st in cls.subtypes:
-                    cls_fields.extend(st.get_field_names())
+        def extract(element):
+            for item in self.get_index(element).get(value, ()):
+                text = item.findtext(child)
+                if text is not None:
+                    return text
 
-            fields = [f for f in return_fields if f in cls_fields]
+        return extract
 
-            for rf in return_fields:
-                if rf not in cls_fields:
-                    raise InvalidFieldError(
-                        "Unknown return field: '{}'".format(rf))
-        return fields
 
-    @classmethod
-    def get_fields(cls, source=('wfs', 'xml'), include_subtypes=True):
-        """Return the metadata of the fields available for this type.
+class _SubtypeRecords(object):
+    """Compact storage of the records of a single subtype of a DOV object.
+
+    Instead of an instance of the subtype with a data dictionary for every
+    record, the values of all records are stored per field. Float fields
+    are stored in NumPy arrays.
+
+    Attributes
+    ----------
+    subtype : class
+        The subtype of the records, subclass of AbstractDovSubType.
+    columns : dict
+        Mapping of the name of every field of the subtype to the list or
+        array of its values, in the order of the records.
+
+    """
+
+    __slots__ = ('subtype', 'columns')
+
+    def __init__(self, subtype, columns):
+        """Initialisation.
 
         Parameters
         ----------
-        source : list<str> or tuple<str> or iterable<str>
-            A list of sources to include in the output. Can be a combination
+        subtype : class
+            The subtype of the records, subclass of AbstractDovSubType.
+        columns : dict
+            Mapping of the name of every field of the subtype to the list or
+            array of its values, in the order of the records.
+
+        """
+        self.subtype = subtype
+        self.columns = columns
+
+    @classmethod
+    def from_xml(cls, subtype, tree, depth_filter=None):
+        """Extract the records of the given subtype from an XML document.
+
+        The values are extracted directly into the columns (see
+        `_extract_columns`), unless the subtype overrides `from_xml` or
+        `from_xml_element`, in which case the values of the instances
+        returned by `from_xml` are used.
+
+        Parameters
+        ----------
+        subtype : class
+            The subtype of the records, subclass of AbstractDovSubType.
+        tree : etree.Element
+            Root element of the parsed XML document of the DOV object.
+        depth_filter : pydov.types.abstract._DepthFilter, optional
+            Filter limiting the records to extract. Records removed by the
+            filter are not extracted at all. Defaults to None, extracting
+            all records.
+
+        Returns
+        -------
+        pydov.types.abstract._SubtypeRecords
+            The records of the subtype in the XML document.
+
+        """
+        names = subtype.get_field_names()
+
+        if subtype.from_xml.__func__ is not \
+                AbstractDovSubType.from_xml.__func__ or \
+                subtype.from_xml_element.__func__ is not \
+                AbstractDovSubType.from_xml_element.__func__:
+            rows = [i.data for i in subtype.from_xml(tree)]
+            if depth_filter is not None:
+                top, bottom = [np.array(
+                    [r.get(f, np.nan) for r in rows], dtype=float)
+                    for f in subtype.depthfields]
+                keep = depth_filter.get_mask(subtype, top, bottom)
+                rows = [r for r, k in zip(rows, keep) if k]
+            values = [[r.get(n, np.nan) for r in rows] for n in names]
+        else:
+            elements = tree.findall(subtype.rootpath)
+            if depth_filter is not None:
+                elements = cls._filter_elements(
+                    subtype, elements, depth_filter)
+            values = cls._extract_columns(subtype, elements)
+
+        fields = subtype.get_fields()
+        columns = {}
+        for name, column in zip(names, values):
+            if fields[name].get('type') == 'float' and \
+                    not isinstance(column, np.ndarray):
+                try:
+                    column = np.array(column, dtype=float)
+                except (ValueError, TypeError):
+                    pass
+            columns[name] = column
+
+        return cls(subtype, columns)
+
+    @classmethod
+    def _extract_columns(cls, subtype, elements):
+        """Extract the values of all fields of the given subtype from its
+        elements, per field.
+
+        Fields referring to a direct child element of the subtype element
+        are extracted in a single pass over the children of every element,
+        instead of evaluating an XPath expression per field and element.
+        Float fields are converted to NumPy arrays at once. Other fields are
+        extracted using their extraction plan.
+
+        Parameters
+        ----------
+        subtype : class
+            The subtype of the records, subclass of AbstractDovSubType.
+        elements : list of etree.Element
+            XML elements of the subtype, one for every record.
+
+        Returns
+        -------
+        list of list or numpy.ndarray
+            Values of every field of the subtype, in the order of the fields
+            and the elements.
+
+        """
+        plan = subtype._get_extraction_plan()
+
+        child_fields = {}
+        for index, field in enumerate(subtype.fields):
+            tag = cls._get_child_tag(field['sourcefield'])
+            if tag is not None and tag not in child_fields:
+                child_fields[tag] = index
+
+        texts = dict((i, [None] * len(elements))
+                     for i in child_fields.values())
+
+        if len(texts) > 0:
+            for row, element in enumerate(elements):
+                for child in element:
+                    index = child_fields.get(child.tag)
+                    if index is not None and texts[index][row] is None:
+                        texts[index][row] = child.text or ''
+
+        values = []
+        try:
+            for index, (name, extract, convert) in enumerate(plan):
+                if index in texts:
+                    values.append(cls._convert_column(
+                        texts[index], convert,
+                        subtype.fields[index].get('type')))
+                else:
+                    values.append([np.nan if t is None else convert(t)
+                                   for t in (extract(e) for e in elements)])
+        finally:
+            _ParameterIndex.clear()
+
+        return values
+
+    @classmethod
+    def _filter_elements(cls, subtype, elements, depth_filter):
+        """Filter the elements of the given subtype by depth.
+
+        Only the depth fields are extracted to filter the elements.
+
+        Parameters
+        ----------
+        subtype : class
+            The subtype of the records, subclass of AbstractDovSubType.
+        elements : list of etree.Element
+            XML elements of the subtype, one for every record.
+        depth_filter : pydov.types.abstract._DepthFilter
+            Filter limiting the records to keep.
+
+        Returns
+        -------
+        list of etree.Element
+            XML elements of the records to keep.
+
+        """
+        plan = dict((name, (extract, convert)) for name, extract, convert
+                    in subtype._get_extraction_plan())
+
+        depths = []
+        try:
+            for field in subtype.depthfields:
+                extract, convert = plan[field]
+                depths.append(np.asarray(cls._convert_column(
+                    [extract(e) for e in elements], convert, 'float'),
+                    dtype=float))
+        finally:
+            _ParameterIndex.clear()
+
+        keep = depth_filter.get_mask(subtype, *depths)
+        return [e for e, k in zip(elements, keep) if k]
+
+    @staticmethod
+    def _get_child_tag(xpath):
+        """Get the tag of the child element referred to by the given XML
+        path.
+
+        Parameters
+        ----------
+        xpath : str
+            XML path of a field, relative to the element of the subtype.
+
+        Returns
+        -------
+        str or None
+            Tag of the child element if the path refers to a direct child
+            element without namespace, None otherwise.
+
+        """
+        tag = xpath.strip('/')
+        if re.match(r'^[A-Za-z_][\w.-]*$', tag) is not None:
+            return tag
+
+    @staticmethod
+    def _convert_column(texts, convert, datatype):
+        """Convert the texts of a field for all records to its datatype.
+
+        Parameters
+        ----------
+        texts : list
+            Texts of the field, None for records without the field.
+        convert : function
+            Function converting a single text to the datatype of the field.
+        datatype : str
+            Datatype of the field.
+
+        Returns
+        -------
+        list or numpy.ndarray
+            Values of the field, using np.nan for missing values. Float
+            fields are returned as a NumPy array.
+
+        """
+        if datatype == 'float':
+            try:
+                return np.array(texts, dtype=float)
+            except (ValueError, TypeError):
+                pass
+
+        return [np.nan if t is None else convert(t) for t in texts]
+
+    def __len__(self):
+        """Return the number of records.
+
+        Returns
+        -------
+        int
+            Number of records.
+
+        """
+        for column in self.columns.values():
+            return len(column)
+        return 0
+
+    def __iter__(self):
+        """Iterate over the records as instances of the subtype.
+
+        Yields
+        ------
+        instance of the subtype
+            An instance of the subtype for every record.
+
+        """
+        names = list(self.columns)
+        for values in zip(*[self.get_column(n) for n in names]):
+            yield self.subtype._from_data(dict(zip(names, values)))
+
+    def get_column(self, name, default=np.nan):
+        """Return the values of the given field for all records.
+
+        Parameters
+        ----------
+        name : str
+            Name of the field.
+        default : object, optional
+            Value to use for all records when the subtype has no field with
+            the given name. Defaults to np.nan.
+
+        Returns
+        -------
+        list
+            List of the values of the field, in the order of the records.
+
+        """
+        column = self.columns.get(name)
+        if column is None:
+            return [default] * len(self)
+        elif isinstance(column, np.ndarray):
+            values = column.tolist()
+            if np.isnan(column).any():
+                values = [np.nan if v != v else v for v in values]
+            return values
+        return column
+
+    def get_rows(self, fields, defaults=None):
+        """Return the values of the given fields for every record.
+
+        Parameters
+        ----------
+        fields : list<str>
+            Names of the fields.
+        defaults : dict, optional
+            Mapping of field names to the value to use when the subtype has
+            no field with this name. Defaults to None, using np.nan.
+
+        Returns
+        -------
+        list of list
+            List of the values of the fields, for every record.
+
+        """
+        defaults = defaults or {}
+        return [list(r) for r in zip(*[self.get_column(
+            f, defaults.get(f, np.nan)) for f in fields])]
+
+
+class _ResolutionPlan(object):
+    """Plan describing which sources are needed to resolve the requested
+    fields of a DOV type, computed once for all instances in a result set.
+
+    Attributes
+    ----------
+    fields : list<str>
+        Names of the requested fields, in the order of the output columns.
+    xml_fields : list<str>
+        Names of the requested fields of the main type that are resolved
+        from the XML document.
+    subtypes : list<str>
+        Names of the subtypes of which at least one field is requested.
+    depth_filters : dict
+        Mapping of the names of the requested subtypes that should be
+        filtered by depth to their pydov.types.abstract._DepthFilter.
+
+    """
+
+    def __init__(self, fields, xml_fields, subtypes, depth_filters=None):
+        """Initialisation.
+
+        Parameters
+        ----------
+        fields : list<str>
+            Names of the requested fields, in the order of the output columns.
+        xml_fields : list<str>
+            Names of the requested fields of the main type that are resolved
+            from the XML document.
+        subtypes : list<str>
+            Names of the subtypes of which at least one field is requested.
+        depth_filters : dict, optional
+            Mapping of the names of the requested subtypes that should be
+            filtered by depth to their pydov.types.abstract._DepthFilter.
+            Defaults to None, not filtering any subtype.
+
+        """
+        self.fields = fields
+        self.xml_fields = xml_fields
+        self.subtypes = subtypes
+        self.depth_filters = depth_filters or {}
+
+    @property
+    def requires_xml(self):
+        """Whether the XML document is needed to resolve the requested
+        fields.
+
+        Returns
+        -------
+        bool
+            True if at least one of the requested fields is resolved from
+            the XML document, False otherwise.
+
+        """
+        return len(self.xml_fields) > 0 or len(self.subtypes) > 0
+
+
+class _DataFrameBuilder(object):
+    """Builder assembling a Pandas dataframe column by column.
+
+    The values of every row are appended to a list per field, which is
+    converted to an array of the dtype matching the type of the field when
+    building the dataframe.
+
+    """
+
+    def __init__(self, fields, types):
+        """Initialisation.
+
+        Parameters
+        ----------
+        fields : list<str>
+            Names of the fields, in the order of the output columns.
+        types : dict
+            Mapping of the field names to the datatype of the field, one of
+            `string`, `float`, `integer`, `date`, `datetime` or `boolean`.
+            The dtype of fields with another or no datatype is inferred by
+            Pandas.
+
+        """
+        self.fields = fields
+        self.types = types
+        self.columns = [[] for f in fields]
+
+    def append(self, result):
+        """Append the rows of a single instance.
+
+        Parameters
+        ----------
+        result : list or list of list
+            Data array of a single instance, as returned by `get_df_array`.
+
+        """
+        if len(result) == 0:
+            return
+
+        if not isinstance(result[0], list):
+            result = [result]
+
+        for row in result:
+            for column, value in zip(self.columns, row):
+                column.append(value)
+
+    def extend(self, columns):
+        """Append a block of rows, given as the values of every column.
+
+        Parameters
+        ----------
+        columns : list of list or numpy.ndarray
+            Values of every field for all rows of the block, in the order of
+            the fields.
+
+        """
+        for column, values in zip(self.columns, columns):
+            if isinstance(values, np.ndarray):
+                values = values.tolist()
+            column.extend(values)
+
+    @staticmethod
+    def _build_column(values, datatype):
+        """Convert the values of a column to an array with the dtype
+        matching the given datatype.
+
+        Integer and boolean columns with missing values use the nullable
+        Pandas dtypes `Int64` and `boolean`. Date and datetime columns use
+        `datetime64`, string columns use `object`, also when all values
+        are missing.
+
+        Parameters
+        ----------
+        values : list
+            Values of the column, using np.nan for missing values.
+        datatype : str
+            Datatype of the field.
+
+        Returns
+        -------
+        list or array-like
+            Values of the column. Returns the values as is when they
+            cannot be converted to the datatype.
+
+        """
+        try:
+            if datatype == 'float':
+                return np.array(values, dtype=float)
+            elif datatype == 'string':
+                return pd.Series(values, dtype=object)
+            elif datatype in ('integer', 'boolean'):
+                if pd.isna(np.array(values, dtype=object)).any():
+                    return pd.array(values, dtype='Int64' if datatype ==
+                                    'integer' else 'boolean')
+                return np.array(values, dtype=np.int64 if datatype ==
+                                'integer' else bool)
+            elif datatype in ('date', 'datetime'):
+                return pd.to_datetime(values).values
+        except (ValueError, TypeError):
+            pass
+        return values
+
+    def build(self):
+        """Build the dataframe of all appended rows.
+
+        Returns
+        -------
+        pandas.core.frame.DataFrame
+            Dataframe with a column for every field.
+
+        """
+        return pd.DataFrame(
+            dict((f, self._build_column(c, self.types.get(f)))
+                 for f, c in zip(self.fields, self.columns)),
+            columns=self.fields)
+
+
+class AbstractDovType(AbstractTypeCommon):
+    """Abstract DOV type grouping fields and methods common to all DOV
+    object types. Not to be instantiated or used directly.
+
+    Attributes
+    ----------
+    subtypes : list of subclass of pydov.types.abstract.AbstractDovSubType
+        List of subtypes of this type.
+
+    """
+
+    subtypes = []
+
+    _UNRESOLVED = "{UNRESOLVED}"
+
+    __fingerprints = {}
+
+    def __init__(self, typename, pkey):
+        """Initialisation.
+
+        Parameters
+        ----------
+        typename : str
+            Name of the DOV object type.
+        pkey : str
+            Permanent key of this DOV object, being a URI of the form
+            `https://www.dov.vlaanderen.be/data/typename/id`.
+
+        Raises
+        ------
+        RuntimeError
+            When the defined fields of this type are invalid.
+
+        """
+        if typename is None or pkey is None:
+            raise ValueError(
+                "Failed to instantiate object of class {} with typename '{}' "
+                "and permkey '{}'. Typename and pkey must not be None.".format(
+                    self.__class__.__name__, typename, pkey))
+
+        self.typename = typename
+        self.pkey = pkey
+
+        for f in self.fields:
+            if not isinstance(f, AbstractField):
+                raise RuntimeError(
+                    "Type '{}' fields should be instances of "
+                    "pydov.types.fields.AbstractField, found {}.".format(
+                        self.__class__.__name__, str(type(f))))
+
+        self.data = dict(
+            zip(self.get_field_names(include_subtypes=False),
+                [AbstractDovType._UNRESOLVED] * len(self.get_field_names()))
+        )
+
+        self.subdata = dict(
+            zip([st.get_name() for st in self.subtypes],
+                [] * len(self.subtypes))
+        )
+
+        self.data['pkey_{}'.format(self.typename)] = self.pkey
+
+        self._xml_data = None
+        self._xml_parsed = False
+        self._parsed_subtypes = {}
+
+    def _parse_xml_data(self, plan=None):
+        """Get remote XML data for this DOV object, parse the raw XML and
+        save the results in the data object.
+
+        Only the parts of the XML document needed for the given plan are
+        parsed: the XML fields of the main type are only extracted when at
+        least one of them is requested and subtypes are only parsed when at
+        least one of their fields is requested. Parts that have been parsed
+        before are not parsed again.
+
+        Parameters
+        ----------
+        plan : pydov.types.abstract._ResolutionPlan, optional
+            Plan describing the fields to resolve. Defaults to None, which
+            will parse the XML fields of the main type and all subtypes.
+
+        """
+        if plan is None:
+            plan = self._get_resolution_plan()
+
+        if not self._needs_xml(plan) or self._load_record(plan):
+            return
+
+        parse_main, subtypes = self._get_unparsed(plan)
+
+        xml = self._get_xml_data()
+        self._xml_parsed = self._xml_parsed or parse_main
+        self._parsed_subtypes.update(
+            (st, plan.depth_filters.get(st)) for st in subtypes)
+
+        try:
+            tree = parse_dov_xml(xml)
+
+            if parse_main:
+                self._extract(tree, self._get_extraction_plan(
+                    source=('xml',)), self.data)
+
+            self._parse_subtypes(tree, subtypes, plan.depth_filters)
+            self._save_record()
+        except XmlParseError:
+            warnings.warn(("Failed to parse XML for object '{}'. Resulting "
+                          "dataframe will be incomplete.").format(self.pkey),
+                          XmlParseWarning)
+
+    @classmethod
+    def _get_fields_fingerprint(cls):
+        """Get a fingerprint of the definitions of the XML fields of this
+        type and its subtypes.
+
+        The fingerprint is computed once and cached, until the fields or
+        subtypes of this type change.
+
+        Returns
+        -------
+        str
+            Hexadecimal digest of the field definitions.
+
+        """
+        check = (cls._get_field_definitions(), tuple(
+            (st, st.rootpath, st._get_field_definitions())
+            for st in cls.subtypes))
+
+        cached = AbstractDovType.__fingerprints.get(cls)
+        if cached is not None and cached[0] == check:
+            return cached[1]
+
+        definitions = [
+            [(f['name'], f['source'], f.get('sourcefield'), f.get('type'))
+             for f in cls.fields if f['source'] == 'xml']]
+        for st in cls.subtypes:
+            definitions.append((st.get_name(), st.rootpath, [
+                (f['name'], f.get('sourcefield'), f.get('type'))
+                for f in st.fields]))
+
+        fingerprint = hashlib.sha1(
+            repr(definitions).encode('utf-8')).hexdigest()
+
+        AbstractDovType.__fingerprints[cls] = (check, fingerprint)
+        return fingerprint
+
+    def _get_record_key(self):
+        """Get the key identifying the record of this instance in the record
+        cache.
+
+        Returns
+        -------
+        tuple
+            Key consisting of the type, the permanent key of this instance
+            and the fingerprint of the field definitions of the type.
+
+        """
+        return ('{}.{}'.format(self.__class__.__module__,
+                               self.__class__.__name__),
+                self.pkey, self._get_fields_fingerprint())
+
+    def _load_record(self, plan):
+        """Load the parsed XML field values and subtypes of this instance
+        from the package wide record cache, if available.
+
+        Records can be partial, containing only the parts of the XML
+        document that have been parsed before. All available parts are
+        loaded, also when they are not needed for the given plan, except
+        for subtypes the plan filters by depth.
+
+        Parameters
+        ----------
+        plan : pydov.types.abstract._ResolutionPlan
+            Plan describing the fields to resolve.
+
+        Returns
+        -------
+        bool
+            True if all values needed for the given plan have been loaded
+            from the record cache, False if the XML document should be
+            parsed.
+
+        """
+        if pydov.record_cache is None:
+            return False
+
+        record = pydov.record_cache.get(self._get_record_key())
+        if record is None:
+            return False
+
+        if record['data'] is not None:
+            self.data.update(record['data'])
+            self._xml_parsed = True
+
+        for subtype in self.subtypes:
+            st_name = subtype.get_name()
+            if st_name in record['subdata'] and \
+                    st_name not in plan.depth_filters:
+                self.subdata[st_name] = _SubtypeRecords(
+                    subtype, record['subdata'][st_name])
+                self._parsed_subtypes[st_name] = None
+
+        return not self._needs_xml(plan)
+
+    def _save_record(self):
+        """Save the parsed XML field values and subtypes of this instance in
+        the package wide record cache, if enabled.
+
+        Only the parts of the XML document that have been parsed are saved.
+        Subtypes filtered by depth are not saved.
+
+        """
+        if pydov.record_cache is None:
+            return
+
+        record = {
+            'data': dict((name, self.data[name]) for name, _, _ in
+                         self._get_extraction_plan(source=('xml',)))
+            if self._xml_parsed else None,
+            'subdata': dict(
+                (st.get_name(), self.subdata[st.get_name()].columns)
+                for st in self.subtypes
+                if st.get_name() in self._parsed_subtypes and
+                self._parsed_subtypes[st.get_name()] is None)
+        }
+        pydov.record_cache.save(self._get_record_key(), record)
+
+    @classmethod
+    def from_wfs_element(cls, feature, namespace):
+        """Build an instance of this type from a WFS feature element.
+
+        Parameters
+        ----------
+        feature : etree.Element
+            XML element representing a single record of the WFS layer.
+        namespace : str
+            Namespace associated with this WFS featuretype.
+
+        Raises
+        ------
+        NotImplementedError
+            This is an abstract method that should be implemented in a
+            subclass.
+
+        """
+        raise NotImplementedError('This should be implemented in a subclass.')
+
+    @classmethod
+    def from_wfs(cls, response, namespace):
+        """Build instances of this type from a WFS response.
+
+        Parameters
+        ----------
+        response : str or bytes or etree.Element or iterable<etree.Element>
+            WFS response containing GML features.
+
+            Can either be a GML `str` or `byte` sequence, in which case it
+            will be parsed and scanned for `gml:featureMembers`.
+
+            Can also be a single instance of `etree.Element` containing the
+            parsed GML response.
+
+            It can also be an iterable (list, tuple or generator) of
+            `etree.Element` in which case it will be looped over.
+        namespace : str
+             Namespace associated with this WFS featuretype.
+
+        Yields
+        ------
+            An instance of this type for each record in the WFS response.
+
+        """
+        if type(response) is str:
+            response = response.encode('utf-8')
+
+        if type(response) is bytes:
+            response = etree.fromstring(response)
+
+        element_type = type(etree.Element(b'xml'))
+        if isinstance(response, element_type):
+            feature_members = response.find('.//{http://www.opengis.net/gml}'
+                                            'featureMembers')
+
+            if feature_members is not None:
+                for ft in feature_members:
+                    yield (cls.from_wfs_element(ft, namespace))
+
+        if type(response) in (list, tuple, set) \
+                or isinstance(response, types.GeneratorType):
+            for el in response:
+                yield (cls.from_wfs_element(el, namespace))
+
+    @classmethod
+    def get_field_names(cls, return_fields=None, include_subtypes=True,
+                        include_wfs_injected=False):
+        """Return the names of the fields available for this type.
+
+        Parameters
+        ----------
+        return_fields : list<str> or tuple<str> or set<str>
+            List of fields to include in the data array. The order is
+            ignored, the default order of the fields of the datatype is used
+            instead. Defaults to None, which will include all fields.
+        include_subtypes : boolean
+            Whether to include fields defined in subtypes (True) or not (
+            False). Defaults to True.
+        include_wfs_injected : boolean
+            Whether to include fields defined in WFS only, not in the
+            default dataframe for this type. Defaults to False.
+
+        Returns
+        -------
+        list<str>
+            List of the field names available for this type. These are also
+            the names of the columns in the output dataframe for this type.
+
+        Raises
+        ------
+        AttributeError
+            If the type of `return_fields` is not one of None, list, tuple or
+            set.
+        pydov.util.errors.InvalidFieldError
+            If at least one of the fields listed in `return_fields` is unknown.
+
+        """
+        if return_fields is None:
+            if include_wfs_injected:
+                fields = [f['name'] for f in cls.fields]
+            else:
+                fields = [f['name'] for f in cls.fields if not f.get(
+                    'wfs_injected', False)]
+            if include_subtypes:
+                for st in cls.subtypes:
+                    fields.extend(st.get_field_names())
+        elif type(return_fields) not in (list, tuple, set):
+            raise AttributeError(
+                'return_fields should be a list, tuple or set')
+        else:
+            cls_fields = [f['name'] for f in cls.fields]
+            if include_subtypes:
+                for st in cls.subtypes:
+                    cls_fields.extend(st.get_field_names())
+
+            fields = [f for f in return_fields if f in cls_fields]
+
+            for rf in return_fields:
+                if rf not in cls_fields:
+                    raise InvalidFieldError(
+                        "Unknown return field: '{}'".format(rf))
+        return fields
+
+    @classmethod
+    def get_fields(cls, source=('wfs', 'xml'), include_subtypes=True):
+        """Return the metadata of the fields available for this type.
+
+        Parameters
+        ----------
+        source : list<str> or tuple<str> or iterable<str>
+            A list of sources to include in the output. Can be a combination
             of one or more of `wfs`, `xml` or `custom . Defaults to (`wfs`,
             `xml`).
         include_subtypes : boolean
@@ -486,76 +1520,423 @@ class AbstractDovType(AbstractTypeCommon):
 
         Returns
         -------
-        collections.OrderedDict<str,dict>
-            Ordered dictionary mapping the field (column) name to the
-            dictionary containing the metadata of this field.
+        collections.OrderedDict<str,dict>
+            Ordered dictionary mapping the field (column) name to the
+            dictionary containing the metadata of this field.
+
+            This metadata dictionary includes at least:
+
+            name (str)
+                The name of the field in the output data.
+
+            source (str)
+                The source of the field (either `wfs`, `xml` or `custom`).
+
+            type (str)
+                Datatype of the output data field (one of `string`, `float`,
+                `integer`, `date`, `datetime`, `boolean`).
+
+            The metadata dictionary additionally includes for fields with
+            source `xml` or `wfs`:
+
+            sourcefield (str)
+                The name of the field in the source (source + sourcefield
+                identify the origin of the data).
+
+            The metadata dictionary additionally includes for fields with
+            source `xml` or `custom`:
+
+            definition (str)
+                The definition of the field.
+
+            notnull (boolean)
+                Whether the field is mandatory (True) or can be null (False).
+
+        """
+        fields = OrderedDict(
+            zip([f['name'] for f in cls.fields if f['source'] in source],
+                [f for f in cls.fields if f['source'] in source]))
+
+        if include_subtypes and 'xml' in source:
+            for st in cls.subtypes:
+                fields.update(st.get_fields())
+
+        return fields
+
+    @classmethod
+    def get_xsd_schemas(cls):
+        """Get a set of distinct XSD schema URLs for this type and its
+        subtypes.
+
+        Returns
+        -------
+        set of str
+            A set of XSD schema URLs.
+
+        """
+        xsd_schemas = set()
+
+        fields = cls.get_fields(source='xml', include_subtypes=True)
+
+        for f in fields.values():
+            if 'xsd_type' in f:
+                xsd_schemas.add(f['xsd_schema'])
+
+        return xsd_schemas
+
+    @classmethod
+    def to_df_array(cls, iterable, return_fields=None):
+        """Returns a dataframe array with one or more arrays (rows) for each
+        instance in the given iterable.
+
+        Uses the package wide executor (`pydov.executor`) to perform IO
+        operations in parallel.
+
+        Parameters
+        ----------
+        iterable : list<DovType> or tuple<DovType> or iterable<DovType>
+            A list of instances of a DOV type.
+        return_fields : list<str> or tuple<str> or set<str> or iterable<str>
+            List of fields to include in the data array. The order is
+            ignored, the default order of the fields of the datatype is used
+            instead. Defaults to None, which will include all fields.
+
+        Returns
+        -------
+        list of list
+            Dataframe contents in the format of a twodimensional list (rows)
+            of lists (columns). The values in the second list are in the
+            same order as the field/column names, for inclusion in the
+            resulting Pandas dataframe of a search operation.
+
+        """
+        plan = cls._get_resolution_plan(return_fields)
+        result_obj = []
+
+        for item in iterable:
+            res = pydov.executor.submit(item._get_df_array, plan)
+            result_obj.append(res)
+
+        return cls._collect_df_array(result_obj)
+
+    @classmethod
+    def to_df_array_iter(cls, iterable, return_fields=None, chunksize=1000):
+        """Returns dataframe arrays for consecutive chunks of at most
+        `chunksize` instances in the given iterable.
+
+        Uses the package wide executor (`pydov.executor`) to perform IO
+        operations in parallel. The instances of the next chunk are
+        resolved while the current chunk is being processed by the caller,
+        at most two chunks of instances are kept in memory at the same time.
+
+        Parameters
+        ----------
+        iterable : list<DovType> or tuple<DovType> or iterable<DovType>
+            A list of instances of a DOV type.
+        return_fields : list<str> or tuple<str> or set<str> or iterable<str>
+            List of fields to include in the data array. The order is
+            ignored, the default order of the fields of the datatype is used
+            instead. Defaults to None, which will include all fields.
+        chunksize : int, optional
+            Maximum number of instances per data array. Defaults to 1000.
+
+        Yields
+        ------
+        list of list
+            Dataframe contents of a chunk of instances, in the format of a
+            twodimensional list (rows) of lists (columns), see
+            `to_df_array`.
+
+        """
+        plan = cls._get_resolution_plan(return_fields)
+        for result_obj in cls._submit_chunks(iterable, plan, chunksize):
+            yield cls._collect_df_array(result_obj)
+
+    @classmethod
+    def to_df(cls, iterable, return_fields=None, depth_range=None,
+              depth_step=None):
+        """Returns a Pandas dataframe with one or more rows for each
+        instance in the given iterable.
+
+        The dataframe is assembled column by column, using a dtype matching
+        the type of every field (see `get_fields`).
+
+        Uses the package wide executor (`pydov.executor`) to perform IO
+        operations in parallel.
+
+        Parameters
+        ----------
+        iterable : list<DovType> or tuple<DovType> or iterable<DovType>
+            A list of instances of a DOV type.
+        return_fields : list<str> or tuple<str> or set<str> or iterable<str>
+            List of fields to include in the dataframe. The order is
+            ignored, the default order of the fields of the datatype is used
+            instead. Defaults to None, which will include all fields.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the records of subtypes with depth
+            fields (see `AbstractDovSubType.depthfields`) to include, either
+            can be None. Records outside the range are not extracted.
+            Defaults to None, including records at all depths.
+        depth_step : float, optional
+            Include only the first record of subtypes with measurements at a
+            single depth in every interval of this depth. Defaults to None,
+            including all records.
+
+        Returns
+        -------
+        pandas.core.frame.DataFrame
+            Dataframe with a column for every field.
+
+        """
+        plan = cls._get_resolution_plan(
+            return_fields, depth_range, depth_step)
+        result_obj = [pydov.executor.submit(item._get_df_columns, plan)
+                      for item in iterable]
+
+        builder = cls._get_df_builder(plan)
+        for res in result_obj:
+            for block in res.result():
+                builder.extend(block)
+        return builder.build()
+
+    @classmethod
+    def to_df_iter(cls, iterable, return_fields=None, chunksize=1000,
+                   depth_range=None, depth_step=None):
+        """Returns Pandas dataframes for consecutive chunks of at most
+        `chunksize` instances in the given iterable.
+
+        The dataframes are assembled like in `to_df`, the instances are
+        resolved like in `to_df_array_iter`.
+
+        Parameters
+        ----------
+        iterable : list<DovType> or tuple<DovType> or iterable<DovType>
+            A list of instances of a DOV type.
+        return_fields : list<str> or tuple<str> or set<str> or iterable<str>
+            List of fields to include in the dataframes. The order is
+            ignored, the default order of the fields of the datatype is used
+            instead. Defaults to None, which will include all fields.
+        chunksize : int, optional
+            Maximum number of instances per dataframe. Defaults to 1000.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the records of subtypes with depth
+            fields (see `AbstractDovSubType.depthfields`) to include, either
+            can be None. Records outside the range are not extracted.
+            Defaults to None, including records at all depths.
+        depth_step : float, optional
+            Include only the first record of subtypes with measurements at a
+            single depth in every interval of this depth. Defaults to None,
+            including all records.
+
+        Yields
+        ------
+        pandas.core.frame.DataFrame
+            Dataframe of a chunk of instances.
+
+        """
+        plan = cls._get_resolution_plan(
+            return_fields, depth_range, depth_step)
+        for result_obj in cls._submit_chunks(iterable, plan, chunksize,
+                                             '_get_df_columns'):
+            builder = cls._get_df_builder(plan)
+            for res in result_obj:
+                for block in res.result():
+                    builder.extend(block)
+            yield builder.build()
+
+    @classmethod
+    def to_df_normalized(cls, iterable, return_fields=None,
+                         depth_range=None, depth_step=None):
+        """Returns a Pandas dataframe with a single row for each instance in
+        the given iterable, together with a separate dataframe for every
+        requested subtype.
+
+        Contrary to `to_df`, the fields of the main type are not repeated
+        for every subtype row: the dataframe of each subtype contains the
+        primary key of the instance it belongs to, followed by the fields of
+        the subtype only. The dataframes can be joined on the primary key.
+
+        Uses the package wide executor (`pydov.executor`) to perform IO
+        operations in parallel.
+
+        Parameters
+        ----------
+        iterable : list<DovType> or tuple<DovType> or iterable<DovType>
+            A list of instances of a DOV type.
+        return_fields : list<str> or tuple<str> or set<str> or iterable<str>
+            List of fields to include in the dataframes. The order is
+            ignored, the default order of the fields of the datatype is used
+            instead. The primary key is always included. Defaults to None,
+            which will include all fields.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the records of subtypes with depth
+            fields (see `AbstractDovSubType.depthfields`) to include, either
+            can be None. Records outside the range are not extracted.
+            Defaults to None, including records at all depths.
+        depth_step : float, optional
+            Include only the first record of subtypes with measurements at a
+            single depth in every interval of this depth. Defaults to None,
+            including all records.
+
+        Returns
+        -------
+        tuple of (pandas.core.frame.DataFrame, dict)
+            Dataframe with a column for every field of the main type, and a
+            dictionary mapping the name of every requested subtype to the
+            dataframe of its fields.
 
-            This metadata dictionary includes at least:
+        """
+        plan = cls._get_resolution_plan(
+            return_fields, depth_range, depth_step)
+        key, main_fields, subtype_fields = cls._get_normalized_fields(plan)
 
-            name (str)
-                The name of the field in the output data.
+        result_obj = [pydov.executor.submit(
+            item._get_normalized_df_array, plan, main_fields, subtype_fields)
+            for item in iterable]
 
-            source (str)
-                The source of the field (either `wfs`, `xml` or `custom`).
+        types = dict((f, d.get('type')) for f, d in cls.get_fields().items())
+        main_builder = _DataFrameBuilder(main_fields, types)
+        subtype_builders = dict(
+            (st, _DataFrameBuilder([key] + fields, types))
+            for st, fields in subtype_fields.items())
 
-            type (str)
-                Datatype of the output data field (one of `string`, `float`,
-                `integer`, `date`, `datetime`, `boolean`).
+        for res in result_obj:
+            main_row, subtype_columns = res.result()
+            main_builder.append(main_row)
+            for st, columns in subtype_columns.items():
+                subtype_builders[st].extend(columns)
 
-            The metadata dictionary additionally includes for fields with
-            source `xml` or `wfs`:
+        return main_builder.build(), dict(
+            (st, b.build()) for st, b in subtype_builders.items())
 
-            sourcefield (str)
-                The name of the field in the source (source + sourcefield
-                identify the origin of the data).
+    @classmethod
+    def _get_normalized_fields(cls, plan):
+        """Split the fields of the given plan in the fields of the main type
+        and the fields of each subtype.
 
-            The metadata dictionary additionally includes for fields with
-            source `xml` or `custom`:
+        Parameters
+        ----------
+        plan : pydov.types.abstract._ResolutionPlan
+            Plan describing the fields to resolve.
 
-            definition (str)
-                The definition of the field.
+        Returns
+        -------
+        tuple of (str, list<str>, dict)
+            Name of the primary key field, names of the fields of the main
+            type (always including the primary key) and a dictionary
+            mapping the name of every requested subtype to the names of its
+            requested fields.
 
-            notnull (boolean)
-                Whether the field is mandatory (True) or can be null (False).
+        """
+        key = [f for f in cls.get_field_names(include_subtypes=False)
+               if f.startswith('pkey')][0]
+
+        subtype_fields = OrderedDict()
+        for st in cls.subtypes:
+            if st.get_name() in plan.subtypes:
+                subtype_fields[st.get_name()] = [
+                    f for f in plan.fields if f in st.get_field_names()]
+
+        all_subtype_fields = set(
+            f for fields in subtype_fields.values() for f in fields)
+        main_fields = [f for f in plan.fields
+                       if f not in all_subtype_fields]
+        if key not in main_fields:
+            main_fields.insert(0, key)
+
+        return key, main_fields, subtype_fields
+
+    @classmethod
+    def _submit_chunks(cls, iterable, plan, chunksize,
+                       method='_get_df_array'):
+        """Resolve the instances in the given iterable using the package
+        wide executor, in consecutive chunks.
+
+        The instances of the next chunk are submitted before the current
+        chunk is yielded, at most two chunks of instances are kept in memory
+        at the same time.
+
+        Parameters
+        ----------
+        iterable : list<DovType> or tuple<DovType> or iterable<DovType>
+            A list of instances of a DOV type.
+        plan : pydov.types.abstract._ResolutionPlan
+            Plan describing the fields to resolve.
+        chunksize : int
+            Maximum number of instances per chunk.
+        method : str, optional
+            Name of the method of the instances returning their data, either
+            `_get_df_array` (default) or `_get_df_columns`.
+
+        Yields
+        ------
+        list of concurrent.futures.Future
+            Futures of the data of a chunk of instances, as returned by
+            `method`.
 
         """
-        fields = OrderedDict(
-            zip([f['name'] for f in cls.fields if f['source'] in source],
-                [f for f in cls.fields if f['source'] in source]))
+        result_obj = []
 
-        if include_subtypes and 'xml' in source:
-            for st in cls.subtypes:
-                fields.update(st.get_fields())
+        for item in iterable:
+            result_obj.append(
+                pydov.executor.submit(getattr(item, method), plan))
 
-        return fields
+            if len(result_obj) == 2 * chunksize:
+                yield result_obj[:chunksize]
+                result_obj = result_obj[chunksize:]
+
+        while len(result_obj) > 0:
+            yield result_obj[:chunksize]
+            result_obj = result_obj[chunksize:]
 
     @classmethod
-    def get_xsd_schemas(cls):
-        """Get a set of distinct XSD schema URLs for this type and its
-        subtypes.
+    def _get_df_builder(cls, plan):
+        """Get a builder for a dataframe containing the fields of the given
+        plan.
+
+        Parameters
+        ----------
+        plan : pydov.types.abstract._ResolutionPlan
+            Plan describing the fields to resolve.
 
         Returns
         -------
-        set of str
-            A set of XSD schema URLs.
+        pydov.types.abstract._DataFrameBuilder
+            Builder for the dataframe.
 
         """
-        xsd_schemas = set()
+        fields = cls.get_fields(source=('wfs', 'xml', 'custom'))
+        return _DataFrameBuilder(plan.fields, dict(
+            (f, fields[f].get('type')) for f in plan.fields if f in fields))
 
-        fields = cls.get_fields(source='xml', include_subtypes=True)
+    @classmethod
+    def _collect_df_array(cls, result_obj):
+        """Wait for the data arrays of the given instances and combine them
+        in a single dataframe array.
 
-        for f in fields.values():
-            if 'xsd_type' in f:
-                xsd_schemas.add(f['xsd_schema'])
+        Parameters
+        ----------
+        result_obj : list of concurrent.futures.Future
+            Futures of the data arrays of the instances, as returned by
+            `_get_df_array`.
 
-        return xsd_schemas
+        Returns
+        -------
+        list of list
+            Dataframe contents in the format of a twodimensional list (rows)
+            of lists (columns).
 
-    @classmethod
-    def to_df_array(cls, iterable, return_fields=None):
-        """Returns a dataframe array with one or more arrays (rows) for each
-        instance in the given iterable.
+        """
+        df_result = []
+        for res in result_obj:
+            cls._unnest_result(res.result(), df_result)
+        return df_result
 
-        Uses parallel processing to speed up IO operations.
+    @classmethod
+    async def to_df_array_async(cls, iterable, return_fields=None,
+                                session=None):
+        """Asynchronous counterpart of `to_df_array`, retrieving the XML
+        data of all instances concurrently.
 
         Parameters
         ----------
@@ -565,6 +1946,9 @@ class AbstractDovType(AbstractTypeCommon):
             List of fields to include in the data array. The order is
             ignored, the default order of the fields of the datatype is used
             instead. Defaults to None, which will include all fields.
+        session : aiohttp.ClientSession, optional
+            Session to use for the requests, as returned by
+            pydov.util.dovutil.create_async_session.
 
         Returns
         -------
@@ -575,31 +1959,78 @@ class AbstractDovType(AbstractTypeCommon):
             resulting Pandas dataframe of a search operation.
 
         """
-        def unnest_result(result, df_result):
-            """Unnest the result into multiple rows (lists) if necessary. Rows
-            are appended to the df_result list."""
-            if len(result) > 0:
-                if isinstance(result[0], list):
-                    for r in result:
-                        df_result.append(r)
-                else:
-                    df_result.append(result)
+        plan = cls._get_resolution_plan(return_fields)
+        results = await asyncio.gather(
+            *[item._get_df_array_async(plan, session) for item in iterable])
 
-        pool = Pool(4)
-        result_obj = []
+        df_result = []
+        for result in results:
+            cls._unnest_result(result, df_result)
 
-        for item in iterable:
-            res = pool.apply_async(item.get_df_array, (return_fields,))
-            result_obj.append(res)
+        return df_result
+
+    @classmethod
+    async def to_df_async(cls, iterable, return_fields=None, session=None,
+                          depth_range=None, depth_step=None):
+        """Asynchronous counterpart of `to_df`, retrieving the XML data of
+        all instances concurrently.
+
+        Parameters
+        ----------
+        iterable : list<DovType> or tuple<DovType> or iterable<DovType>
+            A list of instances of a DOV type.
+        return_fields : list<str> or tuple<str> or set<str> or iterable<str>
+            List of fields to include in the dataframe. The order is
+            ignored, the default order of the fields of the datatype is used
+            instead. Defaults to None, which will include all fields.
+        session : aiohttp.ClientSession, optional
+            Session to use for the requests, as returned by
+            pydov.util.dovutil.create_async_session.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the records of subtypes with depth
+            fields (see `AbstractDovSubType.depthfields`) to include, either
+            can be None. Records outside the range are not extracted.
+            Defaults to None, including records at all depths.
+        depth_step : float, optional
+            Include only the first record of subtypes with measurements at a
+            single depth in every interval of this depth. Defaults to None,
+            including all records.
 
-        pool.close()
-        pool.join()
+        Returns
+        -------
+        pandas.core.frame.DataFrame
+            Dataframe with a column for every field.
 
-        df_result = []
-        for res in result_obj:
-            unnest_result(res.get(), df_result)
+        """
+        plan = cls._get_resolution_plan(
+            return_fields, depth_range, depth_step)
+        results = await asyncio.gather(
+            *[item._get_df_array_async(plan, session) for item in iterable])
 
-        return df_result
+        builder = cls._get_df_builder(plan)
+        for result in results:
+            builder.append(result)
+        return builder.build()
+
+    @staticmethod
+    def _unnest_result(result, df_result):
+        """Unnest the result into multiple rows (lists) if necessary. Rows
+        are appended to the df_result list.
+
+        Parameters
+        ----------
+        result : list or list of list
+            Data array of a single instance, as returned by `get_df_array`.
+        df_result : list of list
+            Dataframe contents to append the rows to.
+
+        """
+        if len(result) > 0:
+            if isinstance(result[0], list):
+                for r in result:
+                    df_result.append(r)
+            else:
+                df_result.append(result)
 
     def _get_xml_data(self):
         """Return the raw XML data for this DOV object.
@@ -610,6 +2041,9 @@ class AbstractDovType(AbstractTypeCommon):
             The raw XML data of this DOV object as bytes.
 
         """
+        if self._xml_data is not None:
+            return self._xml_data
+
         if pydov.cache:
             return pydov.cache.get(self.pkey + '.xml')
         else:
@@ -617,22 +2051,146 @@ class AbstractDovType(AbstractTypeCommon):
             HookRunner.execute_xml_downloaded(self.pkey)
             return xml
 
-    def _parse_subtypes(self, xml):
-        """Parse the subtypes with the given XML data.
+    async def _get_xml_data_async(self, session=None):
+        """Asynchronously return the raw XML data for this DOV object.
 
         Parameters
         ----------
+        session : aiohttp.ClientSession, optional
+            Session to use for the request, as returned by
+            pydov.util.dovutil.create_async_session.
+
+        Returns
+        -------
         xml : bytes
-            The raw XML data of the DOV object as bytes.
+            The raw XML data of this DOV object as bytes.
+
+        """
+        if pydov.cache:
+            return await pydov.cache.get_async(self.pkey + '.xml', session)
+        else:
+            xml = await get_dov_xml_async(self.pkey + '.xml', session)
+            HookRunner.execute_xml_downloaded(self.pkey)
+            return xml
+
+    def _parse_subtypes(self, tree, subtypes=None, depth_filters=None):
+        """Parse the subtypes with the given XML document.
+
+        Parameters
+        ----------
+        tree : etree.Element
+            Root element of the parsed XML document of the DOV object,
+            shared by the main type and all subtypes.
+        subtypes : list<str>, optional
+            Names of the subtypes to parse. Defaults to None, which will
+            parse all subtypes.
+        depth_filters : dict, optional
+            Mapping of the names of the subtypes to filter by depth to their
+            pydov.types.abstract._DepthFilter. Defaults to None, which will
+            not filter any subtype.
 
         """
+        depth_filters = depth_filters or {}
+
         for subtype in self.subtypes:
             st_name = subtype.get_name()
-            if st_name not in self.subdata:
-                self.subdata[st_name] = []
+            if subtypes is not None and st_name not in subtypes:
+                continue
+
+            self.subdata[st_name] = _SubtypeRecords.from_xml(
+                subtype, tree, depth_filters.get(st_name))
+
+    @classmethod
+    def _get_resolution_plan(cls, return_fields=None, depth_range=None,
+                             depth_step=None):
+        """Compute the plan to resolve the given fields for instances of
+        this type.
+
+        Parameters
+        ----------
+        return_fields : list<str> or tuple<str> or set<str> or iterable<str>
+            List of fields to include in the data array. Defaults to None,
+            which will include all fields.
+        depth_range : tuple of (float, float), optional
+            Minimum and maximum depth of the records of the subtypes to
+            include, see `pydov.types.abstract._DepthFilter`. Defaults to
+            None.
+        depth_step : float, optional
+            Include only the first record of the subtypes in every interval
+            of this depth, see `pydov.types.abstract._DepthFilter`. Defaults
+            to None.
+
+        Returns
+        -------
+        pydov.types.abstract._ResolutionPlan
+            Plan describing the fields to return and the sources needed to
+            resolve them.
+
+        Raises
+        ------
+        pydov.util.errors.InvalidFieldError
+            If at least one of the fields listed in `return_fields` is unknown.
+
+        """
+        fields = cls.get_field_names(return_fields)
+
+        xml_fields = [f for f in cls.get_fields(
+            source=('xml',), include_subtypes=False) if f in fields]
+
+        subtypes = [st.get_name() for st in cls.subtypes if any(
+            f in fields for f in st.get_field_names())]
+
+        depth_filters = {}
+        if depth_range is not None or depth_step is not None:
+            depth_filter = _DepthFilter(depth_range, depth_step)
+            depth_filters = dict(
+                (st.get_name(), depth_filter) for st in cls.subtypes
+                if st.get_name() in subtypes and st.depthfields is not None)
+
+        return _ResolutionPlan(fields, xml_fields, subtypes, depth_filters)
+
+    def _needs_xml(self, plan):
+        """Check whether the XML document of this instance still has to be
+        parsed to resolve the fields of the given plan.
+
+        Parameters
+        ----------
+        plan : pydov.types.abstract._ResolutionPlan
+            Plan describing the fields to resolve.
+
+        Returns
+        -------
+        bool
+            True if the XML document should be parsed, False otherwise.
+
+        """
+        parse_main, subtypes = self._get_unparsed(plan)
+        return parse_main or len(subtypes) > 0
+
+    def _get_unparsed(self, plan):
+        """Get the parts of the XML document of this instance that still
+        have to be parsed to resolve the fields of the given plan.
+
+        Parameters
+        ----------
+        plan : pydov.types.abstract._ResolutionPlan
+            Plan describing the fields to resolve.
 
-            for subitem in subtype.from_xml(xml):
-                self.subdata[st_name].append(subitem)
+        Returns
+        -------
+        tuple of (bool, list<str>)
+            Whether the XML fields of the main type should be parsed, and
+            the names of the subtypes that should be parsed.
+
+        """
+        parse_main = not self._xml_parsed and any(
+            self.data.get(f) == self._UNRESOLVED for f in plan.xml_fields)
+
+        subtypes = [st for st in plan.subtypes
+                    if st not in self._parsed_subtypes or
+                    self._parsed_subtypes[st] != plan.depth_filters.get(st)]
+
+        return parse_main, subtypes
 
     def get_df_array(self, return_fields=None):
         """Return the data array of the instance of this type for inclusion
@@ -653,37 +2211,208 @@ class AbstractDovType(AbstractTypeCommon):
             search operation.
 
         """
-        fields = self.get_field_names(return_fields)
-        ownfields = self.get_field_names(include_subtypes=False,
-                                         include_wfs_injected=True)
-        subfields = [f for f in fields if f not in ownfields]
+        return self._get_df_array(self._get_resolution_plan(return_fields))
 
-        if len(subfields) > 0:
-            self._parse_xml_data()
+    def _get_df_array(self, plan):
+        """Return the data array of the instance of this type, resolving
+        the fields according to the given plan.
 
-        datadicts = []
-        datarecords = []
+        The XML document is retrieved and parsed at most once, and only if
+        the plan requires it.
 
-        if len(self.subdata) == 0 or len(subfields) == 0:
-            datadicts.append(self.data)
-        else:
-            for subtype in self.subdata:
-                if len(self.subdata[subtype]) == 0:
-                    datadicts.append(self.data)
-                else:
-                    for subdata in self.subdata[subtype]:
-                        datadict = {}
-                        datadict.update(self.data)
-                        datadict.update(subdata.data)
-                        datadicts.append(datadict)
+        Parameters
+        ----------
+        plan : pydov.types.abstract._ResolutionPlan
+            Plan describing the fields to resolve.
+
+        Returns
+        -------
+        list
+            List of the values of this instance in the same order as the
+            field/column names, for inclusion in the result dataframe of a
+            search operation.
+
+        """
+        record = self._get_record(plan)
+        datarecords = []
 
-        for d in datadicts:
-            datarecords.append([d.get(field, np.nan) for field in fields])
+        for subtype in plan.subtypes:
+            records = self.subdata.get(subtype)
+            if records is not None:
+                datarecords.extend(records.get_rows(plan.fields, record))
 
-        for d in datarecords:
-            if self._UNRESOLVED in d:
-                self._parse_xml_data()
-                datarecords = self.get_df_array(return_fields)
-                break
+        if len(datarecords) == 0:
+            datarecords.append([record[field] for field in plan.fields])
 
         return datarecords
+
+    def _get_normalized_df_array(self, plan, main_fields, subtype_fields):
+        """Return the data array of this instance and the data arrays of its
+        subtypes separately, resolving the fields according to the given
+        plan.
+
+        Parameters
+        ----------
+        plan : pydov.types.abstract._ResolutionPlan
+            Plan describing the fields to resolve.
+        main_fields : list<str>
+            Names of the fields of the main type to return.
+        subtype_fields : dict
+            Mapping of the name of every subtype to return to the names of
+            its fields.
+
+        Returns
+        -------
+        tuple of (list, dict)
+            List of the values of the main type in the same order as
+            `main_fields`, and a dictionary mapping the name of every
+            subtype to the values of its columns: the primary key of this
+            instance followed by the subtype fields.
+
+        """
+        if self._needs_xml(plan):
+            self._parse_xml_data(plan)
+
+        main_row = []
+        for field in main_fields:
+            value = self.data.get(field, np.nan)
+            if value == self._UNRESOLVED:
+                value = np.nan
+            main_row.append(value)
+
+        subtype_columns = {}
+        for subtype, fields in subtype_fields.items():
+            records = self.subdata.get(subtype)
+            if records is not None:
+                subtype_columns[subtype] = [[self.pkey] * len(records)] + [
+                    records.columns.get(f, [np.nan] * len(records))
+                    for f in fields]
+
+        return main_row, subtype_columns
+
+    def _get_df_columns(self, plan):
+        """Return the data of the instance of this type per column,
+        resolving the fields according to the given plan.
+
+        Contrary to `_get_df_array`, the values of the subtypes are
+        returned as the columns of the subtype records (see
+        `_SubtypeRecords`), without building a list per row.
+
+        Parameters
+        ----------
+        plan : pydov.types.abstract._ResolutionPlan
+            Plan describing the fields to resolve.
+
+        Returns
+        -------
+        list of list
+            List of blocks of rows, with every block containing the values
+            of every field (list or numpy.ndarray) in the same order as the
+            field/column names.
+
+        """
+        record = self._get_record(plan)
+        blocks = []
+
+        for subtype in plan.subtypes:
+            records = self.subdata.get(subtype)
+            if records is not None and len(records) > 0:
+                blocks.append([records.columns.get(
+                    field, [record[field]] * len(records))
+                    for field in plan.fields])
+
+        if len(blocks) == 0:
+            blocks.append([[record[field]] for field in plan.fields])
+
+        return blocks
+
+    def _get_record(self, plan):
+        """Return the values of the fields of the main type of this
+        instance, resolving the fields according to the given plan.
+
+        The XML document is retrieved and parsed at most once, and only if
+        the plan requires it.
+
+        Parameters
+        ----------
+        plan : pydov.types.abstract._ResolutionPlan
+            Plan describing the fields to resolve.
+
+        Returns
+        -------
+        dict
+            Mapping of every field of the plan to its value for the main
+            type, using np.nan for missing values and fields of subtypes.
+
+        """
+        if self._needs_xml(plan):
+            self._parse_xml_data(plan)
+
+        record = {}
+        for field in plan.fields:
+            value = self.data.get(field, np.nan)
+            if value == self._UNRESOLVED:
+                value = np.nan
+            record[field] = value
+
+        return record
+
+    async def get_df_array_async(self, return_fields=None, session=None):
+        """Asynchronous counterpart of `get_df_array`, retrieving the XML
+        data of this instance asynchronously if it is needed.
+
+        Parameters
+        ----------
+        return_fields : list<str> or tuple<str> or set<str> or iterable<str>
+            List of fields to include in the data array. The order is
+            ignored, the default order of the fields of the datatype is used
+            instead. Defaults to None, which will include all fields.
+        session : aiohttp.ClientSession, optional
+            Session to use for the request, as returned by
+            pydov.util.dovutil.create_async_session.
+
+        Returns
+        -------
+        list
+            List of the values of this instance in the same order as the
+            field/column names, for inclusion in the result dataframe of a
+            search operation.
+
+        """
+        return await self._get_df_array_async(
+            self._get_resolution_plan(return_fields), session)
+
+    async def _get_df_array_async(self, plan, session=None):
+        """Asynchronous counterpart of `_get_df_array`, retrieving the XML
+        data of this instance asynchronously if the plan requires it.
+
+        Parsing the XML data and extracting the fields is executed using
+        the package wide executor, so it does not block the event loop.
+
+        Parameters
+        ----------
+        plan : pydov.types.abstract._ResolutionPlan
+            Plan describing the fields to resolve.
+        session : aiohttp.ClientSession, optional
+            Session to use for the request, as returned by
+            pydov.util.dovutil.create_async_session.
+
+        Returns
+        -------
+        list
+            List of the values of this instance in the same order as the
+            field/column names, for inclusion in the result dataframe of a
+            search operation.
+
+        """
+        if not self._needs_xml(plan) or self._load_record(plan):
+            return self._get_df_array(plan)
+
+        self._xml_data = await self._get_xml_data_async(session)
+
+        try:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(
+                pydov.executor, self._get_df_array, plan)
+        finally:
+            self._xml_data = None
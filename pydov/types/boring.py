@@ -101,12 +101,7 @@ class Boring(AbstractDovType):
         """
         b = cls(feature.findtext('./{{{}}}fiche'.format(namespace)))
 
-        for field in cls.get_fields(source=('wfs',)).values():
-            b.data[field['name']] = cls._parse(
-                func=feature.findtext,
-                xpath=field['sourcefield'],
-                namespace=namespace,
-                returntype=field.get('type', None)
-            )
+        cls._extract(feature, cls._get_extraction_plan(
+            source=('wfs',), namespace=namespace), b.data)
 
         return b
@@ -172,12 +172,7 @@ class Grondmonster(AbstractDovType):
         grondmonster = cls(feature.findtext(
             './{{{}}}grondmonsterfiche'.format(namespace)))
 
-        for field in cls.get_fields(source=('wfs',)).values():
-            grondmonster.data[field['name']] = cls._parse(
-                func=feature.findtext,
-                xpath=field['sourcefield'],
-                namespace=namespace,
-                returntype=field.get('type', None)
-            )
+        cls._extract(feature, cls._get_extraction_plan(
+            source=('wfs',), namespace=namespace), grondmonster.data)
 
         return grondmonster
@@ -158,12 +158,7 @@ class GrondwaterFilter(AbstractDovType):
         gwfilter = cls(
             feature.findtext('./{{{}}}filterfiche'.format(namespace)))
 
-        for field in cls.get_fields(source=('wfs',)).values():
-            gwfilter.data[field['name']] = cls._parse(
-                func=feature.findtext,
-                xpath=field['sourcefield'],
-                namespace=namespace,
-                returntype=field.get('type', None)
-            )
+        cls._extract(feature, cls._get_extraction_plan(
+            source=('wfs',), namespace=namespace), gwfilter.data)
 
         return gwfilter
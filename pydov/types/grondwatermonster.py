@@ -117,12 +117,7 @@ class GrondwaterMonster(AbstractDovType):
             feature.findtext(
                 './{{{}}}grondwatermonsterfiche'.format(namespace)))
 
-        for field in cls.get_fields(source=('wfs',)).values():
-            gwmonster.data[field['name']] = cls._parse(
-                func=feature.findtext,
-                xpath=field['sourcefield'],
-                namespace=namespace,
-                returntype=field.get('type', None)
-            )
+        cls._extract(feature, cls._get_extraction_plan(
+            source=('wfs',), namespace=namespace), gwmonster.data)
 
         return gwmonster
@@ -76,6 +76,9 @@ class AbstractCommonInterpretatie(AbstractDovType):
         instance = cls(
             feature.findtext('./{{{}}}Interpretatiefiche'.format(namespace)))
 
+        cls._extract(feature, cls._get_extraction_plan(
+            source=('wfs',), namespace=namespace), instance.data)
+
         typeproef = cls._parse(
             func=feature.findtext,
             xpath='Type_proef',
@@ -103,17 +106,6 @@ class AbstractCommonInterpretatie(AbstractDovType):
             instance.data['pkey_boring'] = np.nan
             instance.data['pkey_sondering'] = np.nan
 
-        for field in cls.get_fields(source=('wfs',)).values():
-            if field['name'] in ['pkey_boring', 'pkey_sondering']:
-                continue
-
-            instance.data[field['name']] = cls._parse(
-                func=feature.findtext,
-                xpath=field['sourcefield'],
-                namespace=namespace,
-                returntype=field.get('type', None)
-            )
-
         return instance
 
 
@@ -167,13 +159,8 @@ class AbstractBoringInterpretatie(AbstractDovType):
         instance = cls(
             feature.findtext('./{{{}}}Interpretatiefiche'.format(namespace)))
 
-        for field in cls.get_fields(source=('wfs',)).values():
-            instance.data[field['name']] = cls._parse(
-                func=feature.findtext,
-                xpath=field['sourcefield'],
-                namespace=namespace,
-                returntype=field.get('type', None)
-            )
+        cls._extract(feature, cls._get_extraction_plan(
+            source=('wfs',), namespace=namespace), instance.data)
 
         return instance
 
@@ -181,6 +168,7 @@ class AbstractBoringInterpretatie(AbstractDovType):
 class InformeleStratigrafieLaag(AbstractDovSubType):
 
     rootpath = './/informelestratigrafie/laag'
+    depthfields = ('diepte_laag_van', 'diepte_laag_tot')
 
     fields = [
         XmlField(name='diepte_laag_van',
@@ -212,6 +200,7 @@ class InformeleStratigrafie(AbstractCommonInterpretatie):
 class FormeleStratigrafieLaag(AbstractDovSubType):
 
     rootpath = './/formelestratigrafie/laag'
+    depthfields = ('diepte_laag_van', 'diepte_laag_tot')
 
     fields = [
         XmlField(name='diepte_laag_van',
@@ -267,6 +256,7 @@ class FormeleStratigrafie(AbstractCommonInterpretatie):
 class HydrogeologischeStratigrafieLaag(AbstractDovSubType):
 
     rootpath = './/hydrogeologischeinterpretatie/laag'
+    depthfields = ('diepte_laag_van', 'diepte_laag_tot')
 
     fields = [
         XmlField(name='diepte_laag_van',
@@ -303,6 +293,7 @@ class HydrogeologischeStratigrafie(AbstractBoringInterpretatie):
 class LithologischeBeschrijvingLaag(AbstractDovSubType):
 
     rootpath = './/lithologischebeschrijving/laag'
+    depthfields = ('diepte_laag_van', 'diepte_laag_tot')
 
     fields = [
         XmlField(name='diepte_laag_van',
@@ -333,6 +324,7 @@ class LithologischeBeschrijvingen(AbstractBoringInterpretatie):
 class GecodeerdeLithologieLaag(AbstractDovSubType):
 
     rootpath = './/gecodeerdelithologie/laag'
+    depthfields = ('diepte_laag_van', 'diepte_laag_tot')
 
     __gecodeerdHoofdnaamCodesEnumType = XsdType(
         xsd_schema=build_dov_url('xdov/schema/latest/xsd/kern/interpretatie/'
@@ -428,6 +420,7 @@ class GecodeerdeLithologie(AbstractBoringInterpretatie):
 class GeotechnischeCoderingLaag(AbstractDovSubType):
 
     rootpath = './/geotechnischecodering/laag'
+    depthfields = ('diepte_laag_van', 'diepte_laag_tot')
 
     __geotechnischeCoderingHoofdnaamCodesEnumType = XsdType(
         xsd_schema=build_dov_url(
@@ -529,6 +522,7 @@ class GeotechnischeCodering(AbstractBoringInterpretatie):
 class QuartairStratigrafieLaag(AbstractDovSubType):
 
     rootpath = './/quartairstratigrafie/laag'
+    depthfields = ('diepte_laag_van', 'diepte_laag_tot')
 
     fields = [
         XmlField(name='diepte_laag_van',
@@ -593,6 +587,7 @@ class QuartairStratigrafie(AbstractBoringInterpretatie):
 class InformeleHydrogeologischeStratigrafieLaag(AbstractDovSubType):
 
     rootpath = './/informelehydrostratigrafie/laag'
+    depthfields = ('diepte_laag_van', 'diepte_laag_tot')
 
     fields = [
         XmlField(name='diepte_laag_van',
@@ -14,6 +14,7 @@ from pydov.types.fields import (
 class Meetdata(AbstractDovSubType):
 
     rootpath = './/sondering/sondeonderzoek/penetratietest/meetdata'
+    depthfields = ('z', 'z')
 
     fields = [
         XmlField(name='z',
@@ -121,12 +122,7 @@ class Sondering(AbstractDovType):
         """
         s = cls(feature.findtext('./{{{}}}fiche'.format(namespace)))
 
-        for field in cls.get_fields(source=('wfs',)).values():
-            s.data[field['name']] = cls._parse(
-                func=feature.findtext,
-                xpath=field['sourcefield'],
-                namespace=namespace,
-                returntype=field.get('type', None)
-            )
+        cls._extract(feature, cls._get_extraction_plan(
+            source=('wfs',), namespace=namespace), s.data)
 
         return s
@@ -1,19 +1,173 @@
 # -*- coding: utf-8 -*-
 """Module implementing a local cache for downloaded XML files."""
+import asyncio
+import collections
+import concurrent.futures
 import datetime
 import gzip
+import hashlib
+import json
 import os
 import re
 import shutil
+import sqlite3
 import tempfile
+import threading
+import time
+import weakref
+import zlib
+
+import pydov
+from owslib.etree import etree
+from pydov.util.dovutil import (
+    build_dov_url,
+    get_dov_xml,
+    get_dov_xml_async,
+)
+from pydov.util.hooks import (
+    AbstractInjectHook,
+    AbstractReadHook,
+    HookRunner,
+)
+
+
+class SingleFlight(object):
+    """Class coalescing concurrent calls with the same key into a single
+    execution.
+
+    While a call for a given key is running, subsequent calls for the same
+    key wait for it to finish and share its result (or exception) instead of
+    executing again.
+
+    """
+
+    def __init__(self):
+        """Initialisation."""
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._tasks = {}
+
+    def do(self, key, fn, *args):
+        """Execute the callable `fn` as ``fn(*args)``, unless a call with the
+        same key is already running in another thread.
 
-from pydov.util.dovutil import get_dov_xml
-from pydov.util.hooks import HookRunner
+        Parameters
+        ----------
+        key : hashable
+            Key identifying the call.
+        fn : callable
+            Function to execute.
+        args : list
+            Positional arguments to pass to `fn`.
+
+        Returns
+        -------
+        result : object
+            The result of the call.
+        shared : bool
+            True if the result of a call running in another thread was
+            reused, False if `fn` was executed by this call.
+
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            shared = future is not None
+            if not shared:
+                future = concurrent.futures.Future()
+                self._calls[key] = future
+
+        if shared:
+            return future.result(), True
+
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def do_async(self, key, fn, *args):
+        """Await the coroutine returned by ``fn(*args)``, unless a call with
+        the same key is already running in the current event loop.
+
+        Parameters
+        ----------
+        key : hashable
+            Key identifying the call.
+        fn : callable
+            Coroutine function to execute.
+        args : list
+            Positional arguments to pass to `fn`.
+
+        Returns
+        -------
+        result : object
+            The result of the call.
+        shared : bool
+            True if the result of another running call was reused, False if
+            `fn` was executed by this call.
+
+        """
+        task_key = (asyncio.get_event_loop(), key)
+
+        with self._lock:
+            task = self._tasks.get(task_key)
+            shared = task is not None
+            if not shared:
+                task = asyncio.ensure_future(fn(*args))
+                self._tasks[task_key] = task
+                task.add_done_callback(
+                    lambda t: self._remove_task(task_key))
+
+        return await asyncio.shield(task), shared
+
+    def _remove_task(self, task_key):
+        """Remove the finished task with the given key.
+
+        Parameters
+        ----------
+        task_key : tuple
+            Key identifying the task, consisting of the event loop and the
+            key of the call.
+
+        """
+        with self._lock:
+            self._tasks.pop(task_key, None)
 
 
 class AbstractCache(object):
     """Abstract base class for caching of downloaded XML files from DOV."""
 
+    _re_type_key = re.compile(
+        r'https?://(www|oefen|ontwikkel)\.dov\.vlaanderen\.be/'
+        r'data/([^ /]+)/([^.]+)')
+
+    def _get_type_key_from_url(self, url):
+        """Parse a DOV permalink and return the datatype and object key.
+
+        Parameters
+        ----------
+        url : str
+            Permanent URL to a DOV object.
+
+        Returns
+        -------
+        datatype : str
+            Datatype of the DOV object referred to by the URL.
+        key : str
+            Unique and permanent key of the instance of the DOV object
+            referred to by the URL.
+
+        """
+        datatype = self._re_type_key.search(url)
+        if datatype and len(datatype.groups()) > 2:
+            return datatype.group(2), datatype.group(3)
+
     def _get_remote(self, url):
         """Get the XML data by requesting it from the given URL.
 
@@ -32,6 +186,100 @@ class AbstractCache(object):
         HookRunner.execute_xml_downloaded(url.rstrip('.xml'))
         return xml
 
+    async def _get_remote_async(self, url, session=None):
+        """Get the XML data by asynchronously requesting it from the given
+        URL.
+
+        Parameters
+        ----------
+        url : str
+            Permanent URL to a DOV object.
+        session : aiohttp.ClientSession, optional
+            Session to use for the request, as returned by
+            pydov.util.dovutil.create_async_session.
+
+        Returns
+        -------
+        xml : bytes
+            The raw XML data of this DOV object as bytes.
+
+        """
+        xml = await get_dov_xml_async(url, session)
+        HookRunner.execute_xml_downloaded(url.rstrip('.xml'))
+        return xml
+
+    def _get_single_flight(self):
+        """Get the SingleFlight instance of this cache, creating it if
+        necessary.
+
+        Returns
+        -------
+        pydov.util.caching.SingleFlight
+            Instance coalescing concurrent requests for the same URL.
+
+        """
+        single_flight = self.__dict__.get('_single_flight')
+        if single_flight is None:
+            single_flight = self.__dict__.setdefault(
+                '_single_flight', SingleFlight())
+        return single_flight
+
+    def _fetch_once(self, url, fetch, *args):
+        """Retrieve the XML data for the given URL using ``fetch(*args)``,
+        sharing a single execution between concurrent requests for the same
+        URL.
+
+        Threads reusing the result of another thread notify the hooks as if
+        the data was retrieved from the cache.
+
+        Parameters
+        ----------
+        url : str
+            Permanent URL to a DOV object.
+        fetch : callable
+            Function retrieving (and saving) the XML data.
+        args : list
+            Positional arguments to pass to `fetch`.
+
+        Returns
+        -------
+        xml : bytes
+            The raw XML data of this DOV object as bytes.
+
+        """
+        data, shared = self._get_single_flight().do(url, fetch, *args)
+        if shared:
+            self._emit_cache_hit(url)
+            HookRunner.execute_xml_received(url, data)
+        return data
+
+    async def _fetch_once_async(self, url, fetch, *args):
+        """Asynchronous counterpart of `_fetch_once`, sharing a single
+        execution between concurrent requests for the same URL in the
+        current event loop.
+
+        Parameters
+        ----------
+        url : str
+            Permanent URL to a DOV object.
+        fetch : callable
+            Coroutine function retrieving (and saving) the XML data.
+        args : list
+            Positional arguments to pass to `fetch`.
+
+        Returns
+        -------
+        xml : bytes
+            The raw XML data of this DOV object as bytes.
+
+        """
+        data, shared = await self._get_single_flight().do_async(
+            url, fetch, *args)
+        if shared:
+            self._emit_cache_hit(url)
+            HookRunner.execute_xml_received(url, data)
+        return data
+
     def _emit_cache_hit(self, url):
         """Emit the XML cache hit event for all registered hooks.
 
@@ -67,6 +315,30 @@ class AbstractCache(object):
         """
         raise NotImplementedError
 
+    async def get_async(self, url, session=None):
+        """Asynchronously get the XML data for the DOV object referenced by
+        the given URL.
+
+        The default implementation runs `get` using the package wide
+        executor, subclasses can override this to use `session` instead.
+
+        Parameters
+        ----------
+        url : str
+            Permanent URL to a DOV object.
+        session : aiohttp.ClientSession, optional
+            Session to use for the request, as returned by
+            pydov.util.dovutil.create_async_session.
+
+        Returns
+        -------
+        xml : bytes
+            The raw XML data of this DOV object as bytes.
+
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            pydov.executor, self.get, url)
+
     def clean(self):
         """Clean the cache by removing old records from the cache.
 
@@ -87,7 +359,12 @@ class AbstractFileCache(AbstractCache):
     """Abstract class for filebased caching of downloaded XML files from
     DOV."""
 
-    def __init__(self, max_age=datetime.timedelta(weeks=2), cachedir=None):
+    # Maximum age of the index of the cached files (see `_get_index`) before
+    # it is rebuilt upon saving a file, when the size of the cache is limited.
+    index_refresh_interval = datetime.timedelta(minutes=1)
+
+    def __init__(self, max_age=datetime.timedelta(weeks=2), cachedir=None,
+                 max_size=None):
         """Initialisation.
 
         Set up the instance variables and create the cache directory if
@@ -104,17 +381,31 @@ class AbstractFileCache(AbstractCache):
             files. Be sure to use a directory that will only be used for
             this PyDOV cache. Default to a temporary directory provided by
             the operating system.
+        max_size : int, optional
+            The maximum total size in bytes of the cached files. When
+            exceeded, the least recently used files are removed from the
+            cache. Defaults to None, not limiting the size of the cache.
+
+        Raises
+        ------
+        ValueError
+            When the maximum size is smaller than 1.
 
         """
+        if max_size is not None and max_size < 1:
+            raise ValueError('The maximum size should be at least 1.')
+
         if cachedir:
             self.cachedir = cachedir
         else:
             self.cachedir = os.path.join(tempfile.gettempdir(), 'pydov')
         self.max_age = max_age
+        self.max_size = max_size
 
-        self._re_type_key = re.compile(
-            r'https?://(www|oefen|ontwikkel)\.dov\.vlaanderen\.be/'
-            r'data/([^ /]+)/([^.]+)')
+        self._index = None
+        self._index_size = 0
+        self._index_time = None
+        self._index_lock = threading.Lock()
 
         try:
             if not os.path.exists(self.cachedir):
@@ -141,13 +432,13 @@ class AbstractFileCache(AbstractCache):
         """
         raise NotImplementedError
 
-    def _get_type_key_from_url(self, url):
-        """Parse a DOV permalink and return the datatype and object key.
+    def _get_type_key_from_path(self, path):
+        """Parse a filepath and return the datatype and object key.
 
         Parameters
         ----------
-        url : str
-            Permanent URL to a DOV object.
+        path : str
+            Full, absolute, path to a cached file.
 
         Returns
         -------
@@ -158,28 +449,126 @@ class AbstractFileCache(AbstractCache):
             referred to by the URL.
 
         """
-        datatype = self._re_type_key.search(url)
-        if datatype and len(datatype.groups()) > 2:
-            return datatype.group(2), datatype.group(3)
+        raise NotImplementedError
 
-    def _get_type_key_from_path(self, path):
-        """Parse a filepath and return the datatype and object key.
+    def _get_index(self, refresh=False):
+        """Get the index of the cached files, building it if necessary.
+
+        The index is built by scanning the cache directory, ordering the
+        existing files by their last access time (see `_record_use`).
+        Afterwards it is updated incrementally when files are used, saved or
+        removed by this cache, and rebuilt when it is older than
+        `index_refresh_interval` upon saving a file (see `_record_save`), to
+        include the files saved by other processes using the same cache
+        directory.
+
+        Should be called while holding the `_index_lock`.
 
         Parameters
         ----------
-        path : str
-            Full, absolute, path to a cached file.
+        refresh : bool, optional
+            Whether to rebuild an existing index. Defaults to False.
 
         Returns
         -------
+        collections.OrderedDict
+            Ordered dictionary mapping the path of each cached file to its
+            size in bytes, from least to most recently used.
+
+        """
+        if self._index is None or refresh:
+            files = []
+            if os.path.exists(self.cachedir):
+                for typedir in os.scandir(self.cachedir):
+                    if not typedir.is_dir():
+                        continue
+                    for entry in os.scandir(typedir.path):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        files.append((stat.st_atime, entry.path,
+                                      stat.st_size))
+
+            self._index = collections.OrderedDict(
+                (path, size) for _, path, size in sorted(files))
+            self._index_size = sum(self._index.values())
+            self._index_time = time.monotonic()
+
+        return self._index
+
+    def _record_use(self, datatype, key):
+        """Mark the cached file of the given DOV object as most recently
+        used.
+
+        The use is saved as the last access time of the file, keeping its
+        last modification time (see `_is_valid`), so it is known to other
+        processes and after a restart as well.
+
+        Parameters
+        ----------
         datatype : str
-            Datatype of the DOV object referred to by the URL.
+            Datatype of the DOV object.
         key : str
-            Unique and permanent key of the instance of the DOV object
-            referred to by the URL.
+            Unique and permanent object key of the DOV object.
 
         """
-        raise NotImplementedError
+        if self.max_size is None:
+            return
+
+        filepath = self._get_filepath(datatype, key)
+        with self._index_lock:
+            index = self._get_index()
+            if filepath in index:
+                index.move_to_end(filepath)
+
+        try:
+            os.utime(filepath, ns=(time.time_ns(),
+                                   os.stat(filepath).st_mtime_ns))
+        except OSError:
+            pass
+
+    def _record_save(self, datatype, key):
+        """Add the saved file of the given DOV object to the index, and
+        remove the least recently used files while the total size of the
+        cache exceeds the maximum size.
+
+        The index is rebuilt first when it is older than
+        `index_refresh_interval`.
+
+        Parameters
+        ----------
+        datatype : str
+            Datatype of the DOV object.
+        key : str
+            Unique and permanent object key of the DOV object.
+
+        """
+        if self.max_size is None:
+            return
+
+        filepath = self._get_filepath(datatype, key)
+        try:
+            size = os.path.getsize(filepath)
+        except OSError:
+            return
+
+        with self._index_lock:
+            index = self._get_index()
+            self._index_size += size - index.pop(filepath, 0)
+            index[filepath] = size
+
+            if time.monotonic() - self._index_time > \
+                    self.index_refresh_interval.total_seconds():
+                index = self._get_index(refresh=True)
+
+            while self._index_size > self.max_size and len(index) > 1:
+                path, size = index.popitem(last=False)
+                self._index_size -= size
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
 
     def _is_valid(self, datatype, key):
         """Check if a valid version of the given DOV object exists in the
@@ -265,85 +654,201 @@ class AbstractFileCache(AbstractCache):
         """
         datatype, key = self._get_type_key_from_url(url)
 
-        data = HookRunner.execute_inject_xml_response(url)
-
+        data = self._get_cached(url, datatype, key)
         if data is not None:
-            HookRunner.execute_xml_received(url, data)
             return data
 
-        if self._is_valid(datatype, key):
-            try:
-                self._emit_cache_hit(url)
-                data = self._load(datatype, key).encode('utf-8')
-
-                HookRunner.execute_xml_received(url, data)
-                return data
+        return self._fetch_once(url, self._download, url, datatype, key)
 
-            except Exception:
-                pass
+    async def get_async(self, url, session=None):
+        """Asynchronously get the XML data for the DOV object referenced by
+        the given URL.
 
-        data = self._get_remote(url)
-        try:
-            self._save(datatype, key, data)
-        except Exception:
-            pass
+        If a valid version exists in the cache, it will be loaded and
+        returned. If no valid version exists, the XML will be downloaded
+        asynchronously from the DOV webservice, saved in the cache and
+        returned.
 
-        return data
+        Parameters
+        ----------
+        url : str
+            Permanent URL to a DOV object.
+        session : aiohttp.ClientSession, optional
+            Session to use for the request, as returned by
+            pydov.util.dovutil.create_async_session.
 
-    def clean(self):
-        """Clean the cache by removing old records from the cache.
+        Returns
+        -------
+        xml : bytes
+            The raw XML data of this DOV object as bytes.
 
-        Since during normal use the cache only grows by adding new objects and
-        overwriting existing ones with a new version, you can use this
-        function to clean the cache. It will remove all records older than
-        the maximum age from the cache.
+        """
+        datatype, key = self._get_type_key_from_url(url)
 
-        Note that this method is currently not called anywhere in the code,
-        but it is provided as reference.
+        data = self._get_cached(url, datatype, key)
+        if data is not None:
+            return data
 
-        """
-        if os.path.exists(self.cachedir):
-            for type in os.listdir(self.cachedir):
-                for object in os.listdir(os.path.join(self.cachedir, type)):
-                    datatype, key = self._get_type_key_from_path(
-                        os.path.join(self.cachedir, type, object))
-                    if not self._is_valid(datatype, key):
-                        os.remove(
-                            os.path.join(self.cachedir, datatype, object))
+        return await self._fetch_once_async(
+            url, self._download_async, url, datatype, key, session)
 
-    def remove(self):
-        """Remove the entire cache directory.
+    def _download(self, url, datatype, key):
+        """Download the XML data from the DOV webservice and save it in the
+        cache.
 
-        Note that the default directory to save the cache is a temporary
-        location provided by the operating system, and as a subsequence the
-        OS will normally take care of its removal.
+        Parameters
+        ----------
+        url : str
+            Permanent URL to a DOV object.
+        datatype : str
+            Datatype of the DOV object.
+        key : str
+            Unique and permanent object key of the DOV object.
 
-        Note that this method is currently not called anywhere in the code,
-        but it is provided as reference.
+        Returns
+        -------
+        xml : bytes
+            The raw XML data of this DOV object as bytes.
 
         """
-        if os.path.exists(self.cachedir):
-            shutil.rmtree(self.cachedir)
-
+        data = self._get_remote(url)
+        try:
+            self._save(datatype, key, data)
+            self._record_save(datatype, key)
+        except Exception:
+            pass
 
-class PlainTextFileCache(AbstractFileCache):
-    """Class for plain text caching of downloaded XML files from DOV."""
+        return data
 
-    def _get_filepath(self, datatype, key):
-        """Get the location on disk where the object with given datatype and
-        key is to be saved.
+    async def _download_async(self, url, datatype, key, session=None):
+        """Asynchronously download the XML data from the DOV webservice and
+        save it in the cache.
 
         Parameters
         ----------
+        url : str
+            Permanent URL to a DOV object.
         datatype : str
             Datatype of the DOV object.
         key : str
             Unique and permanent object key of the DOV object.
+        session : aiohttp.ClientSession, optional
+            Session to use for the request, as returned by
+            pydov.util.dovutil.create_async_session.
 
         Returns
         -------
-        str
-            Full absolute path on disk where the object is to be saved.
+        xml : bytes
+            The raw XML data of this DOV object as bytes.
+
+        """
+        data = await self._get_remote_async(url, session)
+        try:
+            self._save(datatype, key, data)
+            self._record_save(datatype, key)
+        except Exception:
+            pass
+
+        return data
+
+    def _get_cached(self, url, datatype, key):
+        """Get the XML data for the DOV object from an injected response or
+        from a valid version in the cache.
+
+        Parameters
+        ----------
+        url : str
+            Permanent URL to a DOV object.
+        datatype : str
+            Datatype of the DOV object.
+        key : str
+            Unique and permanent object key of the DOV object.
+
+        Returns
+        -------
+        xml : bytes or None
+            The raw XML data of this DOV object as bytes, or None if it
+            should be downloaded from the DOV webservice.
+
+        """
+        data = HookRunner.execute_inject_xml_response(url)
+
+        if data is not None:
+            HookRunner.execute_xml_received(url, data)
+            return data
+
+        if self._is_valid(datatype, key):
+            try:
+                self._emit_cache_hit(url)
+                data = self._load(datatype, key).encode('utf-8')
+                self._record_use(datatype, key)
+
+                HookRunner.execute_xml_received(url, data)
+                return data
+
+            except Exception:
+                pass
+
+    def clean(self):
+        """Clean the cache by removing old records from the cache.
+
+        Since during normal use the cache only grows by adding new objects and
+        overwriting existing ones with a new version, you can use this
+        function to clean the cache. It will remove all records older than
+        the maximum age from the cache.
+
+        Note that this method is currently not called anywhere in the code,
+        but it is provided as reference.
+
+        """
+        if os.path.exists(self.cachedir):
+            for type in os.listdir(self.cachedir):
+                for object in os.listdir(os.path.join(self.cachedir, type)):
+                    datatype, key = self._get_type_key_from_path(
+                        os.path.join(self.cachedir, type, object))
+                    if not self._is_valid(datatype, key):
+                        os.remove(
+                            os.path.join(self.cachedir, datatype, object))
+
+        with self._index_lock:
+            self._index = None
+
+    def remove(self):
+        """Remove the entire cache directory.
+
+        Note that the default directory to save the cache is a temporary
+        location provided by the operating system, and as a subsequence the
+        OS will normally take care of its removal.
+
+        Note that this method is currently not called anywhere in the code,
+        but it is provided as reference.
+
+        """
+        if os.path.exists(self.cachedir):
+            shutil.rmtree(self.cachedir)
+
+        with self._index_lock:
+            self._index = None
+
+
+class PlainTextFileCache(AbstractFileCache):
+    """Class for plain text caching of downloaded XML files from DOV."""
+
+    def _get_filepath(self, datatype, key):
+        """Get the location on disk where the object with given datatype and
+        key is to be saved.
+
+        Parameters
+        ----------
+        datatype : str
+            Datatype of the DOV object.
+        key : str
+            Unique and permanent object key of the DOV object.
+
+        Returns
+        -------
+        str
+            Full absolute path on disk where the object is to be saved.
 
         """
         return os.path.join(self.cachedir, datatype, key + '.xml')
@@ -492,3 +997,1124 @@ class GzipTextFileCache(AbstractFileCache):
         filepath = self._get_filepath(datatype, key)
         with gzip.open(filepath, 'rb') as f:
             return f.read().decode('utf-8')
+
+
+class _ThreadConnection(object):
+    """Class holding the database connection of a single thread of a
+    SqliteCache.
+
+    Instances are only referenced by the thread-local storage of their
+    thread, so they are garbage collected when the thread ends.
+
+    """
+
+    def __init__(self, connection, generation):
+        """Initialisation.
+
+        Parameters
+        ----------
+        connection : sqlite3.Connection
+            Connection to the database.
+        generation : int
+            Generation of the database the connection belongs to.
+
+        """
+        self.connection = connection
+        self.generation = generation
+
+
+class SqliteCache(AbstractCache):
+    """Class for caching of downloaded XML files from DOV in a single SQLite
+    database.
+
+    The XML documents are saved zlib-compressed, indexed by their datatype
+    and key, together with the time they were saved. Compared to the file
+    based caches, lookups do not depend on the number of cached objects
+    and cleaning the cache is a single query.
+
+    Every thread uses its own connection to the database, which is used in
+    WAL mode to allow reading while another thread is writing. The
+    connection is closed when the thread ends.
+
+    """
+
+    def __init__(self, max_age=datetime.timedelta(weeks=2), database=None):
+        """Initialisation.
+
+        Set up the instance variables and create the directory of the
+        database if it does not exists already.
+
+        Parameters
+        ----------
+        max_age : datetime.timedelta, optional
+            The maximum age of a cached XML document to be valid. If it has
+            been saved before this time, it will be redownloaded. Defaults
+            to two weeks.
+        database : str, optional
+            Path of the SQLite database file that will be used to save the
+            cached XML documents. Defaults to a file `pydov.sqlite` in a
+            temporary directory provided by the operating system.
+
+        """
+        if database:
+            self.database = database
+        else:
+            self.database = os.path.join(tempfile.gettempdir(),
+                                         'pydov.sqlite')
+        self.max_age = max_age
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._finalizers = []
+        self._generation = 0
+
+        try:
+            folder = os.path.dirname(os.path.abspath(self.database))
+            if not os.path.exists(folder):
+                os.makedirs(folder)
+        except Exception:
+            pass
+
+    def _connect(self):
+        """Open a new connection to the database, creating the table if
+        necessary.
+
+        Returns
+        -------
+        sqlite3.Connection
+            Connection to the database.
+
+        """
+        connection = sqlite3.connect(self.database, timeout=60,
+                                     isolation_level=None,
+                                     check_same_thread=False)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS cache ('
+            'datatype TEXT NOT NULL, '
+            'key TEXT NOT NULL, '
+            'timestamp REAL NOT NULL, '
+            'content BLOB NOT NULL, '
+            'PRIMARY KEY (datatype, key))')
+        connection.execute(
+            'CREATE INDEX IF NOT EXISTS cache_timestamp ON cache (timestamp)')
+        return connection
+
+    def _get_connection(self):
+        """Get the connection to the database of the current thread, opening
+        it if necessary.
+
+        Returns
+        -------
+        sqlite3.Connection
+            Connection to the database.
+
+        """
+        holder = getattr(self._local, 'holder', None)
+        if holder is None or holder.generation != self._generation:
+            with self._lock:
+                holder = _ThreadConnection(self._connect(), self._generation)
+                self._finalizers = [f for f in self._finalizers if f.alive]
+                self._finalizers.append(
+                    weakref.finalize(holder, holder.connection.close))
+                self._local.holder = holder
+        return holder.connection
+
+    def _get_min_timestamp(self):
+        """Get the minimal timestamp of valid cached documents.
+
+        Returns
+        -------
+        float
+            Documents saved before this time (in seconds since the epoch) are
+            older than the maximum age.
+
+        """
+        return time.time() - self.max_age.total_seconds()
+
+    def _load(self, datatype, key):
+        """Read a valid cached version from the database.
+
+        Parameters
+        ----------
+        datatype : str
+            Datatype of the DOV object.
+        key : str
+            Unique and permanent object key of the DOV object.
+
+        Returns
+        -------
+        xml : bytes or None
+            The raw XML data of this DOV object as bytes, or None if no
+            valid cached version exists.
+
+        """
+        row = self._get_connection().execute(
+            'SELECT content FROM cache '
+            'WHERE datatype = ? AND key = ? AND timestamp >= ?',
+            (datatype, key, self._get_min_timestamp())).fetchone()
+
+        if row is not None:
+            return zlib.decompress(row[0])
+
+    def _save(self, datatype, key, content):
+        """Save the given content in the database.
+
+        Parameters
+        ----------
+        datatype : str
+            Datatype of the DOV object to save.
+        key : str
+            Unique and permanent object key of the DOV object to save.
+        content : bytes
+            The raw XML data of this DOV object as bytes.
+
+        """
+        self._get_connection().execute(
+            'INSERT OR REPLACE INTO cache (datatype, key, timestamp, content) '
+            'VALUES (?, ?, ?, ?)',
+            (datatype, key, time.time(), zlib.compress(content)))
+
+    def _get_cached(self, url, datatype, key):
+        """Get the XML data for the DOV object from an injected response or
+        from a valid version in the cache.
+
+        Parameters
+        ----------
+        url : str
+            Permanent URL to a DOV object.
+        datatype : str
+            Datatype of the DOV object.
+        key : str
+            Unique and permanent object key of the DOV object.
+
+        Returns
+        -------
+        xml : bytes or None
+            The raw XML data of this DOV object as bytes, or None if it
+            should be downloaded from the DOV webservice.
+
+        """
+        data = HookRunner.execute_inject_xml_response(url)
+
+        if data is not None:
+            HookRunner.execute_xml_received(url, data)
+            return data
+
+        try:
+            data = self._load(datatype, key)
+        except (sqlite3.Error, zlib.error):
+            data = None
+
+        if data is not None:
+            self._emit_cache_hit(url)
+            HookRunner.execute_xml_received(url, data)
+            return data
+
+    def get(self, url):
+        """Get the XML data for the DOV object referenced by the given URL.
+
+        If a valid version exists in the cache, it will be loaded and
+        returned. If no valid version exists, the XML will be downloaded
+        from the DOV webservice, saved in the cache and returned.
+
+        Parameters
+        ----------
+        url : str
+            Permanent URL to a DOV object.
+
+        Returns
+        -------
+        xml : bytes
+            The raw XML data of this DOV object as bytes.
+
+        """
+        datatype, key = self._get_type_key_from_url(url)
+
+        data = self._get_cached(url, datatype, key)
+        if data is not None:
+            return data
+
+        return self._fetch_once(url, self._download, url, datatype, key)
+
+    async def get_async(self, url, session=None):
+        """Asynchronously get the XML data for the DOV object referenced by
+        the given URL.
+
+        If a valid version exists in the cache, it will be loaded and
+        returned. If no valid version exists, the XML will be downloaded
+        asynchronously from the DOV webservice, saved in the cache and
+        returned.
+
+        Parameters
+        ----------
+        url : str
+            Permanent URL to a DOV object.
+        session : aiohttp.ClientSession, optional
+            Session to use for the request, as returned by
+            pydov.util.dovutil.create_async_session.
+
+        Returns
+        -------
+        xml : bytes
+            The raw XML data of this DOV object as bytes.
+
+        """
+        datatype, key = self._get_type_key_from_url(url)
+
+        data = self._get_cached(url, datatype, key)
+        if data is not None:
+            return data
+
+        return await self._fetch_once_async(
+            url, self._download_async, url, datatype, key, session)
+
+    def _download(self, url, datatype, key):
+        """Download the XML data from the DOV webservice and save it in the
+        cache.
+
+        Parameters
+        ----------
+        url : str
+            Permanent URL to a DOV object.
+        datatype : str
+            Datatype of the DOV object.
+        key : str
+            Unique and permanent object key of the DOV object.
+
+        Returns
+        -------
+        xml : bytes
+            The raw XML data of this DOV object as bytes.
+
+        """
+        data = self._get_remote(url)
+        try:
+            self._save(datatype, key, data)
+        except sqlite3.Error:
+            pass
+
+        return data
+
+    async def _download_async(self, url, datatype, key, session=None):
+        """Asynchronously download the XML data from the DOV webservice and
+        save it in the cache.
+
+        Parameters
+        ----------
+        url : str
+            Permanent URL to a DOV object.
+        datatype : str
+            Datatype of the DOV object.
+        key : str
+            Unique and permanent object key of the DOV object.
+        session : aiohttp.ClientSession, optional
+            Session to use for the request, as returned by
+            pydov.util.dovutil.create_async_session.
+
+        Returns
+        -------
+        xml : bytes
+            The raw XML data of this DOV object as bytes.
+
+        """
+        data = await self._get_remote_async(url, session)
+        try:
+            self._save(datatype, key, data)
+        except sqlite3.Error:
+            pass
+
+        return data
+
+    def clean(self):
+        """Clean the cache by removing old records from the cache.
+
+        Since during normal use the cache only grows by adding new objects and
+        overwriting existing ones with a new version, you can use this
+        function to clean the cache. It will remove all records older than
+        the maximum age from the cache, using a single query.
+
+        """
+        if os.path.exists(self.database):
+            self._get_connection().execute(
+                'DELETE FROM cache WHERE timestamp < ?',
+                (self._get_min_timestamp(),))
+
+    def remove(self):
+        """Remove the entire cache database.
+
+        All connections to the database are closed, new connections will be
+        opened (and the database recreated) when the cache is used again.
+
+        """
+        with self._lock:
+            for finalizer in self._finalizers:
+                finalizer()
+            self._finalizers = []
+            self._generation += 1
+
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(self.database + suffix):
+                os.remove(self.database + suffix)
+
+
+class LRUMemoryCache(AbstractCache):
+    """Class for caching of downloaded XML files from DOV in memory, in front
+    of another cache.
+
+    Recently used XML documents are kept in memory, up to a maximum number
+    of documents and a maximum total size. When either is exceeded, the
+    least recently used documents are discarded. Documents not available in
+    memory are retrieved from the wrapped cache (or from the DOV webservices
+    if no cache is wrapped), and kept in memory afterwards.
+
+    """
+
+    def __init__(self, cache=None, max_entries=1000,
+                 max_bytes=100 * 1024 * 1024, max_age=None):
+        """Initialisation.
+
+        Parameters
+        ----------
+        cache : pydov.util.caching.AbstractCache, optional
+            Cache to retrieve the documents from when they are not available
+            in memory, for example a GzipTextFileCache. Defaults to None,
+            retrieving the documents from the DOV webservices directly.
+        max_entries : int, optional
+            Maximum number of documents to keep in memory. Defaults to 1000.
+        max_bytes : int, optional
+            Maximum total size in bytes of the documents kept in memory.
+            Defaults to 100 MiB.
+        max_age : datetime.timedelta, optional
+            The maximum age of a document kept in memory to be valid.
+            Defaults to the maximum age of the wrapped cache, if any, or no
+            maximum age otherwise.
+
+        Raises
+        ------
+        ValueError
+            When the maximum number of entries or the maximum size is
+            smaller than 1.
+
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError('The maximum number of entries and the maximum '
+                             'size should be at least 1.')
+
+        self.cache = cache
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        if max_age is None:
+            max_age = getattr(cache, 'max_age', None)
+        self.max_age = max_age
+
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self):
+        """Statistics of the usage of the memory cache.
+
+        Returns
+        -------
+        dict
+            Dictionary with the number of hits and misses of the memory
+            cache, and the number of entries and their total size in bytes
+            currently kept in memory.
+
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'bytes': self._bytes
+            }
+
+    def _is_valid(self, timestamp):
+        """Check whether an entry saved at the given time is still valid.
+
+        Parameters
+        ----------
+        timestamp : float
+            Time the entry was saved, in seconds since the epoch.
+
+        Returns
+        -------
+        bool
+            True if the entry is still valid, False otherwise.
+
+        """
+        return self.max_age is None or \
+            time.time() - timestamp <= self.max_age.total_seconds()
+
+    def _load(self, url):
+        """Get a valid document from memory, marking it as most recently
+        used.
+
+        Parameters
+        ----------
+        url : str
+            Permanent URL to a DOV object.
+
+        Returns
+        -------
+        xml : bytes or None
+            The raw XML data of this DOV object as bytes, or None if no valid
+            version is kept in memory.
+
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                data, timestamp = entry
+                if self._is_valid(timestamp):
+                    self._entries.move_to_end(url)
+                    self.hits += 1
+                    return data
+
+                del self._entries[url]
+                self._bytes -= len(data)
+
+            self.misses += 1
+
+    def _save(self, url, data):
+        """Keep the document in memory, discarding the least recently used
+        documents when exceeding the maximum number of entries or size.
+
+        Parameters
+        ----------
+        url : str
+            Permanent URL to a DOV object.
+        data : bytes
+            The raw XML data of this DOV object as bytes.
+
+        """
+        if len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            entry = self._entries.pop(url, None)
+            if entry is not None:
+                self._bytes -= len(entry[0])
+
+            self._entries[url] = (data, time.time())
+            self._bytes += len(data)
+
+            while len(self._entries) > self.max_entries or \
+                    self._bytes > self.max_bytes:
+                discarded, _ = self._entries.popitem(last=False)[1]
+                self._bytes -= len(discarded)
+
+    def _get_cached(self, url):
+        """Get the XML data for the DOV object from an injected response or
+        from memory.
+
+        Parameters
+        ----------
+        url : str
+            Permanent URL to a DOV object.
+
+        Returns
+        -------
+        xml : bytes or None
+            The raw XML data of this DOV object as bytes, or None if it
+            should be retrieved from the wrapped cache or the DOV webservice.
+
+        """
+        data = HookRunner.execute_inject_xml_response(url)
+
+        if data is not None:
+            HookRunner.execute_xml_received(url, data)
+            return data
+
+        data = self._load(url)
+        if data is not None:
+            self._emit_cache_hit(url)
+            HookRunner.execute_xml_received(url, data)
+            return data
+
+    def get(self, url):
+        """Get the XML data for the DOV object referenced by the given URL.
+
+        If a valid version is kept in memory, it will be returned. Otherwise
+        the XML will be retrieved from the wrapped cache (or downloaded from
+        the DOV webservice), kept in memory and returned.
+
+        Parameters
+        ----------
+        url : str
+            Permanent URL to a DOV object.
+
+        Returns
+        -------
+        xml : bytes
+            The raw XML data of this DOV object as bytes.
+
+        """
+        data = self._get_cached(url)
+        if data is not None:
+            return data
+
+        if self.cache is not None:
+            data = self.cache.get(url)
+        else:
+            data = self._fetch_once(url, self._get_remote, url)
+
+        self._save(url, data)
+        return data
+
+    async def get_async(self, url, session=None):
+        """Asynchronously get the XML data for the DOV object referenced by
+        the given URL.
+
+        If a valid version is kept in memory, it will be returned. Otherwise
+        the XML will be retrieved asynchronously from the wrapped cache (or
+        downloaded from the DOV webservice), kept in memory and returned.
+
+        Parameters
+        ----------
+        url : str
+            Permanent URL to a DOV object.
+        session : aiohttp.ClientSession, optional
+            Session to use for the request, as returned by
+            pydov.util.dovutil.create_async_session.
+
+        Returns
+        -------
+        xml : bytes
+            The raw XML data of this DOV object as bytes.
+
+        """
+        data = self._get_cached(url)
+        if data is not None:
+            return data
+
+        if self.cache is not None:
+            data = await self.cache.get_async(url, session)
+        else:
+            data = await self._fetch_once_async(
+                url, self._get_remote_async, url, session)
+
+        self._save(url, data)
+        return data
+
+    def clean(self):
+        """Clean the cache by removing old records from memory and from the
+        wrapped cache."""
+        with self._lock:
+            for url, (data, timestamp) in list(self._entries.items()):
+                if not self._is_valid(timestamp):
+                    del self._entries[url]
+                    self._bytes -= len(data)
+
+        if self.cache is not None:
+            self.cache.clean()
+
+    def remove(self):
+        """Remove all documents from memory and remove the wrapped cache
+        entirely."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+        if self.cache is not None:
+            self.cache.remove()
+
+
+class AbstractRecordCache(object):
+    """Abstract base class for caching of the parsed field values of DOV
+    objects.
+
+    Records are identified by a key consisting of the DOV type, the
+    permanent key of the object and a fingerprint of the field definitions
+    of the type, so records are not reused when the fields of a type
+    change.
+
+    """
+
+    def get(self, key):
+        """Get the record saved under the given key.
+
+        Parameters
+        ----------
+        key : tuple
+            Key identifying the record.
+
+        Returns
+        -------
+        record : dict or None
+            The saved record, or None if no valid record has been saved
+            under the given key.
+
+        """
+        raise NotImplementedError
+
+    def save(self, key, record):
+        """Save the given record under the given key.
+
+        Parameters
+        ----------
+        key : tuple
+            Key identifying the record.
+        record : dict
+            The record to save.
+
+        """
+        raise NotImplementedError
+
+    def clean(self):
+        """Clean the cache by removing old records from the cache."""
+        raise NotImplementedError
+
+    def remove(self):
+        """Remove all records from the cache."""
+        raise NotImplementedError
+
+
+class MemoryRecordCache(AbstractRecordCache):
+    """Class for caching of the parsed field values of DOV objects in
+    memory.
+
+    The most recently used records are kept, up to a maximum number of
+    records.
+
+    """
+
+    def __init__(self, max_entries=10000, max_age=None):
+        """Initialisation.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            Maximum number of records to keep in memory. Defaults to 10000.
+        max_age : datetime.timedelta, optional
+            The maximum age of a record to be valid. Defaults to None, keeping
+            records valid as long as they are in memory.
+
+        Raises
+        ------
+        ValueError
+            When the maximum number of entries is smaller than 1.
+
+        """
+        if max_entries < 1:
+            raise ValueError(
+                'The maximum number of entries should be at least 1.')
+
+        self.max_entries = max_entries
+        self.max_age = max_age
+
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def _is_valid(self, timestamp):
+        """Check whether a record saved at the given time is still valid.
+
+        Parameters
+        ----------
+        timestamp : float
+            Time the record was saved, in seconds since the epoch.
+
+        Returns
+        -------
+        bool
+            True if the record is still valid, False otherwise.
+
+        """
+        return self.max_age is None or \
+            time.time() - timestamp <= self.max_age.total_seconds()
+
+    def get(self, key):
+        """Get the record saved under the given key, marking it as most
+        recently used.
+
+        Parameters
+        ----------
+        key : tuple
+            Key identifying the record.
+
+        Returns
+        -------
+        record : dict or None
+            The saved record, or None if no valid record has been saved
+            under the given key.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._is_valid(entry[1]):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                del self._entries[key]
+
+            self.misses += 1
+
+    def save(self, key, record):
+        """Save the given record under the given key, discarding the least
+        recently used records when exceeding the maximum number of entries.
+
+        Parameters
+        ----------
+        key : tuple
+            Key identifying the record.
+        record : dict
+            The record to save.
+
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (record, time.time())
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clean(self):
+        """Clean the cache by removing records older than the maximum
+        age."""
+        with self._lock:
+            for key, (record, timestamp) in list(self._entries.items()):
+                if not self._is_valid(timestamp):
+                    del self._entries[key]
+
+    def remove(self):
+        """Remove all records from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+class MetadataCacheHook(AbstractReadHook, AbstractInjectHook):
+    """Hook caching the responses of metadata requests on disk.
+
+    Metadata requests include the WFS GetCapabilities and DescribeFeatureType
+    requests, the MD_Metadata and FC_FeatureCatalogue requests and the XSD
+    schemas. Received responses are saved in the cache directory, and
+    injected in subsequent requests (also in other processes) as long as
+    they are younger than the maximum age.
+
+    Older responses are revalidated with the remote service, using a
+    conditional request if the service provided an ETag or Last-Modified
+    header (saved along with the response). If revalidation fails, the older
+    response is used anyway.
+
+    To use it, add an instance to the registered hooks::
+
+        pydov.hooks.append(MetadataCacheHook())
+
+    """
+
+    def __init__(self, max_age=datetime.timedelta(days=1), cachedir=None):
+        """Initialisation.
+
+        Set up the instance variables and create the cache directory if
+        it does not exists already.
+
+        Parameters
+        ----------
+        max_age : datetime.timedelta, optional
+            The maximum age of a cached response to be used without
+            revalidation. Defaults to one day.
+        cachedir : str, optional
+            Path of the directory that will be used to save the cached
+            responses. Defaults to a directory `pydov_metadata` in a
+            temporary directory provided by the operating system.
+
+        """
+        if cachedir:
+            self.cachedir = cachedir
+        else:
+            self.cachedir = os.path.join(tempfile.gettempdir(),
+                                         'pydov_metadata')
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._injected = set()
+        self._validators = {}
+
+        try:
+            if not os.path.exists(self.cachedir):
+                os.makedirs(self.cachedir)
+        except Exception:
+            pass
+
+    def _get_filepath(self, url):
+        """Get the location on disk where the response for the given URL is
+        to be saved.
+
+        Parameters
+        ----------
+        url : str
+            URL of the metadata request.
+
+        Returns
+        -------
+        str
+            Full absolute path on disk where the response is to be saved,
+            without extension.
+
+        """
+        return os.path.join(self.cachedir, hashlib.sha1(
+            url.encode('utf-8')).hexdigest())
+
+    @staticmethod
+    def _get_request_url(url):
+        """Get the URL to request to revalidate the response of the given
+        metadata URL.
+
+        The WFS GetCapabilities request is identified by a shortened URL in
+        the hooks, which is expanded here.
+
+        Parameters
+        ----------
+        url : str
+            URL of the metadata request.
+
+        Returns
+        -------
+        str
+            URL to request.
+
+        """
+        if url == build_dov_url('geoserver/wfs') + '?version=1.1.0':
+            return url + '&service=WFS&request=GetCapabilities'
+        return url
+
+    @staticmethod
+    def _is_cacheable(response):
+        """Check whether the given response can be saved in the cache.
+
+        Parameters
+        ----------
+        response : bytes
+            The raw response of a metadata request.
+
+        Returns
+        -------
+        bool
+            True if the response is a valid XML document, other than an OGC
+            exception report, False otherwise.
+
+        """
+        try:
+            tree = etree.fromstring(response)
+        except Exception:
+            return False
+        return not str(tree.tag).endswith('ExceptionReport')
+
+    def _load(self, url):
+        """Read the cached response for the given URL from disk.
+
+        Parameters
+        ----------
+        url : str
+            URL of the metadata request.
+
+        Returns
+        -------
+        tuple or None
+            Tuple of the cached response (bytes), the validators (dict) and
+            the age of the response (datetime.timedelta), or None if no
+            response has been cached.
+
+        """
+        filepath = self._get_filepath(url)
+        try:
+            age = datetime.datetime.now() - datetime.datetime.fromtimestamp(
+                os.path.getmtime(filepath + '.xml.gz'))
+            with gzip.open(filepath + '.xml.gz', 'rb') as f:
+                response = f.read()
+            with open(filepath + '.json', 'r', encoding='utf-8') as f:
+                validators = json.load(f)
+        except Exception:
+            return None
+
+        return response, validators, age
+
+    def _save(self, url, response, validators=None):
+        """Save the response for the given URL on disk.
+
+        Both files are written to a temporary file unique to the process and
+        thread first, and moved in place afterwards. The response is moved
+        before its validators, so the validators never belong to a newer
+        response than the one on disk.
+
+        Parameters
+        ----------
+        url : str
+            URL of the metadata request.
+        response : bytes
+            The raw response of the metadata request.
+        validators : dict, optional
+            Headers to revalidate the response with: `etag` and/or
+            `last_modified`.
+
+        """
+        filepath = self._get_filepath(url)
+        tmp = '{}.{}.{}.tmp'.format(filepath, os.getpid(),
+                                    threading.get_ident())
+
+        with gzip.open(tmp, 'wb') as f:
+            f.write(response)
+        os.replace(tmp, filepath + '.xml.gz')
+
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(dict(validators or {}, url=url), f)
+        os.replace(tmp, filepath + '.json')
+
+    def _revalidate(self, url, response, validators):
+        """Revalidate the cached response for the given URL with the remote
+        service.
+
+        Parameters
+        ----------
+        url : str
+            URL of the metadata request.
+        response : bytes
+            The cached response of the metadata request.
+        validators : dict
+            Headers to revalidate the response with: `etag` and/or
+            `last_modified`.
+
+        Returns
+        -------
+        bytes
+            The cached response if it is still valid, the new response
+            otherwise.
+
+        Raises
+        ------
+        Exception
+            When the revalidation failed.
+
+        """
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
+        request = pydov.session.get(self._get_request_url(url),
+                                    headers=headers,
+                                    timeout=pydov.request_timeout)
+
+        if request.status_code == 304:
+            os.utime(self._get_filepath(url) + '.xml.gz')
+            return response
+
+        request.raise_for_status()
+        request.encoding = 'utf-8'
+        new_response = request.text.encode('utf8')
+
+        if not self._is_cacheable(new_response):
+            raise ValueError('Invalid metadata response.')
+
+        self._save(url, new_response, {
+            'etag': request.headers.get('ETag'),
+            'last_modified': request.headers.get('Last-Modified')
+        })
+        return new_response
+
+    def inject_meta_response(self, url):
+        """Inject the cached response for the given URL, if available.
+
+        Parameters
+        ----------
+        url : str
+            URL of the metadata request.
+
+        Returns
+        -------
+        bytes, optional
+            The cached (and possibly revalidated) response, or None if no
+            response has been cached yet.
+
+        """
+        cached = self._load(url)
+        if cached is None:
+            return None
+
+        response, validators, age = cached
+        if age > self.max_age:
+            try:
+                response = self._revalidate(url, response, validators)
+            except Exception:
+                pass
+
+        with self._lock:
+            self._injected.add(url)
+        return response
+
+    def meta_validators_received(self, url, validators):
+        """Keep the validators of the response for the given URL, to save
+        them together with the response in `meta_received`.
+
+        Parameters
+        ----------
+        url : str
+            URL of the metadata request.
+        validators : dict
+            Headers to revalidate the response with: `etag` and/or
+            `last_modified`.
+
+        """
+        with self._lock:
+            self._validators[url] = validators
+
+    def meta_received(self, url, response):
+        """Save the received response for the given URL, together with its
+        validators, unless it was injected from the cache.
+
+        Parameters
+        ----------
+        url : str
+            URL of the metadata request.
+        response : bytes
+            The raw response as received from resolving the URL.
+
+        """
+        with self._lock:
+            validators = self._validators.pop(url, None)
+            if url in self._injected:
+                self._injected.discard(url)
+                return
+
+        if not self._is_cacheable(response):
+            return
+
+        try:
+            self._save(url, response, validators)
+        except Exception:
+            pass
+
+    def clean(self):
+        """Clean the cache by removing responses older than the maximum age.
+        """
+        if os.path.exists(self.cachedir):
+            for filename in os.listdir(self.cachedir):
+                if not filename.endswith('.xml.gz'):
+                    continue
+                filepath = os.path.join(self.cachedir, filename)
+                age = datetime.datetime.now() - \
+                    datetime.datetime.fromtimestamp(os.path.getmtime(
+                        filepath))
+                if age > self.max_age:
+                    os.remove(filepath)
+                    json_path = filepath[:-len('.xml.gz')] + '.json'
+                    if os.path.exists(json_path):
+                        os.remove(json_path)
+
+    def remove(self):
+        """Remove the entire cache directory."""
+        if os.path.exists(self.cachedir):
+            shutil.rmtree(self.cachedir)
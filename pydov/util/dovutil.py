@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 """Module grouping utility functions for DOV XML services."""
+import asyncio
+import functools
 import os
 
 from owslib.etree import etree
@@ -7,6 +9,11 @@ from pydov.util.errors import XmlParseError
 import pydov
 from pydov.util.hooks import HookRunner
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 
 def build_dov_url(path):
     """Build the DOV url consisting of the fixed DOV base url, appended with
@@ -40,10 +47,152 @@ def get_remote_url(url):
         The raw XML data as bytes.
 
     """
+    return get_remote_response(url)[0]
+
+
+def get_remote_response(url):
+    """Request the URL from the remote service and return its contents,
+    together with the headers allowing to revalidate it later.
+
+    Parameters
+    ----------
+    url : str
+        URL to download.
+
+    Returns
+    -------
+    xml : bytes
+        The raw XML data as bytes.
+    validators : dict
+        The `etag` (ETag header) and `last_modified` (Last-Modified header)
+        of the response, None when absent.
 
+    """
     request = pydov.session.get(url, timeout=pydov.request_timeout)
     request.encoding = 'utf-8'
-    return request.text.encode('utf8')
+    return request.text.encode('utf8'), {
+        'etag': request.headers.get('ETag'),
+        'last_modified': request.headers.get('Last-Modified')
+    }
+
+
+def create_async_session():
+    """Create a session to perform asynchronous requests, using the headers
+    of `pydov.session` and the timeout of `pydov.request_timeout`.
+
+    The number of simultaneous connections is limited to the number of
+    workers of the package wide executor (`pydov.executor`), if available.
+
+    The session should be closed by the caller after usage.
+
+    Returns
+    -------
+    aiohttp.ClientSession or None
+        A new asynchronous session, or None when aiohttp is not installed.
+
+    """
+    if aiohttp is None:
+        return None
+
+    return aiohttp.ClientSession(
+        headers=dict(pydov.session.headers),
+        timeout=aiohttp.ClientTimeout(total=pydov.request_timeout),
+        connector=aiohttp.TCPConnector(
+            limit=getattr(pydov.executor, 'workers', 4)))
+
+
+async def _request_async(method, url, data=None, session=None):
+    """Asynchronously perform a GET or POST request and return its contents.
+
+    Uses aiohttp when it is installed. Otherwise the request is performed
+    with `pydov.session` using the package wide executor.
+
+    Parameters
+    ----------
+    method : str
+        HTTP method to use, either 'GET' or 'POST'.
+    url : str
+        URL to request.
+    data : bytes, optional
+        Body of the POST request.
+    session : aiohttp.ClientSession, optional
+        Session to use for the request, as returned by
+        `create_async_session`. When None, a temporary session is used.
+
+    Returns
+    -------
+    bytes
+        Response of the request.
+
+    """
+    if aiohttp is None:
+        if method == 'POST':
+            request = functools.partial(
+                pydov.session.post, url, data,
+                timeout=pydov.request_timeout)
+        else:
+            request = functools.partial(
+                pydov.session.get, url, timeout=pydov.request_timeout)
+
+        response = await asyncio.get_event_loop().run_in_executor(
+            pydov.executor, request)
+        response.encoding = 'utf-8'
+        return response.text.encode('utf8')
+
+    if session is None:
+        session = create_async_session()
+        try:
+            return await _request_async(method, url, data, session)
+        finally:
+            await session.close()
+
+    async with session.request(method, url, data=data) as response:
+        content = await response.read()
+    return content.decode('utf-8', 'replace').encode('utf8')
+
+
+async def get_remote_url_async(url, session=None):
+    """Asynchronously request the URL from the remote service and return
+    its contents.
+
+    Parameters
+    ----------
+    url : str
+        URL to download.
+    session : aiohttp.ClientSession, optional
+        Session to use for the request, as returned by
+        `create_async_session`.
+
+    Returns
+    -------
+    xml : bytes
+        The raw XML data as bytes.
+
+    """
+    return await _request_async('GET', url, session=session)
+
+
+async def post_remote_url_async(url, data, session=None):
+    """Asynchronously POST the data to the URL of the remote service and
+    return the response.
+
+    Parameters
+    ----------
+    url : str
+        URL to post to.
+    data : bytes
+        Body of the POST request.
+    session : aiohttp.ClientSession, optional
+        Session to use for the request, as returned by
+        `create_async_session`.
+
+    Returns
+    -------
+    xml : bytes
+        The raw XML data as bytes.
+
+    """
+    return await _request_async('POST', url, data=data, session=session)
 
 
 def get_xsd_schema(url):
@@ -63,7 +212,36 @@ def get_xsd_schema(url):
     response = HookRunner.execute_inject_meta_response(url)
 
     if response is None:
-        response = get_remote_url(url)
+        response, validators = get_remote_response(url)
+        HookRunner.execute_meta_validators_received(url, validators)
+
+    HookRunner.execute_meta_received(url, response)
+
+    return response
+
+
+async def get_xsd_schema_async(url, session=None):
+    """Asynchronously request the XSD schema from DOV webservices and
+    return it.
+
+    Parameters
+    ----------
+    url : str
+        URL of the XSD schema to download.
+    session : aiohttp.ClientSession, optional
+        Session to use for the request, as returned by
+        `create_async_session`.
+
+    Returns
+    -------
+    xml : bytes
+        The raw XML data of this XSD schema as bytes.
+
+    """
+    response = HookRunner.execute_inject_meta_response(url)
+
+    if response is None:
+        response = await get_remote_url_async(url, session)
 
     HookRunner.execute_meta_received(url, response)
 
@@ -94,6 +272,34 @@ def get_dov_xml(url):
     return response
 
 
+async def get_dov_xml_async(url, session=None):
+    """Asynchronously request the XML from the remote DOV webservices and
+    return it.
+
+    Parameters
+    ----------
+    url : str
+        URL of the DOV object to download.
+    session : aiohttp.ClientSession, optional
+        Session to use for the request, as returned by
+        `create_async_session`.
+
+    Returns
+    -------
+    xml : bytes
+        The raw XML data of this DOV object as bytes.
+
+    """
+    response = HookRunner.execute_inject_xml_response(url)
+
+    if response is None:
+        response = await get_remote_url_async(url, session)
+
+    HookRunner.execute_xml_received(url, response)
+
+    return response
+
+
 def parse_dov_xml(xml_data):
     """Parse the given XML data into an ElementTree.
 
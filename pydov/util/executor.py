@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+"""Module implementing the executors used to perform IO operations (like
+XML downloads) in parallel."""
+import concurrent.futures
+import threading
+import time
+
+
+class AbstractExecutor(concurrent.futures.Executor):
+    """Abstract base class for executors running pydov IO operations in
+    parallel.
+
+    A single executor is shared by all searches (see `pydov.executor`),
+    reusing its workers instead of setting up and tearing down a pool for
+    every search.
+
+    Tasks submitted to the executor should not wait for the result of other
+    tasks submitted to the same executor, since this can deadlock an executor
+    of which all workers are occupied. Therefore, the thread based executors
+    run tasks submitted from one of their own worker threads (f.ex. a search
+    running in a task) inline instead.
+
+    """
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedule the callable `fn` to be executed as ``fn(*args,
+        **kwargs)``.
+
+        Parameters
+        ----------
+        fn : callable
+            Function to execute.
+        args : list
+            Positional arguments to pass to `fn`.
+        kwargs : dict
+            Keyword arguments to pass to `fn`.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future representing the execution of the callable.
+
+        """
+        raise NotImplementedError
+
+    def shutdown(self, wait=True):
+        """Release the resources held by the executor.
+
+        The executor remains usable afterwards: resources will be reacquired
+        upon submitting a new task.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Whether to wait for pending tasks to complete. Defaults to True.
+
+        """
+        raise NotImplementedError
+
+
+class ThreadExecutor(AbstractExecutor):
+    """Executor running tasks using a fixed number of worker threads."""
+
+    def __init__(self, workers=4):
+        """Initialisation.
+
+        Parameters
+        ----------
+        workers : int, optional
+            Number of worker threads, i.e. the maximum number of tasks
+            running concurrently. Defaults to 4.
+
+        Raises
+        ------
+        ValueError
+            When the number of workers is smaller than 1.
+
+        """
+        if workers < 1:
+            raise ValueError('The number of workers should be at least 1.')
+
+        self.workers = workers
+
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._local = threading.local()
+
+    def _init_worker(self):
+        """Mark the current thread as a worker thread of this executor."""
+        self._local.worker = True
+
+    def is_worker_thread(self):
+        """Check whether the current thread is a worker thread of this
+        executor.
+
+        Tasks submitted from a worker thread are run inline, since waiting
+        for other tasks of the same executor could deadlock it.
+
+        Returns
+        -------
+        bool
+            True if the current thread is a worker thread of this executor,
+            False otherwise.
+
+        """
+        return getattr(self._local, 'worker', False)
+
+    @staticmethod
+    def _run_inline(fn, args, kwargs):
+        """Run the callable in the calling thread.
+
+        Parameters
+        ----------
+        fn : callable
+            Function to execute.
+        args : list
+            Positional arguments to pass to `fn`.
+        kwargs : dict
+            Keyword arguments to pass to `fn`.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Completed future holding the result or the exception of the
+            callable.
+
+        """
+        future = concurrent.futures.Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _get_pool(self):
+        """Get the underlying thread pool, creating it if necessary.
+
+        Returns
+        -------
+        concurrent.futures.ThreadPoolExecutor
+            Thread pool used to execute the tasks.
+
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.workers, initializer=self._init_worker)
+            return self._pool
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedule the callable `fn` to be executed as ``fn(*args,
+        **kwargs)``.
+
+        Parameters
+        ----------
+        fn : callable
+            Function to execute.
+        args : list
+            Positional arguments to pass to `fn`.
+        kwargs : dict
+            Keyword arguments to pass to `fn`.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future representing the execution of the callable. When called
+            from a worker thread of this executor, the callable is run inline
+            and the future is already completed.
+
+        """
+        if self.is_worker_thread():
+            return self._run_inline(fn, args, kwargs)
+        return self._get_pool().submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait=True):
+        """Stop the worker threads.
+
+        The executor remains usable afterwards: new worker threads will be
+        started upon submitting a new task.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Whether to wait for pending tasks to complete. Defaults to True.
+
+        """
+        with self._pool_lock:
+            pool = self._pool
+            self._pool = None
+
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+
+class AdaptiveThreadExecutor(ThreadExecutor):
+    """Executor adapting the number of concurrently running tasks to the
+    observed latency and error rate.
+
+    Tasks are evaluated in windows of as many tasks as the current
+    concurrency. After each window, the concurrency is:
+
+    * halved when the error rate of the window exceeds `max_error_rate`,
+    * decreased by one when the median latency of the window exceeds the
+      median latency of the previous window by more than a factor
+      `latency_tolerance`,
+    * increased by one otherwise,
+
+    always staying between `min_workers` and `max_workers`.
+
+    """
+
+    def __init__(self, min_workers=2, max_workers=16, workers=4,
+                 latency_tolerance=1.5, max_error_rate=0.1):
+        """Initialisation.
+
+        Parameters
+        ----------
+        min_workers : int, optional
+            Minimal number of concurrently running tasks. Defaults to 2.
+        max_workers : int, optional
+            Maximal number of concurrently running tasks. Defaults to 16.
+        workers : int, optional
+            Initial number of concurrently running tasks. Defaults to 4.
+        latency_tolerance : float, optional
+            Maximal factor the median latency can increase between two
+            windows before the concurrency is decreased. Defaults to 1.5.
+        max_error_rate : float, optional
+            Maximal ratio of failed tasks in a window before the concurrency
+            is halved. Defaults to 0.1.
+
+        Raises
+        ------
+        ValueError
+            When the number of workers is not within 1 <= `min_workers` <=
+            `workers` <= `max_workers`.
+
+        """
+        if not 1 <= min_workers <= workers <= max_workers:
+            raise ValueError('The number of workers should satisfy 1 <= '
+                             'min_workers <= workers <= max_workers.')
+
+        super(AdaptiveThreadExecutor, self).__init__(workers=max_workers)
+
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.concurrency = workers
+        self.latency_tolerance = latency_tolerance
+        self.max_error_rate = max_error_rate
+
+        self._condition = threading.Condition()
+        self._running = 0
+        self._latencies = []
+        self._errors = 0
+        self._previous_latency = None
+
+    def _run(self, fn, args, kwargs):
+        """Run the callable once the current concurrency allows for it,
+        recording its latency and outcome.
+
+        Parameters
+        ----------
+        fn : callable
+            Function to execute.
+        args : list
+            Positional arguments to pass to `fn`.
+        kwargs : dict
+            Keyword arguments to pass to `fn`.
+
+        Returns
+        -------
+        object
+            The result of calling `fn`.
+
+        """
+        with self._condition:
+            while self._running >= self.concurrency:
+                self._condition.wait()
+            self._running += 1
+
+        start = time.time()
+        failed = True
+        try:
+            result = fn(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            self._record(time.time() - start, failed)
+
+    def _record(self, latency, failed):
+        """Record the latency and outcome of a finished task and adapt the
+        concurrency at the end of a window.
+
+        Parameters
+        ----------
+        latency : float
+            Duration of the task, in seconds.
+        failed : bool
+            Whether the task raised an exception.
+
+        """
+        with self._condition:
+            self._running -= 1
+            self._latencies.append(latency)
+            if failed:
+                self._errors += 1
+
+            if len(self._latencies) >= self.concurrency:
+                self._adapt()
+
+            self._condition.notify_all()
+
+    def _adapt(self):
+        """Adapt the concurrency based on the tasks of the current window
+        and start a new window.
+
+        Should be called while holding the lock of `_condition`.
+
+        """
+        latencies = sorted(self._latencies)
+        latency = latencies[len(latencies) // 2]
+        error_rate = float(self._errors) / len(latencies)
+
+        if error_rate > self.max_error_rate:
+            self.concurrency = max(self.min_workers, self.concurrency // 2)
+        elif self._previous_latency is not None and \
+                latency > self._previous_latency * self.latency_tolerance:
+            self.concurrency = max(self.min_workers, self.concurrency - 1)
+        else:
+            self.concurrency = min(self.max_workers, self.concurrency + 1)
+
+        self._previous_latency = latency
+        self._latencies = []
+        self._errors = 0
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedule the callable `fn` to be executed as ``fn(*args,
+        **kwargs)``.
+
+        Parameters
+        ----------
+        fn : callable
+            Function to execute.
+        args : list
+            Positional arguments to pass to `fn`.
+        kwargs : dict
+            Keyword arguments to pass to `fn`.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future representing the execution of the callable. When called
+            from a worker thread of this executor, the callable is run inline
+            and the future is already completed.
+
+        """
+        if self.is_worker_thread():
+            return self._run_inline(fn, args, kwargs)
+        return super(AdaptiveThreadExecutor, self).submit(
+            self._run, fn, args, kwargs)
@@ -81,6 +81,28 @@ class HookRunner(object):
                 result = r
         return result
 
+    @staticmethod
+    def is_read_hook_implemented(hook_name):
+        """Check whether any of the registered read hooks implements the read
+        hook with the given name, instead of inheriting the default
+        implementation of AbstractReadHook.
+
+        Parameters
+        ----------
+        hook_name : str
+            Name of the hook function to check.
+
+        Returns
+        -------
+        bool
+            True if at least one registered read hook implements the hook,
+            False otherwise.
+
+        """
+        default = getattr(AbstractReadHook, hook_name)
+        return any(getattr(type(h), hook_name) is not default
+                   for h in pydov.hooks.get_read_hooks())
+
     @staticmethod
     def execute_meta_received(url, response):
         """Execute the meta_received method for all registered hooks.
@@ -95,6 +117,23 @@ class HookRunner(object):
         """
         HookRunner.__execute_read('meta_received', [url, response])
 
+    @staticmethod
+    def execute_meta_validators_received(url, validators):
+        """Execute the meta_validators_received method for all registered
+        hooks.
+
+        Parameters
+        ----------
+        url : str
+            URL of the metadata request.
+        validators : dict
+            Headers of the response allowing to revalidate it later:
+            `etag` and `last_modified`, None when absent.
+
+        """
+        HookRunner.__execute_read('meta_validators_received',
+                                  [url, validators])
+
     @staticmethod
     def execute_wfs_search_init(typename):
         """Execute the wfs_search_init method for all registered hooks.
@@ -262,6 +301,23 @@ class AbstractReadHook(object):
         """
         pass
 
+    def meta_validators_received(self, url, validators):
+        """Called when a response for a metadata request is received from
+        the remote service, before `meta_received`, with the headers
+        allowing to revalidate the response later.
+
+        Parameters
+        ----------
+        url : str
+            URL of the metadata request.
+        validators : dict
+            Headers of the response allowing to revalidate it later:
+            `etag` (the ETag header) and `last_modified` (the Last-Modified
+            header), None when absent.
+
+        """
+        pass
+
     def wfs_search_init(self, typename):
         """Called upon starting a WFS search.
 
@@ -290,6 +346,9 @@ class AbstractReadHook(object):
         Includes both the GetFeature query as well as the response from the
         WFS server.
 
+        Implementing this hook requires the complete WFS response to be
+        parsed in memory, disabling the incremental parsing of the response.
+
         Parameters
         ----------
         query : etree.ElementTree
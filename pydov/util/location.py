@@ -193,6 +193,7 @@ class Box(AbstractLocation):
         self.miny = miny
         self.maxx = maxx
         self.maxy = maxy
+        self.epsg = epsg
 
         self.element = etree.Element('{http://www.opengis.net/gml}Envelope')
         self.element.set('srsDimension', '2')
@@ -219,6 +220,24 @@ class Box(AbstractLocation):
         """
         return self.element
 
+    def split(self):
+        """Split the box into four quadrants of equal size.
+
+        Returns
+        -------
+        list of Box
+            The lower left, lower right, upper left and upper right quadrant
+            of this box, in the same coordinate reference system.
+
+        """
+        midx = (self.minx + self.maxx) / 2.0
+        midy = (self.miny + self.maxy) / 2.0
+
+        return [Box(self.minx, self.miny, midx, midy, self.epsg),
+                Box(midx, self.miny, self.maxx, midy, self.epsg),
+                Box(self.minx, midy, midx, self.maxy, self.epsg),
+                Box(midx, midy, self.maxx, self.maxy, self.epsg)]
+
 
 class Point(AbstractLocation):
     """Class representing a point location."""
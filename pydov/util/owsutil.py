@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Module grouping utility functions for OWS services."""
-import warnings
+import copy
+
+import requests
 
 import pydov
 
@@ -12,12 +14,19 @@ from owslib.fes import (
 from urllib.parse import urlparse
 
 from owslib.etree import etree
+from owslib.iso import MD_Metadata
 from owslib.namespaces import Namespaces
 from owslib.util import nspath_eval
 
+from .dovutil import (
+    get_remote_response,
+    get_remote_url_async,
+    post_remote_url_async,
+)
 from .errors import (
     MetadataNotFoundError,
     FeatureCatalogueNotFoundError,
+    WfsGetFeatureError,
 )
 from .hooks import HookRunner
 
@@ -34,6 +43,20 @@ def __get_namespaces():
 
 __namespaces = __get_namespaces()
 
+# Geometry types of the attributes in a DescribeFeatureType, by XSD type.
+__geometry_types = {
+    'PointPropertyType': 'Point',
+    'PolygonPropertyType': 'Polygon',
+    'LineStringPropertyType': 'LineString',
+    'MultiPointPropertyType': 'MultiPoint',
+    'MultiLineStringPropertyType': 'MultiLineString',
+    'MultiPolygonPropertyType': 'MultiPolygon',
+    'MultiGeometryPropertyType': 'MultiGeometry',
+    'GeometryPropertyType': 'GeometryCollection',
+    'SurfacePropertyType': '3D Polygon',
+    'MultiSurfacePropertyType': '3D MultiPolygon',
+}
+
 
 def __get_remote_fc(fc_url):
     """Request the remote featurecatalogue by calling the `fc_url` and
@@ -71,6 +94,24 @@ def __get_remote_describefeaturetype(describefeaturetype_url):
     return get_url(describefeaturetype_url)
 
 
+def __get_remote_md(md_url):
+    """Request the remote metadata by calling the `md_url` and returning the
+    response.
+
+    Parameters
+    ----------
+    md_url : str
+        URL to the remote metadata.
+
+    Returns
+    -------
+    bytes
+        Response containing the remote metadata.
+
+    """
+    return get_url(md_url)
+
+
 def get_remote_metadata(contentmetadata):
     """Request and parse the remote metadata associated with the layer
     described in `contentmetadata`.
@@ -90,16 +131,32 @@ def get_remote_metadata(contentmetadata):
     Raises
     ------
     pydov.util.errors.MetadataNotFoundError
-        If the `contentmetadata` has no valid metadata URL associated with it.
+        If the `contentmetadata` has no valid metadata URL associated with it,
+        or none of its metadata URLs could be retrieved and parsed.
 
     """
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore", category=FutureWarning)
-        contentmetadata.parse_remote_metadata(pydov.request_timeout)
-
+    error = None
     for remote_md in contentmetadata.metadataUrls:
-        if 'metadata' in remote_md:
-            return remote_md['metadata']
+        if remote_md.get('url') is None \
+                or (remote_md.get('format') or '').lower() != 'text/xml' \
+                or remote_md.get('type') not in ('TC211', '19115', '19139'):
+            continue
+
+        try:
+            tree = etree.fromstring(__get_remote_md(remote_md['url']))
+        except (requests.RequestException, etree.ParseError) as e:
+            error = e
+            continue
+
+        for tag in ('gmd:MD_Metadata', 'gmi:MI_Metadata'):
+            md = tree.find('.//' + nspath_eval(tag, __namespaces))
+            if md is not None:
+                return MD_Metadata(md)
+
+    if error is not None:
+        raise MetadataNotFoundError(
+            'Failed to retrieve the remote metadata: {}'.format(
+                error)) from error
 
     raise MetadataNotFoundError
 
@@ -173,6 +230,28 @@ def get_featurecatalogue_uuid(md_metadata):
         return fc_uuid
 
 
+def get_featurecatalogue_url(csw_url, fc_uuid):
+    """Get the URL to request the feature catalogue described by the CSW
+    base url and feature catalogue UUID.
+
+    Parameters
+    ----------
+    csw_url : str
+        Base URL of the CSW service to query, should end with 'csw'.
+    fc_uuid : str
+        Universally unique identifier of the feature catalogue.
+
+    Returns
+    -------
+    str
+        URL of the GetRecordById request of the feature catalogue.
+
+    """
+    return csw_url + '?Service=CSW&Request=GetRecordById&Version=2.0.2' \
+                     '&outputSchema=http://www.isotc211.org/2005/gfc' \
+                     '&elementSetName=full&id=' + fc_uuid
+
+
 def get_remote_featurecatalogue(csw_url, fc_uuid):
     """Request and parse the remote feature catalogue described by the CSW
     base url and feature catalogue UUID.
@@ -209,11 +288,7 @@ def get_remote_featurecatalogue(csw_url, fc_uuid):
         given CSW service.
 
     """
-    fc_url = csw_url + '?Service=CSW&Request=GetRecordById&Version=2.0.2' \
-                       '&outputSchema=http://www.isotc211.org/2005/gfc' \
-                       '&elementSetName=full&id=' + fc_uuid
-
-    content = __get_remote_fc(fc_url)
+    content = __get_remote_fc(get_featurecatalogue_url(csw_url, fc_uuid))
     tree = etree.fromstring(content)
 
     fc = tree.find(nspath_eval('gfc:FC_FeatureCatalogue', __namespaces))
@@ -281,7 +356,48 @@ def get_remote_featurecatalogue(csw_url, fc_uuid):
     return r
 
 
-def get_namespace(wfs, layer):
+def get_describefeaturetype_url(wfs, layer):
+    """Get the URL of the DescribeFeatureType request of a layer.
+
+    Parameters
+    ----------
+    wfs : owslib.wfs.WebFeatureService
+        WFS service to use, associated with the layer.
+    layer : str
+        Workspace-qualified name of the layer (typename).
+
+    Returns
+    -------
+    str
+        URL of the DescribeFeatureType request.
+
+    """
+    from owslib.feature.schema import _get_describefeaturetype_url
+    return _get_describefeaturetype_url(url=wfs.url, version='1.1.0',
+                                        typename=layer)
+
+
+def get_remote_describefeaturetype(wfs, layer):
+    """Request and parse the DescribeFeatureType of a layer.
+
+    Parameters
+    ----------
+    wfs : owslib.wfs.WebFeatureService
+        WFS service to use, associated with the layer.
+    layer : str
+        Workspace-qualified name of the layer (typename).
+
+    Returns
+    -------
+    etree.Element
+        Root element of the DescribeFeatureType response.
+
+    """
+    return etree.fromstring(__get_remote_describefeaturetype(
+        get_describefeaturetype_url(wfs, layer)))
+
+
+def get_namespace(wfs, layer, describefeaturetype=None):
     """Request the namespace associated with a layer by performing a
     DescribeFeatureType request.
 
@@ -292,6 +408,10 @@ def get_namespace(wfs, layer):
     layer : str
         Workspace-qualified name of the layer to get the namespace of (
         typename).
+    describefeaturetype : etree.Element, optional
+        Previously retrieved DescribeFeatureType of the layer, as returned by
+        `get_remote_describefeaturetype`. Defaults to None, which performs
+        a new request.
 
     Returns
     -------
@@ -299,13 +419,76 @@ def get_namespace(wfs, layer):
         URI of the namespace associated with the given layer.
 
     """
-    from owslib.feature.schema import _get_describefeaturetype_url
-    url = _get_describefeaturetype_url(url=wfs.url, version='1.1.0',
-                                       typename=layer)
-    schema = __get_remote_describefeaturetype(url)
-    tree = etree.fromstring(schema)
-    namespace = tree.attrib.get('targetNamespace', None)
-    return namespace
+    if describefeaturetype is None:
+        describefeaturetype = get_remote_describefeaturetype(wfs, layer)
+    return describefeaturetype.attrib.get('targetNamespace', None)
+
+
+def get_schema(wfs, layer, describefeaturetype=None):
+    """Request and parse the schema of a layer by performing a
+    DescribeFeatureType request.
+
+    Parameters
+    ----------
+    wfs : owslib.wfs.WebFeatureService
+        WFS service to use, associated with the layer.
+    layer : str
+        Workspace-qualified name of the layer to get the schema of (
+        typename).
+    describefeaturetype : etree.Element, optional
+        Previously retrieved DescribeFeatureType of the layer, as returned by
+        `get_remote_describefeaturetype`. Defaults to None, which performs
+        a new request.
+
+    Returns
+    -------
+    schema : dict
+        Schema associated with the layer, in the format returned by
+        `owslib.feature.schema.get_schema`: a dictionary with the datatype of
+        every attribute in `properties`, the names of the non-nillable
+        attributes in `required` and the geometry type and attribute in
+        `geometry` and `geometry_column`. None if the DescribeFeatureType
+        defines no attributes.
+
+    """
+    root = describefeaturetype
+    if root is None:
+        root = get_remote_describefeaturetype(wfs, layer)
+
+    xs = '{http://www.w3.org/2001/XMLSchema}'
+
+    type_element = root.find('./{}element'.format(xs))
+    if type_element is None:
+        return None
+
+    complex_type = root.find('./{}complexType[@name="{}"]'.format(
+        xs, type_element.get('type').split(':')[-1]))
+    if complex_type is None:
+        return None
+
+    schema = {'properties': {}, 'required': [], 'geometry': None}
+    for element in complex_type.iter(xs + 'element'):
+        name = element.get('name')
+        datatype = element.get('type') or element.get('ref')
+        if datatype is None:
+            restriction = element.find('.//{}restriction'.format(xs))
+            if restriction is not None:
+                datatype = restriction.get('base')
+        if name is None or not datatype:
+            continue
+
+        datatype = datatype.split(':')[-1]
+        if datatype in __geometry_types:
+            schema['geometry'] = __geometry_types[datatype]
+            schema['geometry_column'] = name
+        else:
+            schema['properties'][name] = datatype
+
+        if element.get('nillable', 'false') == 'false':
+            schema['required'].append(name)
+
+    if schema['properties'] or schema['geometry']:
+        return schema
 
 
 def set_geometry_column(location, geometry_column):
@@ -419,7 +602,8 @@ def wfs_build_getfeature_request(typename, geometry_column=None, location=None,
 
     if location is not None:
         location = set_geometry_column(location, geometry_column)
-        filter_parent.append(location)
+        # append a copy, so the location can be reused in other requests
+        filter_parent.append(copy.deepcopy(location))
 
     query.append(filter_xml)
 
@@ -430,6 +614,102 @@ def wfs_build_getfeature_request(typename, geometry_column=None, location=None,
     return xml
 
 
+def wfs_build_getfeature_hits_request(get_feature_request):
+    """Build a WFS GetFeature request returning only the number of features
+    matching the given GetFeature request.
+
+    Parameters
+    ----------
+    get_feature_request : etree.Element
+        XML element representing the WFS GetFeature request.
+
+    Returns
+    -------
+    element : etree.Element
+        XML element representing the WFS GetFeature request with
+        resultType 'hits'.
+
+    """
+    xml = copy.deepcopy(get_feature_request)
+    xml.set('resultType', 'hits')
+    if 'maxFeatures' in xml.attrib:
+        del xml.attrib['maxFeatures']
+    return xml
+
+
+def wfs_build_getfeature_sorted_request(get_feature_request, sort_property):
+    """Build a WFS GetFeature request returning the features matching the
+    given GetFeature request, sorted on `sort_property` after any sort order
+    already present in the request.
+
+    Parameters
+    ----------
+    get_feature_request : etree.Element
+        XML element representing the WFS GetFeature request.
+    sort_property : str
+        Name of a property uniquely identifying the features.
+
+    Returns
+    -------
+    element : etree.Element
+        XML element representing the sorted WFS GetFeature request.
+
+    """
+    xml = copy.deepcopy(get_feature_request)
+
+    query = xml.find('{http://www.opengis.net/wfs}Query')
+    sort_by = query.find('{http://www.opengis.net/ogc}SortBy')
+    if sort_by is None:
+        sort_by = etree.SubElement(query, '{http://www.opengis.net/ogc}SortBy')
+
+    sort_properties = [i.text for i in sort_by.findall(
+        './/{http://www.opengis.net/ogc}PropertyName')]
+    if sort_property not in sort_properties:
+        sort_property_xml = etree.SubElement(
+            sort_by, '{http://www.opengis.net/ogc}SortProperty')
+        etree.SubElement(
+            sort_property_xml,
+            '{http://www.opengis.net/ogc}PropertyName').text = sort_property
+        etree.SubElement(
+            sort_property_xml,
+            '{http://www.opengis.net/ogc}SortOrder').text = 'ASC'
+
+    return xml
+
+
+def wfs_build_getfeature_page_request(get_feature_request, start_index,
+                                      max_features, sort_property):
+    """Build a WFS GetFeature request returning a single page of the features
+    matching the given GetFeature request.
+
+    To make sure consecutive pages neither overlap nor skip any features,
+    the features are sorted on `sort_property`, after any sort order already
+    present in the request (see `wfs_build_getfeature_sorted_request`).
+
+    Parameters
+    ----------
+    get_feature_request : etree.Element
+        XML element representing the WFS GetFeature request.
+    start_index : int
+        Index of the first feature of the page, starting from 0.
+    max_features : int
+        Maximum number of features of the page.
+    sort_property : str
+        Name of a property uniquely identifying the features.
+
+    Returns
+    -------
+    element : etree.Element
+        XML element representing the WFS GetFeature request of the page.
+
+    """
+    xml = wfs_build_getfeature_sorted_request(get_feature_request,
+                                              sort_property)
+    xml.set('startIndex', str(start_index))
+    xml.set('maxFeatures', str(max_features))
+    return xml
+
+
 def wfs_get_feature(baseurl, get_feature_request):
     """Perform a WFS request using POST.
 
@@ -453,6 +733,145 @@ def wfs_get_feature(baseurl, get_feature_request):
     return request.text.encode('utf8')
 
 
+def wfs_get_feature_stream(baseurl, get_feature_request):
+    """Perform a WFS request using POST, returning the response as a stream.
+
+    The response body is read incrementally from the connection, instead of
+    being loaded in memory as a whole.
+
+    Parameters
+    ----------
+    baseurl : str
+        Base URL of the WFS service.
+    get_feature_request : etree.Element
+        XML element representing the WFS GetFeature request.
+
+    Returns
+    -------
+    file-like object
+        Binary file-like object to read the response of the WFS service
+        from. Should be closed after use.
+
+    Raises
+    ------
+    pydov.util.errors.WfsGetFeatureError
+        When the WFS service responds with an HTTP error status.
+
+    """
+    data = etree.tostring(get_feature_request)
+
+    request = pydov.session.post(baseurl, data, timeout=pydov.request_timeout,
+                                 stream=True)
+    try:
+        request.raise_for_status()
+    except requests.HTTPError as e:
+        try:
+            content = request.content
+        finally:
+            request.close()
+        raise WfsGetFeatureError(
+            'Error retrieving features from DOV WFS server ({}):\n{}'.format(
+                e, _get_error_text(content))) from e
+
+    request.raw.decode_content = True
+    return request.raw
+
+
+def _get_error_text(content):
+    """Get the text describing the error in the body of an error response
+    of an OWS service.
+
+    Parameters
+    ----------
+    content : bytes
+        Body of the error response.
+
+    Returns
+    -------
+    str
+        The serialized ExceptionReport if the body contains one, the body
+        itself otherwise.
+
+    """
+    try:
+        tree = etree.fromstring(content)
+    except etree.ParseError:
+        tree = None
+
+    if tree is not None and tree.tag.endswith('}ExceptionReport'):
+        return etree.tostring(tree).decode('utf8')
+
+    return content.decode('utf8', errors='replace')
+
+
+def wfs_iterparse_features(source):
+    """Incrementally parse a WFS GetFeature response.
+
+    Parameters
+    ----------
+    source : file-like object
+        Binary file-like object to read the WFS response from.
+
+    Returns
+    -------
+    root : etree.Element
+        Root element of the WFS response, having its attributes but none of
+        its children.
+    features : generator of etree.Element
+        Generator yielding the elements of the features in the response.
+        Every feature is removed from the tree after it has been processed,
+        so the memory usage does not grow with the number of features in
+        the response.
+
+    """
+    events = iter(etree.iterparse(source, events=('start', 'end')))
+    event, root = next(events)
+
+    def iter_features():
+        feature_members = None
+        depth = 1
+        for event, element in events:
+            if event == 'start':
+                depth += 1
+                if depth == 2 and element.tag == \
+                        '{http://www.opengis.net/gml}featureMembers':
+                    feature_members = element
+                continue
+
+            depth -= 1
+            if depth == 2 and feature_members is not None:
+                yield element
+                element.clear()
+                feature_members.remove(element)
+            elif depth == 1:
+                feature_members = None
+
+    return root, iter_features()
+
+
+async def wfs_get_feature_async(baseurl, get_feature_request, session=None):
+    """Asynchronously perform a WFS request using POST.
+
+    Parameters
+    ----------
+    baseurl : str
+        Base URL of the WFS service.
+    get_feature_request : etree.Element
+        XML element representing the WFS GetFeature request.
+    session : aiohttp.ClientSession, optional
+        Session to use for the request, as returned by
+        `pydov.util.dovutil.create_async_session`.
+
+    Returns
+    -------
+    bytes
+        Response of the WFS service.
+
+    """
+    data = etree.tostring(get_feature_request)
+    return await post_remote_url_async(baseurl, data, session)
+
+
 def get_url(url):
     """Perform a GET request to an OWS service an return the result.
 
@@ -470,9 +889,36 @@ def get_url(url):
     response = HookRunner.execute_inject_meta_response(url)
 
     if response is None:
-        request = pydov.session.get(url, timeout=pydov.request_timeout)
-        request.encoding = 'utf-8'
-        response = request.text.encode('utf8')
+        response, validators = get_remote_response(url)
+        HookRunner.execute_meta_validators_received(url, validators)
+
+    HookRunner.execute_meta_received(url, response)
+
+    return response
+
+
+async def get_url_async(url, session=None):
+    """Asynchronously perform a GET request to an OWS service an return the
+    result.
+
+    Parameters
+    ----------
+    url : str
+        URL to request.
+    session : aiohttp.ClientSession, optional
+        Session to use for the request, as returned by
+        `pydov.util.dovutil.create_async_session`.
+
+    Returns
+    -------
+    bytes
+        Response containing the result of the GET request.
+
+    """
+    response = HookRunner.execute_inject_meta_response(url)
+
+    if response is None:
+        response = await get_remote_url_async(url, session)
 
     HookRunner.execute_meta_received(url, response)
 
@@ -20,8 +20,15 @@ class PropertyInList(OgcExpression):
     Or([PropertyIsEqualTo('methode', 'spade'), PropertyIsEqualTo('methode',
     'spoelboring')])
 
+    Searches using a PropertyInList with more values than its `chunksize`
+    are split into multiple WFS requests of at most `chunksize` values
+    each, which are executed in parallel.
+
     """
-    def __init__(self, propertyname, lst):
+    # default maximum number of values per WFS request
+    chunksize = 500
+
+    def __init__(self, propertyname, lst, chunksize=None):
         """Initialisation.
 
         Parameters
@@ -30,25 +37,73 @@ class PropertyInList(OgcExpression):
             Name of the attribute to query.
         lst : list of str
             List of literals to match against (exact matches).
+        chunksize : int, optional
+            Maximum number of values to use in a single WFS request.
+            Defaults to None, which uses the class attribute `chunksize`
+            (500).
 
         Raises
         ------
         ValueError
             If the given list does not contain at least a single item.
 
+            If the chunksize is smaller than 1.
+
         """
         super(PropertyInList, self).__init__()
 
         if not isinstance(lst, list) and not isinstance(lst, set):
             raise ValueError('list should be of type "list" or "set"')
 
-        if len(set(lst)) < 1:
+        if chunksize is not None:
+            if chunksize < 1:
+                raise ValueError('chunksize should be at least 1')
+            self.chunksize = chunksize
+
+        self.propertyname = propertyname
+        self.values = list(dict.fromkeys(lst))
+
+        if len(self.values) < 1:
             raise ValueError('list should contain at least a single item')
-        elif len(set(lst)) == 1:
-            self.query = PropertyIsEqualTo(propertyname, set(lst).pop())
-        else:
-            self.query = Or(
-                [PropertyIsEqualTo(propertyname, i) for i in set(lst)])
+
+    @property
+    def query(self):
+        """The expression equivalent to this PropertyInList.
+
+        The expression is built when it is needed, as large lists are
+        usually split (see `split`) before being serialised.
+
+        Returns
+        -------
+        owslib.fes.OgcExpression
+            PropertyIsEqualTo expression for a single value, Or combination
+            of PropertyIsEqualTo expressions for multiple values.
+
+        """
+        if len(self.values) == 1:
+            return PropertyIsEqualTo(self.propertyname, self.values[0])
+        return Or([PropertyIsEqualTo(self.propertyname, i)
+                   for i in self.values])
+
+    def split(self):
+        """Split this expression into expressions of at most `chunksize`
+        values each.
+
+        Returns
+        -------
+        list of PropertyInList
+            List of expressions together matching the same values as this
+            expression, or a list containing only this expression if it has
+            no more values than the `chunksize`.
+
+        """
+        if len(self.values) <= self.chunksize:
+            return [self]
+
+        return [PropertyInList(self.propertyname,
+                               self.values[i:i + self.chunksize],
+                               self.chunksize)
+                for i in range(0, len(self.values), self.chunksize)]
 
     def toXML(self):
         """Return the XML representation of the PropertyInList query.
@@ -76,7 +131,7 @@ class Join(PropertyInList):
     'pkey_boring', y), ...]) for every x, y, in df['pkey_boring']
 
     """
-    def __init__(self, dataframe, on, using=None):
+    def __init__(self, dataframe, on, using=None, chunksize=None):
         """Initialisation.
 
         Parameters
@@ -88,6 +143,10 @@ class Join(PropertyInList):
         using : str, optional
             Name of the column in the dataframe to use for joining. By
             default, the same column name as in `on` is assumed.
+        chunksize : int, optional
+            Maximum number of values to use in a single WFS request.
+            Defaults to None, which uses the class attribute `chunksize`
+            of PropertyInList (500).
 
         Raises
         ------
@@ -115,4 +174,4 @@ class Join(PropertyInList):
             raise ValueError("dataframe should contain at least a single "
                              "value in column '{}'.".format(using))
 
-        super(Join, self).__init__(on, value_list)
+        super(Join, self).__init__(on, value_list, chunksize)
@@ -1,7 +1,9 @@
+import asyncio
 import datetime
 import random
 import re
 import sys
+import threading
 
 import numpy as np
 from collections import OrderedDict
@@ -11,8 +13,8 @@ import pytest
 import requests
 from pandas import DataFrame
 from pandas.api.types import (
-    is_int64_dtype, is_object_dtype,
-    is_bool_dtype, is_float_dtype)
+    is_object_dtype, is_bool_dtype, is_float_dtype,
+    is_integer_dtype, is_datetime64_any_dtype)
 
 import pydov
 from owslib.fes import (
@@ -22,8 +24,12 @@ from owslib.fes import (
 )
 from owslib.etree import etree
 from pydov.types.abstract import AbstractField
+from pydov.util.caching import MemoryRecordCache
 from pydov.util.dovutil import build_dov_url
-from pydov.util.errors import InvalidFieldError
+from pydov.util.errors import (
+    InvalidFieldError,
+    InvalidSearchParameterError,
+)
 from pydov.util.location import (
     Within,
     Box,
@@ -381,17 +387,183 @@ class AbstractTestSearch(object):
 
             assert len(datatypes) <= 1
 
-            if len(datatypes) > 0:
-                if field_datatype == 'string':
-                    assert (str in datatypes)
-                elif field_datatype == 'float':
-                    assert float in datatypes
-                elif field_datatype == 'integer':
-                    assert (int in datatypes)
-                elif field_datatype == 'date':
-                    assert datetime.date in datatypes
-                elif field_datatype == 'boolean':
-                    assert bool in datatypes
+            if field_datatype == 'string':
+                assert is_object_dtype(df[field])
+                if len(datatypes) > 0:
+                    assert str in datatypes
+            elif field_datatype == 'float':
+                assert is_float_dtype(df[field])
+            elif field_datatype == 'integer':
+                assert is_integer_dtype(df[field])
+            elif field_datatype in ('date', 'datetime'):
+                assert is_datetime64_any_dtype(df[field])
+            elif field_datatype == 'boolean':
+                assert is_bool_dtype(df[field])
+
+    def test_search_async(self, mp_wfs, mp_get_schema,
+                          mp_remote_describefeaturetype, mp_remote_md,
+                          mp_remote_fc, mp_remote_xsd, mp_remote_wfs_feature,
+                          mp_dov_xml, monkeypatch, request):
+        """Test the search_async method with only the query parameter.
+
+        Test whether the result equals the result of the search method.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_remote_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features.
+        mp_dov_xml : pytest.fixture
+            Monkeypatch the call to get the remote XML data.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+        request : pytest.fixture
+            PyTest fixture providing request context.
+
+        """
+        def read_file(variable):
+            with open(getattr(request.module, variable), 'r',
+                      encoding='utf-8') as f:
+                return f.read().encode('utf-8')
+
+        async def wfs_get_feature_async(*args, **kwargs):
+            return read_file('location_wfs_getfeature')
+
+        async def get_xml_data_async(*args, **kwargs):
+            return read_file('location_dov_xml')
+
+        monkeypatch.setattr(pydov.util.owsutil, 'wfs_get_feature_async',
+                            wfs_get_feature_async)
+        monkeypatch.setattr(pydov.types.abstract.AbstractDovType,
+                            '_get_xml_data_async', get_xml_data_async)
+
+        loop = asyncio.new_event_loop()
+        try:
+            df_async = loop.run_until_complete(
+                self.get_search_object().search_async(
+                    query=self.get_valid_query_single()))
+        finally:
+            loop.close()
+
+        df = self.get_search_object().search(
+            query=self.get_valid_query_single())
+
+        assert type(df_async) is DataFrame
+        assert list(df_async) == self.get_df_default_columns()
+        pd.testing.assert_frame_equal(df_async, df)
+
+    def test_search_iter(self, mp_wfs, mp_get_schema,
+                         mp_remote_describefeaturetype, mp_remote_md,
+                         mp_remote_fc, mp_remote_xsd, mp_remote_wfs_feature,
+                         mp_dov_xml):
+        """Test the search_iter method with only the query parameter.
+
+        Test whether the concatenated results equal the result of the
+        search method.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_remote_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features.
+        mp_dov_xml : pytest.fixture
+            Monkeypatch the call to get the remote XML data.
+
+        """
+        dfs = list(self.get_search_object().search_iter(
+            query=self.get_valid_query_single(), chunksize=1))
+
+        df = self.get_search_object().search(
+            query=self.get_valid_query_single())
+
+        assert len(dfs) == 1
+        assert list(dfs[0]) == self.get_df_default_columns()
+        pd.testing.assert_frame_equal(dfs[0], df)
+
+    def test_search_iter_chunksize_invalid(self):
+        """Test the search_iter method with an invalid chunksize.
+
+        Test whether an InvalidSearchParameterError is raised.
+
+        """
+        with pytest.raises(InvalidSearchParameterError):
+            self.get_search_object().search_iter(
+                query=self.get_valid_query_single(), chunksize=0)
+
+    def test_search_normalized(self, mp_wfs, mp_get_schema,
+                               mp_remote_describefeaturetype, mp_remote_md,
+                               mp_remote_fc, mp_remote_xsd,
+                               mp_remote_wfs_feature, mp_dov_xml):
+        """Test the search_normalized method with only the query parameter.
+
+        Test whether the main dataframe contains a single row per object,
+        whether the subtype dataframes contain the primary key and the
+        subtype fields only and whether together they contain the same rows
+        as the result of the search method.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_remote_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features.
+        mp_dov_xml : pytest.fixture
+            Monkeypatch the call to get the remote XML data.
+
+        """
+        df_main, df_subtypes = self.get_search_object().search_normalized(
+            query=self.get_valid_query_single())
+
+        df = self.get_search_object().search(
+            query=self.get_valid_query_single())
+
+        subtypes = self.get_type().subtypes
+        subtype_fields = [f for st in subtypes for f in st.get_field_names()]
+        key = list(df_main)[0]
+
+        assert key.startswith('pkey')
+        assert list(df_main) == [c for c in df if c not in subtype_fields]
+        assert len(df_main) == df[key].nunique()
+
+        assert sorted(df_subtypes) == sorted(st.get_name() for st in subtypes)
+        for st in subtypes:
+            df_st = df_subtypes[st.get_name()]
+            assert list(df_st) == [key] + list(st.get_field_names())
+            assert set(df_st[key]) <= set(df_main[key])
+
+        assert len(df) == max(1, sum(len(d) for d in df_subtypes.values()))
 
     def test_search_returnfields(self, mp_remote_wfs_feature):
         """Test the search method with the query parameter and a selection of
@@ -1046,6 +1218,258 @@ class AbstractTestTypes(object):
                     assert value.startswith(build_dov_url('data/'))
                     assert not value.endswith('.xml')
 
+    def test_parse_xml_data_once(self, wfs_feature, mp_dov_xml,
+                                 monkeypatch):
+        """Test the _parse_xml_data method.
+
+        Test whether the XML document is parsed only once for the main type
+        and all of its subtypes.
+
+        Parameters
+        ----------
+        wfs_feature : pytest.fixture returning etree.Element
+            Fixture providing an XML element representing a single record of
+            the WFS layer.
+        mp_dov_xml : pytest.fixture
+            Monkeypatch the call to get the remote XML data.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        parse_dov_xml = pydov.types.abstract.parse_dov_xml
+        parsed = []
+
+        def counting_parse_dov_xml(xml_data):
+            parsed.append(xml_data)
+            return parse_dov_xml(xml_data)
+
+        monkeypatch.setattr(pydov.types.abstract, 'parse_dov_xml',
+                            counting_parse_dov_xml)
+
+        feature = self.get_type().from_wfs_element(
+            wfs_feature, self.get_namespace())
+        feature._parse_xml_data()
+
+        assert len(parsed) == 1
+
+    def test_get_df_array_resolve_once(self, wfs_feature, mp_dov_xml,
+                                       monkeypatch):
+        """Test the get_df_array method.
+
+        Test whether the XML document is parsed at most once, also when
+        calling get_df_array multiple times, and whether it is not parsed
+        at all when only WFS fields are requested.
+
+        Parameters
+        ----------
+        wfs_feature : pytest.fixture returning etree.Element
+            Fixture providing an XML element representing a single record of
+            the WFS layer.
+        mp_dov_xml : pytest.fixture
+            Monkeypatch the call to get the remote XML data.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        parse_dov_xml = pydov.types.abstract.parse_dov_xml
+        parsed = []
+
+        def counting_parse_dov_xml(xml_data):
+            parsed.append(xml_data)
+            return parse_dov_xml(xml_data)
+
+        monkeypatch.setattr(pydov.types.abstract, 'parse_dov_xml',
+                            counting_parse_dov_xml)
+
+        feature = self.get_type().from_wfs_element(
+            wfs_feature, self.get_namespace())
+
+        wfs_fields = [f for f in self.get_type().get_fields(
+            source=('wfs',)) if f in self.get_type().get_field_names()]
+        feature.get_df_array(return_fields=wfs_fields)
+        assert len(parsed) == 0
+
+        df_array = feature.get_df_array()
+        assert len(parsed) <= 1
+
+        assert feature.get_df_array() == df_array
+        assert len(parsed) <= 1
+
+    def test_get_df_array_async(self, wfs_feature, mp_dov_xml,
+                                monkeypatch):
+        """Test the get_df_array_async method.
+
+        Test whether the output equals the output of get_df_array and
+        whether the XML document is parsed outside of the event loop.
+
+        Parameters
+        ----------
+        wfs_feature : pytest.fixture returning etree.Element
+            Fixture providing an XML element representing a single record of
+            the WFS layer.
+        mp_dov_xml : pytest.fixture
+            Monkeypatch the call to get the remote XML data.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        parse_dov_xml = pydov.types.abstract.parse_dov_xml
+        parsed = []
+
+        def recording_parse_dov_xml(xml_data):
+            parsed.append(threading.get_ident())
+            return parse_dov_xml(xml_data)
+
+        async def get_xml_data_async(self, session=None):
+            return self._get_xml_data()
+
+        monkeypatch.setattr(pydov.types.abstract, 'parse_dov_xml',
+                            recording_parse_dov_xml)
+        monkeypatch.setattr(pydov.types.abstract.AbstractDovType,
+                            '_get_xml_data_async', get_xml_data_async)
+
+        feature = self.get_type().from_wfs_element(
+            wfs_feature, self.get_namespace())
+
+        loop = asyncio.new_event_loop()
+        try:
+            df_array = loop.run_until_complete(feature.get_df_array_async())
+        finally:
+            loop.close()
+
+        assert len(parsed) == 1
+        assert parsed[0] != threading.get_ident()
+
+        feature = self.get_type().from_wfs_element(
+            wfs_feature, self.get_namespace())
+        assert feature.get_df_array() == df_array
+
+    def test_get_df_array_record_cache(self, wfs_feature, mp_dov_xml,
+                                       monkeypatch):
+        """Test the get_df_array method with the record cache enabled.
+
+        Test whether the XML document is parsed only once for multiple
+        instances of the same DOV object, and whether the results are the
+        same as without record cache.
+
+        Parameters
+        ----------
+        wfs_feature : pytest.fixture returning etree.Element
+            Fixture providing an XML element representing a single record of
+            the WFS layer.
+        mp_dov_xml : pytest.fixture
+            Monkeypatch the call to get the remote XML data.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        ref_array = self.get_type().from_wfs_element(
+            wfs_feature, self.get_namespace()).get_df_array()
+
+        parse_dov_xml = pydov.types.abstract.parse_dov_xml
+        parsed = []
+
+        def counting_parse_dov_xml(xml_data):
+            parsed.append(xml_data)
+            return parse_dov_xml(xml_data)
+
+        monkeypatch.setattr(pydov.types.abstract, 'parse_dov_xml',
+                            counting_parse_dov_xml)
+        monkeypatch.setattr(pydov, 'record_cache', MemoryRecordCache())
+
+        for i in range(3):
+            feature = self.get_type().from_wfs_element(
+                wfs_feature, self.get_namespace())
+            assert feature.get_df_array() == ref_array
+
+        assert len(parsed) <= 1
+        assert pydov.record_cache.hits == len(parsed) * 2
+
+    def test_get_df_array_selective_parsing(self, wfs_feature, mp_dov_xml):
+        """Test the get_df_array method with return fields of a single part
+        of the XML document.
+
+        Test whether subtypes are only parsed when at least one of their
+        fields is requested, and whether the XML fields of the main type are
+        not parsed when only subtype fields are requested.
+
+        Parameters
+        ----------
+        wfs_feature : pytest.fixture returning etree.Element
+            Fixture providing an XML element representing a single record of
+            the WFS layer.
+        mp_dov_xml : pytest.fixture
+            Monkeypatch the call to get the remote XML data.
+
+        """
+        xml_fields = list(self.get_type().get_fields(
+            source=('xml',), include_subtypes=False))
+
+        if len(xml_fields) > 0:
+            feature = self.get_type().from_wfs_element(
+                wfs_feature, self.get_namespace())
+            feature.get_df_array(return_fields=xml_fields)
+
+            assert all(len(v) == 0 for v in feature.subdata.values())
+
+        for subtype in self.get_type().subtypes:
+            feature = self.get_type().from_wfs_element(
+                wfs_feature, self.get_namespace())
+            feature.get_df_array(return_fields=subtype.get_field_names())
+
+            assert list(feature.subdata) == [subtype.get_name()]
+            assert all(feature.data[f] == feature._UNRESOLVED
+                       for f in xml_fields)
+
+    def test_get_df_array_record_cache_partial(self, wfs_feature,
+                                               mp_dov_xml, monkeypatch):
+        """Test the get_df_array method with the record cache enabled and
+        return fields of a single part of the XML document.
+
+        Test whether the parts saved in the record cache are reused and
+        whether only the missing parts are parsed afterwards.
+
+        Parameters
+        ----------
+        wfs_feature : pytest.fixture returning etree.Element
+            Fixture providing an XML element representing a single record of
+            the WFS layer.
+        mp_dov_xml : pytest.fixture
+            Monkeypatch the call to get the remote XML data.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        if len(self.get_type().subtypes) == 0:
+            return
+
+        ref_array = self.get_type().from_wfs_element(
+            wfs_feature, self.get_namespace()).get_df_array()
+        st_fields = self.get_type().subtypes[0].get_field_names()
+
+        parse_dov_xml = pydov.types.abstract.parse_dov_xml
+        parsed = []
+
+        def counting_parse_dov_xml(xml_data):
+            parsed.append(xml_data)
+            return parse_dov_xml(xml_data)
+
+        monkeypatch.setattr(pydov.types.abstract, 'parse_dov_xml',
+                            counting_parse_dov_xml)
+        monkeypatch.setattr(pydov, 'record_cache', MemoryRecordCache())
+
+        for i in range(2):
+            self.get_type().from_wfs_element(
+                wfs_feature, self.get_namespace()).get_df_array(
+                    return_fields=st_fields)
+        assert len(parsed) == 1
+
+        for i in range(2):
+            feature = self.get_type().from_wfs_element(
+                wfs_feature, self.get_namespace())
+            assert feature.get_df_array() == ref_array
+        assert len(parsed) <= 2
+
     def test_get_df_array_wrongreturnfields(self, wfs_feature):
         """Test the get_df_array specifying a nonexistent return field.
 
@@ -1,5 +1,9 @@
 """Module grouping tests for the boring search module."""
+import concurrent.futures
 import glob
+import io
+import threading
+import time
 
 import pytest
 
@@ -18,6 +22,7 @@ from owslib.fes import (
 from owslib.iso import MD_Metadata
 from owslib.util import findall
 from owslib.wfs import WebFeatureService
+from pydov.search.abstract import MetadataRegistry
 from pydov.search.boring import BoringSearch
 from pydov.search.grondwaterfilter import GrondwaterFilterSearch
 
@@ -34,6 +39,8 @@ from pydov.search.interpretaties import GecodeerdeLithologieSearch
 from pydov.search.interpretaties import LithologischeBeschrijvingenSearch
 from pydov.search.sondering import SonderingSearch
 from pydov.search.grondmonster import GrondmonsterSearch
+from pydov.types.boring import Boring
+from pydov.types.grondwaterfilter import GrondwaterFilter
 
 from pydov.util.dovutil import build_dov_url
 
@@ -294,7 +301,7 @@ def wfs_feature(request):
 
 @pytest.fixture(scope='module')
 def mp_remote_wfs_feature(monkeymodule, request):
-    """Monkeypatch the call to get WFS features.
+    """Monkeypatch the calls to get WFS features.
 
     This monkeypatch requires a module variable ``location_wfs_getfeature``
     with the path to the wfs_getfeature file on disk.
@@ -315,9 +322,15 @@ def mp_remote_wfs_feature(monkeymodule, request):
                 data = data.encode('utf-8')
         return data
 
+    def __get_remote_wfs_feature_stream(*args, **kwargs):
+        return io.BytesIO(__get_remote_wfs_feature(*args, **kwargs))
+
     monkeymodule.setattr(pydov.util.owsutil,
                          'wfs_get_feature',
                          __get_remote_wfs_feature)
+    monkeymodule.setattr(pydov.util.owsutil,
+                         'wfs_get_feature_stream',
+                         __get_remote_wfs_feature_stream)
 
 
 @pytest.fixture(scope='module')
@@ -529,3 +542,258 @@ def test_search_query_wrongtype(objectsearch):
     """
     with pytest.raises(InvalidSearchParameterError):
         objectsearch.search(query='computer says no')
+
+
+def test_get_metadata_concurrent(mp_wfs, monkeypatch):
+    """Test the _get_metadata method.
+
+    Test whether the WFS schema, feature catalogue and XSD schemas are
+    requested concurrently.
+
+    Parameters
+    ----------
+    mp_wfs : pytest.fixture
+        Monkeypatch the call to the remote GetCapabilities request.
+    monkeypatch : pytest.fixture
+        PyTest monkeypatch fixture.
+
+    """
+    barrier = threading.Barrier(3, timeout=10)
+
+    def concurrent(result):
+        def request(*args, **kwargs):
+            # only passes when all three requests are running at once
+            barrier.wait()
+            return result
+        return request
+
+    monkeypatch.setattr(pydov.search.abstract.AbstractSearch,
+                        '_get_schema', concurrent('schema'))
+    monkeypatch.setattr(pydov.search.abstract.AbstractSearch,
+                        '_get_featurecatalogue', concurrent('fc'))
+    monkeypatch.setattr(pydov.search.abstract.AbstractSearch,
+                        '_get_remote_xsd_schemas', concurrent('xsd'))
+
+    metadata = BoringSearch()._get_metadata()
+
+    assert metadata == ('schema', 'fc', 'xsd')
+
+
+def test_get_metadata_shared_executor(mp_wfs, monkeypatch):
+    """Test the _get_metadata method.
+
+    Test whether the metadata of multiple search instances is requested
+    using the package wide metadata executor, instead of setting up a thread
+    pool for every instance.
+
+    Parameters
+    ----------
+    mp_wfs : pytest.fixture
+        Monkeypatch the call to the remote GetCapabilities request.
+    monkeypatch : pytest.fixture
+        PyTest monkeypatch fixture.
+
+    """
+    pools = []
+    thread_pool_executor = concurrent.futures.ThreadPoolExecutor
+
+    def create_pool(*args, **kwargs):
+        pools.append(thread_pool_executor(*args, **kwargs))
+        return pools[-1]
+
+    monkeypatch.setattr(pydov.search.abstract.AbstractSearch,
+                        '_get_schema', lambda self: 'schema')
+    monkeypatch.setattr(pydov.search.abstract.AbstractSearch,
+                        '_get_featurecatalogue', lambda self: 'fc')
+    monkeypatch.setattr(pydov.search.abstract.AbstractSearch,
+                        '_get_remote_xsd_schemas', lambda self: 'xsd')
+    monkeypatch.setattr(concurrent.futures, 'ThreadPoolExecutor',
+                        create_pool)
+
+    pydov.metadata_executor.shutdown()
+    try:
+        for i in range(3):
+            assert BoringSearch()._get_metadata() == ('schema', 'fc', 'xsd')
+    finally:
+        pydov.metadata_executor.shutdown()
+
+    assert len(pools) == 1
+
+
+def test_get_remote_xsd_schemas_concurrent(monkeypatch):
+    """Test the _get_remote_xsd_schemas method.
+
+    Test whether multiple XSD schemas are requested concurrently, using
+    no more threads than the package wide metadata executor has workers,
+    and returned in order.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.fixture
+        PyTest monkeypatch fixture.
+
+    """
+    urls = ['https://example.com/{}.xsd'.format(i) for i in range(4)]
+
+    lock = threading.Lock()
+    running = [0, 0]
+    barrier = threading.Barrier(2, timeout=10)
+
+    def get_xsd_schema(url):
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        # only passes when two requests are running at once
+        barrier.wait()
+        with lock:
+            running[0] -= 1
+        return '<schema id="{}"/>'.format(url).encode('utf-8')
+
+    class MyBoring(Boring):
+        @classmethod
+        def get_xsd_schemas(cls):
+            return urls
+
+    monkeypatch.setattr(pydov.search.abstract, 'get_xsd_schema',
+                        get_xsd_schema)
+
+    schemas = BoringSearch(objecttype=MyBoring)._get_remote_xsd_schemas()
+
+    assert [s.get('id') for s in schemas] == urls
+    assert 2 <= running[1] <= pydov.metadata_executor.workers
+
+
+class TestMetadataRegistry(object):
+    """Class grouping tests for the pydov.search.abstract.MetadataRegistry
+    class."""
+
+    def test_get(self):
+        """Test the get method.
+
+        Test whether the metadata is requested only once.
+
+        """
+        registry = MetadataRegistry()
+        calls = []
+
+        def request(url):
+            calls.append(url)
+            return url.upper()
+
+        assert 'a' not in registry
+        assert registry.get('a', request, 'a') == 'A'
+        assert registry.get('a', request, 'a') == 'A'
+        assert registry.get('b', request, 'b') == 'B'
+
+        assert calls == ['a', 'b']
+        assert 'a' in registry
+
+    def test_get_concurrent(self):
+        """Test the get method with concurrent requests for the same URL.
+
+        Test whether the metadata is requested only once and all threads
+        receive the same result.
+
+        """
+        registry = MetadataRegistry()
+        calls = []
+        results = []
+
+        def request():
+            calls.append(1)
+            time.sleep(0.2)
+            return object()
+
+        def get():
+            results.append(registry.get('a', request))
+
+        threads = [threading.Thread(target=get) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert len(results) == 8
+        assert all(r is results[0] for r in results)
+
+    def test_get_error(self):
+        """Test the get method with a failing request.
+
+        Test whether the exception is raised and the request is retried
+        afterwards.
+
+        """
+        registry = MetadataRegistry()
+        calls = []
+
+        def request():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError
+            return 'ok'
+
+        with pytest.raises(RuntimeError):
+            registry.get('a', request)
+
+        assert 'a' not in registry
+        assert registry.get('a', request) == 'ok'
+        assert len(calls) == 2
+
+    def test_clear(self):
+        """Test the clear method.
+
+        Test whether the metadata is requested again afterwards.
+
+        """
+        registry = MetadataRegistry()
+        calls = []
+
+        def request():
+            calls.append(1)
+            return 'ok'
+
+        registry.get('a', request)
+        registry.clear()
+
+        assert 'a' not in registry
+        registry.get('a', request)
+        assert len(calls) == 2
+
+    def test_shared_xsd_schemas(self, monkeypatch):
+        """Test whether XSD schemas referenced by multiple types are
+        requested and parsed only once.
+
+        Parameters
+        ----------
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        url = 'https://example.com/shared/DataCodes.xsd'
+        calls = []
+
+        def get_xsd_schema(url):
+            calls.append(url)
+            return '<schema id="{}"/>'.format(url).encode('utf-8')
+
+        class MyBoring(Boring):
+            @classmethod
+            def get_xsd_schemas(cls):
+                return [url]
+
+        class MyGrondwaterFilter(GrondwaterFilter):
+            @classmethod
+            def get_xsd_schemas(cls):
+                return [url]
+
+        monkeypatch.setattr(pydov.search.abstract, 'get_xsd_schema',
+                            get_xsd_schema)
+
+        schemas_boring = BoringSearch(
+            objecttype=MyBoring)._get_remote_xsd_schemas()
+        schemas_filter = GrondwaterFilterSearch(
+            objecttype=MyGrondwaterFilter)._get_remote_xsd_schemas()
+
+        assert calls == [url]
+        assert schemas_boring[0] is schemas_filter[0]
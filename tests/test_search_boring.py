@@ -1,12 +1,43 @@
 """Module grouping tests for the boring search module."""
+import asyncio
+import copy
 import datetime
+import io
+import threading
 
+import pandas as pd
 import pytest
 
-from owslib.fes import PropertyIsEqualTo
+import pydov
+import pydov.util.executor
+from owslib.etree import etree
+from owslib.fes import (
+    And,
+    PropertyIsEqualTo,
+    SortBy,
+    SortProperty,
+)
+from pydov.search.abstract import AbstractSearch
 from pydov.search.boring import BoringSearch
 from pydov.types.boring import Boring
 from pydov.util import owsutil
+from pydov.util.errors import (
+    FeatureOverflowError,
+    WfsGetFeatureError,
+)
+from pydov.util.hooks import (
+    AbstractReadHook,
+    Hooks,
+)
+from pydov.util.location import (
+    Box,
+    Within,
+)
+from pydov.util.dovutil import build_dov_url
+from pydov.util.query import (
+    Join,
+    PropertyInList,
+)
 from tests.abstract import (
     AbstractTestSearch,
 )
@@ -61,6 +92,197 @@ def md_metadata(wfs, mp_remote_md):
     return owsutil.get_remote_metadata(contentmetadata)
 
 
+def build_features(count):
+    """Build a number of Boring WFS features with distinct identifiers.
+
+    Parameters
+    ----------
+    count : int
+        Number of features to build.
+
+    Returns
+    -------
+    list of etree.Element
+        XML elements of the features, in order of their fiche.
+
+    """
+    with open(location_wfs_feature, 'r', encoding='utf-8') as f:
+        template = etree.fromstring(f.read().encode('utf-8'))
+
+    features = []
+    for i in range(count):
+        feature = copy.deepcopy(template)
+        feature.set('{http://www.opengis.net/gml}id', 'Boringen.{}'.format(i))
+        feature.find('{http://dov.vlaanderen.be/ocdov/dov-pub}fiche').text = \
+            build_dov_url('data/boring/2020-{:06d}'.format(i))
+        features.append(feature)
+    return features
+
+
+def mp_wfs_server(monkeypatch, features, match=None):
+    """Monkeypatch the calls to get WFS features with a WFS server returning
+    at most 2 features per request.
+
+    Requests with a startIndex return the corresponding page of the matching
+    features sorted by the fiche. Other requests return the first matching
+    features, sorted by the fiche when the request has a SortBy and in
+    reverse order otherwise.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.fixture
+        PyTest monkeypatch fixture.
+    features : list of etree.Element
+        XML elements of all the features, in order of their fiche.
+    match : callable, optional
+        Function returning the features matching a GetFeature request.
+        Defaults to None, matching all features.
+
+    Returns
+    -------
+    list of etree.Element
+        List of received WFS GetFeature requests.
+
+    """
+    requests = []
+
+    def wfs_get_feature(baseurl, get_feature_request):
+        requests.append(get_feature_request)
+        matches = features if match is None else match(get_feature_request)
+
+        if get_feature_request.get('resultType') == 'hits':
+            result = []
+        elif get_feature_request.get('startIndex') is not None:
+            start = int(get_feature_request.get('startIndex'))
+            count = int(get_feature_request.get('maxFeatures'))
+            result = matches[start:min(start + count, start + 2)]
+        elif get_feature_request.find(
+                './/{http://www.opengis.net/ogc}SortBy') is not None:
+            result = matches[:2]
+        else:
+            result = list(reversed(matches))[:2]
+
+        collection = etree.Element(
+            '{http://www.opengis.net/wfs}FeatureCollection')
+        collection.set('numberOfFeatures', str(
+            len(matches) if get_feature_request.get('resultType') == 'hits'
+            else len(result)))
+        members = etree.SubElement(
+            collection, '{http://www.opengis.net/gml}featureMembers')
+        members.extend(copy.deepcopy(result))
+        return etree.tostring(collection)
+
+    async def wfs_get_feature_async(baseurl, get_feature_request,
+                                    session=None):
+        return wfs_get_feature(baseurl, get_feature_request)
+
+    def wfs_get_feature_stream(baseurl, get_feature_request):
+        return io.BytesIO(wfs_get_feature(baseurl, get_feature_request))
+
+    monkeypatch.setattr(pydov.util.owsutil, 'wfs_get_feature',
+                        wfs_get_feature)
+    monkeypatch.setattr(pydov.util.owsutil, 'wfs_get_feature_async',
+                        wfs_get_feature_async)
+    monkeypatch.setattr(pydov.util.owsutil, 'wfs_get_feature_stream',
+                        wfs_get_feature_stream)
+    monkeypatch.setattr(BoringSearch, '_max_features_per_request', 2)
+    return requests
+
+
+@pytest.fixture
+def mp_paged_wfs_feature(monkeypatch):
+    """Monkeypatch the call to get WFS features with a WFS server returning
+    at most 2 features per request out of 5 matching features.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.fixture
+        PyTest monkeypatch fixture.
+
+    Returns
+    -------
+    list of etree.Element
+        List of received WFS GetFeature requests.
+
+    """
+    return mp_wfs_server(monkeypatch, build_features(5))
+
+
+@pytest.fixture
+def mp_tiled_wfs_feature(monkeypatch):
+    """Monkeypatch the call to get WFS features with a WFS server returning
+    at most 2 features per request, evaluating the spatial filters of the
+    request on 8 features within Box(0, 0, 8, 8).
+
+    Three features are located on the boundaries of the quadrants of the
+    box, one is located on the boundary of the box itself.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.fixture
+        PyTest monkeypatch fixture.
+
+    Returns
+    -------
+    list of etree.Element
+        List of received WFS GetFeature requests.
+
+    """
+    positions = [(1, 1), (3, 3), (4, 1), (4, 4), (5, 6), (6, 5), (7, 7),
+                 (1, 6), (8, 2)]
+    features = build_features(len(positions))
+
+    def get_box(element):
+        envelope = element.find('.//{http://www.opengis.net/gml}Envelope')
+        return [float(i) for i in (
+            envelope.findtext('{http://www.opengis.net/gml}lowerCorner') +
+            ' ' + envelope.findtext(
+                '{http://www.opengis.net/gml}upperCorner')).split()]
+
+    def match(get_feature_request):
+        within = get_box(get_feature_request.find(
+            './/{http://www.opengis.net/ogc}Within'))
+        intersects = get_feature_request.find(
+            './/{http://www.opengis.net/ogc}Intersects')
+        intersects = get_box(intersects) if intersects is not None else \
+            [float('-inf'), float('-inf'), float('inf'), float('inf')]
+
+        return [f for f, (x, y) in zip(features, positions) if
+                within[0] < x < within[2] and within[1] < y < within[3] and
+                intersects[0] <= x <= intersects[2] and
+                intersects[1] <= y <= intersects[3]]
+
+    return mp_wfs_server(monkeypatch, features, match)
+
+
+@pytest.fixture
+def mp_chunked_wfs_feature(monkeypatch):
+    """Monkeypatch the call to get WFS features with a WFS server returning
+    at most 2 features per request, evaluating the fiche literals of the
+    request on 5 features.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.fixture
+        PyTest monkeypatch fixture.
+
+    Returns
+    -------
+    list of etree.Element
+        List of received WFS GetFeature requests.
+
+    """
+    features = build_features(5)
+
+    def match(get_feature_request):
+        literals = [i.text for i in get_feature_request.findall(
+            './/{http://www.opengis.net/ogc}Literal')]
+        return [f for f in features if f.findtext(
+            '{http://dov.vlaanderen.be/ocdov/dov-pub}fiche') in literals]
+
+    return mp_wfs_server(monkeypatch, features, match)
+
+
 class TestBoringSearch(AbstractTestSearch):
     def get_search_object(self):
         """Get an instance of the search object for this type.
@@ -213,7 +435,7 @@ class TestBoringSearch(AbstractTestSearch):
             query=self.get_valid_query_single())
 
         # specific test for the Zulu time wfs 1.1.0 issue
-        assert df.datum_aanvang.unique()[0] == datetime.date(2004, 12, 20)
+        assert df.datum_aanvang.unique()[0].date() == datetime.date(2004, 12, 20)
 
     def test_search_nan(self, mp_wfs, mp_get_schema,
                         mp_remote_describefeaturetype, mp_remote_md,
@@ -270,3 +492,900 @@ class TestBoringSearch(AbstractTestSearch):
             return_fields=('pkey_boring', 'boornummer', 'boorgatmeting'))
 
         assert not df.boorgatmeting[0]
+
+    def test_search_paging(self, mp_wfs, mp_get_schema,
+                           mp_remote_describefeaturetype, mp_remote_md,
+                           mp_remote_fc, mp_remote_xsd,
+                           mp_paged_wfs_feature):
+        """Test the search method with more features than the WFS server
+        returns for a single request.
+
+        Test whether all features are retrieved by paging through the
+        results sorted on the primary key, reusing the response of the first
+        request as the first page.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_paged_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, returning at most
+            2 features per request.
+
+        """
+        df = self.get_search_object().search(
+            query=self.get_valid_query_single(),
+            return_fields=('pkey_boring',))
+
+        assert list(df.pkey_boring) == [
+            build_dov_url('data/boring/2020-{:06d}'.format(i))
+            for i in range(5)]
+
+        first, hits = mp_paged_wfs_feature[:2]
+        pages = mp_paged_wfs_feature[2:]
+        assert first.get('startIndex') is None
+        assert hits.get('resultType') == 'hits'
+        assert [(p.get('startIndex'), p.get('maxFeatures')) for p in
+                pages] == [('2', '2'), ('4', '1')]
+        assert all(p.find('.//{http://www.opengis.net/ogc}SortBy//'
+                          '{http://www.opengis.net/ogc}PropertyName').text ==
+                   'fiche' for p in [first] + pages)
+
+    def test_search_paging_nested(self, mp_wfs, mp_get_schema,
+                                  mp_remote_describefeaturetype,
+                                  mp_remote_md, mp_remote_fc, mp_remote_xsd,
+                                  mp_paged_wfs_feature):
+        """Test the search method with paging from within a task of the
+        package wide executor.
+
+        Test whether the search completes when the executor has a single
+        worker, which is occupied by the search itself.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_paged_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, returning at most
+            2 features per request.
+
+        """
+        orig_executor = pydov.executor
+        pydov.executor = pydov.util.executor.ThreadExecutor(workers=1)
+        try:
+            df = pydov.executor.submit(
+                self.get_search_object().search,
+                query=self.get_valid_query_single(),
+                return_fields=('pkey_boring',)).result(timeout=30)
+        finally:
+            pydov.executor.shutdown()
+            pydov.executor = orig_executor
+
+        assert list(df.pkey_boring) == [
+            build_dov_url('data/boring/2020-{:06d}'.format(i))
+            for i in range(5)]
+
+    def test_search_paging_maxfeatures(self, mp_wfs, mp_get_schema,
+                                       mp_remote_describefeaturetype,
+                                       mp_remote_md, mp_remote_fc,
+                                       mp_remote_xsd,
+                                       mp_paged_wfs_feature):
+        """Test the search method with more features than the WFS server
+        returns for a single request and the max_features parameter.
+
+        Test whether only the requested number of features is retrieved.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_paged_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, returning at most
+            2 features per request.
+
+        """
+        df = self.get_search_object().search(
+            query=self.get_valid_query_single(),
+            return_fields=('pkey_boring',), max_features=3)
+
+        assert list(df.pkey_boring) == [
+            build_dov_url('data/boring/2020-{:06d}'.format(i))
+            for i in range(3)]
+
+    def test_search_paging_async(self, mp_wfs, mp_get_schema,
+                                 mp_remote_describefeaturetype,
+                                 mp_remote_md, mp_remote_fc,
+                                 mp_remote_xsd, mp_paged_wfs_feature):
+        """Test the search_async method with more features than the WFS
+        server returns for a single request.
+
+        Test whether all features are retrieved by paging through the
+        results.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_paged_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, returning at most
+            2 features per request.
+
+        """
+        loop = asyncio.new_event_loop()
+        try:
+            df = loop.run_until_complete(
+                self.get_search_object().search_async(
+                    query=self.get_valid_query_single(),
+                    return_fields=('pkey_boring',)))
+        finally:
+            loop.close()
+
+        assert list(df.pkey_boring) == [
+            build_dov_url('data/boring/2020-{:06d}'.format(i))
+            for i in range(5)]
+
+    def test_search_paging_unsupported(self, mp_wfs, mp_get_schema,
+                                       mp_remote_describefeaturetype,
+                                       mp_remote_md, mp_remote_fc,
+                                       mp_remote_xsd,
+                                       mp_paged_wfs_feature,
+                                       monkeypatch):
+        """Test the search method with a WFS server ignoring the startIndex
+        of the requests.
+
+        Test whether a FeatureOverflowError is raised.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_paged_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, returning at most
+            2 features per request.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        wfs_get_feature = pydov.util.owsutil.wfs_get_feature
+
+        def ignore_start_index(baseurl, get_feature_request):
+            get_feature_request = copy.deepcopy(get_feature_request)
+            get_feature_request.attrib.pop('startIndex', None)
+            return wfs_get_feature(baseurl, get_feature_request)
+
+        monkeypatch.setattr(pydov.util.owsutil, 'wfs_get_feature',
+                            ignore_start_index)
+
+        with pytest.raises(FeatureOverflowError):
+            self.get_search_object().search(
+                query=self.get_valid_query_single(),
+                return_fields=('pkey_boring',))
+
+    def test_search_iter_paging(self, mp_wfs, mp_get_schema,
+                                mp_remote_describefeaturetype, mp_remote_md,
+                                mp_remote_fc, mp_remote_xsd,
+                                mp_paged_wfs_feature):
+        """Test the search_iter method with more features than the chunksize.
+
+        Test whether the features are returned in dataframes of at most
+        chunksize features.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_paged_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, returning at most
+            2 features per request.
+
+        """
+        dfs = list(self.get_search_object().search_iter(
+            query=self.get_valid_query_single(),
+            return_fields=('pkey_boring', 'diepte_boring_tot'),
+            chunksize=2))
+
+        assert [len(df) for df in dfs] == [2, 2, 1]
+        assert all(list(df) == ['pkey_boring', 'diepte_boring_tot']
+                   for df in dfs)
+        assert list(pd.concat(dfs).pkey_boring) == [
+            build_dov_url('data/boring/2020-{:06d}'.format(i))
+            for i in range(5)]
+
+    def test_search_iter_paging_streamed(self, monkeypatch, mp_wfs,
+                                         mp_get_schema,
+                                         mp_remote_describefeaturetype,
+                                         mp_remote_md, mp_remote_fc,
+                                         mp_remote_xsd,
+                                         mp_paged_wfs_feature):
+        """Test the search_iter method with more features than the WFS
+        server returns for a single request.
+
+        Test whether the pages are streamed instead of being merged in
+        memory and the first page is not requested twice.
+
+        Parameters
+        ----------
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_paged_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, returning at most
+            2 features per request.
+
+        """
+        def merge_search_results(*args, **kwargs):
+            raise AssertionError('Search results should not be merged.')
+
+        monkeypatch.setattr(AbstractSearch, '_merge_search_results',
+                            merge_search_results)
+
+        dfs = list(self.get_search_object().search_iter(
+            query=self.get_valid_query_single(),
+            return_fields=('pkey_boring',), chunksize=2))
+
+        assert list(pd.concat(dfs).pkey_boring) == [
+            build_dov_url('data/boring/2020-{:06d}'.format(i))
+            for i in range(5)]
+        assert [r.get('startIndex') for r in mp_paged_wfs_feature
+                if r.get('resultType') != 'hits'] == [None, '2', '4']
+
+    def test_search_tiling(self, mp_wfs, mp_get_schema,
+                           mp_remote_describefeaturetype, mp_remote_md,
+                           mp_remote_fc, mp_remote_xsd,
+                           mp_tiled_wfs_feature):
+        """Test the search method within a box with more features than the
+        WFS server returns for a single request.
+
+        Test whether all features within the box are retrieved exactly once
+        by splitting the box into tiles.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_tiled_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, returning at most
+            2 features per request.
+
+        """
+        df = self.get_search_object().search(
+            location=Within(Box(0, 0, 8, 8)),
+            return_fields=('pkey_boring',))
+
+        assert sorted(df.pkey_boring) == [
+            build_dov_url('data/boring/2020-{:06d}'.format(i))
+            for i in range(8)]
+
+        assert all(r.get('startIndex') is None
+                   for r in mp_tiled_wfs_feature)
+        assert all(r.find('.//{http://www.opengis.net/ogc}Intersects')
+                   is not None for r in mp_tiled_wfs_feature[1:])
+
+    def test_search_tiling_depth(self, mp_wfs, mp_get_schema,
+                                 mp_remote_describefeaturetype,
+                                 mp_remote_md, mp_remote_fc,
+                                 mp_remote_xsd, mp_tiled_wfs_feature,
+                                 monkeypatch):
+        """Test the search method within a box with more features than the
+        WFS server returns for a single request, limiting the depth of the
+        tiles.
+
+        Test whether all features within the box are retrieved exactly once
+        by paging through the features of the tiles exceeding the limit.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_tiled_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, returning at most
+            2 features per request.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        monkeypatch.setattr(BoringSearch, '_max_tile_depth', 1)
+
+        df = self.get_search_object().search(
+            location=Within(Box(0, 0, 8, 8)),
+            return_fields=('pkey_boring',))
+
+        assert sorted(df.pkey_boring) == [
+            build_dov_url('data/boring/2020-{:06d}'.format(i))
+            for i in range(8)]
+        assert any(r.get('startIndex') is not None
+                   for r in mp_tiled_wfs_feature)
+
+    def test_search_tiling_sortby(self, mp_wfs, mp_get_schema,
+                                  mp_remote_describefeaturetype,
+                                  mp_remote_md, mp_remote_fc,
+                                  mp_remote_xsd, mp_tiled_wfs_feature):
+        """Test the search method within a box with more features than the
+        WFS server returns for a single request and the sort_by parameter.
+
+        Test whether the features are requested page by page instead of
+        by tile, keeping the sort order.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_tiled_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, returning at most
+            2 features per request.
+
+        """
+        df = self.get_search_object().search(
+            location=Within(Box(0, 0, 8, 8)),
+            sort_by=SortBy([SortProperty('pkey_boring', 'ASC')]),
+            return_fields=('pkey_boring',))
+
+        assert list(df.pkey_boring) == [
+            build_dov_url('data/boring/2020-{:06d}'.format(i))
+            for i in range(8)]
+        assert all(r.find('.//{http://www.opengis.net/ogc}Intersects')
+                   is None for r in mp_tiled_wfs_feature)
+
+    def test_search_chunked(self, mp_wfs, mp_get_schema,
+                            mp_remote_describefeaturetype, mp_remote_md,
+                            mp_remote_fc, mp_remote_xsd,
+                            mp_chunked_wfs_feature):
+        """Test the search method with a Join containing more values than
+        its chunksize.
+
+        Test whether the values are split over multiple requests and all
+        features are retrieved once.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_chunked_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, returning at most
+            2 features per request.
+
+        """
+        pkeys = [build_dov_url('data/boring/2020-{:06d}'.format(i))
+                 for i in (0, 1, 3, 4, 3)]
+        df = self.get_search_object().search(
+            query=Join(pd.DataFrame({'pkey_boring': pkeys}), 'pkey_boring',
+                       chunksize=1),
+            return_fields=('pkey_boring',))
+
+        assert sorted(df.pkey_boring) == sorted(set(pkeys))
+        assert len(mp_chunked_wfs_feature) == 4
+        assert all(len(r.findall(
+            './/{http://www.opengis.net/ogc}Literal')) == 1
+            for r in mp_chunked_wfs_feature)
+
+    def test_search_chunked_inflight(self, mp_wfs, mp_get_schema,
+                                     mp_remote_describefeaturetype,
+                                     mp_remote_md, mp_remote_fc,
+                                     mp_remote_xsd, mp_chunked_wfs_feature):
+        """Test the search method with a Join split in more chunks than the
+        WFS executor has workers.
+
+        Test whether no more chunk requests are submitted at once than the
+        number of workers of the WFS executor.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_chunked_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, returning at most
+            2 features per request.
+
+        """
+        class InFlightExecutor(pydov.util.executor.ThreadExecutor):
+            def __init__(self, workers):
+                super(InFlightExecutor, self).__init__(workers)
+                self.lock = threading.Lock()
+                self.in_flight = 0
+                self.max_in_flight = 0
+
+            def run(self, fn, *args, **kwargs):
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    with self.lock:
+                        self.in_flight -= 1
+
+            def submit(self, fn, *args, **kwargs):
+                with self.lock:
+                    self.in_flight += 1
+                    self.max_in_flight = max(self.max_in_flight,
+                                             self.in_flight)
+                return super(InFlightExecutor, self).submit(
+                    self.run, fn, *args, **kwargs)
+
+        pkeys = [build_dov_url('data/boring/2020-{:06d}'.format(i))
+                 for i in range(5)]
+
+        orig_executor = pydov.wfs_executor
+        pydov.wfs_executor = InFlightExecutor(workers=2)
+        try:
+            df = self.get_search_object().search(
+                query=Join(pd.DataFrame({'pkey_boring': pkeys}),
+                           'pkey_boring', chunksize=1),
+                return_fields=('pkey_boring',))
+            max_in_flight = pydov.wfs_executor.max_in_flight
+        finally:
+            pydov.wfs_executor.shutdown()
+            pydov.wfs_executor = orig_executor
+
+        assert sorted(df.pkey_boring) == pkeys
+        assert len(mp_chunked_wfs_feature) == 5
+        assert max_in_flight == 2
+
+    def test_search_chunked_and(self, mp_wfs, mp_get_schema,
+                                mp_remote_describefeaturetype,
+                                mp_remote_md, mp_remote_fc,
+                                mp_remote_xsd, mp_chunked_wfs_feature):
+        """Test the search method with a PropertyInList containing more
+        values than its chunksize as part of an And expression.
+
+        Test whether every request contains the other expressions and a
+        chunk of the values.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_chunked_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, returning at most
+            2 features per request.
+
+        """
+        pkeys = [build_dov_url('data/boring/2020-{:06d}'.format(i))
+                 for i in range(5)]
+        df = self.get_search_object().search(
+            query=And([PropertyIsEqualTo('boornummer', 'GEO-04/169-BNo-B1'),
+                       PropertyInList('pkey_boring', pkeys, chunksize=2)]),
+            return_fields=('pkey_boring',))
+
+        # 3 chunks, the first two chunks are truncated and need a hits
+        # request as well, their first response is reused as the only page
+        assert sorted(df.pkey_boring) == pkeys
+        assert len(mp_chunked_wfs_feature) == 5
+        assert all(r.find('.//{http://www.opengis.net/ogc}And') is not None
+                   for r in mp_chunked_wfs_feature)
+
+    def test_search_chunked_maxfeatures(self, mp_wfs, mp_get_schema,
+                                        mp_remote_describefeaturetype,
+                                        mp_remote_md, mp_remote_fc,
+                                        mp_remote_xsd,
+                                        mp_chunked_wfs_feature):
+        """Test the search method with a PropertyInList containing more
+        values than its chunksize and the max_features parameter.
+
+        Test whether only the requested number of features is returned.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_chunked_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, returning at most
+            2 features per request.
+
+        """
+        pkeys = [build_dov_url('data/boring/2020-{:06d}'.format(i))
+                 for i in range(5)]
+        df = self.get_search_object().search(
+            query=PropertyInList('pkey_boring', pkeys, chunksize=1),
+            return_fields=('pkey_boring',), max_features=3)
+
+        assert len(df) == 3
+        assert len(mp_chunked_wfs_feature) == 5
+
+    def test_search_chunked_unsplit_request(self, mp_wfs, mp_get_schema,
+                                            mp_remote_describefeaturetype,
+                                            mp_remote_md, mp_remote_fc,
+                                            mp_remote_xsd,
+                                            mp_chunked_wfs_feature,
+                                            monkeypatch):
+        """Test the search method with a PropertyInList containing more
+        values than its chunksize.
+
+        Test whether no GetFeature request containing all the values is
+        built.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_chunked_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, returning at most
+            2 features per request.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        build_getfeature_request = owsutil.wfs_build_getfeature_request
+        filters = []
+
+        def recording_build_getfeature_request(*args, **kwargs):
+            filters.append(kwargs.get('filter'))
+            return build_getfeature_request(*args, **kwargs)
+
+        monkeypatch.setattr(owsutil, 'wfs_build_getfeature_request',
+                            recording_build_getfeature_request)
+
+        pkeys = [build_dov_url('data/boring/2020-{:06d}'.format(i))
+                 for i in range(5)]
+        self.get_search_object().search(
+            query=PropertyInList('pkey_boring', pkeys, chunksize=2),
+            return_fields=('pkey_boring',))
+
+        assert len(filters) == 3
+        assert all(f.count(build_dov_url('data/boring/')) <= 2
+                   for f in filters)
+
+    def test_search_chunked_sortby(self, mp_wfs, mp_get_schema,
+                                   mp_remote_describefeaturetype,
+                                   mp_remote_md, mp_remote_fc,
+                                   mp_remote_xsd,
+                                   mp_chunked_wfs_feature):
+        """Test the search method with a PropertyInList containing more
+        values than its chunksize and the sort_by parameter.
+
+        Test whether the values are not split, keeping the sort order.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_chunked_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, returning at most
+            2 features per request.
+
+        """
+        pkeys = [build_dov_url('data/boring/2020-{:06d}'.format(i))
+                 for i in range(5)]
+        df = self.get_search_object().search(
+            query=PropertyInList('pkey_boring', pkeys, chunksize=1),
+            sort_by=SortBy([SortProperty('pkey_boring', 'ASC')]),
+            return_fields=('pkey_boring',))
+
+        assert list(df.pkey_boring) == pkeys
+        assert all(len(r.findall(
+            './/{http://www.opengis.net/ogc}Literal')) == 5
+            for r in mp_chunked_wfs_feature)
+
+    def test_search_chunked_async(self, mp_wfs, mp_get_schema,
+                                  mp_remote_describefeaturetype,
+                                  mp_remote_md, mp_remote_fc,
+                                  mp_remote_xsd, mp_chunked_wfs_feature):
+        """Test the search_async method with a PropertyInList containing
+        more values than its chunksize.
+
+        Test whether all features are retrieved.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_chunked_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, returning at most
+            2 features per request.
+
+        """
+        pkeys = [build_dov_url('data/boring/2020-{:06d}'.format(i))
+                 for i in range(5)]
+
+        loop = asyncio.new_event_loop()
+        try:
+            df = loop.run_until_complete(
+                self.get_search_object().search_async(
+                    query=PropertyInList('pkey_boring', pkeys, chunksize=2),
+                    return_fields=('pkey_boring',)))
+        finally:
+            loop.close()
+
+        assert sorted(df.pkey_boring) == pkeys
+
+    def test_search_stream(self, mp_wfs, mp_get_schema,
+                           mp_remote_describefeaturetype, mp_remote_md,
+                           mp_remote_fc, mp_remote_xsd, mp_remote_wfs_feature,
+                           monkeypatch):
+        """Test the search method parsing the WFS response incrementally.
+
+        Test whether the features are retrieved using a streaming request.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_remote_wfs_feature : pytest.fixture
+            Monkeypatch the calls to get WFS features.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        def wfs_get_feature(*args, **kwargs):
+            raise AssertionError('The WFS response should be streamed.')
+
+        monkeypatch.setattr(pydov.util.owsutil, 'wfs_get_feature',
+                            wfs_get_feature)
+
+        df = self.get_search_object().search(
+            query=self.get_valid_query_single(),
+            return_fields=('pkey_boring', 'boornummer'))
+
+        assert list(df.boornummer) == ['GEO-04/169-BNo-B1']
+
+    def test_search_stream_hook(self, mp_wfs, mp_get_schema,
+                                mp_remote_describefeaturetype, mp_remote_md,
+                                mp_remote_fc, mp_remote_xsd,
+                                mp_remote_wfs_feature, monkeypatch):
+        """Test the search method with a hook receiving the WFS response.
+
+        Test whether the complete WFS response is parsed and passed to the
+        hook instead of parsing the response incrementally.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_remote_wfs_feature : pytest.fixture
+            Monkeypatch the calls to get WFS features.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        class ResultRecorder(AbstractReadHook):
+            def __init__(self):
+                self.results = []
+
+            def wfs_search_result_received(self, query, features):
+                self.results.append(features)
+
+        def wfs_get_feature_stream(*args, **kwargs):
+            raise AssertionError('The WFS response should not be streamed.')
+
+        monkeypatch.setattr(pydov.util.owsutil, 'wfs_get_feature_stream',
+                            wfs_get_feature_stream)
+        monkeypatch.setattr(pydov, 'hooks', Hooks((ResultRecorder(),)))
+
+        df = self.get_search_object().search(
+            query=self.get_valid_query_single(),
+            return_fields=('pkey_boring', 'boornummer'))
+
+        assert len(df) == 1
+        assert len(pydov.hooks[0].results) == 1
+        assert len(pydov.hooks[0].results[0].findall(
+            './/{http://dov.vlaanderen.be/ocdov/dov-pub}Boringen')) == 1
+
+    def test_search_stream_error(self, mp_wfs, mp_get_schema,
+                                 mp_remote_describefeaturetype, mp_remote_md,
+                                 mp_remote_fc, mp_remote_xsd,
+                                 mp_remote_wfs_feature, monkeypatch):
+        """Test the search method with an exception report as WFS response.
+
+        Test whether a WfsGetFeatureError is raised.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_remote_wfs_feature : pytest.fixture
+            Monkeypatch the calls to get WFS features.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        def wfs_get_feature_stream(*args, **kwargs):
+            return io.BytesIO(
+                b'<ows:ExceptionReport xmlns:ows="http://www.opengis.net/ows">'
+                b'<ows:Exception><ows:ExceptionText>Error</ows:ExceptionText>'
+                b'</ows:Exception></ows:ExceptionReport>')
+
+        monkeypatch.setattr(pydov.util.owsutil, 'wfs_get_feature_stream',
+                            wfs_get_feature_stream)
+
+        with pytest.raises(WfsGetFeatureError):
+            self.get_search_object().search(
+                query=self.get_valid_query_single(),
+                return_fields=('pkey_boring', 'boornummer'))
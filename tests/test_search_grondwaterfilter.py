@@ -1,10 +1,19 @@
 """Module grouping tests for the search grondwaterfilter module."""
 import datetime
+import io
 
+import pytest
+
+import pydov
 from owslib.fes import PropertyIsEqualTo
 from pydov.search.grondwaterfilter import GrondwaterFilterSearch
 from pydov.types.grondwaterfilter import GrondwaterFilter
 from pydov.util.dovutil import build_dov_url
+from pydov.util.location import (
+    Box,
+    Within,
+)
+from pydov.util.query import PropertyInList
 from tests.abstract import (
     AbstractTestSearch,
 )
@@ -35,6 +44,60 @@ location_dov_xml = 'tests/data/types/grondwaterfilter/grondwaterfilter.xml'
 location_xsd_base = 'tests/data/types/grondwaterfilter/xsd_*.xml'
 
 
+@pytest.fixture
+def mp_recorded_wfs_feature(monkeypatch):
+    """Monkeypatch the call to get WFS features, recording the received
+    WFS GetFeature requests.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.fixture
+        PyTest monkeypatch fixture.
+
+    Returns
+    -------
+    list of etree.Element
+        List of received WFS GetFeature requests.
+
+    """
+    requests = []
+
+    def wfs_get_feature(baseurl, get_feature_request):
+        requests.append(get_feature_request)
+        with open(location_wfs_getfeature, 'rb') as f:
+            return f.read()
+
+    def wfs_get_feature_stream(baseurl, get_feature_request):
+        return io.BytesIO(wfs_get_feature(baseurl, get_feature_request))
+
+    monkeypatch.setattr(pydov.util.owsutil, 'wfs_get_feature',
+                        wfs_get_feature)
+    monkeypatch.setattr(pydov.util.owsutil, 'wfs_get_feature_stream',
+                        wfs_get_feature_stream)
+    return requests
+
+
+def excludes_empty_filters(get_feature_request):
+    """Check whether the WFS GetFeature request excludes groundwater
+    screens without a primary key.
+
+    Parameters
+    ----------
+    get_feature_request : etree.Element
+        XML element representing the WFS GetFeature request.
+
+    Returns
+    -------
+    bool
+        True if the filter of the request contains a not-null check on
+        the primary key, False otherwise.
+
+    """
+    return get_feature_request.find(
+        './/{http://www.opengis.net/ogc}Not/'
+        '{http://www.opengis.net/ogc}PropertyIsNull') is not None
+
+
 class TestGrondwaterfilterSearch(AbstractTestSearch):
     def get_search_object(self):
         """Get an instance of the search object for this type.
@@ -188,7 +251,7 @@ class TestGrondwaterfilterSearch(AbstractTestSearch):
             query=self.get_valid_query_single())
 
         # specific test for the Zulu time wfs 1.1.0 issue
-        assert df.datum.sort_values()[0] == datetime.date(2004, 4, 7)
+        assert df.datum.sort_values()[0].date() == datetime.date(2004, 4, 7)
 
     def test_search_xmlresolving(self, mp_get_schema,
                                  mp_remote_describefeaturetype,
@@ -216,3 +279,146 @@ class TestGrondwaterfilterSearch(AbstractTestSearch):
                            'meetnet_code'))
 
         assert df.meetnet_code[0] == '8'
+
+    def test_search_exclude_empty_filters(self, mp_wfs, mp_get_schema,
+                                          mp_remote_describefeaturetype,
+                                          mp_remote_md, mp_remote_fc,
+                                          mp_remote_xsd,
+                                          mp_recorded_wfs_feature,
+                                          mp_dov_xml, monkeypatch):
+        """Test the search method with only the query parameter.
+
+        Test whether the search parameters are validated once and whether
+        the request excludes screens without a primary key.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_recorded_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, recording the
+            requests.
+        mp_dov_xml : pytest.fixture
+            Monkeypatch the call to get the remote XML data.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        validations = []
+        pre_search_validation = GrondwaterFilterSearch._pre_search_validation
+
+        def counting_pre_search_validation(self, *args, **kwargs):
+            validations.append(args)
+            return pre_search_validation(self, *args, **kwargs)
+
+        monkeypatch.setattr(GrondwaterFilterSearch, '_pre_search_validation',
+                            counting_pre_search_validation)
+
+        df = self.get_search_object().search(
+            query=self.get_valid_query_single(),
+            return_fields=('pkey_filter',))
+
+        assert len(df) == 1
+        assert len(validations) == 1
+        assert len(mp_recorded_wfs_feature) == 1
+        assert excludes_empty_filters(mp_recorded_wfs_feature[0])
+
+    def test_search_chunked_exclude_empty_filters(
+            self, mp_wfs, mp_get_schema, mp_remote_describefeaturetype,
+            mp_remote_md, mp_remote_fc, mp_remote_xsd,
+            mp_recorded_wfs_feature, mp_dov_xml):
+        """Test the search method with a PropertyInList containing more
+        values than its chunksize.
+
+        Test whether every chunk request excludes screens without a primary
+        key.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_recorded_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, recording the
+            requests.
+        mp_dov_xml : pytest.fixture
+            Monkeypatch the call to get the remote XML data.
+
+        """
+        self.get_search_object().search(
+            query=PropertyInList('filterfiche', [
+                build_dov_url('data/filter/2003-00447{}'.format(i))
+                for i in range(3)], chunksize=1),
+            return_fields=('pkey_filter',))
+
+        assert len(mp_recorded_wfs_feature) == 3
+        assert all(excludes_empty_filters(r)
+                   for r in mp_recorded_wfs_feature)
+
+    def test_search_tiling_exclude_empty_filters(
+            self, mp_wfs, mp_get_schema, mp_remote_describefeaturetype,
+            mp_remote_md, mp_remote_fc, mp_remote_xsd,
+            mp_recorded_wfs_feature, mp_dov_xml, monkeypatch):
+        """Test the search method within a box with more features than the
+        WFS server returns for a single request.
+
+        Test whether the requests of the tiles, and the requests for the
+        number of features of the tiles, exclude screens without a primary
+        key.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_recorded_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features, recording the
+            requests.
+        mp_dov_xml : pytest.fixture
+            Monkeypatch the call to get the remote XML data.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        monkeypatch.setattr(GrondwaterFilterSearch,
+                            '_max_features_per_request', 1)
+
+        df = self.get_search_object().search(
+            location=Within(Box(0, 0, 8, 8)),
+            return_fields=('pkey_filter',))
+
+        assert len(df) == 1
+        assert any(r.get('resultType') == 'hits'
+                   for r in mp_recorded_wfs_feature)
+        assert any(r.find('.//{http://www.opengis.net/ogc}Intersects')
+                   is not None for r in mp_recorded_wfs_feature)
+        assert all(excludes_empty_filters(r)
+                   for r in mp_recorded_wfs_feature)
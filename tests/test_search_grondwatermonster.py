@@ -184,5 +184,6 @@ class TestGrondwaterMonsterSearch(AbstractTestSearch):
             query=self.get_valid_query_single())
 
         # specific test for the Zulu time wfs 1.1.0 issue
-        assert df.datum_monstername.sort_values()[0] == datetime.date(2006, 5, 19)
+        assert df.datum_monstername.sort_values()[0].date() == \
+            datetime.date(2006, 5, 19)
 
@@ -251,3 +251,41 @@ class TestFormeleStratigrafieSearch(AbstractTestSearch):
             return_fields=('pkey_interpretatie', 'diepte_laag_tot'))
 
         assert df.diepte_laag_tot[0] == 8.0
+
+    def test_search_depth_range(self, mp_wfs, mp_get_schema,
+                                mp_remote_describefeaturetype, mp_remote_md,
+                                mp_remote_fc, mp_remote_xsd,
+                                mp_remote_wfs_feature, mp_dov_xml):
+        """Test the search method with a depth range.
+
+        Test whether only the layers (partially) within the depth range are
+        returned.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_remote_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features.
+        mp_dov_xml : pytest.fixture
+            Monkeypatch the call to get the remote XML data.
+
+        """
+        df = self.get_search_object().search(
+            query=self.get_valid_query_single(),
+            return_fields=('pkey_interpretatie', 'diepte_laag_van',
+                           'diepte_laag_tot'),
+            depth_range=(9, None))
+
+        assert list(df.diepte_laag_van) == [8.0, 9.5]
+        assert list(df.diepte_laag_tot) == [9.5, 14.2]
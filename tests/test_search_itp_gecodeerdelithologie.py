@@ -289,7 +289,8 @@ class TestGecodeerdeLithologieSearch(AbstractTestSearch):
         assert df.hoofdnaam2_grondsoort[4] == 'KL'
         assert df.bijmenging1_grondsoort[4] == 'GL'
         assert df.bijmenging1_hoeveelheid[2] == 'M'
-        # mind that the column below is of dtype 'object'
-        assert df.bijmenging1_plaatselijk[2] is False
+        # mind that the column below is of the nullable dtype 'boolean'
+        assert df.bijmenging1_plaatselijk.dtype == 'boolean'
+        assert not df.bijmenging1_plaatselijk[2]
         assert df.bijmenging2_grondsoort[5] == 'GL'
         assert df.bijmenging3_grondsoort[8] == 'NN'
@@ -289,5 +289,6 @@ class TestGeotechnischeCoderingSearch(AbstractTestSearch):
         assert df.hoofdnaam2_grondsoort[0] == 'LE'
         assert df.bijmenging1_grondsoort[0] == 'SN'
         assert df.bijmenging1_hoeveelheid[0] == 'N'
-        # mind that the column below is of dtype 'object'
-        assert df.bijmenging1_plaatselijk[0] is False
+        # mind that the column below is of the nullable dtype 'boolean'
+        assert df.bijmenging1_plaatselijk.dtype == 'boolean'
+        assert not df.bijmenging1_plaatselijk[0]
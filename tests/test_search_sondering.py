@@ -10,6 +10,7 @@ from pydov.search.sondering import SonderingSearch
 from pydov.types.boring import Boring
 from pydov.types.sondering import Sondering
 from pydov.util import owsutil
+from pydov.util.errors import InvalidSearchParameterError
 from tests.abstract import (
     AbstractTestSearch,
 )
@@ -214,7 +215,8 @@ class TestSonderingSearch(AbstractTestSearch):
             query=self.get_valid_query_single())
 
         # specific test for the Zulu time wfs 1.1.0 issue
-        assert df.datum_aanvang.unique()[0] == datetime.date(2002, 12, 17)
+        assert df.datum_aanvang.unique()[0].date() == \
+            datetime.date(2002, 12, 17)
 
         assert pd.Timestamp(
             df.datum_gw_meting.unique()[0]).to_pydatetime() == \
@@ -275,3 +277,113 @@ class TestSonderingSearch(AbstractTestSearch):
             return_fields=('pkey_sondering', 'sondeernummer', 'diepte_gw_m'))
 
         assert df.diepte_gw_m[0] == 3.60
+
+    def test_search_normalized_returnfields(self, mp_get_schema,
+                                            mp_remote_describefeaturetype,
+                                            mp_remote_wfs_feature,
+                                            mp_dov_xml):
+        """Test the search_normalized method with a selection of return
+        fields.
+
+        Test whether the main dataframe contains the primary key and the
+        measurements are returned with the primary key of the CPT only.
+
+        Parameters
+        ----------
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features.
+        mp_dov_xml : pytest.fixture
+            Monkeypatch the call to get the remote XML data.
+
+        """
+        df, subtypes = self.get_search_object().search_normalized(
+            query=self.get_valid_query_single(),
+            return_fields=('sondeernummer', 'z', 'qc'))
+
+        df_full = self.get_search_object().search(
+            query=self.get_valid_query_single(),
+            return_fields=('pkey_sondering', 'sondeernummer', 'z', 'qc'))
+
+        assert list(df) == ['pkey_sondering', 'sondeernummer']
+        assert len(df) == 1
+
+        meetdata = subtypes['Meetdata']
+        assert list(meetdata) == ['pkey_sondering', 'z', 'qc']
+        assert len(meetdata) == len(df_full)
+        assert (meetdata.pkey_sondering == df.pkey_sondering[0]).all()
+        pd.testing.assert_frame_equal(
+            meetdata, df_full[['pkey_sondering', 'z', 'qc']])
+
+    def test_search_depth(self, mp_wfs, mp_get_schema,
+                          mp_remote_describefeaturetype, mp_remote_md,
+                          mp_remote_fc, mp_remote_xsd, mp_remote_wfs_feature,
+                          mp_dov_xml):
+        """Test the search method with a depth range and depth step.
+
+        Test whether only the first measurement of every depth step within
+        the depth range is returned.
+
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_get_schema : pytest.fixture
+            Monkeypatch the call to a remote OWSLib schema.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+        mp_remote_wfs_feature : pytest.fixture
+            Monkeypatch the call to get WFS features.
+        mp_dov_xml : pytest.fixture
+            Monkeypatch the call to get the remote XML data.
+
+        """
+        df = self.get_search_object().search(
+            query=self.get_valid_query_single(),
+            return_fields=('pkey_sondering', 'z', 'qc'),
+            depth_range=(10, 12), depth_step=0.5)
+
+        assert list(df.z) == [10.0, 10.5, 11.0, 11.5, 12.0]
+        assert not df.qc.hasnans
+
+    @pytest.mark.parametrize('depth_range,depth_step', [
+        ((12, 10), None), ((10,), None), ('10-12', None), ((10, 12), 0),
+        (None, -0.1), (None, '0.1')])
+    def test_search_depth_invalid(self, depth_range, depth_step):
+        """Test the search method with invalid depth parameters.
+
+        Test whether an InvalidSearchParameterError is raised.
+
+        Parameters
+        ----------
+        depth_range : tuple
+            Depth range to test.
+        depth_step : float
+            Depth step to test.
+
+        """
+        with pytest.raises(InvalidSearchParameterError):
+            self.get_search_object().search(
+                query=self.get_valid_query_single(),
+                depth_range=depth_range, depth_step=depth_step)
+
+    def test_search_depth_unsupported(self):
+        """Test the search_iter method with depth parameters for a type
+        without subtypes that can be filtered by depth.
+
+        Test whether an InvalidSearchParameterError is raised.
+
+        """
+        with pytest.raises(InvalidSearchParameterError):
+            BoringSearch().search_iter(
+                query=PropertyIsEqualTo('boornummer', 'GEO-04/169-B1'),
+                depth_range=(0, 10))
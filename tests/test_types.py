@@ -1,13 +1,29 @@
 """Module grouping tests for the boring search module."""
+import datetime
+import xml.etree.ElementTree
 
+import numpy as np
+import pandas as pd
 import pytest
+from pandas.api.types import is_datetime64_any_dtype
 
+import pydov
+from pydov.types.abstract import (
+    _DataFrameBuilder,
+    _DepthFilter,
+    _ParameterIndex,
+    _SubtypeRecords,
+)
 from pydov.types.boring import Boring
-from pydov.types.fields import XmlField
+from pydov.types.fields import (
+    XmlField,
+    _WfsInjectedField,
+)
 from pydov.types.grondwaterfilter import GrondwaterFilter
 from pydov.types.grondwatermonster import GrondwaterMonster
 from pydov.types.grondmonster import Grondmonster
 from pydov.types.interpretaties import (
+    FormeleStratigrafieLaag,
     GecodeerdeLithologie,
     HydrogeologischeStratigrafie,
     InformeleStratigrafie,
@@ -17,7 +33,11 @@ from pydov.types.interpretaties import (
     QuartairStratigrafie,
     InformeleHydrogeologischeStratigrafie,
 )
-from pydov.types.sondering import Sondering
+from pydov.types.sondering import (
+    Meetdata,
+    Sondering,
+)
+from pydov.util.dovutil import parse_dov_xml
 
 type_objects = [Boring,
                 Sondering,
@@ -112,3 +132,525 @@ def test_extend_fields_with_extra(objecttype):
     assert len(fields) == len(objecttype.fields) + len(extra_fields)
 
     assert fields[-1] == extra_fields[-1]
+
+
+@pytest.mark.parametrize("objecttype", type_objects)
+def test_extraction_plan_cached(objecttype):
+    """Test the _get_extraction_plan method.
+
+    Test whether the plan is compiled once and reused afterwards.
+
+    """
+    plan = objecttype._get_extraction_plan(source=('xml',))
+    assert objecttype._get_extraction_plan(source=('xml',)) is plan
+    assert [p[0] for p in plan] == list(objecttype.get_fields(
+        source=('xml',), include_subtypes=False))
+
+
+def test_extraction_plan_extend_fields():
+    """Test the _get_extraction_plan method with extended fields.
+
+    Test whether a subclass with extended fields gets a plan including the
+    extra fields, while the plan of the original class is unaffected.
+
+    """
+    class MyBoring(Boring):
+        fields = Boring.extend_fields([
+            XmlField(name='boormethode',
+                     source_xpath='/boring/details/boormethode/methode',
+                     definition='Boormethode van het eerste interval.',
+                     datatype='string')
+        ])
+
+    plan = Boring._get_extraction_plan(source=('xml',))
+    my_plan = MyBoring._get_extraction_plan(source=('xml',))
+
+    assert 'boormethode' not in [p[0] for p in plan]
+    assert 'boormethode' in [p[0] for p in my_plan]
+
+
+def test_fields_fingerprint():
+    """Test the _get_fields_fingerprint method.
+
+    Test whether the fingerprint is stable, and differs for a subclass with
+    extended XML fields or extended subtype fields, but not for extra WFS
+    fields.
+
+    """
+    class MyBoring(Boring):
+        fields = Boring.extend_fields([
+            XmlField(name='boormethode',
+                     source_xpath='/boring/details/boormethode/methode',
+                     definition='Boormethode van het eerste interval.',
+                     datatype='string')
+        ])
+
+    class MyWfsBoring(Boring):
+        fields = Boring.extend_fields([
+            _WfsInjectedField(name='extra', datatype='string')
+        ])
+
+    fingerprint = Boring._get_fields_fingerprint()
+
+    assert Boring._get_fields_fingerprint() == fingerprint
+    assert MyBoring._get_fields_fingerprint() != fingerprint
+    assert MyWfsBoring._get_fields_fingerprint() == fingerprint
+
+    class MySubType(Boring.subtypes[0]):
+        fields = Boring.subtypes[0].extend_fields([
+            XmlField(name='extra',
+                     source_xpath='/extra',
+                     definition='Extra field.',
+                     datatype='string')
+        ])
+
+    class MySubBoring(Boring):
+        subtypes = [MySubType]
+
+    assert MySubBoring._get_fields_fingerprint() != fingerprint
+
+
+def test_extraction_plan_injected_fields():
+    """Test the _get_extraction_plan method with injected WFS fields.
+
+    Test whether the plan is invalidated when a field is injected in the
+    fields of the type.
+
+    """
+    class MyBoring(Boring):
+        fields = Boring.extend_fields([])
+
+    plan = MyBoring._get_extraction_plan(source=('wfs',), namespace='ns')
+    assert 'extra' not in [p[0] for p in plan]
+
+    MyBoring.fields.append(_WfsInjectedField(name='extra', datatype='string'))
+
+    plan = MyBoring._get_extraction_plan(source=('wfs',), namespace='ns')
+    assert 'extra' in [p[0] for p in plan]
+
+
+def test_extraction_plan_replaced_field():
+    """Test the _get_extraction_plan method with a replaced field.
+
+    Test whether the plan is invalidated when a field is replaced by another
+    one, keeping the number of fields and the list itself.
+
+    """
+    class MyBoring(Boring):
+        fields = Boring.extend_fields([
+            XmlField(name='extra',
+                     source_xpath='/boring/details/boormethode/methode',
+                     definition='Extra field.',
+                     datatype='string')
+        ])
+
+    plan = MyBoring._get_extraction_plan(source=('xml',))
+    assert [p for p in plan if p[0] == 'extra']
+
+    MyBoring.fields[-1] = XmlField(name='other',
+                                   source_xpath='/boring/diepte_tot_m',
+                                   definition='Other field.',
+                                   datatype='float')
+
+    plan = MyBoring._get_extraction_plan(source=('xml',))
+    assert not [p for p in plan if p[0] == 'extra']
+    assert [p for p in plan if p[0] == 'other']
+
+
+def test_fields_fingerprint_replaced_field():
+    """Test the _get_fields_fingerprint method with replaced fields.
+
+    Test whether the fingerprint changes when a field of the type or of a
+    subtype is replaced by another one, keeping the number of fields.
+
+    """
+    class MySubType(Boring.subtypes[0]):
+        fields = Boring.subtypes[0].extend_fields([
+            XmlField(name='extra',
+                     source_xpath='/extra',
+                     definition='Extra field.',
+                     datatype='string')
+        ])
+
+    class MyBoring(Boring):
+        fields = Boring.extend_fields([
+            XmlField(name='extra',
+                     source_xpath='/boring/details/boormethode/methode',
+                     definition='Extra field.',
+                     datatype='string')
+        ])
+        subtypes = [MySubType]
+
+    fingerprint = MyBoring._get_fields_fingerprint()
+
+    MyBoring.fields[-1] = XmlField(name='extra',
+                                   source_xpath='/boring/diepte_tot_m',
+                                   definition='Extra field.',
+                                   datatype='string')
+    fingerprint_fields = MyBoring._get_fields_fingerprint()
+    assert fingerprint_fields != fingerprint
+
+    MySubType.fields[-1] = XmlField(name='extra',
+                                    source_xpath='/extra',
+                                    definition='Extra field.',
+                                    datatype='float')
+    assert MyBoring._get_fields_fingerprint() != fingerprint_fields
+
+
+def test_extraction_findtext(monkeypatch):
+    """Test the _get_extraction_plan method without lxml.
+
+    Test whether the values are extracted using findtext, with the same
+    result as with compiled XPath expressions.
+
+    """
+    class MyBoring(Boring):
+        fields = Boring.extend_fields([])
+
+    with open('tests/data/types/boring/boring.xml', 'rb') as f:
+        data = f.read()
+
+    data_xpath = {}
+    MyBoring._extract(pydov.types.abstract.etree.fromstring(data),
+                      MyBoring._get_extraction_plan(source=('xml',)),
+                      data_xpath)
+
+    monkeypatch.setattr(pydov.types.abstract, 'etree', xml.etree.ElementTree)
+
+    data_findtext = {}
+    MyBoring._extract(xml.etree.ElementTree.fromstring(data),
+                      MyBoring._get_extraction_plan(source=('xml',)),
+                      data_findtext)
+
+    assert len(data_xpath) > 0
+    assert data_findtext.keys() == data_xpath.keys()
+    for field in data_xpath:
+        assert data_findtext[field] == data_xpath[field] or (
+            np.isnan(data_findtext[field]) and np.isnan(data_xpath[field]))
+
+
+def test_extraction_parameter_index(monkeypatch):
+    """Test the _get_extraction_plan method with fields selecting an
+    observation by its parameter.
+
+    Test whether the observations are indexed once per document, also for
+    extra fields, with the same result as with the XML path of every field.
+
+    """
+    class MyGrondmonster(Grondmonster):
+        fields = Grondmonster.extend_fields([
+            XmlField(name='astm_code',
+                     source_xpath='/grondmonster/observatieData/observatie['
+                                  'parameter="ASTM_CODE"]/waarde_text',
+                     definition='ASTM code.',
+                     datatype='string')
+        ])
+
+    builds = []
+    build_index = _ParameterIndex._build_index
+
+    def _build_index(self, element):
+        builds.append(element)
+        return build_index(self, element)
+
+    monkeypatch.setattr(_ParameterIndex, '_build_index', _build_index)
+
+    with open('tests/data/types/grondmonster/grondmonster.xml', 'rb') as f:
+        tree = parse_dov_xml(f.read())
+
+    data = {}
+    MyGrondmonster._extract(
+        tree, MyGrondmonster._get_extraction_plan(source=('xml',)), data)
+
+    assert builds == [tree]
+    assert data['astm_code'] == 'OH'
+    assert data['vloeigrens'] == 86.4
+
+    for field in MyGrondmonster.fields:
+        if field['source'] == 'xml':
+            text = MyGrondmonster._compile_xpath(
+                field['sourcefield'], None)(tree)
+            assert (np.isnan(data[field['name']]) if text is None else
+                    data[field['name']] == MyGrondmonster._typeconvert(
+                        text, field['type']))
+
+
+def test_parameter_index_released(monkeypatch):
+    """Test the _extract method with fields selecting an observation by its
+    parameter.
+
+    Test whether the index of the observations, referring to the XML
+    document, is released after extracting the fields.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.fixture
+        PyTest monkeypatch fixture.
+
+    """
+    with open('tests/data/types/grondmonster/grondmonster.xml', 'rb') as f:
+        tree = parse_dov_xml(f.read())
+
+    builds = []
+    build_index = _ParameterIndex._build_index
+
+    def _build_index(self, element):
+        builds.append(element)
+        return build_index(self, element)
+
+    monkeypatch.setattr(_ParameterIndex, '_build_index', _build_index)
+
+    data = {}
+    Grondmonster._extract(
+        tree, Grondmonster._get_extraction_plan(source=('xml',)), data)
+
+    assert builds == [tree]
+    assert data['vloeigrens'] == 86.4
+    assert _ParameterIndex._local.indexes == {}
+
+
+def test_parameter_index_extractors():
+    """Test the get_extractors method of _ParameterIndex.
+
+    Test whether only paths sharing their observations with another path
+    are included, and whether the first observation having the requested
+    element is used.
+
+    """
+    xpaths = ['/a/b[p="x"]/v', '/a/b[p="y"]/v', '/a/c[p="x"]/v', '/a/b/v']
+    extractors = _ParameterIndex.get_extractors(xpaths)
+    assert sorted(extractors) == xpaths[:2]
+
+    element = xml.etree.ElementTree.fromstring(
+        '<r><a><b><p>x</p></b><b><p>x</p><v>1</v></b>'
+        '<b><p>y</p><v/></b></a></r>')
+    assert extractors[xpaths[0]](element) == '1'
+    assert extractors[xpaths[1]](element) == ''
+
+    element = xml.etree.ElementTree.fromstring('<r><a><b><p>y</p></b></a></r>')
+    assert extractors[xpaths[0]](element) is None
+    assert extractors[xpaths[1]](element) is None
+
+
+def test_df_builder_dtypes():
+    """Test the dtypes of the columns built by the _DataFrameBuilder.
+
+    Test whether every column has the dtype matching the type of the field,
+    using nullable dtypes for integer and boolean columns with missing
+    values and the object dtype for string columns without values.
+
+    """
+    builder = _DataFrameBuilder(
+        ['s', 's_na', 'f', 'i', 'i_na', 'b', 'b_na', 'd', 'dt', 'x'],
+        {'s': 'string', 's_na': 'string', 'f': 'float', 'i': 'integer',
+         'i_na': 'integer', 'b': 'boolean', 'b_na': 'boolean', 'd': 'date',
+         'dt': 'datetime'})
+
+    builder.append([['a', np.nan, 1.5, 1, 1, True, True,
+                     datetime.date(2020, 1, 1),
+                     datetime.datetime(2020, 1, 1, 12, 0), 'x']])
+    builder.append(['b', np.nan, np.nan, 2, np.nan, False, np.nan, np.nan,
+                    np.nan, np.nan])
+    builder.append([])
+
+    df = builder.build()
+
+    assert list(df) == ['s', 's_na', 'f', 'i', 'i_na', 'b', 'b_na', 'd',
+                        'dt', 'x']
+    assert len(df) == 2
+    assert df.s.dtype == object
+    assert df.s_na.dtype == object
+    assert df.f.dtype == np.float64
+    assert df.i.dtype == np.int64
+    assert df.i_na.dtype == 'Int64'
+    assert df.b.dtype == bool
+    assert df.b_na.dtype == 'boolean'
+    assert is_datetime64_any_dtype(df.d)
+    assert is_datetime64_any_dtype(df.dt)
+
+    assert df.d[0] == pd.Timestamp(2020, 1, 1)
+    assert df.dt[0] == pd.Timestamp(2020, 1, 1, 12, 0)
+    assert pd.isna(df.i_na[1]) and pd.isna(df.b_na[1]) and pd.isna(df.d[1])
+
+
+def test_df_builder_extend():
+    """Test appending blocks of columns to the _DataFrameBuilder.
+
+    Test whether blocks of lists and arrays result in the same dataframe as
+    appending the rows one by one.
+
+    """
+    builder = _DataFrameBuilder(['s', 'f'], {'s': 'string', 'f': 'float'})
+    builder.extend([['a', 'a'], np.array([1.0, np.nan])])
+    builder.extend([['b'], [2.0]])
+
+    ref_builder = _DataFrameBuilder(['s', 'f'],
+                                    {'s': 'string', 'f': 'float'})
+    ref_builder.append([['a', 1.0], ['a', np.nan], ['b', 2.0]])
+
+    pd.testing.assert_frame_equal(builder.build(), ref_builder.build())
+
+
+def test_df_builder_invalid():
+    """Test the _DataFrameBuilder with values not matching the type of the
+    field.
+
+    Test whether the values are kept as is.
+
+    """
+    builder = _DataFrameBuilder(['i'], {'i': 'integer'})
+    builder.append(['a'])
+
+    df = builder.build()
+
+    assert list(df.i) == ['a']
+
+
+def test_subtype_records():
+    """Test extracting the records of a subtype in columns.
+
+    Test whether the records equal the instances returned by the from_xml
+    method of the subtype, and whether float fields are stored in arrays.
+
+    """
+    with open('tests/data/types/sondering/sondering.xml', 'rb') as f:
+        tree = parse_dov_xml(f.read())
+
+    records = _SubtypeRecords.from_xml(Meetdata, tree)
+    instances = list(Meetdata.from_xml(tree))
+
+    assert len(records) == len(instances) > 0
+    assert isinstance(records.columns['z'], np.ndarray)
+    assert records.get_column('z') == [i.data['z'] for i in instances]
+    assert records.get_column('unknown') == [np.nan] * len(instances)
+
+    for record, instance in zip(records, instances):
+        assert type(record) is Meetdata
+        assert record.data.keys() == instance.data.keys()
+        for field in record.data:
+            assert record.data[field] == instance.data[field] or (
+                np.isnan(record.data[field]) and
+                np.isnan(instance.data[field]))
+
+
+@pytest.mark.parametrize("objecttype,xml_file", [
+    (Boring, 'boring/boring.xml'),
+    (Sondering, 'sondering/sondering.xml'),
+    (GrondwaterFilter, 'grondwaterfilter/grondwaterfilter.xml'),
+    (GrondwaterMonster, 'grondwatermonster/grondwatermonster.xml'),
+    (Grondmonster, 'grondmonster/grondmonster.xml'),
+    (InformeleStratigrafie,
+     'interpretaties/informele_stratigrafie/informele_stratigrafie.xml'),
+    (FormeleStratigrafie,
+     'interpretaties/formele_stratigrafie/formele_stratigrafie.xml'),
+    (HydrogeologischeStratigrafie,
+     'interpretaties/hydrogeologische_stratigrafie/'
+     'hydrogeologische_stratigrafie.xml'),
+    (InformeleHydrogeologischeStratigrafie,
+     'interpretaties/informele_hydrogeologische_stratigrafie/'
+     'informele_hydrogeologische_stratigrafie.xml'),
+    (GecodeerdeLithologie,
+     'interpretaties/gecodeerde_lithologie/gecodeerde_lithologie.xml'),
+    (LithologischeBeschrijvingen,
+     'interpretaties/lithologische_beschrijvingen/'
+     'lithologische_beschrijvingen.xml'),
+    (GeotechnischeCodering,
+     'interpretaties/geotechnische_codering/geotechnische_codering.xml'),
+    (QuartairStratigrafie,
+     'interpretaties/quartaire_stratigrafie/quartaire_stratigrafie.xml')])
+def test_subtype_records_extract_columns(objecttype, xml_file):
+    """Test extracting the records of the subtypes of every type in
+    columns.
+
+    Test whether the values extracted per field equal the values of the
+    instances returned by the from_xml method of the subtype.
+
+    Parameters
+    ----------
+    objecttype : AbstractDovType
+        Objecttype to test.
+    xml_file : str
+        Path of the XML document of the objecttype, relative to the test
+        data of the types.
+
+    """
+    with open('tests/data/types/' + xml_file, 'rb') as f:
+        tree = parse_dov_xml(f.read())
+
+    for subtype in objecttype.subtypes:
+        records = _SubtypeRecords.from_xml(subtype, tree)
+        instances = list(subtype.from_xml(tree))
+
+        assert len(records) == len(instances)
+        for field in subtype.get_field_names():
+            assert records.get_column(field) == [
+                i.data[field] for i in instances]
+
+
+def test_subtype_records_from_xml_element():
+    """Test extracting the records of a subtype overriding the
+    from_xml_element method.
+
+    Test whether the values of the instances returned by the subtype are
+    used.
+
+    """
+    class MyMeetdata(Meetdata):
+        @classmethod
+        def from_xml_element(cls, element):
+            instance = super(MyMeetdata, cls).from_xml_element(element)
+            instance.data['qc'] = 1.0
+            return instance
+
+    with open('tests/data/types/sondering/sondering.xml', 'rb') as f:
+        tree = parse_dov_xml(f.read())
+
+    records = _SubtypeRecords.from_xml(MyMeetdata, tree)
+
+    assert len(records) > 0
+    assert records.get_column('qc') == [1.0] * len(records)
+    assert records.get_rows(['z', 'x'], {'x': 0}) == [
+        [z, 0] for z in records.get_column('z')]
+
+
+def test_depth_filter_mask():
+    """Test the mask of records to keep of the _DepthFilter.
+
+    Test whether records outside the depth range and without depth are
+    removed, whether layers partially within the range are kept and whether
+    only the first measurement of every depth step is kept.
+
+    """
+    depths = np.array([0.0, 0.1, 0.2, 0.3, 0.35, 0.4, np.nan, 0.5])
+
+    keep = _DepthFilter((0.1, 0.4)).get_mask(Meetdata, depths, depths)
+    assert keep.tolist() == [False, True, True, True, True, True, False,
+                             False]
+
+    keep = _DepthFilter(depth_step=0.1).get_mask(Meetdata, depths, depths)
+    assert keep.tolist() == [True, True, True, True, False, True, False,
+                             True]
+
+    keep = _DepthFilter((1.0, 2.0), 0.5).get_mask(
+        FormeleStratigrafieLaag, np.array([0.0, 1.5, 2.5]),
+        np.array([1.5, 2.5, 3.0]))
+    assert keep.tolist() == [True, True, False]
+
+
+def test_subtype_records_depth_filter():
+    """Test extracting the records of a subtype with a depth filter.
+
+    Test whether only the records within the depth range and of distinct
+    depth steps are extracted.
+
+    """
+    with open('tests/data/types/sondering/sondering.xml', 'rb') as f:
+        tree = parse_dov_xml(f.read())
+
+    z = _SubtypeRecords.from_xml(Meetdata, tree).columns['z']
+    records = _SubtypeRecords.from_xml(
+        Meetdata, tree, _DepthFilter((10, 20), 0.5))
+
+    assert len(records) == len(set(np.floor(z[(z >= 10) & (z <= 20)] / 0.5)))
+    assert all(10 <= v <= 20 for v in records.get_column('z'))
+    assert len(set(records.get_column('qc'))) > 1
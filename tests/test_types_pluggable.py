@@ -85,11 +85,25 @@ class MyGrondwaterFilterOpbouw(GrondwaterFilter):
 
 class TestMyWrongGrondwaterFilter(object):
     """Class grouping tests for the MyWrongGrondwaterFilter custom type."""
-    def test_get_fields(self):
+    def test_get_fields(self, mp_wfs, mp_remote_describefeaturetype,
+                        mp_remote_md, mp_remote_fc, mp_remote_xsd):
         """Test the get_fields method.
 
         Test whether a RuntimeError is raised.
 
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+
         """
         fs = GrondwaterFilterSearch(objecttype=MyWrongGrondwaterFilter)
 
@@ -97,8 +111,8 @@ class TestMyWrongGrondwaterFilter(object):
             fs.get_fields()
 
     def test_search(self, mp_wfs, mp_remote_describefeaturetype,
-                    mp_remote_md, mp_remote_fc, mp_remote_wfs_feature,
-                    mp_dov_xml):
+                    mp_remote_md, mp_remote_fc, mp_remote_xsd,
+                    mp_remote_wfs_feature, mp_dov_xml):
         """Test the search method.
 
         Test whether a RuntimeError is raised.
@@ -113,6 +127,8 @@ class TestMyWrongGrondwaterFilter(object):
             Monkeypatch the call to get the remote metadata.
         mp_remote_fc : pytest.fixture
             Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
         mp_remote_wfs_feature : pytest.fixture
             Monkeypatch the call to get WFS features.
         mp_dov_xml : pytest.fixture
@@ -129,12 +145,26 @@ class TestMyWrongGrondwaterFilter(object):
 
 class TestMyGrondwaterFilter(object):
     """Class grouping tests for the MyGrondwaterFilter custom type."""
-    def test_get_fields(self):
+    def test_get_fields(self, mp_wfs, mp_remote_describefeaturetype,
+                        mp_remote_md, mp_remote_fc, mp_remote_xsd):
         """Test the get_fields method.
 
         Test whether the extra field is available in the output of the
         get_fields metadata.
 
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+
         """
         fs = GrondwaterFilterSearch(objecttype=MyGrondwaterFilter)
         fields = fs.get_fields()
@@ -142,8 +172,8 @@ class TestMyGrondwaterFilter(object):
         assert 'grondwatersysteem' in fields
 
     def test_search(self, mp_wfs, mp_remote_describefeaturetype,
-                    mp_remote_md, mp_remote_fc, mp_remote_wfs_feature,
-                    mp_dov_xml):
+                    mp_remote_md, mp_remote_fc, mp_remote_xsd,
+                    mp_remote_wfs_feature, mp_dov_xml):
         """Test the search method.
 
         Test whether the extra fields from the custom type are resolved into
@@ -159,6 +189,8 @@ class TestMyGrondwaterFilter(object):
             Monkeypatch the call to get the remote metadata.
         mp_remote_fc : pytest.fixture
             Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
         mp_remote_wfs_feature : pytest.fixture
             Monkeypatch the call to get WFS features.
         mp_dov_xml : pytest.fixture
@@ -178,12 +210,26 @@ class TestMyGrondwaterFilter(object):
 class TestMyGrondwaterFilterOpbouw(object):
     """Class grouping tests for the MyGrondwaterFilterOpbouw and
     MyFilterOpbouw custom type."""
-    def test_get_fields(self):
+    def test_get_fields(self, mp_wfs, mp_remote_describefeaturetype,
+                        mp_remote_md, mp_remote_fc, mp_remote_xsd):
         """Test the get_fields method.
 
         Test whether the extra field is available in the output of the
         get_fields metadata.
 
+        Parameters
+        ----------
+        mp_wfs : pytest.fixture
+            Monkeypatch the call to the remote GetCapabilities request.
+        mp_remote_describefeaturetype : pytest.fixture
+            Monkeypatch the call to a remote DescribeFeatureType.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to get the remote metadata.
+        mp_remote_fc : pytest.fixture
+            Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
+
         """
         fs = GrondwaterFilterSearch(objecttype=MyGrondwaterFilterOpbouw)
         fields = fs.get_fields()
@@ -196,8 +242,8 @@ class TestMyGrondwaterFilterOpbouw(object):
         assert 'opbouw_element' in fields
 
     def test_search(self, mp_wfs, mp_remote_describefeaturetype,
-                    mp_remote_md, mp_remote_fc, mp_remote_wfs_feature,
-                    mp_dov_xml):
+                    mp_remote_md, mp_remote_fc, mp_remote_xsd,
+                    mp_remote_wfs_feature, mp_dov_xml):
         """Test the search method.
 
         Test whether the extra fields from the custom type are resolved into
@@ -213,6 +259,8 @@ class TestMyGrondwaterFilterOpbouw(object):
             Monkeypatch the call to get the remote metadata.
         mp_remote_fc : pytest.fixture
             Monkeypatch the call to get the remote feature catalogue.
+        mp_remote_xsd : pytest.fixture
+            Monkeypatch the call to get the remote XSD schemas.
         mp_remote_wfs_feature : pytest.fixture
             Monkeypatch the call to get WFS features.
         mp_dov_xml : pytest.fixture
@@ -1,8 +1,12 @@
 """Module grouping tests for the pydov.util.caching module."""
+import asyncio
 import datetime
+import gc
 import gzip
 import os
+import sqlite3
 import tempfile
+import threading
 
 import time
 
@@ -12,8 +16,15 @@ import pydov
 from pydov.util.caching import (
     PlainTextFileCache,
     GzipTextFileCache,
+    SqliteCache,
+    LRUMemoryCache,
+    MemoryRecordCache,
+    MetadataCacheHook,
+    SingleFlight,
 )
+from pydov.util import owsutil
 from pydov.util.dovutil import build_dov_url
+from pydov.util.hooks import Hooks
 
 
 @pytest.fixture
@@ -34,10 +45,41 @@ def mp_remote_xml(monkeypatch):
                 data = data.encode('utf-8')
         return data
 
-    monkeypatch.setattr(pydov.util.caching.AbstractFileCache,
+    monkeypatch.setattr(pydov.util.caching.AbstractCache,
                         '_get_remote', _get_remote_data)
 
 
+@pytest.fixture
+def mp_remote_xml_async(monkeypatch):
+    """Monkeypatch the asynchronous call to get the remote Boring XML data.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.fixture
+        PyTest monkeypatch fixture.
+
+    """
+
+    async def _get_remote_data_async(*args, **kwargs):
+        with open('tests/data/types/boring/boring.xml', 'r') as f:
+            data = f.read()
+            if type(data) is not bytes:
+                data = data.encode('utf-8')
+        return data
+
+    monkeypatch.setattr(pydov.util.caching.AbstractCache,
+                        '_get_remote_async', _get_remote_data_async)
+
+
+def run_async(coroutine):
+    """Run the given coroutine in a new event loop and return its result."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
 @pytest.fixture
 def plaintext_cache(request):
     """Fixture for a temporary cache.
@@ -80,6 +122,8 @@ def gziptext_cache(request):
     ----------
     max_age : datetime.timedelta
         The maximum age to use for the cache.
+    max_size : int, optional
+        The maximum size to use for the cache.
 
     """
     orig_cache = pydov.cache
@@ -89,9 +133,11 @@ def gziptext_cache(request):
     else:
         max_age = request.param[0]
 
+    max_size = request.param[1] if len(request.param) > 1 else None
+
     gziptext_cache = GzipTextFileCache(
         cachedir=os.path.join(tempfile.gettempdir(), 'pydov_tests'),
-        max_age=max_age)
+        max_age=max_age, max_size=max_size)
     pydov.cache = gziptext_cache
 
     yield gziptext_cache
@@ -100,6 +146,112 @@ def gziptext_cache(request):
     pydov.cache = orig_cache
 
 
+@pytest.fixture
+def sqlite_cache(request):
+    """Fixture for a temporary cache.
+
+    This fixture should be parametrized, with a list of parameters in the
+    order described below.
+
+    Paramaters
+    ----------
+    max_age : datetime.timedelta
+        The maximum age to use for the cache.
+
+    """
+    orig_cache = pydov.cache
+
+    if len(request.param) == 0:
+        max_age = datetime.timedelta(seconds=1)
+    else:
+        max_age = request.param[0]
+
+    sqlite_cache = SqliteCache(
+        database=os.path.join(tempfile.gettempdir(), 'pydov_tests',
+                              'pydov.sqlite'),
+        max_age=max_age)
+    pydov.cache = sqlite_cache
+
+    yield sqlite_cache
+
+    sqlite_cache.remove()
+    pydov.cache = orig_cache
+
+
+@pytest.fixture
+def lru_cache(request):
+    """Fixture for a temporary in-memory cache wrapping a
+    GzipTextFileCache.
+
+    This fixture should be parametrized, with a list of parameters in the
+    order described below.
+
+    Paramaters
+    ----------
+    max_entries : int
+        The maximum number of entries to keep in memory.
+    max_bytes : int
+        The maximum total size of the entries kept in memory.
+
+    """
+    orig_cache = pydov.cache
+
+    kwargs = dict(zip(['max_entries', 'max_bytes'], request.param))
+
+    lru_cache = LRUMemoryCache(
+        GzipTextFileCache(
+            cachedir=os.path.join(tempfile.gettempdir(), 'pydov_tests'),
+            max_age=datetime.timedelta(seconds=1)),
+        **kwargs)
+    pydov.cache = lru_cache
+
+    yield lru_cache
+
+    lru_cache.remove()
+    pydov.cache = orig_cache
+
+
+@pytest.fixture
+def metadata_cache_hook(monkeypatch):
+    """Fixture for a temporary metadata cache hook, with a maximum age of 1
+    second, registered as the only hook."""
+    hook = MetadataCacheHook(
+        cachedir=os.path.join(tempfile.gettempdir(), 'pydov_tests_metadata'),
+        max_age=datetime.timedelta(seconds=1))
+    monkeypatch.setattr(pydov, 'hooks', Hooks((hook,)))
+
+    yield hook
+
+    hook.remove()
+
+
+class MetadataResponse(object):
+    """Fake response of a metadata request."""
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.encoding = None
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+def get_sqlite_timestamp(cache, datatype, key):
+    """Get the timestamp of the record saved in the SqliteCache, or None if
+    no record exists."""
+    row = cache._get_connection().execute(
+        'SELECT timestamp FROM cache WHERE datatype = ? AND key = ?',
+        (datatype, key)).fetchone()
+    if row is not None:
+        return row[0]
+
+
 @pytest.fixture
 def nocache():
     """Fixture to temporarily disable caching."""
@@ -390,6 +542,43 @@ class TestPlainTextFileCacheCache(object):
             build_dov_url('data/boring/2004-103984.xml'))
         assert type(cached_data) is bytes
 
+    @pytest.mark.parametrize('plaintext_cache', [[]],
+                             indirect=['plaintext_cache'])
+    def test_get_async(self, plaintext_cache, mp_remote_xml_async):
+        """Test the get_async method.
+
+        Test whether the document is saved in the cache and reused in a
+        second function call.
+
+        Parameters
+        ----------
+        plaintext_cache : pytest.fixture providing
+                pydov.util.caching.PlainTextFileCache
+            PlainTextFileCache using a temporary directory and a maximum age
+            of 1 second.
+        mp_remote_xml_async : pytest.fixture
+            Monkeypatch the asynchronous call to the remote DOV service
+            returning an XML document.
+
+        """
+        cached_file = os.path.join(
+            plaintext_cache.cachedir, 'boring', '2004-103984.xml')
+
+        plaintext_cache.clean()
+        assert not os.path.exists(cached_file)
+
+        ref_data = run_async(plaintext_cache.get_async(
+            build_dov_url('data/boring/2004-103984.xml')))
+        assert type(ref_data) is bytes
+        assert os.path.exists(cached_file)
+
+        first_download_time = os.path.getmtime(cached_file)
+
+        cached_data = run_async(plaintext_cache.get_async(
+            build_dov_url('data/boring/2004-103984.xml')))
+        assert cached_data == ref_data
+        assert os.path.getmtime(cached_file) == first_download_time
+
 
 class TestGzipTextFileCacheCache(object):
     """Class grouping tests for the pydov.util.caching.PlainTextFileCache
@@ -671,3 +860,1235 @@ class TestGzipTextFileCacheCache(object):
         cached_data = gziptext_cache.get(
             build_dov_url('data/boring/2004-103984.xml'))
         assert type(cached_data) is bytes
+
+    @pytest.mark.parametrize('gziptext_cache', [[]],
+                             indirect=['gziptext_cache'])
+    def test_get_async(self, gziptext_cache, mp_remote_xml_async):
+        """Test the get_async method.
+
+        Test whether the document is saved in the cache and reused in a
+        second function call.
+
+        Parameters
+        ----------
+        gziptext_cache : pytest.fixture providing
+                pydov.util.caching.GzipTextFileCache
+            GzipTextFileCache using a temporary directory and a maximum age
+            of 1 second.
+        mp_remote_xml_async : pytest.fixture
+            Monkeypatch the asynchronous call to the remote DOV service
+            returning an XML document.
+
+        """
+        cached_file = os.path.join(
+            gziptext_cache.cachedir, 'boring', '2004-103984.xml.gz')
+
+        gziptext_cache.clean()
+        assert not os.path.exists(cached_file)
+
+        ref_data = run_async(gziptext_cache.get_async(
+            build_dov_url('data/boring/2004-103984.xml')))
+        assert type(ref_data) is bytes
+        assert os.path.exists(cached_file)
+
+        first_download_time = os.path.getmtime(cached_file)
+
+        cached_data = run_async(gziptext_cache.get_async(
+            build_dov_url('data/boring/2004-103984.xml')))
+        assert cached_data == ref_data
+        assert os.path.getmtime(cached_file) == first_download_time
+
+
+class TestSizeBoundedFileCache(object):
+    """Class grouping tests for the maximum size of the
+    pydov.util.caching.AbstractFileCache class."""
+
+    def test_invalid_max_size(self):
+        """Test initialising a cache with an invalid maximum size.
+
+        Test whether a ValueError is raised.
+
+        """
+        with pytest.raises(ValueError):
+            GzipTextFileCache(max_size=0)
+
+    @staticmethod
+    def get_cached_file(cache, i):
+        """Get the path of the cached file of the i-th test object."""
+        return os.path.join(cache.cachedir, 'boring', '2004-{}.xml.gz'.format(
+            i))
+
+    @pytest.mark.parametrize('gziptext_cache',
+                             [[datetime.timedelta(minutes=1), 1]],
+                             indirect=['gziptext_cache'])
+    def test_evict_lru(self, gziptext_cache, mp_remote_xml):
+        """Test whether the least recently used files are removed when
+        exceeding the maximum size.
+
+        Parameters
+        ----------
+        gziptext_cache : pytest.fixture providing
+                pydov.util.caching.GzipTextFileCache
+            GzipTextFileCache using a temporary directory, a maximum age
+            of 1 minute and a maximum size of 1 byte.
+        mp_remote_xml : pytest.fixture
+            Monkeypatch the call to the remote DOV service returning an XML
+            document.
+
+        """
+        gziptext_cache.get(build_dov_url('data/boring/2004-0.xml'))
+        size = os.path.getsize(self.get_cached_file(gziptext_cache, 0))
+        gziptext_cache.max_size = size * 2
+
+        gziptext_cache.get(build_dov_url('data/boring/2004-1.xml'))
+        gziptext_cache.get(build_dov_url('data/boring/2004-0.xml'))
+        gziptext_cache.get(build_dov_url('data/boring/2004-2.xml'))
+
+        assert os.path.exists(self.get_cached_file(gziptext_cache, 0))
+        assert not os.path.exists(self.get_cached_file(gziptext_cache, 1))
+        assert os.path.exists(self.get_cached_file(gziptext_cache, 2))
+        assert gziptext_cache._index_size == size * 2
+
+    @pytest.mark.parametrize('gziptext_cache',
+                             [[datetime.timedelta(minutes=1), 1]],
+                             indirect=['gziptext_cache'])
+    def test_keep_last(self, gziptext_cache, mp_remote_xml):
+        """Test whether the most recently saved file is kept, even if it
+        exceeds the maximum size by itself.
+
+        Parameters
+        ----------
+        gziptext_cache : pytest.fixture providing
+                pydov.util.caching.GzipTextFileCache
+            GzipTextFileCache using a temporary directory, a maximum age
+            of 1 minute and a maximum size of 1 byte.
+        mp_remote_xml : pytest.fixture
+            Monkeypatch the call to the remote DOV service returning an XML
+            document.
+
+        """
+        gziptext_cache.get(build_dov_url('data/boring/2004-0.xml'))
+        gziptext_cache.get(build_dov_url('data/boring/2004-1.xml'))
+
+        assert not os.path.exists(self.get_cached_file(gziptext_cache, 0))
+        assert os.path.exists(self.get_cached_file(gziptext_cache, 1))
+
+    @pytest.mark.parametrize('gziptext_cache',
+                             [[datetime.timedelta(minutes=1)]],
+                             indirect=['gziptext_cache'])
+    def test_initial_scan(self, gziptext_cache, mp_remote_xml, monkeypatch):
+        """Test whether existing files are indexed by a single scan of the
+        cache directory, ordered by modification time.
+
+        Parameters
+        ----------
+        gziptext_cache : pytest.fixture providing
+                pydov.util.caching.GzipTextFileCache
+            GzipTextFileCache using a temporary directory and a maximum age
+            of 1 minute.
+        mp_remote_xml : pytest.fixture
+            Monkeypatch the call to the remote DOV service returning an XML
+            document.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        for i in range(3):
+            gziptext_cache.get(
+                build_dov_url('data/boring/2004-{}.xml'.format(i)))
+            os.utime(self.get_cached_file(gziptext_cache, i),
+                     (time.time() - 10 + i, time.time() - 10 + i))
+        size = os.path.getsize(self.get_cached_file(gziptext_cache, 0))
+
+        scans = []
+        scandir = os.scandir
+
+        def count_scandir(path):
+            scans.append(path)
+            return scandir(path)
+
+        monkeypatch.setattr(os, 'scandir', count_scandir)
+
+        bounded_cache = GzipTextFileCache(
+            cachedir=gziptext_cache.cachedir, max_age=gziptext_cache.max_age,
+            max_size=size * 3)
+        bounded_cache.get(build_dov_url('data/boring/2004-3.xml'))
+        bounded_cache.get(build_dov_url('data/boring/2004-4.xml'))
+
+        assert len(scans) == 2
+        assert not os.path.exists(self.get_cached_file(gziptext_cache, 0))
+        assert not os.path.exists(self.get_cached_file(gziptext_cache, 1))
+        assert os.path.exists(self.get_cached_file(gziptext_cache, 2))
+
+    @pytest.mark.parametrize('gziptext_cache',
+                             [[datetime.timedelta(minutes=1)]],
+                             indirect=['gziptext_cache'])
+    def test_persist_use(self, gziptext_cache, mp_remote_xml):
+        """Test whether the use of cached files is known to a new cache
+        instance, f.ex. after a restart, without changing their validity.
+
+        Parameters
+        ----------
+        gziptext_cache : pytest.fixture providing
+                pydov.util.caching.GzipTextFileCache
+            GzipTextFileCache using a temporary directory and a maximum age
+            of 1 minute.
+        mp_remote_xml : pytest.fixture
+            Monkeypatch the call to the remote DOV service returning an XML
+            document.
+
+        """
+        for i in range(3):
+            gziptext_cache.get(
+                build_dov_url('data/boring/2004-{}.xml'.format(i)))
+            os.utime(self.get_cached_file(gziptext_cache, i),
+                     (time.time() - 10 + i, time.time() - 10 + i))
+        size = os.path.getsize(self.get_cached_file(gziptext_cache, 0))
+
+        bounded_cache = GzipTextFileCache(
+            cachedir=gziptext_cache.cachedir, max_age=gziptext_cache.max_age,
+            max_size=size * 3)
+        mtime = os.path.getmtime(self.get_cached_file(gziptext_cache, 0))
+        bounded_cache.get(build_dov_url('data/boring/2004-0.xml'))
+        assert os.path.getmtime(
+            self.get_cached_file(gziptext_cache, 0)) == mtime
+
+        restarted_cache = GzipTextFileCache(
+            cachedir=gziptext_cache.cachedir, max_age=gziptext_cache.max_age,
+            max_size=size * 3)
+        restarted_cache.get(build_dov_url('data/boring/2004-3.xml'))
+
+        assert os.path.exists(self.get_cached_file(gziptext_cache, 0))
+        assert not os.path.exists(self.get_cached_file(gziptext_cache, 1))
+        assert os.path.exists(self.get_cached_file(gziptext_cache, 2))
+
+    @pytest.mark.parametrize('gziptext_cache',
+                             [[datetime.timedelta(minutes=1)]],
+                             indirect=['gziptext_cache'])
+    def test_refresh_index(self, gziptext_cache, mp_remote_xml,
+                           monkeypatch):
+        """Test whether files saved by another cache using the same
+        directory, f.ex. in another process, are included in the size of the
+        cache once the index is refreshed.
+
+        Parameters
+        ----------
+        gziptext_cache : pytest.fixture providing
+                pydov.util.caching.GzipTextFileCache
+            GzipTextFileCache using a temporary directory and a maximum age
+            of 1 minute.
+        mp_remote_xml : pytest.fixture
+            Monkeypatch the call to the remote DOV service returning an XML
+            document.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        gziptext_cache.get(build_dov_url('data/boring/2004-0.xml'))
+        size = os.path.getsize(self.get_cached_file(gziptext_cache, 0))
+
+        bounded_cache = GzipTextFileCache(
+            cachedir=gziptext_cache.cachedir, max_age=gziptext_cache.max_age,
+            max_size=size * 3)
+        bounded_cache.get(build_dov_url('data/boring/2004-1.xml'))
+
+        for i in (2, 3):
+            gziptext_cache.get(
+                build_dov_url('data/boring/2004-{}.xml'.format(i)))
+
+        bounded_cache.get(build_dov_url('data/boring/2004-4.xml'))
+        assert bounded_cache._index_size == size * 3
+        assert all(os.path.exists(self.get_cached_file(gziptext_cache, i))
+                   for i in range(5))
+
+        monkeypatch.setattr(bounded_cache, 'index_refresh_interval',
+                            datetime.timedelta(0))
+        bounded_cache.get(build_dov_url('data/boring/2004-5.xml'))
+
+        assert bounded_cache._index_size == size * 3
+        assert [os.path.exists(self.get_cached_file(gziptext_cache, i))
+                for i in range(6)] == [False, False, False, True, True, True]
+
+
+class TestSqliteCache(object):
+    """Class grouping tests for the pydov.util.caching.SqliteCache class."""
+
+    @pytest.mark.parametrize('sqlite_cache', [[]],
+                             indirect=['sqlite_cache'])
+    def test_clean(self, sqlite_cache, mp_remote_xml):
+        """Test the clean method.
+
+        Test whether the cached record is removed after the clean method
+        has been called and the record has expired.
+
+        Parameters
+        ----------
+        sqlite_cache : pytest.fixture providing
+                pydov.util.caching.SqliteCache
+            SqliteCache using a temporary database and a maximum age of 1
+            second.
+        mp_remote_xml : pytest.fixture
+            Monkeypatch the call to the remote DOV service returning an XML
+            document.
+
+        """
+        sqlite_cache.get(build_dov_url('data/boring/2004-103984.xml'))
+        assert get_sqlite_timestamp(
+            sqlite_cache, 'boring', '2004-103984') is not None
+
+        sqlite_cache.clean()
+        assert get_sqlite_timestamp(
+            sqlite_cache, 'boring', '2004-103984') is not None
+
+        time.sleep(1.5)
+        sqlite_cache.clean()
+        assert get_sqlite_timestamp(
+            sqlite_cache, 'boring', '2004-103984') is None
+        assert os.path.exists(sqlite_cache.database)
+
+    @pytest.mark.parametrize('sqlite_cache', [[]],
+                             indirect=['sqlite_cache'])
+    def test_remove(self, sqlite_cache, mp_remote_xml):
+        """Test the remove method.
+
+        Test whether the database is nonexistent after the remove method has
+        been called, and is recreated when using the cache afterwards.
+
+        Parameters
+        ----------
+        sqlite_cache : pytest.fixture providing
+                pydov.util.caching.SqliteCache
+            SqliteCache using a temporary database and a maximum age of 1
+            second.
+        mp_remote_xml : pytest.fixture
+            Monkeypatch the call to the remote DOV service returning an XML
+            document.
+
+        """
+        sqlite_cache.get(build_dov_url('data/boring/2004-103984.xml'))
+        assert os.path.exists(sqlite_cache.database)
+
+        sqlite_cache.remove()
+        assert not os.path.exists(sqlite_cache.database)
+
+        sqlite_cache.get(build_dov_url('data/boring/2004-103984.xml'))
+        assert get_sqlite_timestamp(
+            sqlite_cache, 'boring', '2004-103984') is not None
+
+    @pytest.mark.parametrize('sqlite_cache', [[]],
+                             indirect=['sqlite_cache'])
+    def test_get_reuse(self, sqlite_cache, mp_remote_xml):
+        """Test the get method.
+
+        Test whether the document is saved in the cache and reused in a
+        second function call.
+
+        Parameters
+        ----------
+        sqlite_cache : pytest.fixture providing
+                pydov.util.caching.SqliteCache
+            SqliteCache using a temporary database and a maximum age of 1
+            second.
+        mp_remote_xml : pytest.fixture
+            Monkeypatch the call to the remote DOV service returning an XML
+            document.
+
+        """
+        sqlite_cache.get(build_dov_url('data/boring/2004-103984.xml'))
+        first_download_time = get_sqlite_timestamp(
+            sqlite_cache, 'boring', '2004-103984')
+        assert first_download_time is not None
+
+        time.sleep(0.5)
+        sqlite_cache.get(build_dov_url('data/boring/2004-103984.xml'))
+        # assure we didn't redownload the file:
+        assert get_sqlite_timestamp(
+            sqlite_cache, 'boring', '2004-103984') == first_download_time
+
+    @pytest.mark.parametrize('sqlite_cache', [[]],
+                             indirect=['sqlite_cache'])
+    def test_get_invalid(self, sqlite_cache, mp_remote_xml):
+        """Test the get method.
+
+        Test whether the document is not reused if the second function call
+        is after the maximum age of the cached record.
+
+        Parameters
+        ----------
+        sqlite_cache : pytest.fixture providing
+                pydov.util.caching.SqliteCache
+            SqliteCache using a temporary database and a maximum age of 1
+            second.
+        mp_remote_xml : pytest.fixture
+            Monkeypatch the call to the remote DOV service returning an XML
+            document.
+
+        """
+        sqlite_cache.get(build_dov_url('data/boring/2004-103984.xml'))
+        first_download_time = get_sqlite_timestamp(
+            sqlite_cache, 'boring', '2004-103984')
+
+        time.sleep(1.5)
+        sqlite_cache.get(build_dov_url('data/boring/2004-103984.xml'))
+        # assure we did redownload the file, since original is invalid now:
+        assert get_sqlite_timestamp(
+            sqlite_cache, 'boring', '2004-103984') > first_download_time
+
+    @pytest.mark.parametrize('sqlite_cache', [[]],
+                             indirect=['sqlite_cache'])
+    def test_reuse_content(self, sqlite_cache, mp_remote_xml):
+        """Test whether the saved data is reused.
+
+        Test if the contents returned by the cache are the same as the
+        original data, with the same datatype (i.e. bytes).
+
+        Parameters
+        ----------
+        sqlite_cache : pytest.fixture providing
+                pydov.util.caching.SqliteCache
+            SqliteCache using a temporary database and a maximum age of 1
+            second.
+        mp_remote_xml : pytest.fixture
+            Monkeypatch the call to the remote DOV service returning an XML
+            document.
+
+        """
+        with open('tests/data/types/boring/boring.xml', 'r') as ref:
+            ref_data = ref.read().encode('utf-8')
+
+        data = sqlite_cache.get(build_dov_url('data/boring/2004-103984.xml'))
+        assert type(data) is bytes
+        assert data == ref_data
+
+        cached_data = sqlite_cache.get(
+            build_dov_url('data/boring/2004-103984.xml'))
+        assert type(cached_data) is bytes
+        assert cached_data == ref_data
+
+    @pytest.mark.parametrize('sqlite_cache', [[]],
+                             indirect=['sqlite_cache'])
+    def test_get_async(self, sqlite_cache, mp_remote_xml_async):
+        """Test the get_async method.
+
+        Test whether the document is saved in the cache and reused in a
+        second function call.
+
+        Parameters
+        ----------
+        sqlite_cache : pytest.fixture providing
+                pydov.util.caching.SqliteCache
+            SqliteCache using a temporary database and a maximum age of 1
+            second.
+        mp_remote_xml_async : pytest.fixture
+            Monkeypatch the asynchronous call to the remote DOV service
+            returning an XML document.
+
+        """
+        ref_data = run_async(sqlite_cache.get_async(
+            build_dov_url('data/boring/2004-103984.xml')))
+        assert type(ref_data) is bytes
+
+        first_download_time = get_sqlite_timestamp(
+            sqlite_cache, 'boring', '2004-103984')
+        assert first_download_time is not None
+
+        cached_data = run_async(sqlite_cache.get_async(
+            build_dov_url('data/boring/2004-103984.xml')))
+        assert cached_data == ref_data
+        assert get_sqlite_timestamp(
+            sqlite_cache, 'boring', '2004-103984') == first_download_time
+
+    @pytest.mark.parametrize('sqlite_cache', [[]],
+                             indirect=['sqlite_cache'])
+    def test_get_threads(self, sqlite_cache, mp_remote_xml):
+        """Test the get method from multiple threads concurrently.
+
+        Test whether all threads get the same data without errors.
+
+        Parameters
+        ----------
+        sqlite_cache : pytest.fixture providing
+                pydov.util.caching.SqliteCache
+            SqliteCache using a temporary database and a maximum age of 1
+            second.
+        mp_remote_xml : pytest.fixture
+            Monkeypatch the call to the remote DOV service returning an XML
+            document.
+
+        """
+        results = []
+
+        def get(i):
+            results.append(sqlite_cache.get(
+                build_dov_url('data/boring/2004-{}.xml'.format(i % 5))))
+
+        threads = [threading.Thread(target=get, args=(i,))
+                   for i in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(results) == 20
+        assert len(set(results)) == 1
+        for i in range(5):
+            assert get_sqlite_timestamp(
+                sqlite_cache, 'boring', '2004-{}'.format(i)) is not None
+
+
+    @pytest.mark.parametrize('sqlite_cache', [[]],
+                             indirect=['sqlite_cache'])
+    def test_close_thread_connection(self, sqlite_cache, mp_remote_xml):
+        """Test the connections of threads that ended.
+
+        Test whether the connection of a thread is closed when the thread
+        ends, while the connection of the main thread remains open.
+
+        Parameters
+        ----------
+        sqlite_cache : pytest.fixture providing
+                pydov.util.caching.SqliteCache
+            SqliteCache using a temporary database and a maximum age of 1
+            second.
+        mp_remote_xml : pytest.fixture
+            Monkeypatch the call to the remote DOV service returning an XML
+            document.
+
+        """
+        connections = []
+
+        def get():
+            sqlite_cache.get(build_dov_url('data/boring/2004-103984.xml'))
+            connections.append(sqlite_cache._get_connection())
+
+        thread = threading.Thread(target=get)
+        thread.start()
+        thread.join()
+        gc.collect()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            connections[0].execute('SELECT 1')
+
+        get()
+        assert connections[1].execute('SELECT 1').fetchone() == (1,)
+        assert len([f for f in sqlite_cache._finalizers if f.alive]) == 1
+
+
+class TestLRUMemoryCache(object):
+    """Class grouping tests for the pydov.util.caching.LRUMemoryCache
+    class."""
+
+    def test_invalid_limits(self):
+        """Test initialising the cache with invalid limits.
+
+        Test whether a ValueError is raised.
+
+        """
+        with pytest.raises(ValueError):
+            LRUMemoryCache(max_entries=0)
+
+        with pytest.raises(ValueError):
+            LRUMemoryCache(max_bytes=0)
+
+    def test_max_age(self):
+        """Test whether the maximum age defaults to the one of the wrapped
+        cache."""
+        assert LRUMemoryCache().max_age is None
+
+        cache = SqliteCache(max_age=datetime.timedelta(days=1))
+        assert LRUMemoryCache(cache).max_age == datetime.timedelta(days=1)
+
+    @pytest.mark.parametrize('lru_cache', [[]], indirect=['lru_cache'])
+    def test_get_reuse(self, lru_cache, mp_remote_xml, monkeypatch):
+        """Test the get method.
+
+        Test whether the document is retrieved from the wrapped cache once
+        and served from memory afterwards.
+
+        Parameters
+        ----------
+        lru_cache : pytest.fixture providing
+                pydov.util.caching.LRUMemoryCache
+            LRUMemoryCache wrapping a GzipTextFileCache using a temporary
+            directory and a maximum age of 1 second.
+        mp_remote_xml : pytest.fixture
+            Monkeypatch the call to the remote DOV service returning an XML
+            document.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        calls = []
+        wrapped_get = lru_cache.cache.get
+
+        def get(url):
+            calls.append(url)
+            return wrapped_get(url)
+
+        monkeypatch.setattr(lru_cache.cache, 'get', get)
+
+        url = build_dov_url('data/boring/2004-103984.xml')
+        ref_data = lru_cache.get(url)
+        assert type(ref_data) is bytes
+        assert lru_cache.get(url) == ref_data
+        assert lru_cache.get(url) == ref_data
+
+        assert calls == [url]
+        assert lru_cache.stats == {
+            'hits': 2,
+            'misses': 1,
+            'entries': 1,
+            'bytes': len(ref_data)
+        }
+
+    @pytest.mark.parametrize('lru_cache', [[]], indirect=['lru_cache'])
+    def test_get_invalid(self, lru_cache, mp_remote_xml):
+        """Test the get method.
+
+        Test whether the document is not served from memory after the
+        maximum age.
+
+        Parameters
+        ----------
+        lru_cache : pytest.fixture providing
+                pydov.util.caching.LRUMemoryCache
+            LRUMemoryCache wrapping a GzipTextFileCache using a temporary
+            directory and a maximum age of 1 second.
+        mp_remote_xml : pytest.fixture
+            Monkeypatch the call to the remote DOV service returning an XML
+            document.
+
+        """
+        url = build_dov_url('data/boring/2004-103984.xml')
+        lru_cache.get(url)
+
+        time.sleep(1.5)
+        lru_cache.get(url)
+        assert lru_cache.stats['hits'] == 0
+        assert lru_cache.stats['misses'] == 2
+        assert lru_cache.stats['entries'] == 1
+
+    @pytest.mark.parametrize('lru_cache', [[2]], indirect=['lru_cache'])
+    def test_max_entries(self, lru_cache, mp_remote_xml):
+        """Test whether the least recently used documents are discarded
+        when exceeding the maximum number of entries.
+
+        Parameters
+        ----------
+        lru_cache : pytest.fixture providing
+                pydov.util.caching.LRUMemoryCache
+            LRUMemoryCache wrapping a GzipTextFileCache using a temporary
+            directory and a maximum age of 1 second, keeping at most 2
+            entries.
+        mp_remote_xml : pytest.fixture
+            Monkeypatch the call to the remote DOV service returning an XML
+            document.
+
+        """
+        urls = [build_dov_url('data/boring/2004-{}.xml'.format(i))
+                for i in range(3)]
+
+        lru_cache.get(urls[0])
+        lru_cache.get(urls[1])
+        lru_cache.get(urls[0])
+        lru_cache.get(urls[2])
+
+        assert lru_cache.stats['entries'] == 2
+        assert list(lru_cache._entries) == [urls[0], urls[2]]
+
+    @pytest.mark.parametrize('lru_cache', [[10, 100000]],
+                             indirect=['lru_cache'])
+    def test_max_bytes(self, lru_cache, mp_remote_xml):
+        """Test whether the least recently used documents are discarded
+        when exceeding the maximum size, and documents larger than the
+        maximum size are not kept in memory.
+
+        Parameters
+        ----------
+        lru_cache : pytest.fixture providing
+                pydov.util.caching.LRUMemoryCache
+            LRUMemoryCache wrapping a GzipTextFileCache using a temporary
+            directory and a maximum age of 1 second, keeping at most 100000
+            bytes.
+        mp_remote_xml : pytest.fixture
+            Monkeypatch the call to the remote DOV service returning an XML
+            document.
+
+        """
+        size = len(lru_cache.get(build_dov_url('data/boring/2004-0.xml')))
+        lru_cache.max_bytes = size * 2
+
+        for i in range(1, 4):
+            lru_cache.get(build_dov_url('data/boring/2004-{}.xml'.format(i)))
+
+        assert lru_cache.stats['entries'] == 2
+        assert lru_cache.stats['bytes'] == size * 2
+
+        lru_cache.remove()
+        lru_cache.max_bytes = size - 1
+        lru_cache.get(build_dov_url('data/boring/2004-0.xml'))
+        assert lru_cache.stats['entries'] == 0
+
+    @pytest.mark.parametrize('lru_cache', [[]], indirect=['lru_cache'])
+    def test_remove(self, lru_cache, mp_remote_xml):
+        """Test the remove method.
+
+        Test whether the memory and the wrapped cache are emptied.
+
+        Parameters
+        ----------
+        lru_cache : pytest.fixture providing
+                pydov.util.caching.LRUMemoryCache
+            LRUMemoryCache wrapping a GzipTextFileCache using a temporary
+            directory and a maximum age of 1 second.
+        mp_remote_xml : pytest.fixture
+            Monkeypatch the call to the remote DOV service returning an XML
+            document.
+
+        """
+        lru_cache.get(build_dov_url('data/boring/2004-103984.xml'))
+        assert lru_cache.stats['entries'] == 1
+
+        lru_cache.remove()
+        assert lru_cache.stats['entries'] == 0
+        assert lru_cache.stats['bytes'] == 0
+        assert not os.path.exists(lru_cache.cache.cachedir)
+
+    def test_get_nocache(self, mp_remote_xml):
+        """Test the get method without wrapped cache.
+
+        Test whether the document is downloaded and kept in memory.
+
+        Parameters
+        ----------
+        mp_remote_xml : pytest.fixture
+            Monkeypatch the call to the remote DOV service returning an XML
+            document.
+
+        """
+        cache = LRUMemoryCache()
+        url = build_dov_url('data/boring/2004-103984.xml')
+
+        assert cache.get(url) == cache.get(url)
+        assert cache.stats['hits'] == 1
+
+    def test_get_async(self, mp_remote_xml_async):
+        """Test the get_async method.
+
+        Test whether the document is downloaded once and served from memory
+        afterwards.
+
+        Parameters
+        ----------
+        mp_remote_xml_async : pytest.fixture
+            Monkeypatch the asynchronous call to the remote DOV service
+            returning an XML document.
+
+        """
+        cache = LRUMemoryCache()
+        url = build_dov_url('data/boring/2004-103984.xml')
+
+        ref_data = run_async(cache.get_async(url))
+        assert type(ref_data) is bytes
+        assert run_async(cache.get_async(url)) == ref_data
+        assert cache.stats['hits'] == 1
+        assert cache.stats['misses'] == 1
+
+
+class TestMemoryRecordCache(object):
+    """Class grouping tests for the pydov.util.caching.MemoryRecordCache
+    class."""
+
+    def test_invalid_max_entries(self):
+        """Test initialising the cache with an invalid maximum number of
+        entries.
+
+        Test whether a ValueError is raised.
+
+        """
+        with pytest.raises(ValueError):
+            MemoryRecordCache(max_entries=0)
+
+    def test_get_save(self):
+        """Test the get and save methods.
+
+        Test whether saved records are returned, and the least recently used
+        records are discarded when exceeding the maximum number of entries.
+
+        """
+        cache = MemoryRecordCache(max_entries=2)
+
+        assert cache.get(('boring', 'a', 'x')) is None
+
+        cache.save(('boring', 'a', 'x'), {'data': 'a'})
+        cache.save(('boring', 'b', 'x'), {'data': 'b'})
+        assert cache.get(('boring', 'a', 'x')) == {'data': 'a'}
+        assert cache.get(('boring', 'a', 'y')) is None
+
+        cache.save(('boring', 'c', 'x'), {'data': 'c'})
+        assert cache.get(('boring', 'b', 'x')) is None
+        assert cache.get(('boring', 'a', 'x')) == {'data': 'a'}
+        assert cache.get(('boring', 'c', 'x')) == {'data': 'c'}
+
+        assert cache.hits == 3
+        assert cache.misses == 3
+
+    def test_max_age(self):
+        """Test whether records are invalid after the maximum age, and
+        removed by the clean method."""
+        cache = MemoryRecordCache(max_age=datetime.timedelta(seconds=1))
+        cache.save(('boring', 'a', 'x'), {'data': 'a'})
+        cache.save(('boring', 'b', 'x'), {'data': 'b'})
+        assert cache.get(('boring', 'a', 'x')) == {'data': 'a'}
+
+        time.sleep(1.5)
+        assert cache.get(('boring', 'a', 'x')) is None
+
+        cache.clean()
+        assert len(cache._entries) == 0
+
+    def test_remove(self):
+        """Test whether the remove method removes all records."""
+        cache = MemoryRecordCache()
+        cache.save(('boring', 'a', 'x'), {'data': 'a'})
+
+        cache.remove()
+        assert cache.get(('boring', 'a', 'x')) is None
+
+
+class TestSingleFlight(object):
+    """Class grouping tests for the pydov.util.caching.SingleFlight class."""
+
+    def test_do(self):
+        """Test the do method.
+
+        Test whether concurrent calls with the same key are executed once
+        and share the result, while calls with another key are executed
+        separately.
+
+        """
+        single_flight = SingleFlight()
+        calls = []
+        results = []
+
+        def slow(key):
+            calls.append(key)
+            time.sleep(0.2)
+            return key * 2
+
+        def run(key):
+            results.append(single_flight.do(key, slow, key))
+
+        threads = [threading.Thread(target=run, args=(k,))
+                   for k in ['a'] * 5 + ['b']]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(calls) == ['a', 'b']
+        assert sorted(r[0] for r in results) == ['aa'] * 5 + ['bb']
+        assert len([r for r in results if not r[1]]) == 2
+
+        assert single_flight.do('a', slow, 'a') == ('aa', False)
+
+    def test_do_exception(self):
+        """Test the do method with a failing call.
+
+        Test whether the exception is raised in all waiting threads.
+
+        """
+        single_flight = SingleFlight()
+        errors = []
+
+        def fail():
+            time.sleep(0.2)
+            raise RuntimeError
+
+        def run():
+            try:
+                single_flight.do('a', fail)
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run) for i in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(errors) == 3
+
+    def test_do_async(self):
+        """Test the do_async method.
+
+        Test whether concurrent coroutines with the same key are awaited
+        once and share the result.
+
+        """
+        single_flight = SingleFlight()
+        calls = []
+
+        async def slow(key):
+            calls.append(key)
+            await asyncio.sleep(0.1)
+            return key * 2
+
+        async def main():
+            return await asyncio.gather(
+                *[single_flight.do_async('a', slow, 'a') for i in range(5)])
+
+        results = run_async(main())
+
+        assert calls == ['a']
+        assert [r[0] for r in results] == ['aa'] * 5
+        assert [r[1] for r in results].count(False) == 1
+
+    @pytest.mark.parametrize('gziptext_cache', [[]],
+                             indirect=['gziptext_cache'])
+    def test_cache_get(self, gziptext_cache, monkeypatch):
+        """Test concurrent calls of the get method of a cache for the same
+        URL.
+
+        Test whether the document is downloaded and saved only once.
+
+        Parameters
+        ----------
+        gziptext_cache : pytest.fixture providing
+                pydov.util.caching.GzipTextFileCache
+            GzipTextFileCache using a temporary directory and a maximum age
+            of 1 second.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        downloads = []
+        saves = []
+
+        def _get_remote_data(self, url):
+            downloads.append(url)
+            time.sleep(0.2)
+            with open('tests/data/types/boring/boring.xml', 'rb') as f:
+                return f.read()
+
+        save = GzipTextFileCache._save
+
+        def _save(self, datatype, key, content):
+            saves.append(key)
+            return save(self, datatype, key, content)
+
+        monkeypatch.setattr(GzipTextFileCache, '_get_remote',
+                            _get_remote_data)
+        monkeypatch.setattr(GzipTextFileCache, '_save', _save)
+
+        results = []
+
+        def get():
+            results.append(gziptext_cache.get(
+                build_dov_url('data/boring/2004-103984.xml')))
+
+        threads = [threading.Thread(target=get) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(downloads) == 1
+        assert saves == ['2004-103984']
+        assert len(results) == 8
+        assert len(set(results)) == 1
+
+    @pytest.mark.parametrize('gziptext_cache', [[]],
+                             indirect=['gziptext_cache'])
+    def test_cache_get_async(self, gziptext_cache, monkeypatch):
+        """Test concurrent calls of the get_async method of a cache for the
+        same URL.
+
+        Test whether the document is downloaded only once.
+
+        Parameters
+        ----------
+        gziptext_cache : pytest.fixture providing
+                pydov.util.caching.GzipTextFileCache
+            GzipTextFileCache using a temporary directory and a maximum age
+            of 1 second.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        downloads = []
+
+        async def _get_remote_data_async(self, url, session=None):
+            downloads.append(url)
+            await asyncio.sleep(0.1)
+            with open('tests/data/types/boring/boring.xml', 'rb') as f:
+                return f.read()
+
+        monkeypatch.setattr(GzipTextFileCache, '_get_remote_async',
+                            _get_remote_data_async)
+
+        async def main():
+            return await asyncio.gather(*[gziptext_cache.get_async(
+                build_dov_url('data/boring/2004-103984.xml'))
+                for i in range(5)])
+
+        results = run_async(main())
+
+        assert len(downloads) == 1
+        assert len(set(results)) == 1
+
+
+class TestMetadataCacheHook(object):
+    """Class grouping tests for the pydov.util.caching.MetadataCacheHook
+    class."""
+
+    url = build_dov_url('geoserver/wfs') + \
+        '?service=WFS&request=DescribeFeatureType'
+
+    def test_save_inject(self, metadata_cache_hook):
+        """Test whether a received response is saved and injected
+        afterwards, without saving it again.
+
+        Parameters
+        ----------
+        metadata_cache_hook : pytest.fixture providing
+                pydov.util.caching.MetadataCacheHook
+            MetadataCacheHook using a temporary directory and a maximum age
+            of 1 second.
+
+        """
+        assert metadata_cache_hook.inject_meta_response(self.url) is None
+
+        metadata_cache_hook.meta_received(self.url, b'<schema/>')
+        cached_file = metadata_cache_hook._get_filepath(self.url) + '.xml.gz'
+        assert os.path.exists(cached_file)
+        mtime = os.path.getmtime(cached_file)
+
+        time.sleep(0.1)
+        assert metadata_cache_hook.inject_meta_response(
+            self.url) == b'<schema/>'
+        metadata_cache_hook.meta_received(self.url, b'<schema/>')
+        assert os.path.getmtime(cached_file) == mtime
+
+    def test_save_order(self, metadata_cache_hook, monkeypatch):
+        """Test whether the response is moved in place before its
+        validators, from a temporary file unique to the process.
+
+        Parameters
+        ----------
+        metadata_cache_hook : pytest.fixture providing
+                pydov.util.caching.MetadataCacheHook
+            MetadataCacheHook using a temporary directory and a maximum age
+            of 1 second.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        replaced = []
+        replace = os.replace
+
+        def record_replace(src, dst):
+            replaced.append((src, dst))
+            replace(src, dst)
+
+        monkeypatch.setattr(os, 'replace', record_replace)
+
+        metadata_cache_hook._save(self.url, b'<schema/>', {'etag': '"abc"'})
+
+        filepath = metadata_cache_hook._get_filepath(self.url)
+        assert [dst for src, dst in replaced] == [
+            filepath + '.xml.gz', filepath + '.json']
+        assert all('.{}.'.format(os.getpid()) in os.path.basename(src)
+                   for src, dst in replaced)
+        assert metadata_cache_hook._load(self.url)[:2] == (
+            b'<schema/>', {'etag': '"abc"', 'url': self.url})
+
+    def test_not_cacheable(self, metadata_cache_hook):
+        """Test whether invalid responses and exception reports are not
+        saved.
+
+        Parameters
+        ----------
+        metadata_cache_hook : pytest.fixture providing
+                pydov.util.caching.MetadataCacheHook
+            MetadataCacheHook using a temporary directory and a maximum age
+            of 1 second.
+
+        """
+        metadata_cache_hook.meta_received(self.url, b'not xml')
+        assert metadata_cache_hook.inject_meta_response(self.url) is None
+
+        metadata_cache_hook.meta_received(
+            self.url, b'<ows:ExceptionReport '
+                      b'xmlns:ows="http://www.opengis.net/ows"/>')
+        assert metadata_cache_hook.inject_meta_response(self.url) is None
+
+    def test_revalidate_not_modified(self, metadata_cache_hook,
+                                     monkeypatch):
+        """Test whether an expired response is revalidated with a
+        conditional request, and reused when it is not modified.
+
+        Parameters
+        ----------
+        metadata_cache_hook : pytest.fixture providing
+                pydov.util.caching.MetadataCacheHook
+            MetadataCacheHook using a temporary directory and a maximum age
+            of 1 second.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        requests = []
+
+        def get(url, headers=None, timeout=None):
+            requests.append((url, headers))
+            return MetadataResponse(304)
+
+        monkeypatch.setattr(pydov.session, 'get', get)
+
+        metadata_cache_hook._save(self.url, b'<schema/>', {'etag': '"abc"'})
+        cached_file = metadata_cache_hook._get_filepath(self.url) + '.xml.gz'
+
+        time.sleep(1.5)
+        assert metadata_cache_hook.inject_meta_response(
+            self.url) == b'<schema/>'
+        assert requests == [(self.url, {'If-None-Match': '"abc"'})]
+
+        assert metadata_cache_hook.inject_meta_response(
+            self.url) == b'<schema/>'
+        assert len(requests) == 1
+        assert os.path.exists(cached_file)
+
+    def test_revalidate_modified(self, metadata_cache_hook, monkeypatch):
+        """Test whether an expired response is replaced by the new
+        response of the remote service.
+
+        Parameters
+        ----------
+        metadata_cache_hook : pytest.fixture providing
+                pydov.util.caching.MetadataCacheHook
+            MetadataCacheHook using a temporary directory and a maximum age
+            of 1 second.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        def get(url, headers=None, timeout=None):
+            return MetadataResponse(200, b'<new/>', {'ETag': '"def"'})
+
+        monkeypatch.setattr(pydov.session, 'get', get)
+
+        metadata_cache_hook.meta_received(self.url, b'<schema/>')
+
+        time.sleep(1.5)
+        assert metadata_cache_hook.inject_meta_response(self.url) == b'<new/>'
+
+        response, validators, age = metadata_cache_hook._load(self.url)
+        assert response == b'<new/>'
+        assert validators['etag'] == '"def"'
+
+    def test_revalidate_error(self, metadata_cache_hook, monkeypatch):
+        """Test whether an expired response is used when revalidation
+        fails.
+
+        Parameters
+        ----------
+        metadata_cache_hook : pytest.fixture providing
+                pydov.util.caching.MetadataCacheHook
+            MetadataCacheHook using a temporary directory and a maximum age
+            of 1 second.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        def get(url, headers=None, timeout=None):
+            return MetadataResponse(503)
+
+        monkeypatch.setattr(pydov.session, 'get', get)
+
+        metadata_cache_hook.meta_received(self.url, b'<schema/>')
+
+        time.sleep(1.5)
+        assert metadata_cache_hook.inject_meta_response(
+            self.url) == b'<schema/>'
+
+    def test_get_url_validators(self, metadata_cache_hook, monkeypatch):
+        """Test whether the validators of the first response are saved along
+        with it, and used to revalidate it once it expired.
+
+        Parameters
+        ----------
+        metadata_cache_hook : pytest.fixture providing
+                pydov.util.caching.MetadataCacheHook
+            MetadataCacheHook using a temporary directory and a maximum age
+            of 1 second.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        requests = []
+
+        def get(url, headers=None, timeout=None):
+            requests.append(headers)
+            if headers:
+                return MetadataResponse(304)
+            return MetadataResponse(200, b'<schema/>', {
+                'ETag': '"abc"',
+                'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+
+        monkeypatch.setattr(pydov.session, 'get', get)
+
+        assert owsutil.get_url(self.url) == b'<schema/>'
+
+        response, validators, age = metadata_cache_hook._load(self.url)
+        assert validators['etag'] == '"abc"'
+        assert validators['last_modified'] == \
+            'Wed, 21 Oct 2015 07:28:00 GMT'
+
+        time.sleep(1.5)
+        assert owsutil.get_url(self.url) == b'<schema/>'
+        assert requests == [None, {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'}]
+
+    def test_capabilities_url(self):
+        """Test whether the shortened GetCapabilities URL is expanded for
+        revalidation."""
+        url = build_dov_url('geoserver/wfs') + '?version=1.1.0'
+        assert MetadataCacheHook._get_request_url(url) == \
+            url + '&service=WFS&request=GetCapabilities'
+        assert MetadataCacheHook._get_request_url(self.url) == self.url
+
+    def test_get_url(self, metadata_cache_hook, monkeypatch):
+        """Test whether metadata requests are performed once when the hook
+        is registered.
+
+        Parameters
+        ----------
+        metadata_cache_hook : pytest.fixture providing
+                pydov.util.caching.MetadataCacheHook
+            MetadataCacheHook using a temporary directory and a maximum age
+            of 1 second.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        requests = []
+
+        def get(url, headers=None, timeout=None):
+            requests.append(url)
+            return MetadataResponse(200, b'<schema/>')
+
+        monkeypatch.setattr(pydov.session, 'get', get)
+
+        assert owsutil.get_url(self.url) == b'<schema/>'
+        assert owsutil.get_url(self.url) == b'<schema/>'
+        assert requests == [self.url]
+
+        metadata_cache_hook.clean()
+        assert owsutil.get_url(self.url) == b'<schema/>'
+
+        time.sleep(1.5)
+        metadata_cache_hook.clean()
+        assert not os.path.exists(
+            metadata_cache_hook._get_filepath(self.url) + '.xml.gz')
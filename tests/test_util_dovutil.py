@@ -1,9 +1,11 @@
 """Module grouping tests for the pydov.util.owsutil module."""
+import asyncio
 import copy
 import os
 
 import pytest
 
+import pydov
 from pydov.util import dovutil
 
 env_var = "PYDOV_BASE_URL"
@@ -21,6 +23,28 @@ def pydov_base_url_environment():
     os.environ = old_environ
 
 
+@pytest.fixture
+def mp_session_get(monkeypatch):
+    """Monkeypatch the GET request of the package wide session and disable
+    aiohttp, returning a fixed response.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.fixture
+        PyTest monkeypatch fixture.
+
+    """
+    class Response(object):
+        encoding = None
+        text = u'<xml>d\xe9</xml>'
+
+    def get(url, *args, **kwargs):
+        return Response()
+
+    monkeypatch.setattr(dovutil, 'aiohttp', None)
+    monkeypatch.setattr(pydov.session, 'get', get)
+
+
 class TestDovutil(object):
     """Class grouping tests for the pydov.util.dovutil module."""
 
@@ -83,3 +107,21 @@ class TestDovutil(object):
         assert env_var in os.environ
         assert dovutil.build_dov_url('geonetwork/') == \
                'https://dov/geonetwork/'
+
+    def test_get_remote_url_async_fallback(self, mp_session_get):
+        """Test the get_remote_url_async function without aiohttp.
+
+        Test whether the request is performed using the package wide
+        session and executor.
+
+        """
+        assert dovutil.create_async_session() is None
+
+        loop = asyncio.new_event_loop()
+        try:
+            data = loop.run_until_complete(dovutil.get_remote_url_async(
+                'https://dov/data/boring/1.xml'))
+        finally:
+            loop.close()
+
+        assert data == u'<xml>d\xe9</xml>'.encode('utf8')
@@ -0,0 +1,317 @@
+"""Module grouping tests for the pydov.util.executor module."""
+import threading
+import time
+
+import pytest
+
+import pydov
+from pydov.types.boring import Boring
+from pydov.util.executor import (
+    ThreadExecutor,
+    AdaptiveThreadExecutor,
+)
+from tests.test_search_boring import (
+    location_wfs_getfeature,
+    location_dov_xml,
+)
+from tests.test_search import (
+    wfs_getfeature,
+    mp_dov_xml,
+)
+
+
+class CountingExecutor(ThreadExecutor):
+    """Executor implementation for testing purposes, counting the number of
+    submitted tasks."""
+    def __init__(self, workers=4):
+        super(CountingExecutor, self).__init__(workers)
+        self.count_submit = 0
+
+    def submit(self, fn, *args, **kwargs):
+        self.count_submit += 1
+        return super(CountingExecutor, self).submit(fn, *args, **kwargs)
+
+
+@pytest.fixture
+def counting_executor():
+    """PyTest fixture temporarily replacing the package wide executor with a
+    CountingExecutor."""
+    orig_executor = pydov.executor
+    pydov.executor = CountingExecutor()
+    yield pydov.executor
+    pydov.executor.shutdown()
+    pydov.executor = orig_executor
+
+
+class TestThreadExecutor(object):
+    """Class grouping tests for the pydov.util.executor.ThreadExecutor
+    class."""
+
+    def test_invalid_workers(self):
+        """Test initialising an executor with zero workers.
+
+        Test whether a ValueError is raised.
+
+        """
+        with pytest.raises(ValueError):
+            ThreadExecutor(workers=0)
+
+    def test_submit(self):
+        """Test the submit method.
+
+        Test whether the results are returned in the order of submission.
+
+        """
+        executor = ThreadExecutor(workers=2)
+        futures = [executor.submit(pow, i, 2) for i in range(10)]
+        assert [f.result() for f in futures] == [i**2 for i in range(10)]
+        executor.shutdown()
+
+    def test_submit_exception(self):
+        """Test the submit method with a failing task.
+
+        Test whether the exception is raised when retrieving the result.
+
+        """
+        def fail():
+            raise RuntimeError
+
+        executor = ThreadExecutor(workers=2)
+        future = executor.submit(fail)
+
+        with pytest.raises(RuntimeError):
+            future.result()
+        executor.shutdown()
+
+    def test_max_workers(self):
+        """Test whether no more tasks run concurrently than the number of
+        workers."""
+        lock = threading.Lock()
+        running = [0]
+        max_running = [0]
+
+        def task():
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+
+        executor = ThreadExecutor(workers=3)
+        for f in [executor.submit(task) for i in range(20)]:
+            f.result()
+        executor.shutdown()
+
+        assert max_running[0] <= 3
+
+    def test_reuse(self):
+        """Test whether the executor reuses its pool across calls and can
+        still be used after shutdown."""
+        executor = ThreadExecutor(workers=2)
+
+        executor.submit(pow, 2, 2).result()
+        pool = executor._pool
+        executor.submit(pow, 2, 2).result()
+        assert executor._pool is pool
+
+        executor.shutdown()
+        assert executor._pool is None
+
+        assert executor.submit(pow, 2, 3).result() == 8
+        executor.shutdown()
+
+    def test_is_worker_thread(self):
+        """Test the is_worker_thread method.
+
+        Test whether only the worker threads of the executor itself are
+        detected.
+
+        """
+        executor = ThreadExecutor(workers=2)
+        other = ThreadExecutor(workers=1)
+
+        assert not executor.is_worker_thread()
+        assert executor.submit(executor.is_worker_thread).result()
+        assert not other.submit(executor.is_worker_thread).result()
+
+        executor.shutdown()
+        other.shutdown()
+
+    def test_submit_nested(self):
+        """Test submitting a task from within a task of the same executor.
+
+        Test whether the nested task runs inline instead of deadlocking the
+        executor with a single worker.
+
+        """
+        executor = ThreadExecutor(workers=1)
+
+        def task():
+            return executor.submit(pow, 2, 3).result(timeout=5)
+
+        assert executor.submit(task).result(timeout=10) == 8
+        executor.shutdown()
+
+    def test_map(self):
+        """Test the map method inherited from concurrent.futures.Executor."""
+        executor = ThreadExecutor(workers=2)
+        assert list(executor.map(abs, [-1, -2, 3])) == [1, 2, 3]
+        executor.shutdown()
+
+
+class TestAdaptiveThreadExecutor(object):
+    """Class grouping tests for the
+    pydov.util.executor.AdaptiveThreadExecutor class."""
+
+    def test_invalid_workers(self):
+        """Test initialising an executor with an invalid number of workers.
+
+        Test whether a ValueError is raised.
+
+        """
+        with pytest.raises(ValueError):
+            AdaptiveThreadExecutor(min_workers=4, workers=2)
+
+        with pytest.raises(ValueError):
+            AdaptiveThreadExecutor(max_workers=2, workers=4)
+
+    def test_submit(self):
+        """Test the submit method.
+
+        Test whether the results are returned in the order of submission.
+
+        """
+        executor = AdaptiveThreadExecutor()
+        futures = [executor.submit(pow, i, 2) for i in range(50)]
+        assert [f.result() for f in futures] == [i**2 for i in range(50)]
+        executor.shutdown()
+
+    def test_grow(self):
+        """Test whether the concurrency increases with stable latencies."""
+        executor = AdaptiveThreadExecutor(min_workers=1, max_workers=8,
+                                          workers=2)
+        for f in [executor.submit(time.sleep, 0.02) for i in range(100)]:
+            f.result()
+        executor.shutdown()
+
+        assert executor.concurrency > 2
+
+    def test_shrink_errors(self):
+        """Test whether the concurrency decreases when tasks fail."""
+        def fail():
+            raise RuntimeError
+
+        executor = AdaptiveThreadExecutor(min_workers=1, max_workers=8,
+                                          workers=8)
+        futures = [executor.submit(fail) for i in range(20)]
+        for f in futures:
+            with pytest.raises(RuntimeError):
+                f.result()
+        executor.shutdown()
+
+        assert executor.concurrency == 1
+
+    def test_submit_nested(self):
+        """Test submitting a task from within a task of the same executor.
+
+        Test whether the nested task runs inline instead of waiting for a
+        free slot while the concurrency is limited to one.
+
+        """
+        executor = AdaptiveThreadExecutor(min_workers=1, max_workers=1,
+                                          workers=1)
+
+        def task():
+            return executor.submit(pow, 2, 3).result(timeout=5)
+
+        assert executor.submit(task).result(timeout=10) == 8
+        executor.shutdown()
+
+    def test_shrink_latency(self):
+        """Test whether the concurrency decreases when the latency
+        increases."""
+        executor = AdaptiveThreadExecutor(min_workers=1, max_workers=8,
+                                          workers=4, latency_tolerance=1.5)
+        executor._latencies = [0.1] * 4
+        executor._adapt()
+        assert executor.concurrency == 5
+
+        executor._latencies = [1.0] * 5
+        executor._adapt()
+        assert executor.concurrency == 4
+
+
+class TestExecutorDataframe(object):
+    """Class grouping tests for the usage of the package wide executor."""
+
+    def test_to_df_array(self, counting_executor, wfs_getfeature,
+                         mp_dov_xml):
+        """Test whether to_df_array uses the package wide executor.
+
+        Parameters
+        ----------
+        counting_executor : pytest.fixture providing CountingExecutor
+            Executor counting the number of submitted tasks.
+        wfs_getfeature : pytest.fixture returning str
+            Fixture providing a WFS GetFeature response.
+        mp_dov_xml : pytest.fixture
+            Monkeypatch the call to get the remote XML data.
+
+        """
+        features = list(Boring.from_wfs(
+            wfs_getfeature, 'http://dov.vlaanderen.be/ocdov/dov-pub'))
+        df_array = Boring.to_df_array(features)
+
+        assert counting_executor.count_submit == len(features)
+        assert len(df_array) >= len(features)
+
+    def test_to_df_array_iter(self, counting_executor, wfs_getfeature,
+                              mp_dov_xml):
+        """Test whether to_df_array_iter uses the package wide executor and
+        yields the same rows as to_df_array.
+
+        Parameters
+        ----------
+        counting_executor : pytest.fixture providing CountingExecutor
+            Executor counting the number of submitted tasks.
+        wfs_getfeature : pytest.fixture returning str
+            Fixture providing a WFS GetFeature response.
+        mp_dov_xml : pytest.fixture
+            Monkeypatch the call to get the remote XML data.
+
+        """
+        features = list(Boring.from_wfs(
+            wfs_getfeature, 'http://dov.vlaanderen.be/ocdov/dov-pub'))
+        df_arrays = list(Boring.to_df_array_iter(features, chunksize=1))
+
+        assert counting_executor.count_submit == len(features)
+        assert len(df_arrays) == len(features)
+        assert [r for a in df_arrays for r in a] == \
+            Boring.to_df_array(features)
+
+    def test_to_df_array_nested(self, wfs_getfeature, mp_dov_xml):
+        """Test whether to_df_array completes when called from within a task
+        of the package wide executor with a single worker.
+
+        Parameters
+        ----------
+        wfs_getfeature : pytest.fixture returning str
+            Fixture providing a WFS GetFeature response.
+        mp_dov_xml : pytest.fixture
+            Monkeypatch the call to get the remote XML data.
+
+        """
+        features = list(Boring.from_wfs(
+            wfs_getfeature, 'http://dov.vlaanderen.be/ocdov/dov-pub'))
+
+        orig_executor = pydov.executor
+        pydov.executor = ThreadExecutor(workers=1)
+        try:
+            df_array = pydov.executor.submit(
+                Boring.to_df_array, features).result(timeout=30)
+        finally:
+            pydov.executor.shutdown()
+            pydov.executor = orig_executor
+
+        assert df_array == Boring.to_df_array(features)
@@ -11,6 +11,7 @@ from pydov.util.hooks import (
     AbstractReadHook,
     SimpleStatusHook,
     AbstractInjectHook,
+    HookRunner,
     Hooks,
 )
 from tests.abstract import service_ok
@@ -433,3 +434,26 @@ class TestHookInject(object):
 
         assert df.iloc[0].gemeente == 'Bevergem'
         assert df.iloc[0].boormethode == 'De Pypere 106 T'
+
+
+class TestHookRunner(object):
+    def test_is_read_hook_implemented(self, monkeypatch):
+        """Test the HookRunner.is_read_hook_implemented method.
+
+        Test whether only hooks overriding the default implementation are
+        taken into account.
+
+        Parameters
+        ----------
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        monkeypatch.setattr(pydov, 'hooks', Hooks((SimpleStatusHook(),)))
+        assert HookRunner.is_read_hook_implemented('wfs_search_result')
+        assert not HookRunner.is_read_hook_implemented(
+            'wfs_search_result_received')
+
+        pydov.hooks.append(HookCounter())
+        assert HookRunner.is_read_hook_implemented(
+            'wfs_search_result_received')
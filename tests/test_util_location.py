@@ -57,6 +57,21 @@ class TestLocation(object):
             '<gml:upperCorner>3.807100 51.127000</gml:upperCorner>'
             '</gml:Envelope>')
 
+    def test_box_split(self):
+        """Test the split method of the Box type.
+
+        Test whether the quadrants cover the box and keep the coordinate
+        reference system.
+
+        """
+        box = Box(3.6, 50.9, 3.8, 51.1, epsg=4326)
+        quadrants = box.split()
+
+        assert [(q.minx, q.miny, q.maxx, q.maxy) for q in quadrants] == [
+            (3.6, 50.9, 3.7, 51.0), (3.7, 50.9, 3.8, 51.0),
+            (3.6, 51.0, 3.7, 51.1), (3.7, 51.0, 3.8, 51.1)]
+        assert all(q.epsg == 4326 for q in quadrants)
+
     def test_box_invalid(self):
         """Test the Box type with the wrong ordering of coordinates.
 
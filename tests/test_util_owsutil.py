@@ -1,8 +1,12 @@
 """Module grouping tests for the pydov.util.owsutil module."""
 import copy
+import glob
+import io
 
 import pytest
+import requests
 
+import pydov
 from owslib.etree import etree
 from owslib.fes import (
     PropertyIsEqualTo,
@@ -10,13 +14,19 @@ from owslib.fes import (
     SortBy,
     SortProperty,
 )
+from owslib.feature.schema import (
+    _construct_schema,
+    _get_elements,
+)
 from owslib.iso import MD_Metadata
 from owslib.util import nspath_eval
 from pydov.util import owsutil
+from pydov.util.owsutil import get_remote_metadata
 from pydov.util.dovutil import build_dov_url
 from pydov.util.errors import (
     MetadataNotFoundError,
     FeatureCatalogueNotFoundError,
+    WfsGetFeatureError,
 )
 from pydov.util.location import (
     Within,
@@ -25,6 +35,7 @@ from pydov.util.location import (
 from tests.abstract import clean_xml
 
 from tests.test_search_boring import (
+    build_features,
     md_metadata,
     mp_remote_md,
     mp_remote_describefeaturetype,
@@ -41,6 +52,30 @@ from tests.test_search import (
 )
 
 
+def build_response(status_code, content):
+    """Build a response of the requests library.
+
+    Parameters
+    ----------
+    status_code : int
+        HTTP status code of the response.
+    content : bytes
+        Body of the response.
+
+    Returns
+    -------
+    requests.Response
+        The response, with its body available as a stream.
+
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = 'Reason'
+    response.url = build_dov_url('geoserver/wfs')
+    response.raw = io.BytesIO(content)
+    return response
+
+
 class TestOwsutil(object):
     """Class grouping tests for the pydov.util.owsutil module."""
 
@@ -241,6 +276,112 @@ class TestOwsutil(object):
         assert type(md_metadata) is MD_Metadata
 
 
+    def test_get_remote_metadata_mi(self, wfs, monkeypatch):
+        """Test the owsutil.get_remote_metadata method with a MI_Metadata
+        document.
+
+        The function is imported directly, since other tests in this module
+        monkeypatch it.
+
+        Test whether the metadata is found and parsed.
+
+        Parameters
+        ----------
+        wfs : pytest.fixture returning owslib.wfs.WebFeatureService
+            WebFeatureService based on the local GetCapabilities.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        with open(location_md_metadata, 'rb') as f:
+            tree = etree.fromstring(f.read())
+
+        md = tree.find('.//{http://www.isotc211.org/2005/gmd}MD_Metadata')
+        md.tag = '{http://www.isotc211.org/2005/gmi}MI_Metadata'
+
+        monkeypatch.setattr(owsutil, '__get_remote_md',
+                            lambda url: etree.tostring(tree))
+
+        metadata = get_remote_metadata(wfs.contents['dov-pub:Boringen'])
+        assert type(metadata) is MD_Metadata
+        assert metadata.identifier is not None
+
+    @pytest.mark.parametrize('error', [
+        requests.ConnectionError('Connection refused'),
+        etree.ParseError('Invalid XML', None, 1, 1)])
+    def test_get_remote_metadata_error(self, wfs, monkeypatch, error):
+        """Test the owsutil.get_remote_metadata method when the metadata
+        cannot be retrieved or parsed.
+
+        Test whether a MetadataNotFoundError is raised, caused by the
+        original error.
+
+        Parameters
+        ----------
+        wfs : pytest.fixture returning owslib.wfs.WebFeatureService
+            WebFeatureService based on the local GetCapabilities.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+        error : Exception
+            Error raised when retrieving the metadata.
+
+        """
+        def get_remote_md(url):
+            raise error
+
+        monkeypatch.setattr(owsutil, '__get_remote_md', get_remote_md)
+
+        with pytest.raises(MetadataNotFoundError) as e:
+            get_remote_metadata(wfs.contents['dov-pub:Boringen'])
+
+        assert e.value.__cause__ is error
+
+    def test_get_remote_metadata_unexpected_error(self, wfs, monkeypatch):
+        """Test the owsutil.get_remote_metadata method with an unexpected
+        error.
+
+        Test whether the error is not hidden by a MetadataNotFoundError.
+
+        Parameters
+        ----------
+        wfs : pytest.fixture returning owslib.wfs.WebFeatureService
+            WebFeatureService based on the local GetCapabilities.
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        def get_remote_md(url):
+            raise RuntimeError
+
+        monkeypatch.setattr(owsutil, '__get_remote_md', get_remote_md)
+
+        with pytest.raises(RuntimeError):
+            get_remote_metadata(wfs.contents['dov-pub:Boringen'])
+
+    @pytest.mark.parametrize('describefeaturetype', sorted(glob.glob(
+        'tests/data/types/*/wfsdescribefeaturetype.xml')))
+    def test_get_schema(self, describefeaturetype):
+        """Test the owsutil.get_schema method.
+
+        Test whether the schema equals the one built by OWSLib.
+
+        Parameters
+        ----------
+        describefeaturetype : str
+            Path of a DescribeFeatureType response.
+
+        """
+        with open(describefeaturetype, 'rb') as f:
+            root = etree.fromstring(f.read())
+
+        type_element = root.find('./{http://www.w3.org/2001/XMLSchema}element')
+        expected = _construct_schema(_get_elements(
+            type_element.get('type').split(':')[1], root), root.nsmap)
+
+        schema = owsutil.get_schema(None, None, root)
+        assert schema == expected
+        assert len(schema['properties']) > 0
+
     def test_wfs_build_getfeature_request_onlytypename(self):
         """Test the owsutil.wfs_build_getfeature_request method with only a
         typename specified.
@@ -533,3 +674,179 @@ class TestOwsutil(object):
             ':PropertyName>datum_aanvang</ogc:PropertyName><ogc:SortOrder>ASC'
             '</ogc:SortOrder></ogc:SortProperty></ogc:SortBy></wfs:Query>'
             '</wfs:GetFeature>')
+
+    def test_wfs_build_getfeature_hits_request(self):
+        """Test the owsutil.wfs_build_getfeature_hits_request method.
+
+        Test whether the resultType is set and maxFeatures is removed,
+        leaving the original request untouched.
+
+        """
+        xml = owsutil.wfs_build_getfeature_request(
+            'dov-pub:Boringen', propertyname=['fiche'], max_features=10)
+        hits = owsutil.wfs_build_getfeature_hits_request(xml)
+
+        assert hits.get('resultType') == 'hits'
+        assert hits.get('maxFeatures') is None
+        assert xml.get('resultType') is None
+        assert xml.get('maxFeatures') == '10'
+
+    def test_wfs_build_getfeature_page_request(self):
+        """Test the owsutil.wfs_build_getfeature_page_request method.
+
+        Test whether the XML of the WFS GetFeature call is generated
+        correctly.
+
+        """
+        xml = owsutil.wfs_build_getfeature_request(
+            'dov-pub:Boringen', propertyname=['fiche', 'diepte_tot_m'])
+        page = owsutil.wfs_build_getfeature_page_request(
+            xml, start_index=20, max_features=10, sort_property='fiche')
+
+        assert clean_xml(etree.tostring(page).decode('utf8')) == clean_xml(
+            '<wfs:GetFeature xmlns:wfs="http://www.opengis.net/wfs" '
+            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+            'service="WFS" version="1.1.0" '
+            'xsi:schemaLocation="http://www.opengis.net/wfs '
+            'http://schemas.opengis.net/wfs/1.1.0/wfs.xsd" startIndex="20" '
+            'maxFeatures="10"><wfs:Query '
+            'typeName="dov-pub:Boringen"><wfs:PropertyName>fiche</wfs'
+            ':PropertyName><wfs:PropertyName>diepte_tot_m</wfs:PropertyName'
+            '><ogc:Filter/><ogc:SortBy xmlns:ogc="http://www.opengis.net/ogc">'
+            '<ogc:SortProperty><ogc:PropertyName>fiche</ogc:PropertyName>'
+            '<ogc:SortOrder>ASC</ogc:SortOrder></ogc:SortProperty>'
+            '</ogc:SortBy></wfs:Query></wfs:GetFeature>')
+
+    def test_wfs_build_getfeature_page_request_sortby(self):
+        """Test the owsutil.wfs_build_getfeature_page_request method with an
+        existing sortby.
+
+        Test whether the sort property is added after the existing sort
+        properties.
+
+        """
+        sort_by = SortBy([SortProperty('diepte_tot_m', 'DESC')])
+        sort_by = etree.tostring(sort_by.toXML(), encoding='unicode')
+
+        xml = owsutil.wfs_build_getfeature_request(
+            'dov-pub:Boringen', propertyname=['fiche', 'diepte_tot_m'],
+            sort_by=sort_by)
+        page = owsutil.wfs_build_getfeature_page_request(
+            xml, start_index=0, max_features=10, sort_property='fiche')
+
+        assert [i.text for i in page.findall(
+            './/{http://www.opengis.net/ogc}PropertyName')] == \
+            ['diepte_tot_m', 'fiche']
+        assert len(xml.findall(
+            './/{http://www.opengis.net/ogc}SortProperty')) == 1
+
+    def test_wfs_iterparse_features(self):
+        """Test the owsutil.wfs_iterparse_features method.
+
+        Test whether all features are yielded in order and removed from the
+        tree after processing.
+
+        """
+        collection = etree.Element(
+            '{http://www.opengis.net/wfs}FeatureCollection')
+        collection.set('numberOfFeatures', '3')
+        members = etree.SubElement(
+            collection, '{http://www.opengis.net/gml}featureMembers')
+        members.extend(build_features(3))
+
+        root, features = owsutil.wfs_iterparse_features(
+            io.BytesIO(etree.tostring(collection)))
+
+        assert root.get('numberOfFeatures') == '3'
+
+        fiches = []
+        for feature in features:
+            # the previous features have been removed from the tree
+            assert root[0][0] is feature
+            fiches.append(feature.findtext(
+                '{http://dov.vlaanderen.be/ocdov/dov-pub}fiche'))
+
+        assert fiches == [
+            build_dov_url('data/boring/2020-{:06d}'.format(i))
+            for i in range(3)]
+        assert len(root[0]) == 0
+
+    def test_wfs_iterparse_features_exception(self):
+        """Test the owsutil.wfs_iterparse_features method with an exception
+        report.
+
+        Test whether no features are yielded and the complete report is
+        available after processing.
+
+        """
+        report = b'''<ows:ExceptionReport
+            xmlns:ows="http://www.opengis.net/ows" version="1.0.0">
+            <ows:Exception exceptionCode="InvalidParameterValue">
+                <ows:ExceptionText>Unknown typename</ows:ExceptionText>
+            </ows:Exception>
+        </ows:ExceptionReport>'''
+
+        root, features = owsutil.wfs_iterparse_features(io.BytesIO(report))
+
+        assert root.get('numberOfFeatures') is None
+        assert list(features) == []
+        assert root.findtext('.//{http://www.opengis.net/ows}'
+                             'ExceptionText') == 'Unknown typename'
+
+    @pytest.mark.parametrize('content', [
+        b'<ows:ExceptionReport xmlns:ows="http://www.opengis.net/ows">'
+        b'<ows:Exception><ows:ExceptionText>Unknown typename'
+        b'</ows:ExceptionText></ows:Exception></ows:ExceptionReport>',
+        b'<html><body>Unknown typename</body></html>',
+        b'Unknown typename'])
+    def test_wfs_get_feature_stream_error(self, monkeypatch, content):
+        """Test the owsutil.wfs_get_feature_stream method with an HTTP error
+        status.
+
+        Test whether a WfsGetFeatureError including the body of the
+        response is raised, and the response is closed.
+
+        Parameters
+        ----------
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+        content : bytes
+            Body of the error response.
+
+        """
+        response = build_response(500, content)
+        monkeypatch.setattr(pydov.session, 'post',
+                            lambda *args, **kwargs: response)
+
+        closed = []
+        monkeypatch.setattr(response, 'close', lambda: closed.append(True))
+
+        with pytest.raises(WfsGetFeatureError) as e:
+            owsutil.wfs_get_feature_stream(
+                build_dov_url('geoserver/wfs'), etree.Element('GetFeature'))
+
+        assert '500' in str(e.value)
+        assert 'Unknown typename' in str(e.value)
+        assert closed == [True]
+
+    def test_wfs_get_feature_stream(self, monkeypatch):
+        """Test the owsutil.wfs_get_feature_stream method.
+
+        Test whether the body of a successful response is returned as a
+        stream.
+
+        Parameters
+        ----------
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        response = build_response(200, b'<FeatureCollection/>')
+        monkeypatch.setattr(pydov.session, 'post',
+                            lambda *args, **kwargs: response)
+
+        stream = owsutil.wfs_get_feature_stream(
+            build_dov_url('geoserver/wfs'), etree.Element('GetFeature'))
+
+        assert stream.read() == b'<FeatureCollection/>'
+        stream.close()
@@ -138,6 +138,56 @@ class TestPropertyInList(object):
             l = 'goed'
             PropertyInList('betrouwbaarheid', l)
 
+    def test_split(self):
+        """Test splitting the PropertyInList expression in chunks.
+
+        Test whether the chunks contain all the values once and at most
+        chunksize values each.
+
+        """
+        l = ['a', 'b', 'c', 'b', 'd', 'e']
+
+        query = PropertyInList('methode', l, chunksize=2)
+        chunks = query.split()
+
+        assert [c.values for c in chunks] == [['a', 'b'], ['c', 'd'], ['e']]
+        assert all(c.propertyname == 'methode' for c in chunks)
+        assert chunks[-1].toXML().tag == \
+            '{http://www.opengis.net/ogc}PropertyIsEqualTo'
+
+    def test_split_single(self):
+        """Test splitting a PropertyInList expression with no more values
+        than its chunksize.
+
+        Test whether the expression itself is returned.
+
+        """
+        query = PropertyInList('methode', ['a', 'b'])
+        assert query.split() == [query]
+
+    def test_chunksize_default(self, monkeypatch):
+        """Test changing the default chunksize of the PropertyInList class.
+
+        Test whether the default is used by new expressions.
+
+        Parameters
+        ----------
+        monkeypatch : pytest.fixture
+            PyTest monkeypatch fixture.
+
+        """
+        monkeypatch.setattr(PropertyInList, 'chunksize', 2)
+        assert len(PropertyInList('methode', ['a', 'b', 'c']).split()) == 2
+
+    def test_chunksize_invalid(self):
+        """Test the PropertyInList expression with a chunksize of zero.
+
+        Test whether a ValueError is raised.
+
+        """
+        with pytest.raises(ValueError):
+            PropertyInList('methode', ['a', 'b'], chunksize=0)
+
 
 class TestJoin(object):
     """Test the Join query expression."""
@@ -374,3 +424,24 @@ class TestJoin(object):
             l.remove(literal.text)
 
         assert len(l) == 0
+
+    def test_chunksize(self):
+        """Test the Join expression with a chunksize.
+
+        Test whether the values are split in chunks of at most chunksize
+        values.
+
+        """
+        l = [build_dov_url('data/boring/1986-068853'),
+             build_dov_url('data/boring/1986-068843'),
+             build_dov_url('data/boring/1980-068861')]
+
+        df = pd.DataFrame({
+            'pkey_boring': pd.Series(l),
+            'diepte_tot_m': pd.Series([10, 20, 30])
+        })
+
+        query = Join(df, 'pkey_boring', chunksize=2)
+        chunks = query.split()
+
+        assert [c.values for c in chunks] == [l[:2], l[2:]]